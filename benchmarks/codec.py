@@ -0,0 +1,170 @@
+"""Compare serialization of struct through protocols of thriftworker and
+thrift.
+
+Two kinds of structs are measured: *dynamic* ones, as generated with
+``thrift --gen py:dynamic``, delegate to :meth:`readStruct` and
+:meth:`writeStruct` of protocol, so they are processed by compiled codec;
+*stock* ones process fields one by one with base protocol, like code
+generated with plain ``thrift --gen py`` does, and take fastbinary path
+only with :class:`TBinaryProtocolAccelerated`.
+
+Run after ``python setup.py build_ext --inplace``::
+
+    python benchmarks/codec.py [--number N]
+
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+from timeit import default_timer
+
+from thrift.Thrift import TType
+from thrift.protocol.TBase import TBase
+from thrift.protocol.TProtocol import TProtocolBase
+from thrift.protocol.TBinaryProtocol import TBinaryProtocolAccelerated
+from thrift.protocol.TCompactProtocol import TCompactProtocol
+from thrift.transport.TTransport import TMemoryBuffer
+
+from thriftworker.protocols import BinaryProtocol, CompactProtocol
+from thriftworker.protocols.codec import encode_binary, decode_binary
+
+try:
+    from thrift.protocol import fastbinary
+except ImportError:
+    fastbinary = None
+
+PROTOCOLS = (TBinaryProtocolAccelerated, BinaryProtocol, TCompactProtocol,
+             CompactProtocol)
+
+
+class Item(TBase):
+
+    __slots__ = ['id', 'name', 'enabled']
+
+    thrift_spec = (
+        None,
+        (1, TType.I32, 'id', None, None),
+        (2, TType.STRING, 'name', None, None),
+        (3, TType.BOOL, 'enabled', None, None),
+    )
+
+    def __init__(self, id=None, name=None, enabled=None):
+        self.id = id
+        self.name = name
+        self.enabled = enabled
+
+
+class Bag(TBase):
+
+    __slots__ = ['long', 'real', 'items', 'tags', 'scores']
+
+    thrift_spec = (
+        None,
+        (1, TType.I64, 'long', None, None),
+        (2, TType.DOUBLE, 'real', None, None),
+        (3, TType.LIST, 'items', (TType.STRUCT, (Item, Item.thrift_spec)),
+         None),
+        (4, TType.SET, 'tags', (TType.STRING, None), None),
+        (5, TType.MAP, 'scores', (TType.STRING, None, TType.I64, None),
+         None),
+    )
+
+    def __init__(self, long=None, real=None, items=None, tags=None,
+                 scores=None):
+        self.long = long
+        self.real = real
+        self.items = items
+        self.tags = tags
+        self.scores = scores
+
+
+class StockMixin(object):
+    """Skip :meth:`readStruct` and :meth:`writeStruct` of protocol."""
+
+    def read(self, iprot):
+        if iprot.__class__ is TBinaryProtocolAccelerated and fastbinary:
+            return TBase.read(self, iprot)
+        TProtocolBase.readStruct(iprot, self, self.thrift_spec)
+
+    def write(self, oprot):
+        if oprot.__class__ is TBinaryProtocolAccelerated and fastbinary:
+            return TBase.write(self, oprot)
+        TProtocolBase.writeStruct(oprot, self, self.thrift_spec)
+
+
+class StockItem(StockMixin, Item):
+
+    __slots__ = ()
+
+
+class StockBag(StockMixin, Bag):
+
+    __slots__ = ()
+
+
+StockItem.thrift_spec = Item.thrift_spec
+StockBag.thrift_spec = Bag.thrift_spec[:3] + (
+    (3, TType.LIST, 'items', (TType.STRUCT,
+                              (StockItem, StockItem.thrift_spec)), None),
+) + Bag.thrift_spec[4:]
+
+
+def make_bag(Bag, Item):
+    return Bag(long=1 << 40, real=0.5,
+               items=[Item(i, 'item{0}'.format(i), bool(i % 2))
+                      for i in range(20)],
+               tags=set('tag{0}'.format(i) for i in range(10)),
+               scores={'score{0}'.format(i): i for i in range(10)})
+
+
+def measure(func, number):
+    """Return microseconds per call of given function."""
+    started = default_timer()
+    for _ in xrange(number):
+        func()
+    return (default_timer() - started) / number * 1e6
+
+
+def measure_protocol(protocol_cls, bag, number):
+    buf = TMemoryBuffer()
+    bag.write(protocol_cls(buf))
+    data = buf.getvalue()
+
+    def encode():
+        bag.write(protocol_cls(TMemoryBuffer()))
+
+    def decode():
+        bag.__class__().read(protocol_cls(TMemoryBuffer(data)))
+
+    return measure(encode, number), measure(decode, number)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--number', type=int, default=2000,
+                        help='number of structs per measurement')
+    args = parser.parse_args()
+    print('us per struct, encode / decode')
+    for kind, bag in (('dynamic', make_bag(Bag, Item)),
+                      ('stock', make_bag(StockBag, StockItem))):
+        for protocol_cls in PROTOCOLS:
+            encode, decode = measure_protocol(protocol_cls, bag, args.number)
+            print('{0:8} {1:28} {2:8.1f} / {3:8.1f}'.format(
+                kind, protocol_cls.__name__, encode, decode))
+    bag = make_bag(Bag, Item)
+    spec = Bag.thrift_spec
+    data = encode_binary(bag, spec)
+    print('{0:8} {1:28} {2:8.1f} / {3:8.1f}'.format(
+        'raw', 'codec', measure(lambda: encode_binary(bag, spec), args.number),
+        measure(lambda: decode_binary(Bag(), spec, data), args.number)))
+    if fastbinary is not None:
+        spec = (Bag, spec)
+        print('{0:8} {1:28} {2:8.1f} / {3:8.1f}'.format(
+            'raw', 'fastbinary',
+            measure(lambda: fastbinary.encode_binary(bag, spec), args.number),
+            measure(lambda: fastbinary.decode_binary(
+                Bag(), TMemoryBuffer(data), spec), args.number)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Measure throughput of processor created by
+:meth:`thriftworker.services.Services.create_processor`, that reuses
+transports, protocols and output buffer per thread, against processor that
+creates them for each request. Input buffer is created for each request by
+both of them.
+
+Run after ``python setup.py build_ext --inplace``::
+
+    python benchmarks/processor.py [--number N] [--size BYTES]
+
+"""
+from __future__ import absolute_import, print_function
+
+import argparse
+from cStringIO import StringIO
+from timeit import default_timer
+
+from thrift.Thrift import TMessageType, TType
+from thrift.protocol.TBinaryProtocol import TBinaryProtocolAcceleratedFactory
+from thrift.transport.TTransport import TMemoryBuffer
+
+from thriftworker.app import ThriftWorker
+
+SERVICE = 'Benchmark'
+
+
+class Processor(object):
+    """Answer each call with string of given size."""
+
+    def __init__(self, size):
+        self.reply = b'x' * size
+
+    def process(self, iprot, oprot):
+        name, _, seqid = iprot.readMessageBegin()
+        iprot.skip(TType.STRUCT)
+        iprot.readMessageEnd()
+        oprot.writeMessageBegin(name, TMessageType.REPLY, seqid)
+        oprot.writeStructBegin('result')
+        oprot.writeFieldBegin('success', TType.STRING, 0)
+        oprot.writeString(self.reply)
+        oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+        return name
+
+
+def create_call(proto_factory):
+    transport = TMemoryBuffer()
+    oprot = proto_factory.getProtocol(transport)
+    oprot.writeMessageBegin('call', TMessageType.CALL, 1)
+    oprot.writeStructBegin('args')
+    oprot.writeFieldBegin('key', TType.STRING, 1)
+    oprot.writeString(b'key')
+    oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+    oprot.writeMessageEnd()
+    return transport.getvalue()
+
+
+def create_fresh_processor(processor, get_factory):
+    """Create transports and protocols for each request."""
+
+    def inner_processor(message_buffer, protocol=None):
+        proto_factory = get_factory(protocol)
+        in_transport = TMemoryBuffer(message_buffer.getvalue())
+        out_transport = TMemoryBuffer()
+        in_prot = proto_factory.getProtocol(in_transport)
+        out_prot = proto_factory.getProtocol(out_transport)
+        method = processor.process(in_prot, out_prot)
+        return (method, out_transport.getvalue())
+
+    return inner_processor
+
+
+def measure(process, data, number):
+    """Return number of processed requests per second."""
+    buffers = [StringIO(data) for _ in xrange(number)]
+    started = default_timer()
+    for message_buffer in buffers:
+        process(message_buffer)
+    return number / (default_timer() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--number', type=int, default=100000,
+                        help='number of requests per measurement')
+    parser.add_argument('--size', type=int, default=100,
+                        help='size of reply in bytes')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of measurements, best one is shown')
+    args = parser.parse_args()
+    proto_factory = TBinaryProtocolAcceleratedFactory()
+    app = ThriftWorker(protocol_factory=proto_factory)
+    processor = Processor(args.size)
+    app.services.register(SERVICE, processor)
+    data = create_call(proto_factory)
+    processors = (
+        ('fresh', create_fresh_processor(
+            processor, app.services.create_factory_getter(SERVICE))),
+        ('reused', app.services.create_processor(SERVICE)))
+    # Interleave measurements, so drift of machine affects both equally.
+    rates = {}
+    for _ in xrange(args.repeat):
+        for name, process in processors:
+            rate = measure(process, data, args.number)
+            rates[name] = max(rates.get(name, 0), rate)
+    for name, _ in processors:
+        print('{0:8} {1:10.0f} req/s'.format(name, rates[name]))
+
+
+if __name__ == '__main__':
+    main()
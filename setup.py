@@ -125,7 +125,12 @@ def prepare_sources(sources):
 
 
 modules = {
+    'protocols.codec': dict(),
+    'transports.buffered.connection': dict(),
     'transports.framed.connection': dict(),
+    'transports.header.connection': dict(),
+    'transports.admin.connection': dict(),
+    'transports.message': dict(),
     'transports.utils': dict(),
     'utils._monotime': dict(
         sources=[
@@ -146,8 +151,7 @@ modules = {
         sources=[
             source_extension('utils.stats.timer'),
             os.path.join(here, 'src', 'cm_timer.c'),
-            os.path.join(here, 'src', 'cm_quantile.c'),
-            os.path.join(here, 'src', 'cm_heap.c'),
+            os.path.join(here, 'src', 'cm_sketch.c'),
         ],
         extra_compile_args=['-std=c99'],
     ),
@@ -36,6 +36,39 @@ int counter_add_sample(counter *counter, double sample) {
     return 0;
 }
 
+/**
+ * Adds all samples of other counter
+ * @arg dest The counter to add to
+ * @arg other The counter to add
+ * @return 0 on success.
+ */
+int counter_merge(counter *dest, counter *other) {
+    if (other->count == 0) return 0;
+    if (dest->count == 0 || other->min < dest->min) dest->min = other->min;
+    if (dest->count == 0 || other->max > dest->max) dest->max = other->max;
+    dest->count += other->count;
+    dest->sum += other->sum;
+    dest->squared_sum += other->squared_sum;
+    return 0;
+}
+
+/**
+ * Removes samples of other counter, that is earlier copy of this one.
+ * Minimum and maximum are kept.
+ * @arg dest The counter to remove from
+ * @arg other The counter to remove
+ * @return 0 on success.
+ */
+int counter_subtract(counter *dest, counter *other) {
+    // Counter was reset after copy was taken, all samples are new.
+    if (other->count > dest->count) return 0;
+    if (other->count == dest->count) return init_counter(dest);
+    dest->count -= other->count;
+    dest->sum -= other->sum;
+    dest->squared_sum -= other->squared_sum;
+    return 0;
+}
+
 /**
  * Returns the number of samples in the counter
  * @arg counter The counter to query
@@ -25,6 +25,23 @@ int init_counter(counter *counter);
  */
 int counter_add_sample(counter *counter, double sample);
 
+/**
+ * Adds all samples of other counter
+ * @arg dest The counter to add to
+ * @arg other The counter to add
+ * @return 0 on success.
+ */
+int counter_merge(counter *dest, counter *other);
+
+/**
+ * Removes samples of other counter, that is earlier copy of this one.
+ * Minimum and maximum are kept.
+ * @arg dest The counter to remove from
+ * @arg other The counter to remove
+ * @return 0 on success.
+ */
+int counter_subtract(counter *dest, counter *other);
+
 /**
  * Returns the number of samples in the counter
  * @arg counter The counter to query
@@ -0,0 +1,219 @@
+#include <math.h>
+#include <stdlib.h>
+#include <string.h>
+#include "cm_sketch.h"
+
+/* Static declarations */
+static int32_t sketch_index(cm_sketch *sketch, double sample);
+static void shift_bins(cm_sketch *sketch, int32_t offset);
+
+/**
+ * Initializes the sketch struct
+ * @arg eps The relative accuracy of quantiles, must be on (0, 1)
+ * @arg num_bins The number of buckets
+ * @arg sketch The sketch struct to initialize
+ * @return 0 on success.
+ */
+int init_cm_sketch(double eps, uint32_t num_bins, cm_sketch *sketch) {
+    if (eps <= 0 || eps >= 1 || num_bins == 0) return -1;
+    sketch->eps = eps;
+    sketch->gamma = (1 + eps) / (1 - eps);
+    sketch->log_gamma = log(sketch->gamma);
+    sketch->min_value = 1e-9;
+    sketch->num_bins = num_bins;
+    sketch->bins = calloc(num_bins, sizeof(uint64_t));
+    if (!sketch->bins) return -1;
+    cm_sketch_reset(sketch);
+    return 0;
+}
+
+/**
+ * Destroy the sketch struct.
+ * @arg sketch The sketch to destroy
+ * @return 0 on success.
+ */
+int destroy_cm_sketch(cm_sketch *sketch) {
+    free(sketch->bins);
+    sketch->bins = NULL;
+    return 0;
+}
+
+/**
+ * Removes all samples from the sketch
+ * @arg sketch The sketch to reset
+ */
+void cm_sketch_reset(cm_sketch *sketch) {
+    memset(sketch->bins, 0, sketch->num_bins * sizeof(uint64_t));
+    sketch->offset = 0;
+    sketch->populated = 0;
+    sketch->zero_count = 0;
+    sketch->count = 0;
+}
+
+/**
+ * Adds a new sample to the sketch
+ * @arg sketch The sketch to add to
+ * @arg sample The new sample value
+ * @return 0 on success.
+ */
+int cm_sketch_add(cm_sketch *sketch, double sample) {
+    if (sample != sample) return -1;
+    if (sample < sketch->min_value) {
+        sketch->zero_count++;
+        sketch->count++;
+        return 0;
+    }
+    return cm_sketch_add_bin(sketch, sketch_index(sketch, sample), 1);
+}
+
+/**
+ * Adds a bucket count to the sketch
+ * @arg sketch The sketch to add to
+ * @arg index The index of bucket
+ * @arg count The number of samples in bucket
+ * @return 0 on success.
+ */
+int cm_sketch_add_bin(cm_sketch *sketch, int32_t index, uint64_t count) {
+    int32_t last;
+    if (!count) return 0;
+    if (!sketch->populated) {
+        // Center first bucket, so window may grow to both sides.
+        sketch->offset = index - (int32_t)(sketch->num_bins / 2);
+        sketch->populated = 1;
+    }
+    last = sketch->offset + (int32_t)sketch->num_bins - 1;
+    if (index > last) {
+        // Move window up, lowest buckets are collapsed.
+        shift_bins(sketch, index - (int32_t)sketch->num_bins + 1);
+    } else if (index < sketch->offset) {
+        // Move window down if highest buckets are empty.
+        int32_t high = last;
+        while (high >= sketch->offset && !sketch->bins[high - sketch->offset])
+            high--;
+        if (high < index + (int32_t)sketch->num_bins) {
+            shift_bins(sketch, index);
+        } else {
+            index = sketch->offset;
+        }
+    }
+    sketch->bins[index - sketch->offset] += count;
+    sketch->count += count;
+    return 0;
+}
+
+/**
+ * Queries for a quantile value
+ * @arg sketch The sketch to query
+ * @arg quantile The quantile to query, must be on [0, 1]
+ * @return The value on success or 0.
+ */
+double cm_sketch_query(cm_sketch *sketch, double quantile) {
+    uint64_t rank, seen;
+    uint32_t i;
+    if (!sketch->count || quantile < 0 || quantile > 1) return 0;
+    rank = (uint64_t)(quantile * (sketch->count - 1));
+    if (rank < sketch->zero_count) return 0;
+    seen = sketch->zero_count;
+    for (i = 0; i < sketch->num_bins; i++) {
+        seen += sketch->bins[i];
+        if (seen > rank) {
+            // Middle of bucket in terms of relative error.
+            return 2 * pow(sketch->gamma, sketch->offset + (int32_t)i) /
+                (1 + sketch->gamma);
+        }
+    }
+    return 0;
+}
+
+/**
+ * Adds all samples of other sketch
+ * @arg sketch The sketch to add to
+ * @arg other The sketch with the same accuracy and number of buckets
+ * @return 0 on success, -1 if sketches are incompatible.
+ */
+int cm_sketch_merge(cm_sketch *sketch, cm_sketch *other) {
+    uint32_t i;
+    if (sketch->gamma != other->gamma || sketch->num_bins != other->num_bins)
+        return -1;
+    if (!sketch->populated) {
+        // Take window of other sketch, so nothing is collapsed.
+        memcpy(sketch->bins, other->bins, other->num_bins * sizeof(uint64_t));
+        sketch->offset = other->offset;
+        sketch->populated = other->populated;
+        sketch->zero_count += other->zero_count;
+        sketch->count += other->count;
+        return 0;
+    }
+    // Add from highest buckets, so window is moved at most once.
+    for (i = other->num_bins; i > 0; i--) {
+        cm_sketch_add_bin(sketch, other->offset + (int32_t)(i - 1),
+                          other->bins[i - 1]);
+    }
+    sketch->zero_count += other->zero_count;
+    sketch->count += other->zero_count;
+    return 0;
+}
+
+/**
+ * Removes samples of other sketch, that is earlier copy of this one
+ * @arg sketch The sketch to remove from
+ * @arg other The sketch with the same accuracy and number of buckets
+ * @return 0 on success, -1 if sketches are incompatible.
+ */
+int cm_sketch_subtract(cm_sketch *sketch, cm_sketch *other) {
+    uint32_t i;
+    int32_t index, last = (int32_t)sketch->num_bins - 1;
+    uint64_t count;
+    if (sketch->gamma != other->gamma || sketch->num_bins != other->num_bins)
+        return -1;
+    for (i = 0; i < other->num_bins; i++) {
+        if (!other->bins[i]) continue;
+        // Buckets below window were collapsed into the lowest one.
+        index = other->offset + (int32_t)i - sketch->offset;
+        if (index < 0) index = 0;
+        if (index > last) index = last;
+        count = other->bins[i];
+        if (count > sketch->bins[index]) count = sketch->bins[index];
+        sketch->bins[index] -= count;
+        sketch->count -= count;
+    }
+    count = other->zero_count;
+    if (count > sketch->zero_count) count = sketch->zero_count;
+    sketch->zero_count -= count;
+    sketch->count -= count;
+    return 0;
+}
+
+// Returns index of bucket for positive sample
+static int32_t sketch_index(cm_sketch *sketch, double sample) {
+    return (int32_t)ceil(log(sample) / sketch->log_gamma);
+}
+
+// Moves window of buckets to start at given offset
+static void shift_bins(cm_sketch *sketch, int32_t offset) {
+    int32_t shift = offset - sketch->offset;
+    uint32_t n = sketch->num_bins, i;
+    uint64_t collapsed = 0;
+    if (shift > 0) {
+        if ((uint32_t)shift >= n) {
+            for (i = 0; i < n; i++) collapsed += sketch->bins[i];
+            memset(sketch->bins, 0, n * sizeof(uint64_t));
+        } else {
+            for (i = 0; i < (uint32_t)shift; i++) collapsed += sketch->bins[i];
+            memmove(sketch->bins, sketch->bins + shift,
+                    (n - shift) * sizeof(uint64_t));
+            memset(sketch->bins + n - shift, 0, shift * sizeof(uint64_t));
+        }
+        sketch->bins[0] += collapsed;
+    } else if (shift < 0) {
+        shift = -shift;
+        if ((uint32_t)shift >= n) {
+            memset(sketch->bins, 0, n * sizeof(uint64_t));
+        } else {
+            memmove(sketch->bins + shift, sketch->bins,
+                    (n - shift) * sizeof(uint64_t));
+            memset(sketch->bins, 0, shift * sizeof(uint64_t));
+        }
+    }
+    sketch->offset = offset;
+}
@@ -0,0 +1,87 @@
+#ifndef CM_SKETCH_H
+#define CM_SKETCH_H
+#include <stdint.h>
+
+/**
+ * Mergeable quantile sketch with relative accuracy (DDSketch). Samples
+ * are counted in logarithmic buckets, so memory is fixed by number of
+ * buckets. When samples don't fit into buckets, lowest buckets are
+ * collapsed and only accuracy of lowest quantiles suffers.
+ */
+typedef struct {
+    double eps;           // Relative accuracy of quantiles
+    double gamma;         // Ratio of bucket bounds
+    double log_gamma;     // Natural logarithm of gamma
+    double min_value;     // Samples below are counted as zero
+    uint32_t num_bins;    // Number of buckets
+    int32_t offset;       // Index of first bucket
+    int populated;        // Is any bucket populated
+    uint64_t zero_count;  // Number of zero and negative samples
+    uint64_t count;       // Number of samples
+    uint64_t *bins;       // Counts of buckets
+} cm_sketch;
+
+/**
+ * Initializes the sketch struct
+ * @arg eps The relative accuracy of quantiles, must be on (0, 1)
+ * @arg num_bins The number of buckets
+ * @arg sketch The sketch struct to initialize
+ * @return 0 on success.
+ */
+int init_cm_sketch(double eps, uint32_t num_bins, cm_sketch *sketch);
+
+/**
+ * Destroy the sketch struct.
+ * @arg sketch The sketch to destroy
+ * @return 0 on success.
+ */
+int destroy_cm_sketch(cm_sketch *sketch);
+
+/**
+ * Adds a new sample to the sketch
+ * @arg sketch The sketch to add to
+ * @arg sample The new sample value
+ * @return 0 on success.
+ */
+int cm_sketch_add(cm_sketch *sketch, double sample);
+
+/**
+ * Adds a bucket count to the sketch
+ * @arg sketch The sketch to add to
+ * @arg index The index of bucket
+ * @arg count The number of samples in bucket
+ * @return 0 on success.
+ */
+int cm_sketch_add_bin(cm_sketch *sketch, int32_t index, uint64_t count);
+
+/**
+ * Queries for a quantile value
+ * @arg sketch The sketch to query
+ * @arg quantile The quantile to query, must be on [0, 1]
+ * @return The value on success or 0.
+ */
+double cm_sketch_query(cm_sketch *sketch, double quantile);
+
+/**
+ * Adds all samples of other sketch
+ * @arg sketch The sketch to add to
+ * @arg other The sketch with the same accuracy and number of buckets
+ * @return 0 on success, -1 if sketches are incompatible.
+ */
+int cm_sketch_merge(cm_sketch *sketch, cm_sketch *other);
+
+/**
+ * Removes samples of other sketch, that is earlier copy of this one
+ * @arg sketch The sketch to remove from
+ * @arg other The sketch with the same accuracy and number of buckets
+ * @return 0 on success, -1 if sketches are incompatible.
+ */
+int cm_sketch_subtract(cm_sketch *sketch, cm_sketch *other);
+
+/**
+ * Removes all samples from the sketch
+ * @arg sketch The sketch to reset
+ */
+void cm_sketch_reset(cm_sketch *sketch);
+
+#endif
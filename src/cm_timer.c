@@ -1,24 +1,18 @@
 #include <math.h>
 #include "cm_timer.h"
 
-/* Static declarations */
-static void finalize_timer(timer *timer);
-
 /**
  * Initializes the timer struct
- * @arg eps The maximum error for the quantiles
- * @arg quantiles A sorted array of double quantile values, must be on (0, 1)
- * @arg num_quants The number of entries in the quantiles array
- * @arg timeer The timer struct to initialize
+ * @arg eps The maximum relative error for the quantiles
+ * @arg num_bins The number of buckets of sketch
+ * @arg timer The timer struct to initialize
  * @return 0 on success.
  */
-int init_timer(double eps, double *quantiles, uint32_t num_quants, timer *timer) {
-    timer->count = 0;
-    timer->sum = 0;
-    timer->squared_sum = 0;
-    timer->finalized = 1;
-    int res = init_cm_quantile(eps, quantiles, num_quants, &timer->cm);
-    return res;
+int init_timer(double eps, uint32_t num_bins, timer *timer) {
+    int res = init_cm_sketch(eps, num_bins, &timer->sketch);
+    if (res) return res;
+    timer_reset(timer);
+    return 0;
 }
 
 /**
@@ -27,7 +21,7 @@ int init_timer(double eps, double *quantiles, uint32_t num_quants, timer *timer)
  * @return 0 on success.
  */
 int destroy_timer(timer *timer) {
-    return destroy_cm_quantile(&timer->cm);
+    return destroy_cm_sketch(&timer->sketch);
 }
 
 /**
@@ -37,11 +31,83 @@ int destroy_timer(timer *timer) {
  * @return 0 on success.
  */
 int timer_add_sample(timer *timer, double sample) {
+    if (!timer->count || sample < timer->min) timer->min = sample;
+    if (!timer->count || sample > timer->max) timer->max = sample;
     timer->count += 1;
     timer->sum += sample;
     timer->squared_sum += pow(sample, 2);
-    timer->finalized = 0;
-    return cm_add_sample(&timer->cm, sample);
+    return cm_sketch_add(&timer->sketch, sample);
+}
+
+/**
+ * Adds all samples of other timer
+ * @arg dest The timer to add to
+ * @arg other The timer with the same accuracy and number of buckets
+ * @return 0 on success, -1 if timers are incompatible.
+ */
+int timer_merge(timer *dest, timer *other) {
+    int res = cm_sketch_merge(&dest->sketch, &other->sketch);
+    if (res || !other->count) return res;
+    if (!dest->count || other->min < dest->min) dest->min = other->min;
+    if (!dest->count || other->max > dest->max) dest->max = other->max;
+    dest->count += other->count;
+    dest->sum += other->sum;
+    dest->squared_sum += other->squared_sum;
+    return 0;
+}
+
+/**
+ * Removes samples of other timer, that is earlier copy of this one.
+ * Minimum and maximum are estimated from remaining buckets.
+ * @arg dest The timer to remove from
+ * @arg other The timer with the same accuracy and number of buckets
+ * @return 0 on success, -1 if timers are incompatible.
+ */
+int timer_subtract(timer *dest, timer *other) {
+    cm_sketch *sketch = &dest->sketch;
+    uint32_t low, high;
+    double bound;
+    if (sketch->gamma != other->sketch.gamma ||
+            sketch->num_bins != other->sketch.num_bins)
+        return -1;
+    // Timer was reset after copy was taken, all samples are new.
+    if (other->count > dest->count) return 0;
+    if (other->count == dest->count) {
+        timer_reset(dest);
+        return 0;
+    }
+    cm_sketch_subtract(sketch, &other->sketch);
+    dest->count -= other->count;
+    dest->sum -= other->sum;
+    dest->squared_sum -= other->squared_sum;
+    for (low = 0; low < sketch->num_bins && !sketch->bins[low]; low++);
+    for (high = sketch->num_bins; high > low && !sketch->bins[high - 1];
+         high--);
+    if (low == high) {
+        // Only samples below precision of sketch are left.
+        if (sketch->zero_count) dest->max = sketch->min_value;
+        return 0;
+    }
+    if (!sketch->zero_count) {
+        bound = pow(sketch->gamma, sketch->offset + (int32_t)low - 1);
+        if (bound > dest->min) dest->min = bound;
+    }
+    bound = pow(sketch->gamma, sketch->offset + (int32_t)high - 1);
+    if (bound < dest->max) dest->max = bound;
+    return 0;
+}
+
+/**
+ * Removes all samples from the timer
+ * @arg timer The timer to reset
+ */
+void timer_reset(timer *timer) {
+    timer->count = 0;
+    timer->sum = 0;
+    timer->squared_sum = 0;
+    timer->min = 0;
+    timer->max = 0;
+    cm_sketch_reset(&timer->sketch);
 }
 
 /**
@@ -51,8 +117,13 @@ int timer_add_sample(timer *timer, double sample) {
  * @return The value on success or 0.
  */
 double timer_query(timer *timer, double quantile) {
-    finalize_timer(timer);
-    return cm_query(&timer->cm, quantile);
+    double value;
+    if (!timer->count) return 0;
+    value = cm_sketch_query(&timer->sketch, quantile);
+    // Sketch returns middle of bucket, keep it within seen values.
+    if (value < timer->min) return timer->min;
+    if (value > timer->max) return timer->max;
+    return value;
 }
 
 /**
@@ -67,12 +138,10 @@ uint64_t timer_count(timer *timer) {
 /**
  * Returns the minimum timer value
  * @arg timer The timer to query
- * @return The number of samples
+ * @return The minimum value
  */
 double timer_min(timer *timer) {
-    finalize_timer(timer);
-    if (!timer->cm.samples) return 0;
-    return timer->cm.samples->value;
+    return timer->min;
 }
 
 /**
@@ -120,18 +189,5 @@ double timer_squared_sum(timer *timer) {
  * @return The maximum value
  */
 double timer_max(timer *timer) {
-    finalize_timer(timer);
-    if (!timer->cm.end) return 0;
-    return timer->cm.end->value;
-}
-
-// Finalizes the timer for queries
-static void finalize_timer(timer *timer) {
-    if (timer->finalized) return;
-
-    // Force the quantile to flush internal
-    // buffers so that queries are accurate.
-    cm_flush(&timer->cm);
-
-    timer->finalized = 1;
+    return timer->max;
 }
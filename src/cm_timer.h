@@ -1,25 +1,25 @@
 #ifndef TIMER_H
 #define TIMER_H
 #include <stdint.h>
-#include "cm_quantile.h"
+#include "cm_sketch.h"
 
 typedef struct {
     uint64_t count;     // Count of items
     double sum;         // Sum of the values
     double squared_sum; // Sum of the squared values
-    int finalized;      // Is the cm_quantile finalized
-    cm_quantile cm;     // Quantile we use
+    double min;         // Minimum value
+    double max;         // Maximum value
+    cm_sketch sketch;   // Sketch we use for quantiles
 } timer;
 
 /**
  * Initializes the timer struct
- * @arg eps The maximum error for the quantiles
- * @arg quantiles A sorted array of double quantile values, must be on (0, 1)
- * @arg num_quants The number of entries in the quantiles array
- * @arg timeer The timer struct to initialize
+ * @arg eps The maximum relative error for the quantiles
+ * @arg num_bins The number of buckets of sketch
+ * @arg timer The timer struct to initialize
  * @return 0 on success.
  */
-int init_timer(double eps, double *quantiles, uint32_t num_quants, timer *timer);
+int init_timer(double eps, uint32_t num_bins, timer *timer);
 
 /**
  * Destroy the timer struct.
@@ -36,6 +36,12 @@ int destroy_timer(timer *timer);
  */
 int timer_add_sample(timer *timer, double sample);
 
+/**
+ * Removes all samples from the timer
+ * @arg timer The timer to reset
+ */
+void timer_reset(timer *timer);
+
 /**
  * Queries for a quantile value
  * @arg timer The timer to query
@@ -44,6 +50,23 @@ int timer_add_sample(timer *timer, double sample);
  */
 double timer_query(timer *timer, double quantile);
 
+/**
+ * Adds all samples of other timer
+ * @arg dest The timer to add to
+ * @arg other The timer with the same accuracy and number of buckets
+ * @return 0 on success, -1 if timers are incompatible.
+ */
+int timer_merge(timer *dest, timer *other);
+
+/**
+ * Removes samples of other timer, that is earlier copy of this one.
+ * Minimum and maximum are estimated from remaining buckets.
+ * @arg dest The timer to remove from
+ * @arg other The timer with the same accuracy and number of buckets
+ * @return 0 on success, -1 if timers are incompatible.
+ */
+int timer_subtract(timer *dest, timer *other);
+
 /**
  * Returns the number of samples in the timer
  * @arg timer The timer to query
@@ -54,7 +77,7 @@ uint64_t timer_count(timer *timer);
 /**
  * Returns the minimum timer value
  * @arg timer The timer to query
- * @return The number of samples
+ * @return The minimum value
  */
 double timer_min(timer *timer);
 
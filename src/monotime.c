@@ -41,6 +41,20 @@ static PyObject *monotonic(PyObject *self, PyObject *args)
   return Py_BuildValue("d", (double)(now * factor));
 }
 
+static PyObject *monotonic_ns(PyObject *self, PyObject *args)
+{
+  static mach_timebase_info_data_t timebase;
+
+  if (!PyArg_ParseTuple(args, ""))
+    return NULL;
+
+  if (!timebase.denom)
+    mach_timebase_info(&timebase);
+
+  return PyLong_FromUnsignedLongLong(
+      mach_absolute_time() * timebase.numer / timebase.denom);
+}
+
 
 #else  /* !__MACH__, so try POSIX.1-2001 */
 
@@ -73,6 +87,23 @@ static PyObject *monotonic(PyObject *self, PyObject *args)
   return Py_BuildValue("d", (double)(ts.tv_sec * 1.0 + ts.tv_nsec / 1e9));
 }
 
+static PyObject *monotonic_ns(PyObject *self, PyObject *args)
+{
+  struct timespec ts;
+
+  if (!PyArg_ParseTuple(args, ""))
+    return NULL;
+
+#ifdef CLOCK_MONOTONIC_RAW
+  if (clock_gettime(CLOCK_MONOTONIC_RAW, &ts) < 0)
+#endif
+  if (clock_gettime(CLOCK_MONOTONIC, &ts) < 0)
+    return PyErr_SetFromErrno(PyExc_OSError);
+
+  return PyLong_FromUnsignedLongLong(
+      (unsigned long long)ts.tv_sec * 1000000000ULL + ts.tv_nsec);
+}
+
 
 #endif  /* __MACH__ */
 
@@ -81,6 +112,9 @@ static PyMethodDef _monotime_methods[] = {
     { "monotonic", monotonic, METH_VARARGS,
         "Returns a strictly increasing number of seconds since\n"
         "an arbitrary start point." },
+    { "monotonic_ns", monotonic_ns, METH_VARARGS,
+        "Returns a strictly increasing number of nanoseconds since\n"
+        "the same start point as monotonic()." },
     { NULL, NULL, 0, NULL },  // sentinel
 };
 
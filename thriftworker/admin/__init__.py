@@ -0,0 +1,134 @@
+"""Service that expose runtime state of application over Thrift and plain
+HTTP. Requests are processed in loop, so they are answered even if all
+workers are busy.
+
+"""
+from __future__ import absolute_import
+
+import json
+from time import time
+
+from ..exporters.collector import STATS
+from ..transports.message import HTTP, peek_message
+from ..utils.mixin import LoopMixin
+
+from . import AdminService
+
+
+class HttpProtocol(object):
+    """Give access to raw HTTP request and response buffers."""
+
+    def __init__(self, trans):
+        self.trans = trans
+
+
+class HttpProtocolFactory(object):
+    """Create :class:`HttpProtocol` instances."""
+
+    def getProtocol(self, trans):
+        return HttpProtocol(trans)
+
+
+class AdminProcessor(AdminService.Processor):
+    """Process Thrift calls and HTTP requests of admin service. Return
+    name of called method like other processors do.
+
+    """
+
+    #: Handlers of HTTP paths.
+    paths = {'/stats': 'getStats', '/state': 'getState'}
+
+    def process(self, iprot, oprot):
+        if isinstance(iprot, HttpProtocol):
+            return self.process_http(iprot, oprot)
+        header = peek_message(iprot.trans.getvalue())
+        AdminService.Processor.process(self, iprot, oprot)
+        return header.name if header is not None else None
+
+    def process_http(self, iprot, oprot):
+        line = iprot.trans.getvalue().split(b'\r\n', 1)[0].split()
+        path = line[1].split(b'?', 1)[0] if len(line) > 1 else None
+        method = self.paths.get(path)
+        if method is None:
+            status, body = '404 Not Found', ''
+        else:
+            status, body = '200 OK', getattr(self._handler, method)()
+        oprot.trans.write(
+            'HTTP/1.0 {0}\r\nContent-Type: application/json\r\n'
+            'Content-Length: {1}\r\nConnection: close\r\n\r\n{2}'
+            .format(status, len(body), body if line[0] != 'HEAD' else ''))
+        return method or path
+
+
+class Admin(LoopMixin):
+    """Handler of admin service. All state is read in loop where it's
+    changed, so it's consistent without locks.
+
+    """
+
+    acceptor_cls = 'thriftworker.transports.admin:AdminAcceptor'
+
+    def __init__(self, name='Admin'):
+        self.name = name
+        super(Admin, self).__init__()
+
+    def register(self, host, port, backlog=None):
+        """Register admin service and its listener."""
+        self.app.services.register(
+            self.name, AdminProcessor(self),
+            protocols={HTTP: HttpProtocolFactory()}, inline=True,
+            acceptor=self.acceptor_cls)
+        self.app.listeners.register(self.name, host, port, backlog=backlog)
+
+    def stats(self):
+        """Return current statistics of application."""
+        app = self.app
+        result = {name: getattr(app, name).to_dict() for name in STATS}
+        coalescing = result['coalescing'] = {}
+        for coalescer in app.service_options('coalescing'):
+            coalescing.update(coalescer.to_dict())
+        result['timestamp'] = time()
+        return result
+
+    def state(self):
+        """Return state of acceptors, connections, worker and loop."""
+        app = self.app
+        worker = app.worker
+        acceptors, connections = {}, []
+        for acceptor in app.acceptors:
+            acceptors[acceptor.name] = {
+                'connections': acceptor.connections_number,
+                'active': acceptor.active}
+            for connection in acceptor:
+                connections.append({
+                    'service': acceptor.name,
+                    'peer': '{0[0]}:{0[1]}'.format(connection.peer),
+                    'inflight': connection.inflight,
+                    'protocol': connection.protocol,
+                    'bytes_in': connection.bytes_in,
+                    'bytes_out': connection.bytes_out,
+                    'frames_in': connection.frames_in,
+                    'frames_out': connection.frames_out,
+                    'age': connection.age,
+                    'idle': connection.idle})
+        loop = self.loop
+        started = loop.now()
+        loop.update_time()
+        monitor = app.hub.lag_monitor
+        return {'acceptors': acceptors,
+                'connections': connections,
+                'worker': {'pool_size': worker.pool_size,
+                           'concurrency': int(worker.concurrency),
+                           'queue_size': worker.queue_size},
+                # Time since current loop iteration started, ms.
+                'loop': {'lag': loop.now() - started,
+                         # Last drift of monitor timer, ms.
+                         'drift': monitor.lag if monitor.started else None,
+                         'stalls': monitor.stalls,
+                         'callbacks': app.hub.backlog}}
+
+    def getStats(self):
+        return json.dumps(self.stats(), sort_keys=True)
+
+    def getState(self):
+        return json.dumps(self.state(), sort_keys=True)
@@ -0,0 +1,12 @@
+/**
+ * Runtime state of thriftworker application. Values are JSON documents.
+ */
+service AdminService {
+
+  /** Snapshot of counters and timers. */
+  string getStats(),
+
+  /** Acceptors, connections, worker and loop state. */
+  string getState()
+
+}
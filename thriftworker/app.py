@@ -15,9 +15,10 @@ from .state import set_current_app, get_current_app
 from .listener import Listener, Listeners
 from .hub import Hub
 from .services import Services
+from .workers.hooks import Hooks
 from .utils.decorators import cached_property
 from .utils.mixin import SubclassMixin
-from .utils.stats import Counters, Timers
+from .utils.stats import Counters, Timers, HeavyHitters
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,24 @@ class ThriftWorker(SubclassMixin):
         self.timeouts = Timers()
         self.execution_timers = Timers()
         self.dispatching_timers = Timers()
+        self.queue_timers = Timers()
+        self.handback_timers = Timers()
+        self.write_timers = Timers()
+        # Sizes of requests and responses by method and of read chunks by
+        # service, in bytes.
+        self.request_sizes = Timers()
+        self.response_sizes = Timers()
+        self.read_sizes = Timers()
+        self.loop_lag = Timers()
+        # Busy and idle time of each worker thread, time in queue, queue
+        # depth and waits for queue mutex.
+        self.pool_timers = Timers()
+        # Tasks completed by each worker thread.
+        self.pool_counters = Counters()
+        self.shedding_counters = Counters()
+        # Traffic by peer host, bounded to heaviest hosts.
+        self.peer_requests = HeavyHitters()
+        self.peer_responses = HeavyHitters()
         # Set provided instance if we can.
         if loop is not None:
             self.loop = loop
@@ -107,6 +126,11 @@ class ThriftWorker(SubclassMixin):
         """Instance of bounded :class:`LoopContainer`."""
         return self.Hub()
 
+    @cached_property
+    def hooks(self):
+        """Registry of request lifecycle hooks."""
+        return Hooks()
+
     @cached_property
     def Services(self):
         """Create bounded :class:`Processor` class."""
@@ -145,6 +169,78 @@ class ThriftWorker(SubclassMixin):
         """Create pool of acceptors."""
         return self.Acceptors()
 
+    @cached_property
+    def Collector(self):
+        """Create bounded :class:`Collector` class."""
+        return self.subclass_with_self(
+            'thriftworker.exporters:Collector')
+
+    @cached_property
+    def collector(self):
+        """Create collector that snapshots statistics for exporters."""
+        return self.Collector()
+
+    @cached_property
+    def PrometheusExporter(self):
+        """Create bounded :class:`PrometheusExporter` class."""
+        return self.subclass_with_self(
+            'thriftworker.exporters:PrometheusExporter')
+
+    @cached_property
+    def StatsdExporter(self):
+        """Create bounded :class:`StatsdExporter` class."""
+        return self.subclass_with_self(
+            'thriftworker.exporters:StatsdExporter')
+
+    @cached_property
+    def Admin(self):
+        """Create bounded :class:`Admin` class."""
+        return self.subclass_with_self('thriftworker.admin:Admin')
+
+    def service_options(self, name):
+        """Return distinct options of registered services with given
+        name, like their caches or coalescers.
+
+        """
+        options = {}
+        for service_name in self.services:
+            option = getattr(self.services[service_name], name)
+            if option is not None:
+                options[id(option)] = option
+        return list(options.values())
+
+    @property
+    def coalescing_counters(self):
+        """Counters of coalescers of all services, by method and kind."""
+        result = Counters()
+        for coalescer in self.service_options('coalescing'):
+            result.merge(coalescer.stats())
+        return result
+
+    @property
+    def cache_counters(self):
+        """Hits, misses and evictions of caches of all services."""
+        result = Counters()
+        for cache in self.service_options('cache'):
+            result.merge(cache.stats())
+        return result
+
+    @property
+    def batch_sizes(self):
+        """Sizes of batches of all services, by method."""
+        result = Timers()
+        for batcher in self.service_options('batching'):
+            result.merge(batcher.sizes)
+        return result
+
+    @property
+    def batch_delays(self):
+        """How long first requests of batches waited, by method."""
+        result = Timers()
+        for batcher in self.service_options('batching'):
+            result.merge(batcher.delays)
+        return result
+
     @property
     def worker_cls(self):
         if self.pool_size == 1:
@@ -9,6 +9,34 @@ LENGTH_FORMAT = '!i'
 
 LENGTH_SIZE = calcsize(LENGTH_FORMAT)
 
+PEEK_SIZE = 256
+
+COMPRESSION_THRESHOLD = 1024
+
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
 BACKLOG_SIZE = 1024
 
+QUEUE_SIZE = 1024
+
+CACHE_SIZE = 64 * 1024 * 1024
+
+CACHE_TTL = 60.0
+
+BATCH_WINDOW = 2.0
+
+BATCH_SIZE = 64
+
+CLIENT_POOL_SIZE = 4
+
+CLIENT_TIMEOUT = 5.0
+
+STATS_INTERVAL = 10.0
+
+STATSD_PACKET_SIZE = 512
+
+HEAVY_HITTERS_CAPACITY = 64
+
+LAG_INTERVAL = 0.1
+
 NONBLOCKING = (errno.EAGAIN, errno.EWOULDBLOCK)
@@ -8,3 +8,19 @@ class AllocationError(Exception):
 
 class BindError(Exception):
     """Error on socket binding."""
+
+
+class Timeout(Exception):
+    """Operation didn't complete in time."""
+
+
+class PoolFull(Exception):
+    """Backlog of greenlet pool is full."""
+
+
+class ClientError(Exception):
+    """Call of downstream service failed."""
+
+
+class ClientTimeout(ClientError, Timeout):
+    """Downstream service didn't answer in time."""
@@ -0,0 +1,6 @@
+"""Ship collected statistics to monitoring systems."""
+from __future__ import absolute_import
+
+from .collector import Collector, Snapshot
+from .prometheus import PrometheusExporter
+from .statsd import StatsdExporter
@@ -0,0 +1,104 @@
+from __future__ import absolute_import
+
+import logging
+from time import time
+from collections import namedtuple
+
+from pyuv import Timer
+
+from ..constants import STATS_INTERVAL
+from ..utils.loop import in_loop
+from ..utils.mixin import LoopMixin
+
+logger = logging.getLogger(__name__)
+
+#: Statistics collected at some moment. Deltas contain samples added since
+#: previous snapshot, totals contain all samples.
+Snapshot = namedtuple('Snapshot', 'timestamp interval deltas totals')
+
+#: Statistics of application that we collect.
+STATS = ('counters', 'shedding_counters', 'timeouts', 'execution_timers',
+         'dispatching_timers', 'queue_timers', 'handback_timers',
+         'write_timers', 'request_sizes', 'response_sizes', 'read_sizes',
+         'peer_requests', 'peer_responses', 'loop_lag', 'pool_timers',
+         'pool_counters', 'coalescing_counters', 'cache_counters',
+         'batch_sizes', 'batch_delays')
+
+
+class Collector(LoopMixin):
+    """Periodically copy statistics of application to snapshot. Stats of
+    application stay cumulative, deltas are found by subtracting previous
+    totals, and new snapshot replaces previous one at once. Exporters read
+    snapshots without touching stats that are updated by workers.
+
+    """
+
+    def __init__(self, interval=None):
+        self.interval = interval or STATS_INTERVAL
+        self.snapshot = Snapshot(time(), 0.0, {}, {})
+        self.callbacks = []
+        self.samplers = []
+        self._timer = None
+        super(Collector, self).__init__()
+
+    @property
+    def started(self):
+        return self._timer is not None
+
+    def add_callback(self, callback):
+        """Call given function with each new snapshot in loop."""
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def add_sampler(self, sampler):
+        """Call given function in loop before each snapshot, so it can add
+        samples of current state, like depth of queue.
+
+        """
+        self.samplers.append(sampler)
+
+    def remove_sampler(self, sampler):
+        if sampler in self.samplers:
+            self.samplers.remove(sampler)
+
+    @in_loop
+    def collect(self):
+        """Make new snapshot from current statistics."""
+        for sampler in list(self.samplers):
+            try:
+                sampler()
+            except Exception as exc:
+                logger.exception(exc)
+        previous = self.snapshot
+        now = time()
+        deltas, totals = {}, {}
+        for name in STATS:
+            total = totals[name] = getattr(self.app, name).snapshot()
+            delta = deltas[name] = total.snapshot()
+            if name in previous.totals:
+                delta.subtract(previous.totals[name])
+        snapshot = self.snapshot = Snapshot(now, now - previous.timestamp,
+                                            deltas, totals)
+        for callback in list(self.callbacks):
+            try:
+                callback(snapshot)
+            except Exception as exc:
+                logger.exception(exc)
+        return snapshot
+
+    @in_loop
+    def start(self):
+        if self._timer is not None:
+            return
+        self.snapshot = self.snapshot._replace(timestamp=time())
+        timer = self._timer = Timer(self.loop)
+        timer.start(lambda h: self.collect(), self.interval, self.interval)
+
+    @in_loop
+    def stop(self):
+        timer, self._timer = self._timer, None
+        if timer is not None and not timer.closed:
+            timer.close()
@@ -0,0 +1,149 @@
+from __future__ import absolute_import
+
+import logging
+
+from pyuv import TCP
+
+from ..constants import BACKLOG_SIZE
+from ..utils.loop import in_loop
+from ..utils.mixin import LoopMixin
+from ..utils.stats import Timers
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4'
+
+# Limit size of request we are ready to read.
+MAX_REQUEST_SIZE = 8192
+
+
+def escape(value):
+    """Escape value of label."""
+    return str(value).replace('\\', r'\\').replace('"', r'\"') \
+        .replace('\n', r'\n')
+
+
+def format_value(value):
+    return repr(float(value))
+
+
+def render(totals, prefix='thriftworker'):
+    """Render statistics in Prometheus text format. Timers are exported
+    as summaries with quantiles, counters as summaries without them.
+
+    """
+    lines = []
+    for group in sorted(totals):
+        stats = totals[group]
+        metric = '{0}_{1}'.format(prefix, group)
+        lines.append('# TYPE {0} summary'.format(metric))
+        is_timers = isinstance(stats, Timers)
+        for key in sorted(stats):
+            value = stats[key]
+            label = 'name="{0}"'.format(escape(key))
+            if is_timers:
+                for quantile in value.quantiles:
+                    lines.append('{0}{{{1},quantile="{2!r}"}} {3}'.format(
+                        metric, label, quantile,
+                        format_value(value.query(quantile))))
+            lines.append('{0}_sum{{{1}}} {2}'.format(
+                metric, label, format_value(value.sum)))
+            lines.append('{0}_count{{{1}}} {2}'.format(
+                metric, label, value.count))
+    return '\n'.join(lines) + '\n'
+
+
+class PrometheusExporter(LoopMixin):
+    """Serve last snapshot of statistics over HTTP for Prometheus. Text is
+    rendered once per snapshot in loop.
+
+    """
+
+    def __init__(self, address, path='/metrics', prefix='thriftworker',
+                 backlog=None):
+        self.address = address
+        self.path = path
+        self.prefix = prefix
+        self.backlog = backlog or BACKLOG_SIZE
+        self.handle = None
+        self.connections = set()
+        self._rendered = (None, None)
+        super(PrometheusExporter, self).__init__()
+
+    @property
+    def collector(self):
+        return self.app.collector
+
+    @property
+    def port(self):
+        """Return binded port number."""
+        return self.handle.getsockname()[1]
+
+    def render(self):
+        """Return text of current snapshot."""
+        snapshot = self.collector.snapshot
+        rendered_snapshot, text = self._rendered
+        if rendered_snapshot is not snapshot:
+            text = render(snapshot.totals, self.prefix)
+            self._rendered = (snapshot, text)
+        return text
+
+    def respond(self, request):
+        lines = request.split('\r\n', 1)[0].split()
+        if len(lines) < 2 or lines[0] not in ('GET', 'HEAD'):
+            status, body = '405 Method Not Allowed', ''
+        elif lines[1].split('?', 1)[0] != self.path:
+            status, body = '404 Not Found', ''
+        else:
+            status, body = '200 OK', self.render()
+        head = ('HTTP/1.0 {0}\r\nContent-Type: {1}\r\n'
+                'Content-Length: {2}\r\nConnection: close\r\n\r\n'
+                .format(status, CONTENT_TYPE, len(body)))
+        return head if lines and lines[0] == 'HEAD' else head + body
+
+    def cb_close(self, connection):
+        self.connections.discard(connection)
+
+    def cb_connection(self, handle, error):
+        if error:
+            logger.error('Exporter failed to accept connection: %r', error)
+            return
+        connection = TCP(self.loop)
+        handle.accept(connection)
+        # Keep connection alive until response is written.
+        self.connections.add(connection)
+        buf = []
+
+        def cb_read(connection, data, error):
+            if error or data is None:
+                connection.close(self.cb_close)
+                return
+            buf.append(data)
+            request = b''.join(buf)
+            if b'\r\n\r\n' not in request and \
+                    len(request) < MAX_REQUEST_SIZE:
+                return
+            connection.stop_read()
+            connection.write(self.respond(request),
+                             lambda h, error: h.close(self.cb_close))
+
+        connection.start_read(cb_read)
+
+    @in_loop
+    def start(self):
+        """Listen for scrapes and start collector."""
+        if self.handle is not None:
+            return
+        handle = self.handle = TCP(self.loop)
+        handle.bind(self.address)
+        handle.listen(self.cb_connection, self.backlog)
+        self.collector.start()
+
+    @in_loop
+    def stop(self):
+        handle, self.handle = self.handle, None
+        if handle is not None and not handle.closed:
+            handle.close()
+        for connection in list(self.connections):
+            if not connection.closed:
+                connection.close(self.cb_close)
@@ -0,0 +1,106 @@
+from __future__ import absolute_import
+
+import logging
+import re
+
+from pyuv import UDP
+
+from ..constants import STATSD_PACKET_SIZE
+from ..utils.loop import in_loop
+from ..utils.mixin import LoopMixin
+from ..utils.stats import Timers
+
+logger = logging.getLogger(__name__)
+
+#: Characters that may break statsd line, like ``:``, ``|``, ``@`` or
+#: whitespace.
+UNSAFE_RE = re.compile(r'[^\w.\-]')
+
+
+def format_key(key):
+    """Replace unsafe characters of given key with underscores."""
+    return UNSAFE_RE.sub('_', str(key))
+
+
+def format_metrics(deltas, prefix='thriftworker'):
+    """Return statsd lines for statistics of one interval. Counts and sums
+    are sent as counters, timers as gauges of their quantiles.
+
+    """
+    lines = []
+    for group in sorted(deltas):
+        stats = deltas[group]
+        is_timers = isinstance(stats, Timers)
+        for key in sorted(stats):
+            value = stats[key]
+            if not value.count:
+                continue
+            name = '{0}.{1}.{2}'.format(prefix, group, format_key(key))
+            lines.append('{0}.count:{1}|c'.format(name, value.count))
+            if is_timers:
+                lines.append('{0}.mean:{1!r}|g'.format(name, value.mean))
+                lines.append('{0}.max:{1!r}|g'.format(name, value.max))
+                for label, quantile in sorted(value.query_all().items()):
+                    lines.append('{0}.{1}:{2!r}|g'.format(
+                        name, label.replace('.', '_'), quantile))
+            else:
+                lines.append('{0}.sum:{1!r}|c'.format(name, value.sum))
+    return lines
+
+
+def pack(lines, size=None):
+    """Join lines into packets not bigger than given size if possible."""
+    size = size or STATSD_PACKET_SIZE
+    packets, packet = [], ''
+    for line in lines:
+        if packet and len(packet) + len(line) + 1 > size:
+            packets.append(packet)
+            packet = ''
+        packet = packet + '\n' + line if packet else line
+    if packet:
+        packets.append(packet)
+    return packets
+
+
+class StatsdExporter(LoopMixin):
+    """Push statistics of each collected interval to statsd over UDP."""
+
+    def __init__(self, address, prefix='thriftworker', packet_size=None):
+        self.address = address
+        self.prefix = prefix
+        self.packet_size = packet_size or STATSD_PACKET_SIZE
+        self.handle = None
+        super(StatsdExporter, self).__init__()
+
+    @property
+    def collector(self):
+        return self.app.collector
+
+    def cb_send(self, handle, error):
+        if error:
+            logger.warning('Statsd packet not sent: %r', error)
+
+    def push(self, snapshot):
+        """Send deltas of given snapshot."""
+        handle = self.handle
+        if handle is None or handle.closed:
+            return
+        lines = format_metrics(snapshot.deltas, self.prefix)
+        for packet in pack(lines, self.packet_size):
+            handle.send(self.address, packet, self.cb_send)
+
+    @in_loop
+    def start(self):
+        """Subscribe to snapshots of collector and start it."""
+        if self.handle is not None:
+            return
+        self.handle = UDP(self.loop)
+        self.collector.add_callback(self.push)
+        self.collector.start()
+
+    @in_loop
+    def stop(self):
+        self.collector.remove_callback(self.push)
+        handle, self.handle = self.handle, None
+        if handle is not None and not handle.closed:
+            handle.close()
@@ -3,4 +3,6 @@ from __future__ import absolute_import
 from .loop import Hub
 from .waiter import Waiter
 from .task import Greenlet
-from .utils import sleep
+from .client import Client
+from .pool import GreenletPool
+from .utils import sleep, with_timeout
@@ -0,0 +1,280 @@
+"""Thrift client that call downstream services from greenlets of hub.
+
+Calls are sent over pool of framed connections to endpoint. Many calls
+may wait for their replies on the same connection, sequence ids are
+replaced on the wire to match replies to calls.
+
+"""
+from __future__ import absolute_import
+
+import logging
+from struct import Struct
+from cStringIO import StringIO
+
+from pyuv import TCP
+from pyuv.errno import strerror
+from thrift.Thrift import TMessageType
+from thrift.transport.TTransport import TTransportBase, TMemoryBuffer
+
+from ..constants import LENGTH_FORMAT, LENGTH_SIZE, MAX_FRAME_SIZE, \
+    CLIENT_POOL_SIZE, CLIENT_TIMEOUT
+from ..exceptions import ClientError, ClientTimeout
+from ..transports.message import peek_message, BINARY
+
+logger = logging.getLogger(__name__)
+
+length_struct = Struct(LENGTH_FORMAT)
+seqid_struct = Struct('!i')
+
+
+def wait(hub, waiter, timeout):
+    """Wait for given waiter at most *timeout* seconds."""
+    if not timeout:
+        return waiter.get()
+    entry = hub.timers.schedule(
+        timeout, waiter.throw, ClientTimeout,
+        ClientTimeout('Timeout happened after {0} seconds'.format(timeout)))
+    try:
+        return waiter.get()
+    finally:
+        entry.cancel()
+
+
+class Channel(object):
+    """Framed connection to endpoint that carry many calls at once."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.hub = pool.hub
+        self.handle = None
+        self.connected = False
+        self.closed = False
+        self.next_seqid = 0
+        # Calls that wait for reply, by sequence id on the wire.
+        self.pending = {}
+        # Greenlets that wait for connection.
+        self.waiters = []
+        self.buffer = bytearray()
+
+    def __len__(self):
+        """Return number of calls that wait for connection or reply."""
+        return len(self.pending) + len(self.waiters)
+
+    def __repr__(self):
+        return '<{0}({1}, {2} waiting) at {3}>'.format(
+            type(self).__name__, self.pool.address, len(self), hex(id(self)))
+
+    def open(self, timeout=None):
+        """Connect to endpoint if not connected yet."""
+        if self.connected:
+            return
+        elif self.closed:
+            raise ClientError('Connection to {0} closed'
+                              .format(self.pool.address))
+        waiter = self.hub.Waiter()
+        self.waiters.append(waiter)
+        if self.handle is None:
+            self.handle = TCP(self.hub.loop)
+            self.handle.connect(self.pool.address, self.cb_connect)
+        try:
+            wait(self.hub, waiter, timeout)
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+
+    def cb_connect(self, handle, error):
+        waiters, self.waiters = self.waiters, []
+        if error:
+            self.close('Connection to {0} failed: {1}'
+                       .format(self.pool.address, strerror(error)))
+            for waiter in waiters:
+                waiter.throw(ClientError, ClientError(
+                    'Connection to {0} failed: {1}'
+                    .format(self.pool.address, strerror(error))))
+            return
+        self.connected = True
+        handle.nodelay(True)
+        handle.start_read(self.cb_read)
+        for waiter in waiters:
+            waiter.switch()
+
+    def close(self, reason='Connection closed'):
+        """Close connection and fail all pending calls."""
+        if self.closed:
+            return
+        self.closed = True
+        self.connected = False
+        pending, self.pending = self.pending, {}
+        if self.handle is not None and not self.handle.closed:
+            self.handle.close()
+        for waiter, _ in pending.values():
+            # Close may be called out of hub greenlet.
+            self.hub.callback(waiter.throw, ClientError, ClientError(reason))
+        self.pool.discard(self)
+
+    def call(self, payload, header, timeout=None):
+        """Send call and wait for reply. Return ``None`` for oneway call."""
+        seqid = self.next_seqid = (self.next_seqid + 1) & 0x7fffffff
+        data = self.pool.replace_seqid(payload, header, seqid)
+        self.handle.write(length_struct.pack(len(data)) + data,
+                          self.cb_write)
+        if header.type == TMessageType.ONEWAY:
+            return None
+        waiter = self.hub.Waiter()
+        self.pending[seqid] = (waiter, header.seqid)
+        try:
+            return wait(self.hub, waiter, timeout)
+        finally:
+            self.pending.pop(seqid, None)
+
+    def cb_write(self, handle, error):
+        if error:
+            self.close('Write to {0} failed: {1}'
+                       .format(self.pool.address, strerror(error)))
+
+    def cb_read(self, handle, data, error):
+        if error:
+            self.close('Connection to {0} lost: {1}'
+                       .format(self.pool.address, strerror(error)))
+            return
+        buf = self.buffer
+        buf.extend(data)
+        while len(buf) >= LENGTH_SIZE:
+            length = length_struct.unpack_from(buf)[0]
+            if length <= 0 or length > MAX_FRAME_SIZE:
+                self.close('Bad frame from {0}'.format(self.pool.address))
+                return
+            end = LENGTH_SIZE + length
+            if len(buf) < end:
+                break
+            frame = bytes(buf[LENGTH_SIZE:end])
+            del buf[:end]
+            header = peek_message(frame)
+            entry = self.pending.pop(header.seqid, None) \
+                if header is not None else None
+            if entry is None:
+                logger.warning('Unexpected reply from %s: %r',
+                               self.pool.address, header)
+                continue
+            waiter, seqid = entry
+            waiter.switch(self.pool.replace_seqid(frame, header, seqid))
+
+
+class ClientPool(object):
+    """Pool of connections to one endpoint."""
+
+    def __init__(self, hub, address, size=None, timeout=None,
+                 proto_factory=None):
+        self.hub = hub
+        self.address = address
+        self.size = size or CLIENT_POOL_SIZE
+        self.timeout = timeout or CLIENT_TIMEOUT
+        self.proto_factory = proto_factory or hub.app.protocol_factory
+        self.channels = []
+
+    def __len__(self):
+        """Return number of connections."""
+        return len(self.channels)
+
+    def __repr__(self):
+        return '<{0}({1}, {2}/{3}) at {4}>'.format(
+            type(self).__name__, self.address, len(self), self.size,
+            hex(id(self)))
+
+    def discard(self, channel):
+        """Forget closed connection."""
+        if channel in self.channels:
+            self.channels.remove(channel)
+
+    def close(self):
+        """Close all connections."""
+        for channel in list(self.channels):
+            channel.close()
+
+    def replace_seqid(self, payload, header, seqid):
+        """Return message with other sequence id."""
+        if header.protocol == BINARY:
+            # Sequence id is the last field of binary header.
+            return payload[:header.size - 4] + seqid_struct.pack(seqid) + \
+                payload[header.size:]
+        transport = TMemoryBuffer()
+        self.proto_factory.getProtocol(transport).writeMessageBegin(
+            header.name, header.type, seqid)
+        return transport.getvalue() + payload[header.size:]
+
+    def acquire(self):
+        """Return least loaded connection, open new one if all are busy."""
+        channels = self.channels
+        channel = min(channels, key=len) if channels else None
+        if channel is None or (len(channel) and len(channels) < self.size):
+            channel = Channel(self)
+            channels.append(channel)
+        return channel
+
+    def call(self, payload, timeout=None):
+        """Send serialized call and return serialized reply."""
+        header = peek_message(payload)
+        if header is None:
+            raise ClientError('Message header can not be read')
+        timeout = timeout or self.timeout
+        channel = self.acquire()
+        channel.open(timeout)
+        return channel.call(payload, header, timeout)
+
+
+class CallTransport(TTransportBase):
+    """Transport of one call that send written message on flush."""
+
+    def __init__(self, pool, timeout=None):
+        self.pool = pool
+        self.timeout = timeout
+        self.output = []
+        self.input = StringIO()
+
+    def isOpen(self):
+        return True
+
+    def write(self, data):
+        self.output.append(data)
+
+    def flush(self):
+        payload, self.output = ''.join(self.output), []
+        self.input = StringIO(self.pool.call(payload, self.timeout) or '')
+
+    def read(self, sz):
+        return self.input.read(sz)
+
+
+class Client(object):
+    """Call methods of client class generated by thrift from greenlets of
+    hub. Each call blocks only its greenlet.
+
+    :param client_class: ``Client`` class of generated service
+    :param address: tuple of host and port of endpoint
+    :param pool_size: how many connections may be opened to endpoint
+    :param timeout: how many seconds we wait for connection and reply
+
+    """
+
+    def __init__(self, hub, client_class, address, pool_size=None,
+                 timeout=None, proto_factory=None):
+        self.client_class = client_class
+        self.pool = ClientPool(hub, address, pool_size, timeout,
+                               proto_factory)
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not hasattr(self.client_class, name):
+            raise AttributeError(name)
+        pool, client_class = self.pool, self.client_class
+
+        def inner_call(*args, **kwargs):
+            transport = CallTransport(pool)
+            client = client_class(pool.proto_factory.getProtocol(transport))
+            return getattr(client, name)(*args, **kwargs)
+
+        inner_call.__name__ = name
+        return inner_call
+
+    def close(self):
+        """Close all connections to endpoint."""
+        self.pool.close()
@@ -0,0 +1,89 @@
+"""Measure how late loop handles its events."""
+from __future__ import absolute_import
+
+import sys
+import logging
+import traceback
+from threading import Event
+from thread import start_new_thread, get_ident
+
+from pyuv import Timer
+
+from ..constants import LAG_INTERVAL
+from ..utils.loop import in_loop
+from ..utils.monotime import monotonic
+
+logger = logging.getLogger(__name__)
+
+
+class LagMonitor(object):
+    """Measure lag of loop as drift of periodic timer (``'timer'`` key of
+    given timers) and wait of callbacks sent from other threads
+    (``'callback'`` key), both in milliseconds. If `threshold` in seconds
+    is given, stack of loop thread is logged when loop doesn't handle
+    timer that long.
+
+    """
+
+    def __init__(self, queue, timers, interval=None, threshold=None):
+        self.queue = queue
+        self.timers = timers
+        self.interval = interval or LAG_INTERVAL
+        self.threshold = threshold
+        # Last measured drift of timer, ms.
+        self.lag = None
+        # Number of times loop was blocked longer than threshold.
+        self.stalls = 0
+        self._handle = None
+        self._heartbeat = None
+        self._stopped = None
+
+    @property
+    def started(self):
+        return self._handle is not None
+
+    def _tick(self, handle):
+        now = monotonic()
+        lag = self.lag = max(now - self._heartbeat - self.interval, 0) * 1e3
+        self.timers['timer'].add(lag)
+        self._heartbeat = now
+
+    def _watch(self, ident, stopped):
+        """Log stack of loop thread once per stall longer than threshold."""
+        reported = None
+        while not stopped.wait(self.threshold / 2.0):
+            heartbeat = self._heartbeat
+            blocked = monotonic() - heartbeat - self.interval
+            if blocked < self.threshold or heartbeat == reported:
+                continue
+            reported = heartbeat
+            self.stalls += 1
+            frame = sys._current_frames().get(ident)
+            if frame is None:
+                continue
+            logger.warning('Loop is blocked for %.2f ms:\n%s', blocked * 1e3,
+                           ''.join(traceback.format_stack(frame)))
+
+    @in_loop
+    def start(self):
+        if self._handle is not None:
+            return
+        self.queue.timer = self.timers['callback']
+        self._heartbeat = monotonic()
+        handle = self._handle = Timer(self.queue.loop)
+        handle.start(self._tick, self.interval, self.interval)
+        if self.threshold is not None:
+            self._stopped = Event()
+            start_new_thread(self._watch, (get_ident(), self._stopped))
+
+    @in_loop
+    def stop(self):
+        handle, self._handle = self._handle, None
+        if handle is None:
+            return
+        self.queue.timer = None
+        stopped, self._stopped = self._stopped, None
+        if stopped is not None:
+            stopped.set()
+        if not handle.closed:
+            handle.close()
@@ -16,7 +16,11 @@ from ..utils.decorators import cached_property
 
 from .waiter import Waiter
 from .task import Greenlet
+from .client import Client
+from .pool import GreenletPool
+from .timers import TimerHeap
 from .queue import AsyncQueue
+from .lag import LagMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +94,8 @@ class Hub(LoopMixin):
     def __init__(self):
         self.Waiter = partial(Waiter, self)
         self.Greenlet = partial(Greenlet, self)
+        self.Client = partial(Client, self)
+        self.GreenletPool = partial(GreenletPool, self)
         self._started = Event()
         self._stopped = Event()
 
@@ -98,6 +104,21 @@ class Hub(LoopMixin):
         """Create async queue here."""
         return AsyncQueue(self.loop)
 
+    @property
+    def backlog(self):
+        """Number of callbacks waiting for loop."""
+        return len(self._async_queue)
+
+    @cached_property
+    def lag_monitor(self):
+        """Monitor of loop lag, should be started explicitly."""
+        return LagMonitor(self._async_queue, self.app.loop_lag)
+
+    @cached_property
+    def timers(self):
+        """Heap of timeouts shared by all greenlets."""
+        return TimerHeap(self.loop)
+
     @cached_property
     def _greenlet(self):
         """Greenlet in which we run loop."""
@@ -136,7 +157,10 @@ class Hub(LoopMixin):
 
     def _teardown_loop(self, loop):
         loop.excepthook = None
+        if 'lag_monitor' in self.__dict__:
+            self.lag_monitor.stop()
         self._async_queue.close()
+        self.timers.close()
         del self._greenlet
         del self._guard
 
@@ -0,0 +1,70 @@
+"""Bounded pool of greenlets."""
+from __future__ import absolute_import
+
+from collections import deque
+
+from ..exceptions import PoolFull
+
+
+class GreenletPool(object):
+    """Run functions in greenlets, at most *size* of them at once. Other
+    greenlets wait in backlog until running ones finish. Should be used
+    only from loop thread.
+
+    :param size: how many greenlets may run at once
+    :param backlog: how many greenlets may wait, unlimited by default
+
+    """
+
+    def __init__(self, hub, size, backlog=None):
+        if size < 1:
+            raise ValueError('Pool size must be positive.')
+        self.hub = hub
+        self.size = size
+        self.backlog = backlog
+        self.greenlets = set()
+        self.queue = deque()
+
+    def __len__(self):
+        """Return number of running greenlets."""
+        return len(self.greenlets)
+
+    def __repr__(self):
+        return '<{0}({1}/{2}, {3} waiting) at {4}>'.format(
+            type(self).__name__, len(self), self.size, len(self.queue),
+            hex(id(self)))
+
+    def full(self):
+        """Will new greenlet wait in backlog?"""
+        return len(self.greenlets) >= self.size
+
+    def spawn(self, run, *args, **kwargs):
+        """Return new :class:`Greenlet` that will be started when pool has
+        room for it. Raise :class:`PoolFull` if backlog is full.
+
+        """
+        greenlet = self.hub.Greenlet(run, *args, **kwargs)
+        if not self.full():
+            self._start(greenlet)
+        elif self.backlog is not None and len(self.queue) >= self.backlog:
+            raise PoolFull('Backlog of {0!r} is full'.format(self))
+        else:
+            self.queue.append(greenlet)
+        return greenlet
+
+    def _start(self, greenlet):
+        self.greenlets.add(greenlet)
+        greenlet.rawlink(self._discard)
+        greenlet.start()
+
+    def _discard(self, greenlet):
+        self.greenlets.discard(greenlet)
+        if self.queue and not self.full():
+            self._start(self.queue.popleft())
+
+    def join(self):
+        """Wait until all running and waiting greenlets finish."""
+        while self.greenlets or self.queue:
+            greenlets = list(self.greenlets) or [self.queue[0]]
+            for greenlet in greenlets:
+                greenlet.join()
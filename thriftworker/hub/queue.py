@@ -6,6 +6,8 @@ from collections import deque
 
 import pyuv
 
+from ..utils.monotime import monotonic
+
 logger = logging.getLogger(__name__)
 noop = lambda h: None
 
@@ -33,6 +35,11 @@ class AsyncQueue(object):
             self._dispatcher.unref()
         self._tick = pyuv.Async(loop, self._spin_up)
         self._spinner = pyuv.Idle(self.loop)
+        self._timer = None
+
+    def __len__(self):
+        """Number of messages waiting for dispatch."""
+        return len(self._queue)
 
     def send(self, msg):
         """ add a message to the queue
@@ -45,6 +52,32 @@ class AsyncQueue(object):
         if not self._tick.closed:
             self._tick.send()
 
+    def _timed_send(self, msg):
+        """Send message that record how long it waited for dispatch."""
+        timer, sent = self._timer, monotonic()
+
+        def timed_msg():
+            timer.add((monotonic() - sent) * 1000.0)
+            msg()
+
+        AsyncQueue.send(self, timed_msg)
+
+    @property
+    def timer(self):
+        """Timer of milliseconds messages wait for dispatch, may be
+        ``None``. Messages are stamped only when it's set.
+
+        """
+        return self._timer
+
+    @timer.setter
+    def timer(self, timer):
+        self._timer = timer
+        if timer is None:
+            self.__dict__.pop('send', None)
+        else:
+            self.send = self._timed_send
+
     def close(self):
         """ close the queue """
         self._queue.clear()
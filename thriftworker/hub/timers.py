@@ -0,0 +1,95 @@
+"""Timeouts of greenlets that share one loop timer."""
+from __future__ import absolute_import
+
+import heapq
+import logging
+from itertools import count
+
+from pyuv import Timer
+
+logger = logging.getLogger(__name__)
+
+
+class TimerEntry(object):
+    """Scheduled call that may be cancelled."""
+
+    __slots__ = ['deadline', 'callback', 'args', 'active']
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self):
+        """Prevent call if it's not done yet."""
+        self.active = False
+        self.callback = self.args = None
+
+
+class TimerHeap(object):
+    """Schedule calls with heap of deadlines driven by single loop timer.
+    Should be used only from loop thread.
+
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self._heap = []
+        self._counter = count()
+        self._handle = None
+        self._deadline = None
+
+    def __len__(self):
+        """Return number of scheduled calls, cancelled included."""
+        return len(self._heap)
+
+    def __repr__(self):
+        return '<{0}({1} scheduled) at {2}>'.format(
+            type(self).__name__, len(self), hex(id(self)))
+
+    def schedule(self, seconds, callback, *args):
+        """Call function after given number of seconds, return
+        :class:`TimerEntry`.
+
+        """
+        deadline = self.loop.now() + max(seconds, 0) * 1e3
+        entry = TimerEntry(deadline, callback, args)
+        heapq.heappush(self._heap, (deadline, next(self._counter), entry))
+        if self._deadline is None or deadline < self._deadline:
+            self._arm(deadline)
+        return entry
+
+    def _arm(self, deadline):
+        handle = self._handle
+        if handle is None or handle.closed:
+            handle = self._handle = Timer(self.loop)
+        self._deadline = deadline
+        handle.start(self._expire,
+                     max(deadline - self.loop.now(), 0) / 1e3, 0)
+
+    def _expire(self, handle):
+        heap = self._heap
+        now = self.loop.now()
+        self._deadline = None
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)[2]
+            if entry.active:
+                callback, args = entry.callback, entry.args
+                entry.cancel()
+                try:
+                    callback(*args)
+                except Exception as exc:
+                    logger.exception(exc)
+        # Drop cancelled entries from top.
+        while heap and not heap[0][2].active:
+            heapq.heappop(heap)
+        if heap:
+            self._arm(heap[0][0])
+
+    def close(self):
+        """Drop scheduled calls and close timer."""
+        del self._heap[:]
+        self._deadline = None
+        if self._handle is not None and not self._handle.closed:
+            self._handle.close()
@@ -1,9 +1,10 @@
 from __future__ import absolute_import
 
 from six import PY3
-from pyuv import Timer
+from greenlet import getcurrent
 
 from ..state import current_app
+from ..exceptions import Timeout
 
 
 class _NONE(object):
@@ -43,9 +44,27 @@ def sleep(seconds=0):
     """
     hub = current_app.hub
     loop = current_app.loop
+    waiter = hub.Waiter()
     if seconds <= 0:
-        waiter = hub.Waiter()
         loop.callback(waiter.switch)
         waiter.get()
     else:
-        hub.wait(Timer(loop), seconds, False)
+        entry = hub.timers.schedule(seconds, waiter.switch)
+        try:
+            waiter.get()
+        finally:
+            entry.cancel()
+
+
+def with_timeout(seconds, func, *args, **kwargs):
+    """Call function in current greenlet, raise :class:`Timeout` if it
+    doesn't return in *seconds*.
+
+    """
+    exception = Timeout('Timeout happened after {0} seconds'.format(seconds))
+    entry = current_app.hub.timers.schedule(seconds, getcurrent().throw,
+                                            exception)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        entry.cancel()
@@ -9,7 +9,7 @@ from pyuv import Pipe
 from .constants import BACKLOG_SIZE
 from .exceptions import BindError
 from .utils.mixin import LoopMixin
-from .utils.loop import in_loop
+from .utils.loop import in_loop, submit_many, wait_all
 from .utils.decorators import cached_property
 from .utils.other import get_addresses_from_pool
 
@@ -123,6 +123,18 @@ class Listeners(LoopMixin):
         """Return enumerated mapping of listeners."""
         return {i: listener for i, listener in enumerate(self._listeners)}
 
+    def start(self):
+        """Start all registered listeners with one loop wakeup."""
+        wait_all(submit_many((listener.start.func,)
+                             for listener in self._listeners
+                             if not listener.started))
+
+    def stop(self):
+        """Stop all started listeners with one loop wakeup."""
+        wait_all(submit_many((listener.stop.func,)
+                             for listener in self._listeners
+                             if listener.started))
+
     def register(self, name, host, port, backlog=None):
         """Register new listener with given parameters."""
         listener = self.Listener(name, (host, port), backlog=backlog)
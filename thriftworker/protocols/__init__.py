@@ -0,0 +1,73 @@
+"""Protocols that serialize structs with compiled codec.
+
+Structs generated with ``thrift --gen py:dynamic`` delegate serialization to
+:meth:`readStruct` and :meth:`writeStruct` of protocol, so they are encoded
+and decoded by :mod:`thriftworker.protocols.codec` in one call. Other
+structs are processed field by field as by base protocol, which is much
+slower than default :class:`TBinaryProtocolAccelerated`, so keep default
+for them. With dynamic structs :class:`CompactProtocol` gives compact
+encoding at speed of binary one, while :class:`BinaryProtocol` is on par
+with default protocol. See ``benchmarks/codec.py``.
+
+"""
+from __future__ import absolute_import
+
+from thrift.protocol.TProtocol import TProtocolBase
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.protocol.TCompactProtocol import TCompactProtocol
+
+from . import codec
+
+
+class CodecMixin:
+    """Read and write whole structs with codec functions."""
+
+    encode = decode = None
+
+    def readStruct(self, obj, thrift_spec):
+        buf = getattr(self.trans, 'cstringio_buf', None)
+        if buf is None:
+            return TProtocolBase.readStruct(self, obj, thrift_spec)
+        position = buf.tell()
+        try:
+            size = self.decode(obj, thrift_spec, buf.read())
+        except EOFError:
+            # Struct isn't buffered completely, let transport refill it.
+            buf.seek(position)
+            return TProtocolBase.readStruct(self, obj, thrift_spec)
+        buf.seek(position + size)
+
+    def writeStruct(self, obj, thrift_spec):
+        self.trans.write(self.encode(obj, thrift_spec))
+
+
+class BinaryProtocol(CodecMixin, TBinaryProtocol):
+    """Binary protocol with compiled codec."""
+
+    encode = staticmethod(codec.encode_binary)
+    decode = staticmethod(codec.decode_binary)
+
+
+class CompactProtocol(CodecMixin, TCompactProtocol):
+    """Compact protocol with compiled codec."""
+
+    encode = staticmethod(codec.encode_compact)
+    decode = staticmethod(codec.decode_compact)
+
+
+class BinaryProtocolFactory(object):
+    """Create :class:`BinaryProtocol` instances."""
+
+    def __init__(self, strictRead=False, strictWrite=True):
+        self.strictRead = strictRead
+        self.strictWrite = strictWrite
+
+    def getProtocol(self, trans):
+        return BinaryProtocol(trans, self.strictRead, self.strictWrite)
+
+
+class CompactProtocolFactory(object):
+    """Create :class:`CompactProtocol` instances."""
+
+    def getProtocol(self, trans):
+        return CompactProtocol(trans)
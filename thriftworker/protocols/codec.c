@@ -0,0 +1,19276 @@
+/* Generated by Cython 0.29.36 */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_36"
+#define CYTHON_HEX_VERSION 0x001D24F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__thriftworker__protocols__codec
+#define __PYX_HAVE_API__thriftworker__protocols__codec
+/* Early includes */
+#include <stdint.h>
+#include <string.h>
+#include <stdio.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "thriftworker/protocols/codec.pyx",
+  "stringsource",
+  "type.pxd",
+};
+
+/*--- Type declarations ---*/
+struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec;
+struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec;
+struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec;
+struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer;
+struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer;
+
+/* "thriftworker/protocols/codec.pyx":12
+ * 
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     T_STOP = 0
+ *     T_BOOL = 2
+ */
+enum  {
+  __pyx_e_12thriftworker_9protocols_5codec_T_STOP = 0,
+  __pyx_e_12thriftworker_9protocols_5codec_T_BOOL = 2,
+  __pyx_e_12thriftworker_9protocols_5codec_T_BYTE = 3,
+  __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE = 4,
+  __pyx_e_12thriftworker_9protocols_5codec_T_I16 = 6,
+  __pyx_e_12thriftworker_9protocols_5codec_T_I32 = 8,
+  __pyx_e_12thriftworker_9protocols_5codec_T_I64 = 10,
+  __pyx_e_12thriftworker_9protocols_5codec_T_STRING = 11,
+  __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT = 12,
+  __pyx_e_12thriftworker_9protocols_5codec_T_MAP = 13,
+  __pyx_e_12thriftworker_9protocols_5codec_T_SET = 14,
+  __pyx_e_12thriftworker_9protocols_5codec_T_LIST = 15,
+  __pyx_e_12thriftworker_9protocols_5codec_C_STOP = 0,
+  __pyx_e_12thriftworker_9protocols_5codec_C_TRUE = 1,
+  __pyx_e_12thriftworker_9protocols_5codec_C_FALSE = 2,
+  __pyx_e_12thriftworker_9protocols_5codec_C_BYTE = 3,
+  __pyx_e_12thriftworker_9protocols_5codec_C_I16 = 4,
+  __pyx_e_12thriftworker_9protocols_5codec_C_I32 = 5,
+  __pyx_e_12thriftworker_9protocols_5codec_C_I64 = 6,
+  __pyx_e_12thriftworker_9protocols_5codec_C_DOUBLE = 7,
+  __pyx_e_12thriftworker_9protocols_5codec_C_BINARY = 8,
+  __pyx_e_12thriftworker_9protocols_5codec_C_LIST = 9,
+  __pyx_e_12thriftworker_9protocols_5codec_C_SET = 10,
+  __pyx_e_12thriftworker_9protocols_5codec_C_MAP = 11,
+  __pyx_e_12thriftworker_9protocols_5codec_C_STRUCT = 12,
+  __pyx_e_12thriftworker_9protocols_5codec_MAX_DEPTH = 64
+};
+
+/* "thriftworker/protocols/codec.pyx":105
+ * 
+ * 
+ * cdef class TypeSpec:             # <<<<<<<<<<<<<<
+ *     """Type of value with compiled arguments."""
+ * 
+ */
+struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec {
+  PyObject_HEAD
+  int ttype;
+  int ctype;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *value;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *key;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_struct;
+};
+
+
+/* "thriftworker/protocols/codec.pyx":120
+ * 
+ * 
+ * cdef class FieldSpec:             # <<<<<<<<<<<<<<
+ *     """Field of struct."""
+ * 
+ */
+struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec {
+  PyObject_HEAD
+  int fid;
+  PyObject *name;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *type;
+};
+
+
+/* "thriftworker/protocols/codec.pyx":102
+ * #-----------------------------------------------------------------------------
+ * 
+ * cdef class StructSpec             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_StructSpec *__pyx_vtab;
+  PyObject *cls;
+  PyObject *fields;
+  PyObject *by_id;
+};
+
+
+/* "thriftworker/protocols/codec.pyx":200
+ * #-----------------------------------------------------------------------------
+ * 
+ * cdef class OutputBuffer:             # <<<<<<<<<<<<<<
+ *     """Growing output buffer."""
+ * 
+ */
+struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_vtab;
+  char *data;
+  Py_ssize_t size;
+  Py_ssize_t capacity;
+};
+
+
+/* "thriftworker/protocols/codec.pyx":277
+ * 
+ * 
+ * cdef class InputBuffer:             # <<<<<<<<<<<<<<
+ *     """Read values from bytes."""
+ * 
+ */
+struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_InputBuffer *__pyx_vtab;
+  PyObject *value;
+  unsigned char const *data;
+  Py_ssize_t position;
+  Py_ssize_t length;
+};
+
+
+
+/* "thriftworker/protocols/codec.pyx":128
+ * 
+ * 
+ * cdef class StructSpec:             # <<<<<<<<<<<<<<
+ *     """Struct class with its fields."""
+ * 
+ */
+
+struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_StructSpec {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *(*lookup)(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *, int);
+};
+static struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_StructSpec *__pyx_vtabptr_12thriftworker_9protocols_5codec_StructSpec;
+static CYTHON_INLINE struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_f_12thriftworker_9protocols_5codec_10StructSpec_lookup(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *, int);
+
+
+/* "thriftworker/protocols/codec.pyx":200
+ * #-----------------------------------------------------------------------------
+ * 
+ * cdef class OutputBuffer:             # <<<<<<<<<<<<<<
+ *     """Growing output buffer."""
+ * 
+ */
+
+struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer {
+  int (*reserve)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, Py_ssize_t);
+  int (*write_byte)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint8_t);
+  int (*write_raw)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, char const *, Py_ssize_t);
+  int (*write_big)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t, int);
+  int (*write_little)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t, int);
+  int (*write_varint)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t);
+  PyObject *(*getvalue)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *);
+};
+static struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_vtabptr_12thriftworker_9protocols_5codec_OutputBuffer;
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint8_t);
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_raw(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, char const *, Py_ssize_t);
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t, int);
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_little(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t, int);
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t);
+static CYTHON_INLINE PyObject *__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_getvalue(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *);
+
+
+/* "thriftworker/protocols/codec.pyx":277
+ * 
+ * 
+ * cdef class InputBuffer:             # <<<<<<<<<<<<<<
+ *     """Read values from bytes."""
+ * 
+ */
+
+struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_InputBuffer {
+  int (*ensure)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, Py_ssize_t);
+  int (*read_byte)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *);
+  uint64_t (*read_big)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, int);
+  uint64_t (*read_little)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, int);
+  uint64_t (*read_varint)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *);
+  PyObject *(*read_raw)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, Py_ssize_t);
+};
+static struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_InputBuffer *__pyx_vtabptr_12thriftworker_9protocols_5codec_InputBuffer;
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, Py_ssize_t);
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *);
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, int);
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_little(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, int);
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *);
+static CYTHON_INLINE PyObject *__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_raw(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, Py_ssize_t);
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
+/* UnpackUnboundCMethod.proto */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+} __Pyx_CachedCFunction;
+
+/* CallUnboundCMethod1.proto */
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
+
+/* CallUnboundCMethod2.proto */
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2);
+#else
+#define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
+#endif
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kwdict, const char* function_name, int kw_allowed);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* RaiseNoneIterError.proto */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+/* UnpackTupleError.proto */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto */
+#define __Pyx_unpack_tuple2(tuple, value1, value2, is_tuple, has_known_size, decref_tuple)\
+    (likely(is_tuple || PyTuple_Check(tuple)) ?\
+        (likely(has_known_size || PyTuple_GET_SIZE(tuple) == 2) ?\
+            __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple) :\
+            (__Pyx_UnpackTupleError(tuple, 2), -1)) :\
+        __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple))
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_36
+#define __PYX_HAVE_RT_ImportType_proto_0_29_36
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_36(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_36(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_36 {
+   __Pyx_ImportType_CheckSize_Error_0_29_36 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_36 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_36 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_36(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_36 check_size);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int8_t __Pyx_PyInt_As_int8_t(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int16_t __Pyx_PyInt_As_int16_t(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int32_t __Pyx_PyInt_As_int32_t(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int8_t(int8_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int16_t(int16_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int32_t(int32_t value);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static CYTHON_INLINE struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_f_12thriftworker_9protocols_5codec_10StructSpec_lookup(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_self, int __pyx_v_fid); /* proto*/
+static int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_reserve(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, Py_ssize_t __pyx_v_length); /* proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, uint8_t __pyx_v_value); /* proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_raw(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, char const *__pyx_v_value, Py_ssize_t __pyx_v_length); /* proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, uint64_t __pyx_v_value, int __pyx_v_length); /* proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_little(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, uint64_t __pyx_v_value, int __pyx_v_length); /* proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, uint64_t __pyx_v_value); /* proto*/
+static CYTHON_INLINE PyObject *__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_getvalue(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self); /* proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, Py_ssize_t __pyx_v_length); /* proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self); /* proto*/
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, int __pyx_v_length); /* proto*/
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_little(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, int __pyx_v_length); /* proto*/
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self); /* proto*/
+static CYTHON_INLINE PyObject *__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_raw(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, Py_ssize_t __pyx_v_length); /* proto*/
+
+/* Module declarations from 'libc.stdint' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.bytes' */
+
+/* Module declarations from 'thriftworker.protocols.codec' */
+static PyTypeObject *__pyx_ptype_12thriftworker_9protocols_5codec_StructSpec = 0;
+static PyTypeObject *__pyx_ptype_12thriftworker_9protocols_5codec_TypeSpec = 0;
+static PyTypeObject *__pyx_ptype_12thriftworker_9protocols_5codec_FieldSpec = 0;
+static PyTypeObject *__pyx_ptype_12thriftworker_9protocols_5codec_OutputBuffer = 0;
+static PyTypeObject *__pyx_ptype_12thriftworker_9protocols_5codec_InputBuffer = 0;
+static PyObject *__pyx_v_12thriftworker_9protocols_5codec_structs = 0;
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_to_ctype(int); /*proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_to_ttype(int); /*proto*/
+static struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_f_12thriftworker_9protocols_5codec_compile_type(int, PyObject *, PyObject *); /*proto*/
+static struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_f_12thriftworker_9protocols_5codec_compile_struct(PyObject *, PyObject *, PyObject *); /*proto*/
+static struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_f_12thriftworker_9protocols_5codec_get_struct(PyObject *, PyObject *); /*proto*/
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_zigzag(int64_t); /*proto*/
+static CYTHON_INLINE int64_t __pyx_f_12thriftworker_9protocols_5codec_unzigzag(uint64_t); /*proto*/
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_double_bits(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_12thriftworker_9protocols_5codec_bits_double(uint64_t); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_12thriftworker_9protocols_5codec_to_bytes(PyObject *); /*proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_check_type(int, int); /*proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_check_size(int64_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_check_depth(int); /*proto*/
+static int __pyx_f_12thriftworker_9protocols_5codec_write_binary_value(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *, PyObject *); /*proto*/
+static int __pyx_f_12thriftworker_9protocols_5codec_write_binary_struct(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *, PyObject *); /*proto*/
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec_read_binary_value(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *); /*proto*/
+static int __pyx_f_12thriftworker_9protocols_5codec_skip_binary(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, int, int); /*proto*/
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec_read_binary_struct(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *, PyObject *); /*proto*/
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_write_compact_size(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, int, Py_ssize_t); /*proto*/
+static int __pyx_f_12thriftworker_9protocols_5codec_write_compact_value(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *, PyObject *); /*proto*/
+static int __pyx_f_12thriftworker_9protocols_5codec_write_compact_struct(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *, PyObject *); /*proto*/
+static CYTHON_INLINE int64_t __pyx_f_12thriftworker_9protocols_5codec_read_compact_size(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *); /*proto*/
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec_read_compact_value(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *); /*proto*/
+static int __pyx_f_12thriftworker_9protocols_5codec_skip_compact(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, int, int); /*proto*/
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec_read_compact_struct(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *, PyObject *); /*proto*/
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_TypeSpec__set_state(struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *, PyObject *); /*proto*/
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_FieldSpec__set_state(struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *, PyObject *); /*proto*/
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_StructSpec__set_state(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *, PyObject *); /*proto*/
+#define __Pyx_MODULE_NAME "thriftworker.protocols.codec"
+extern int __pyx_module_is_main_thriftworker__protocols__codec;
+int __pyx_module_is_main_thriftworker__protocols__codec = 0;
+
+/* Implementation of 'thriftworker.protocols.codec' */
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_EOFError;
+static const char __pyx_k_get[] = "get";
+static const char __pyx_k_inp[] = "inp";
+static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_obj[] = "obj";
+static const char __pyx_k_out[] = "out";
+static const char __pyx_k_data[] = "data";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_class[] = "__class__";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_value[] = "value";
+static const char __pyx_k_format[] = "format";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_EOFError[] = "EOFError";
+static const char __pyx_k_TypeSpec[] = "TypeSpec";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_position[] = "position";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_FieldSpec[] = "FieldSpec";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_iteritems[] = "iteritems";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_StructSpec[] = "StructSpec";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_DEPTH_LIMIT[] = "DEPTH_LIMIT";
+static const char __pyx_k_InputBuffer[] = "InputBuffer";
+static const char __pyx_k_MemoryError[] = "MemoryError";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_thrift_spec[] = "thrift_spec";
+static const char __pyx_k_INVALID_DATA[] = "INVALID_DATA";
+static const char __pyx_k_OutputBuffer[] = "OutputBuffer";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_NEGATIVE_SIZE[] = "NEGATIVE_SIZE";
+static const char __pyx_k_decode_binary[] = "decode_binary";
+static const char __pyx_k_encode_binary[] = "encode_binary";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_decode_compact[] = "decode_compact";
+static const char __pyx_k_encode_compact[] = "encode_compact";
+static const char __pyx_k_unknown_type_0[] = "unknown type {0}";
+static const char __pyx_k_negative_size_0[] = "negative size {0}";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_too_deep_nesting[] = "too deep nesting";
+static const char __pyx_k_TProtocolException[] = "TProtocolException";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_varint_is_too_long[] = "varint is too long";
+static const char __pyx_k_position_out_of_range[] = "position out of range";
+static const char __pyx_k_pyx_unpickle_TypeSpec[] = "__pyx_unpickle_TypeSpec";
+static const char __pyx_k_pyx_unpickle_FieldSpec[] = "__pyx_unpickle_FieldSpec";
+static const char __pyx_k_unknown_compact_type_0[] = "unknown compact type {0}";
+static const char __pyx_k_pyx_unpickle_StructSpec[] = "__pyx_unpickle_StructSpec";
+static const char __pyx_k_thrift_protocol_TProtocol[] = "thrift.protocol.TProtocol";
+static const char __pyx_k_expected_type_0_received_1[] = "expected type {0}, received {1}";
+static const char __pyx_k_thriftworker_protocols_codec[] = "thriftworker.protocols.codec";
+static const char __pyx_k_Encode_and_decode_Thrift_structs[] = "Encode and decode Thrift structs with compiled ``thrift_spec`` tables.";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0xfd374a6, 0x5147eee, 0x734ef0a) = (ctype, key, struct, ttype, value))";
+static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static const char __pyx_k_thriftworker_protocols_codec_pyx[] = "thriftworker/protocols/codec.pyx";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_2[] = "Incompatible checksums (0x%x vs (0xc7c5c28, 0x1ce2014, 0x3cdc14a) = (fid, name, type))";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_3[] = "Incompatible checksums (0x%x vs (0xd5acf4f, 0xc55953b, 0x2775343) = (by_id, cls, fields))";
+static PyObject *__pyx_n_s_DEPTH_LIMIT;
+static PyObject *__pyx_n_s_EOFError;
+static PyObject *__pyx_n_s_FieldSpec;
+static PyObject *__pyx_n_s_INVALID_DATA;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_3;
+static PyObject *__pyx_n_s_InputBuffer;
+static PyObject *__pyx_n_s_MemoryError;
+static PyObject *__pyx_n_s_NEGATIVE_SIZE;
+static PyObject *__pyx_n_s_OutputBuffer;
+static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_StructSpec;
+static PyObject *__pyx_n_s_TProtocolException;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_TypeSpec;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_s_class;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_decode_binary;
+static PyObject *__pyx_n_s_decode_compact;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_encode_binary;
+static PyObject *__pyx_n_s_encode_compact;
+static PyObject *__pyx_kp_s_expected_type_0_received_1;
+static PyObject *__pyx_n_s_format;
+static PyObject *__pyx_n_s_get;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_inp;
+static PyObject *__pyx_n_s_iteritems;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_s_negative_size_0;
+static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+static PyObject *__pyx_n_s_obj;
+static PyObject *__pyx_n_s_out;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_position;
+static PyObject *__pyx_kp_s_position_out_of_range;
+static PyObject *__pyx_n_s_pyx_PickleError;
+static PyObject *__pyx_n_s_pyx_checksum;
+static PyObject *__pyx_n_s_pyx_result;
+static PyObject *__pyx_n_s_pyx_state;
+static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_FieldSpec;
+static PyObject *__pyx_n_s_pyx_unpickle_StructSpec;
+static PyObject *__pyx_n_s_pyx_unpickle_TypeSpec;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_thrift_protocol_TProtocol;
+static PyObject *__pyx_n_s_thrift_spec;
+static PyObject *__pyx_n_s_thriftworker_protocols_codec;
+static PyObject *__pyx_kp_s_thriftworker_protocols_codec_pyx;
+static PyObject *__pyx_kp_s_too_deep_nesting;
+static PyObject *__pyx_kp_s_unknown_compact_type_0;
+static PyObject *__pyx_kp_s_unknown_type_0;
+static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_n_s_value;
+static PyObject *__pyx_kp_s_varint_is_too_long;
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_8TypeSpec___reduce_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_8TypeSpec_2__setstate_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_9FieldSpec___reduce_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_9FieldSpec_2__setstate_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_10StructSpec___reduce_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_10StructSpec_2__setstate_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer___cinit__(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self); /* proto */
+static void __pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_2__dealloc__(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_4__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_6__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer___cinit__(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, PyObject *__pyx_v_value, Py_ssize_t __pyx_v_position); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_encode_binary(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_thrift_spec); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_2decode_binary(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_thrift_spec, PyObject *__pyx_v_data, Py_ssize_t __pyx_v_position); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_4encode_compact(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_thrift_spec); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_6decode_compact(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_thrift_spec, PyObject *__pyx_v_data, Py_ssize_t __pyx_v_position); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_8__pyx_unpickle_TypeSpec(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_10__pyx_unpickle_FieldSpec(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_12__pyx_unpickle_StructSpec(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_StructSpec(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_TypeSpec(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_FieldSpec(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_OutputBuffer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_InputBuffer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_get = {0, &__pyx_n_s_get, 0, 0, 0};
+static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_update = {0, &__pyx_n_s_update, 0, 0, 0};
+static PyObject *__pyx_int_30285844;
+static PyObject *__pyx_int_41374531;
+static PyObject *__pyx_int_63816010;
+static PyObject *__pyx_int_85229294;
+static PyObject *__pyx_int_120909578;
+static PyObject *__pyx_int_206935355;
+static PyObject *__pyx_int_209476648;
+static PyObject *__pyx_int_224055119;
+static PyObject *__pyx_int_265516198;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__17;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_codeobj__10;
+static PyObject *__pyx_codeobj__12;
+static PyObject *__pyx_codeobj__14;
+static PyObject *__pyx_codeobj__16;
+static PyObject *__pyx_codeobj__18;
+static PyObject *__pyx_codeobj__20;
+static PyObject *__pyx_codeobj__22;
+/* Late includes */
+
+/* "thriftworker/protocols/codec.pyx":44
+ * 
+ * 
+ * cdef inline int to_ctype(int ttype) except -1:             # <<<<<<<<<<<<<<
+ *     if ttype == T_BOOL:
+ *         return C_TRUE
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_to_ctype(int __pyx_v_ttype) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("to_ctype", 0);
+
+  /* "thriftworker/protocols/codec.pyx":45
+ * 
+ * cdef inline int to_ctype(int ttype) except -1:
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         return C_TRUE
+ *     elif ttype == T_BYTE:
+ */
+  switch (__pyx_v_ttype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BOOL:
+
+    /* "thriftworker/protocols/codec.pyx":46
+ * cdef inline int to_ctype(int ttype) except -1:
+ *     if ttype == T_BOOL:
+ *         return C_TRUE             # <<<<<<<<<<<<<<
+ *     elif ttype == T_BYTE:
+ *         return C_BYTE
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_TRUE;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":45
+ * 
+ * cdef inline int to_ctype(int ttype) except -1:
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         return C_TRUE
+ *     elif ttype == T_BYTE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BYTE:
+
+    /* "thriftworker/protocols/codec.pyx":48
+ *         return C_TRUE
+ *     elif ttype == T_BYTE:
+ *         return C_BYTE             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I16:
+ *         return C_I16
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_BYTE;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":47
+ *     if ttype == T_BOOL:
+ *         return C_TRUE
+ *     elif ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         return C_BYTE
+ *     elif ttype == T_I16:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I16:
+
+    /* "thriftworker/protocols/codec.pyx":50
+ *         return C_BYTE
+ *     elif ttype == T_I16:
+ *         return C_I16             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I32:
+ *         return C_I32
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_I16;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":49
+ *     elif ttype == T_BYTE:
+ *         return C_BYTE
+ *     elif ttype == T_I16:             # <<<<<<<<<<<<<<
+ *         return C_I16
+ *     elif ttype == T_I32:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I32:
+
+    /* "thriftworker/protocols/codec.pyx":52
+ *         return C_I16
+ *     elif ttype == T_I32:
+ *         return C_I32             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I64:
+ *         return C_I64
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_I32;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":51
+ *     elif ttype == T_I16:
+ *         return C_I16
+ *     elif ttype == T_I32:             # <<<<<<<<<<<<<<
+ *         return C_I32
+ *     elif ttype == T_I64:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I64:
+
+    /* "thriftworker/protocols/codec.pyx":54
+ *         return C_I32
+ *     elif ttype == T_I64:
+ *         return C_I64             # <<<<<<<<<<<<<<
+ *     elif ttype == T_DOUBLE:
+ *         return C_DOUBLE
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_I64;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":53
+ *     elif ttype == T_I32:
+ *         return C_I32
+ *     elif ttype == T_I64:             # <<<<<<<<<<<<<<
+ *         return C_I64
+ *     elif ttype == T_DOUBLE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE:
+
+    /* "thriftworker/protocols/codec.pyx":56
+ *         return C_I64
+ *     elif ttype == T_DOUBLE:
+ *         return C_DOUBLE             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRING:
+ *         return C_BINARY
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_DOUBLE;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":55
+ *     elif ttype == T_I64:
+ *         return C_I64
+ *     elif ttype == T_DOUBLE:             # <<<<<<<<<<<<<<
+ *         return C_DOUBLE
+ *     elif ttype == T_STRING:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRING:
+
+    /* "thriftworker/protocols/codec.pyx":58
+ *         return C_DOUBLE
+ *     elif ttype == T_STRING:
+ *         return C_BINARY             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRUCT:
+ *         return C_STRUCT
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_BINARY;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":57
+ *     elif ttype == T_DOUBLE:
+ *         return C_DOUBLE
+ *     elif ttype == T_STRING:             # <<<<<<<<<<<<<<
+ *         return C_BINARY
+ *     elif ttype == T_STRUCT:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":60
+ *         return C_BINARY
+ *     elif ttype == T_STRUCT:
+ *         return C_STRUCT             # <<<<<<<<<<<<<<
+ *     elif ttype == T_MAP:
+ *         return C_MAP
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_STRUCT;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":59
+ *     elif ttype == T_STRING:
+ *         return C_BINARY
+ *     elif ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         return C_STRUCT
+ *     elif ttype == T_MAP:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":62
+ *         return C_STRUCT
+ *     elif ttype == T_MAP:
+ *         return C_MAP             # <<<<<<<<<<<<<<
+ *     elif ttype == T_SET:
+ *         return C_SET
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_MAP;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":61
+ *     elif ttype == T_STRUCT:
+ *         return C_STRUCT
+ *     elif ttype == T_MAP:             # <<<<<<<<<<<<<<
+ *         return C_MAP
+ *     elif ttype == T_SET:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_SET:
+
+    /* "thriftworker/protocols/codec.pyx":64
+ *         return C_MAP
+ *     elif ttype == T_SET:
+ *         return C_SET             # <<<<<<<<<<<<<<
+ *     elif ttype == T_LIST:
+ *         return C_LIST
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_SET;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":63
+ *     elif ttype == T_MAP:
+ *         return C_MAP
+ *     elif ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         return C_SET
+ *     elif ttype == T_LIST:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":66
+ *         return C_SET
+ *     elif ttype == T_LIST:
+ *         return C_LIST             # <<<<<<<<<<<<<<
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                              'unknown type {0}'.format(ttype))
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_C_LIST;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":65
+ *     elif ttype == T_SET:
+ *         return C_SET
+ *     elif ttype == T_LIST:             # <<<<<<<<<<<<<<
+ *         return C_LIST
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ */
+    break;
+    default: break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":67
+ *     elif ttype == T_LIST:
+ *         return C_LIST
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,             # <<<<<<<<<<<<<<
+ *                              'unknown type {0}'.format(ttype))
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_INVALID_DATA); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":68
+ *         return C_LIST
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                              'unknown type {0}'.format(ttype))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_unknown_type_0, __pyx_n_s_format); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_ttype); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_4, __pyx_t_3};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_4, __pyx_t_3};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 67, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__pyx_t_5) {
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_8, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_8, __pyx_t_3);
+    __pyx_t_4 = 0;
+    __pyx_t_3 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 67, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":44
+ * 
+ * 
+ * cdef inline int to_ctype(int ttype) except -1:             # <<<<<<<<<<<<<<
+ *     if ttype == T_BOOL:
+ *         return C_TRUE
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.to_ctype", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":71
+ * 
+ * 
+ * cdef inline int to_ttype(int ctype) except -1:             # <<<<<<<<<<<<<<
+ *     if ctype == C_TRUE or ctype == C_FALSE:
+ *         return T_BOOL
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_to_ttype(int __pyx_v_ctype) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("to_ttype", 0);
+
+  /* "thriftworker/protocols/codec.pyx":72
+ * 
+ * cdef inline int to_ttype(int ctype) except -1:
+ *     if ctype == C_TRUE or ctype == C_FALSE:             # <<<<<<<<<<<<<<
+ *         return T_BOOL
+ *     elif ctype == C_BYTE:
+ */
+  switch (__pyx_v_ctype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_C_TRUE:
+    case __pyx_e_12thriftworker_9protocols_5codec_C_FALSE:
+
+    /* "thriftworker/protocols/codec.pyx":73
+ * cdef inline int to_ttype(int ctype) except -1:
+ *     if ctype == C_TRUE or ctype == C_FALSE:
+ *         return T_BOOL             # <<<<<<<<<<<<<<
+ *     elif ctype == C_BYTE:
+ *         return T_BYTE
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_BOOL;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":72
+ * 
+ * cdef inline int to_ttype(int ctype) except -1:
+ *     if ctype == C_TRUE or ctype == C_FALSE:             # <<<<<<<<<<<<<<
+ *         return T_BOOL
+ *     elif ctype == C_BYTE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_BYTE:
+
+    /* "thriftworker/protocols/codec.pyx":75
+ *         return T_BOOL
+ *     elif ctype == C_BYTE:
+ *         return T_BYTE             # <<<<<<<<<<<<<<
+ *     elif ctype == C_I16:
+ *         return T_I16
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_BYTE;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":74
+ *     if ctype == C_TRUE or ctype == C_FALSE:
+ *         return T_BOOL
+ *     elif ctype == C_BYTE:             # <<<<<<<<<<<<<<
+ *         return T_BYTE
+ *     elif ctype == C_I16:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_I16:
+
+    /* "thriftworker/protocols/codec.pyx":77
+ *         return T_BYTE
+ *     elif ctype == C_I16:
+ *         return T_I16             # <<<<<<<<<<<<<<
+ *     elif ctype == C_I32:
+ *         return T_I32
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_I16;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":76
+ *     elif ctype == C_BYTE:
+ *         return T_BYTE
+ *     elif ctype == C_I16:             # <<<<<<<<<<<<<<
+ *         return T_I16
+ *     elif ctype == C_I32:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_I32:
+
+    /* "thriftworker/protocols/codec.pyx":79
+ *         return T_I16
+ *     elif ctype == C_I32:
+ *         return T_I32             # <<<<<<<<<<<<<<
+ *     elif ctype == C_I64:
+ *         return T_I64
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_I32;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":78
+ *     elif ctype == C_I16:
+ *         return T_I16
+ *     elif ctype == C_I32:             # <<<<<<<<<<<<<<
+ *         return T_I32
+ *     elif ctype == C_I64:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_I64:
+
+    /* "thriftworker/protocols/codec.pyx":81
+ *         return T_I32
+ *     elif ctype == C_I64:
+ *         return T_I64             # <<<<<<<<<<<<<<
+ *     elif ctype == C_DOUBLE:
+ *         return T_DOUBLE
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_I64;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":80
+ *     elif ctype == C_I32:
+ *         return T_I32
+ *     elif ctype == C_I64:             # <<<<<<<<<<<<<<
+ *         return T_I64
+ *     elif ctype == C_DOUBLE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_DOUBLE:
+
+    /* "thriftworker/protocols/codec.pyx":83
+ *         return T_I64
+ *     elif ctype == C_DOUBLE:
+ *         return T_DOUBLE             # <<<<<<<<<<<<<<
+ *     elif ctype == C_BINARY:
+ *         return T_STRING
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":82
+ *     elif ctype == C_I64:
+ *         return T_I64
+ *     elif ctype == C_DOUBLE:             # <<<<<<<<<<<<<<
+ *         return T_DOUBLE
+ *     elif ctype == C_BINARY:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_BINARY:
+
+    /* "thriftworker/protocols/codec.pyx":85
+ *         return T_DOUBLE
+ *     elif ctype == C_BINARY:
+ *         return T_STRING             # <<<<<<<<<<<<<<
+ *     elif ctype == C_LIST:
+ *         return T_LIST
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_STRING;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":84
+ *     elif ctype == C_DOUBLE:
+ *         return T_DOUBLE
+ *     elif ctype == C_BINARY:             # <<<<<<<<<<<<<<
+ *         return T_STRING
+ *     elif ctype == C_LIST:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":87
+ *         return T_STRING
+ *     elif ctype == C_LIST:
+ *         return T_LIST             # <<<<<<<<<<<<<<
+ *     elif ctype == C_SET:
+ *         return T_SET
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_LIST;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":86
+ *     elif ctype == C_BINARY:
+ *         return T_STRING
+ *     elif ctype == C_LIST:             # <<<<<<<<<<<<<<
+ *         return T_LIST
+ *     elif ctype == C_SET:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_SET:
+
+    /* "thriftworker/protocols/codec.pyx":89
+ *         return T_LIST
+ *     elif ctype == C_SET:
+ *         return T_SET             # <<<<<<<<<<<<<<
+ *     elif ctype == C_MAP:
+ *         return T_MAP
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_SET;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":88
+ *     elif ctype == C_LIST:
+ *         return T_LIST
+ *     elif ctype == C_SET:             # <<<<<<<<<<<<<<
+ *         return T_SET
+ *     elif ctype == C_MAP:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":91
+ *         return T_SET
+ *     elif ctype == C_MAP:
+ *         return T_MAP             # <<<<<<<<<<<<<<
+ *     elif ctype == C_STRUCT:
+ *         return T_STRUCT
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_MAP;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":90
+ *     elif ctype == C_SET:
+ *         return T_SET
+ *     elif ctype == C_MAP:             # <<<<<<<<<<<<<<
+ *         return T_MAP
+ *     elif ctype == C_STRUCT:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_C_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":93
+ *         return T_MAP
+ *     elif ctype == C_STRUCT:
+ *         return T_STRUCT             # <<<<<<<<<<<<<<
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                              'unknown compact type {0}'.format(ctype))
+ */
+    __pyx_r = __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":92
+ *     elif ctype == C_MAP:
+ *         return T_MAP
+ *     elif ctype == C_STRUCT:             # <<<<<<<<<<<<<<
+ *         return T_STRUCT
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ */
+    break;
+    default: break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":94
+ *     elif ctype == C_STRUCT:
+ *         return T_STRUCT
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,             # <<<<<<<<<<<<<<
+ *                              'unknown compact type {0}'.format(ctype))
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_INVALID_DATA); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":95
+ *         return T_STRUCT
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                              'unknown compact type {0}'.format(ctype))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_unknown_compact_type_0, __pyx_n_s_format); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_ctype); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_4, __pyx_t_3};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_4, __pyx_t_3};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__pyx_t_5) {
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_8, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_8, __pyx_t_3);
+    __pyx_t_4 = 0;
+    __pyx_t_3 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 94, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":71
+ * 
+ * 
+ * cdef inline int to_ttype(int ctype) except -1:             # <<<<<<<<<<<<<<
+ *     if ctype == C_TRUE or ctype == C_FALSE:
+ *         return T_BOOL
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.to_ttype", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_8TypeSpec_1__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_8TypeSpec_1__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_8TypeSpec___reduce_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_8TypeSpec___reduce_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.ctype, self.key, self.struct, self.ttype, self.value)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->ctype); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->ttype); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(5); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->key));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->key));
+  PyTuple_SET_ITEM(__pyx_t_3, 1, ((PyObject *)__pyx_v_self->key));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->__pyx_struct));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->__pyx_struct));
+  PyTuple_SET_ITEM(__pyx_t_3, 2, ((PyObject *)__pyx_v_self->__pyx_struct));
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->value));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->value));
+  PyTuple_SET_ITEM(__pyx_t_3, 4, ((PyObject *)__pyx_v_self->value));
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.ctype, self.key, self.struct, self.ttype, self.value)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.ctype, self.key, self.struct, self.ttype, self.value)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.key is not None or self.struct is not None or self.value is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.ctype, self.key, self.struct, self.ttype, self.value)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.key is not None or self.struct is not None or self.value is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, None), state
+ */
+  /*else*/ {
+    __pyx_t_4 = (((PyObject *)__pyx_v_self->key) != Py_None);
+    __pyx_t_6 = (__pyx_t_4 != 0);
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_5 = __pyx_t_6;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_6 = (((PyObject *)__pyx_v_self->__pyx_struct) != Py_None);
+    __pyx_t_4 = (__pyx_t_6 != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_5 = __pyx_t_4;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_4 = (((PyObject *)__pyx_v_self->value) != Py_None);
+    __pyx_t_6 = (__pyx_t_4 != 0);
+    __pyx_t_5 = __pyx_t_6;
+    __pyx_L4_bool_binop_done:;
+    __pyx_v_use_setstate = __pyx_t_5;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.key is not None or self.struct is not None or self.value is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, None), state
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.key is not None or self.struct is not None or self.value is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_TypeSpec); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_265516198);
+    __Pyx_GIVEREF(__pyx_int_265516198);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_265516198);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.key is not None or self.struct is not None or self.value is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, None), state
+ *     else:
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_TypeSpec__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_TypeSpec); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_265516198);
+    __Pyx_GIVEREF(__pyx_int_265516198);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_265516198);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.TypeSpec.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_TypeSpec__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_8TypeSpec_3__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_8TypeSpec_3__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_8TypeSpec_2__setstate_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_8TypeSpec_2__setstate_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_TypeSpec__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_TypeSpec__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_TypeSpec, (type(self), 0xfd374a6, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_TypeSpec__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.TypeSpec.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_9FieldSpec_1__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_9FieldSpec_1__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_9FieldSpec___reduce_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_9FieldSpec___reduce_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.fid, self.name, self.type)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->fid); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->name);
+  __Pyx_GIVEREF(__pyx_v_self->name);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_self->name);
+  __Pyx_INCREF(((PyObject *)__pyx_v_self->type));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self->type));
+  PyTuple_SET_ITEM(__pyx_t_2, 2, ((PyObject *)__pyx_v_self->type));
+  __pyx_t_1 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.fid, self.name, self.type)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_2 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v__dict = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.fid, self.name, self.type)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_3 = (__pyx_v__dict != Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v__dict);
+    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.name is not None or self.type is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.fid, self.name, self.type)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.name is not None or self.type is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, None), state
+ */
+  /*else*/ {
+    __pyx_t_3 = (__pyx_v_self->name != Py_None);
+    __pyx_t_5 = (__pyx_t_3 != 0);
+    if (!__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_5 = (((PyObject *)__pyx_v_self->type) != Py_None);
+    __pyx_t_3 = (__pyx_t_5 != 0);
+    __pyx_t_4 = __pyx_t_3;
+    __pyx_L4_bool_binop_done:;
+    __pyx_v_use_setstate = __pyx_t_4;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.name is not None or self.type is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, None), state
+ *     else:
+ */
+  __pyx_t_4 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.name is not None or self.type is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_FieldSpec); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_209476648);
+    __Pyx_GIVEREF(__pyx_int_209476648);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_209476648);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, Py_None);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_2);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_v_state);
+    __pyx_t_1 = 0;
+    __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.name is not None or self.type is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, None), state
+ *     else:
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_FieldSpec__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_pyx_unpickle_FieldSpec); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_209476648);
+    __Pyx_GIVEREF(__pyx_int_209476648);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_209476648);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_state);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
+    __pyx_t_6 = 0;
+    __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.FieldSpec.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_FieldSpec__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_9FieldSpec_3__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_9FieldSpec_3__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_9FieldSpec_2__setstate_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_9FieldSpec_2__setstate_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_FieldSpec__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_FieldSpec__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_FieldSpec, (type(self), 0xc7c5c28, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_FieldSpec__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.FieldSpec.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":139
+ *     cdef dict by_id
+ * 
+ *     cdef inline FieldSpec lookup(self, int fid):             # <<<<<<<<<<<<<<
+ *         return self.by_id.get(fid)
+ * 
+ */
+
+static CYTHON_INLINE struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_f_12thriftworker_9protocols_5codec_10StructSpec_lookup(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_self, int __pyx_v_fid) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("lookup", 0);
+
+  /* "thriftworker/protocols/codec.pyx":140
+ * 
+ *     cdef inline FieldSpec lookup(self, int fid):
+ *         return self.by_id.get(fid)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  if (unlikely(__pyx_v_self->by_id == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 140, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_fid); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyDict_GetItemDefault(__pyx_v_self->by_id, __pyx_t_1, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_12thriftworker_9protocols_5codec_FieldSpec))))) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_r = ((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":139
+ *     cdef dict by_id
+ * 
+ *     cdef inline FieldSpec lookup(self, int fid):             # <<<<<<<<<<<<<<
+ *         return self.by_id.get(fid)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.StructSpec.lookup", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_10StructSpec_1__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_10StructSpec_1__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_10StructSpec___reduce_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_10StructSpec___reduce_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.by_id, self.cls, self.fields)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->by_id);
+  __Pyx_GIVEREF(__pyx_v_self->by_id);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_self->by_id);
+  __Pyx_INCREF(__pyx_v_self->cls);
+  __Pyx_GIVEREF(__pyx_v_self->cls);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_self->cls);
+  __Pyx_INCREF(__pyx_v_self->fields);
+  __Pyx_GIVEREF(__pyx_v_self->fields);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_self->fields);
+  __pyx_v_state = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.by_id, self.cls, self.fields)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_1 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v__dict = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.by_id, self.cls, self.fields)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_2 = (__pyx_v__dict != Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v__dict);
+    __pyx_t_4 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.by_id is not None or self.cls is not None or self.fields is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.by_id, self.cls, self.fields)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.by_id is not None or self.cls is not None or self.fields is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, None), state
+ */
+  /*else*/ {
+    __pyx_t_2 = (__pyx_v_self->by_id != ((PyObject*)Py_None));
+    __pyx_t_5 = (__pyx_t_2 != 0);
+    if (!__pyx_t_5) {
+    } else {
+      __pyx_t_3 = __pyx_t_5;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_5 = (__pyx_v_self->cls != Py_None);
+    __pyx_t_2 = (__pyx_t_5 != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_self->fields != ((PyObject*)Py_None));
+    __pyx_t_5 = (__pyx_t_2 != 0);
+    __pyx_t_3 = __pyx_t_5;
+    __pyx_L4_bool_binop_done:;
+    __pyx_v_use_setstate = __pyx_t_3;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.by_id is not None or self.cls is not None or self.fields is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, None), state
+ *     else:
+ */
+  __pyx_t_3 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.by_id is not None or self.cls is not None or self.fields is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_pyx_unpickle_StructSpec); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_224055119);
+    __Pyx_GIVEREF(__pyx_int_224055119);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_224055119);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, Py_None);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_1);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_v_state);
+    __pyx_t_4 = 0;
+    __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.by_id is not None or self.cls is not None or self.fields is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, None), state
+ *     else:
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_StructSpec__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_pyx_unpickle_StructSpec); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_224055119);
+    __Pyx_GIVEREF(__pyx_int_224055119);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_224055119);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1);
+    __pyx_t_6 = 0;
+    __pyx_t_1 = 0;
+    __pyx_r = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.StructSpec.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_StructSpec__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_10StructSpec_3__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_10StructSpec_3__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_10StructSpec_2__setstate_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_10StructSpec_2__setstate_cython__(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_StructSpec__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_StructSpec__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_StructSpec, (type(self), 0xd5acf4f, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_StructSpec__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.StructSpec.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":147
+ * 
+ * 
+ * cdef TypeSpec compile_type(int ttype, object args, dict pending):             # <<<<<<<<<<<<<<
+ *     cdef TypeSpec spec = TypeSpec()
+ *     spec.ttype = ttype
+ */
+
+static struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_f_12thriftworker_9protocols_5codec_compile_type(int __pyx_v_ttype, PyObject *__pyx_v_args, PyObject *__pyx_v_pending) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_spec = 0;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("compile_type", 0);
+
+  /* "thriftworker/protocols/codec.pyx":148
+ * 
+ * cdef TypeSpec compile_type(int ttype, object args, dict pending):
+ *     cdef TypeSpec spec = TypeSpec()             # <<<<<<<<<<<<<<
+ *     spec.ttype = ttype
+ *     spec.ctype = to_ctype(ttype)
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_TypeSpec)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_spec = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":149
+ * cdef TypeSpec compile_type(int ttype, object args, dict pending):
+ *     cdef TypeSpec spec = TypeSpec()
+ *     spec.ttype = ttype             # <<<<<<<<<<<<<<
+ *     spec.ctype = to_ctype(ttype)
+ *     if ttype == T_STRUCT:
+ */
+  __pyx_v_spec->ttype = __pyx_v_ttype;
+
+  /* "thriftworker/protocols/codec.pyx":150
+ *     cdef TypeSpec spec = TypeSpec()
+ *     spec.ttype = ttype
+ *     spec.ctype = to_ctype(ttype)             # <<<<<<<<<<<<<<
+ *     if ttype == T_STRUCT:
+ *         spec.struct = compile_struct(args[0], args[1], pending)
+ */
+  __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_to_ctype(__pyx_v_ttype); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 150, __pyx_L1_error)
+  __pyx_v_spec->ctype = __pyx_t_2;
+
+  /* "thriftworker/protocols/codec.pyx":151
+ *     spec.ttype = ttype
+ *     spec.ctype = to_ctype(ttype)
+ *     if ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         spec.struct = compile_struct(args[0], args[1], pending)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+  switch (__pyx_v_ttype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":152
+ *     spec.ctype = to_ctype(ttype)
+ *     if ttype == T_STRUCT:
+ *         spec.struct = compile_struct(args[0], args[1], pending)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         spec.value = compile_type(args[0], args[1], pending)
+ */
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_args, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_args, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_compile_struct(__pyx_t_1, __pyx_t_3, __pyx_v_pending)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GIVEREF(__pyx_t_4);
+    __Pyx_GOTREF(__pyx_v_spec->__pyx_struct);
+    __Pyx_DECREF(((PyObject *)__pyx_v_spec->__pyx_struct));
+    __pyx_v_spec->__pyx_struct = ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":151
+ *     spec.ttype = ttype
+ *     spec.ctype = to_ctype(ttype)
+ *     if ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         spec.struct = compile_struct(args[0], args[1], pending)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":153
+ *     if ttype == T_STRUCT:
+ *         spec.struct = compile_struct(args[0], args[1], pending)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         spec.value = compile_type(args[0], args[1], pending)
+ *     elif ttype == T_MAP:
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_SET:
+
+    /* "thriftworker/protocols/codec.pyx":154
+ *         spec.struct = compile_struct(args[0], args[1], pending)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         spec.value = compile_type(args[0], args[1], pending)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_MAP:
+ *         spec.key = compile_type(args[0], args[1], pending)
+ */
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_args, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_4); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 154, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_args, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_compile_type(__pyx_t_2, __pyx_t_4, __pyx_v_pending)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GIVEREF(__pyx_t_3);
+    __Pyx_GOTREF(__pyx_v_spec->value);
+    __Pyx_DECREF(((PyObject *)__pyx_v_spec->value));
+    __pyx_v_spec->value = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":153
+ *     if ttype == T_STRUCT:
+ *         spec.struct = compile_struct(args[0], args[1], pending)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         spec.value = compile_type(args[0], args[1], pending)
+ *     elif ttype == T_MAP:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":156
+ *         spec.value = compile_type(args[0], args[1], pending)
+ *     elif ttype == T_MAP:
+ *         spec.key = compile_type(args[0], args[1], pending)             # <<<<<<<<<<<<<<
+ *         spec.value = compile_type(args[2], args[3], pending)
+ *     return spec
+ */
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_args, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_args, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_compile_type(__pyx_t_2, __pyx_t_3, __pyx_v_pending)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GIVEREF(__pyx_t_4);
+    __Pyx_GOTREF(__pyx_v_spec->key);
+    __Pyx_DECREF(((PyObject *)__pyx_v_spec->key));
+    __pyx_v_spec->key = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":157
+ *     elif ttype == T_MAP:
+ *         spec.key = compile_type(args[0], args[1], pending)
+ *         spec.value = compile_type(args[2], args[3], pending)             # <<<<<<<<<<<<<<
+ *     return spec
+ * 
+ */
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_args, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_4); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_args, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_compile_type(__pyx_t_2, __pyx_t_4, __pyx_v_pending)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GIVEREF(__pyx_t_3);
+    __Pyx_GOTREF(__pyx_v_spec->value);
+    __Pyx_DECREF(((PyObject *)__pyx_v_spec->value));
+    __pyx_v_spec->value = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":155
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         spec.value = compile_type(args[0], args[1], pending)
+ *     elif ttype == T_MAP:             # <<<<<<<<<<<<<<
+ *         spec.key = compile_type(args[0], args[1], pending)
+ *         spec.value = compile_type(args[2], args[3], pending)
+ */
+    break;
+    default: break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":158
+ *         spec.key = compile_type(args[0], args[1], pending)
+ *         spec.value = compile_type(args[2], args[3], pending)
+ *     return spec             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_spec));
+  __pyx_r = __pyx_v_spec;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":147
+ * 
+ * 
+ * cdef TypeSpec compile_type(int ttype, object args, dict pending):             # <<<<<<<<<<<<<<
+ *     cdef TypeSpec spec = TypeSpec()
+ *     spec.ttype = ttype
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.compile_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_spec);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":161
+ * 
+ * 
+ * cdef StructSpec compile_struct(object cls, object thrift_spec, dict pending):             # <<<<<<<<<<<<<<
+ *     cdef StructSpec spec = structs.get(cls) or pending.get(cls)
+ *     cdef FieldSpec field
+ */
+
+static struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_f_12thriftworker_9protocols_5codec_compile_struct(PyObject *__pyx_v_cls, PyObject *__pyx_v_thrift_spec, PyObject *__pyx_v_pending) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_spec = 0;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_field = 0;
+  PyObject *__pyx_v_entry = NULL;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("compile_struct", 0);
+
+  /* "thriftworker/protocols/codec.pyx":162
+ * 
+ * cdef StructSpec compile_struct(object cls, object thrift_spec, dict pending):
+ *     cdef StructSpec spec = structs.get(cls) or pending.get(cls)             # <<<<<<<<<<<<<<
+ *     cdef FieldSpec field
+ *     if spec is not None:
+ */
+  if (unlikely(__pyx_v_12thriftworker_9protocols_5codec_structs == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 162, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyDict_GetItemDefault(__pyx_v_12thriftworker_9protocols_5codec_structs, __pyx_v_cls, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 162, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 162, __pyx_L1_error)
+  if (!__pyx_t_3) {
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  } else {
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_12thriftworker_9protocols_5codec_StructSpec))))) __PYX_ERR(0, 162, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_1 = __pyx_t_2;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    goto __pyx_L3_bool_binop_done;
+  }
+  if (unlikely(__pyx_v_pending == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 162, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyDict_GetItemDefault(__pyx_v_pending, __pyx_v_cls, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 162, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_12thriftworker_9protocols_5codec_StructSpec))))) __PYX_ERR(0, 162, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_1 = __pyx_t_2;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_L3_bool_binop_done:;
+  __pyx_v_spec = ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":164
+ *     cdef StructSpec spec = structs.get(cls) or pending.get(cls)
+ *     cdef FieldSpec field
+ *     if spec is not None:             # <<<<<<<<<<<<<<
+ *         return spec
+ *     spec = pending[cls] = StructSpec()
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_spec) != Py_None);
+  __pyx_t_4 = (__pyx_t_3 != 0);
+  if (__pyx_t_4) {
+
+    /* "thriftworker/protocols/codec.pyx":165
+ *     cdef FieldSpec field
+ *     if spec is not None:
+ *         return spec             # <<<<<<<<<<<<<<
+ *     spec = pending[cls] = StructSpec()
+ *     spec.cls = cls
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __Pyx_INCREF(((PyObject *)__pyx_v_spec));
+    __pyx_r = __pyx_v_spec;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":164
+ *     cdef StructSpec spec = structs.get(cls) or pending.get(cls)
+ *     cdef FieldSpec field
+ *     if spec is not None:             # <<<<<<<<<<<<<<
+ *         return spec
+ *     spec = pending[cls] = StructSpec()
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":166
+ *     if spec is not None:
+ *         return spec
+ *     spec = pending[cls] = StructSpec()             # <<<<<<<<<<<<<<
+ *     spec.cls = cls
+ *     spec.fields = []
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_StructSpec)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_DECREF_SET(__pyx_v_spec, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_1));
+  if (unlikely(__pyx_v_pending == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 166, __pyx_L1_error)
+  }
+  if (unlikely(PyDict_SetItem(__pyx_v_pending, __pyx_v_cls, __pyx_t_1) < 0)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":167
+ *         return spec
+ *     spec = pending[cls] = StructSpec()
+ *     spec.cls = cls             # <<<<<<<<<<<<<<
+ *     spec.fields = []
+ *     spec.by_id = {}
+ */
+  __Pyx_INCREF(__pyx_v_cls);
+  __Pyx_GIVEREF(__pyx_v_cls);
+  __Pyx_GOTREF(__pyx_v_spec->cls);
+  __Pyx_DECREF(__pyx_v_spec->cls);
+  __pyx_v_spec->cls = __pyx_v_cls;
+
+  /* "thriftworker/protocols/codec.pyx":168
+ *     spec = pending[cls] = StructSpec()
+ *     spec.cls = cls
+ *     spec.fields = []             # <<<<<<<<<<<<<<
+ *     spec.by_id = {}
+ *     for entry in thrift_spec or ():
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_spec->fields);
+  __Pyx_DECREF(__pyx_v_spec->fields);
+  __pyx_v_spec->fields = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":169
+ *     spec.cls = cls
+ *     spec.fields = []
+ *     spec.by_id = {}             # <<<<<<<<<<<<<<
+ *     for entry in thrift_spec or ():
+ *         if entry is None:
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_spec->by_id);
+  __Pyx_DECREF(__pyx_v_spec->by_id);
+  __pyx_v_spec->by_id = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":170
+ *     spec.fields = []
+ *     spec.by_id = {}
+ *     for entry in thrift_spec or ():             # <<<<<<<<<<<<<<
+ *         if entry is None:
+ *             continue
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_thrift_spec); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (!__pyx_t_4) {
+  } else {
+    __Pyx_INCREF(__pyx_v_thrift_spec);
+    __pyx_t_1 = __pyx_v_thrift_spec;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __Pyx_INCREF(__pyx_empty_tuple);
+  __pyx_t_1 = __pyx_empty_tuple;
+  __pyx_L8_bool_binop_done:;
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_5 = 0;
+    __pyx_t_6 = NULL;
+  } else {
+    __pyx_t_5 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_6 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 170, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_6)) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 170, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 170, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_6(__pyx_t_2);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 170, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_entry, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":171
+ *     spec.by_id = {}
+ *     for entry in thrift_spec or ():
+ *         if entry is None:             # <<<<<<<<<<<<<<
+ *             continue
+ *         field = FieldSpec()
+ */
+    __pyx_t_4 = (__pyx_v_entry == Py_None);
+    __pyx_t_3 = (__pyx_t_4 != 0);
+    if (__pyx_t_3) {
+
+      /* "thriftworker/protocols/codec.pyx":172
+ *     for entry in thrift_spec or ():
+ *         if entry is None:
+ *             continue             # <<<<<<<<<<<<<<
+ *         field = FieldSpec()
+ *         field.fid = entry[0]
+ */
+      goto __pyx_L6_continue;
+
+      /* "thriftworker/protocols/codec.pyx":171
+ *     spec.by_id = {}
+ *     for entry in thrift_spec or ():
+ *         if entry is None:             # <<<<<<<<<<<<<<
+ *             continue
+ *         field = FieldSpec()
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":173
+ *         if entry is None:
+ *             continue
+ *         field = FieldSpec()             # <<<<<<<<<<<<<<
+ *         field.fid = entry[0]
+ *         field.name = entry[2]
+ */
+    __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_FieldSpec)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_field, ((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":174
+ *             continue
+ *         field = FieldSpec()
+ *         field.fid = entry[0]             # <<<<<<<<<<<<<<
+ *         field.name = entry[2]
+ *         field.type = compile_type(entry[1], entry[3], pending)
+ */
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_entry, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 174, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_field->fid = __pyx_t_7;
+
+    /* "thriftworker/protocols/codec.pyx":175
+ *         field = FieldSpec()
+ *         field.fid = entry[0]
+ *         field.name = entry[2]             # <<<<<<<<<<<<<<
+ *         field.type = compile_type(entry[1], entry[3], pending)
+ *         spec.fields.append(field)
+ */
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_entry, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 175, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    __Pyx_GOTREF(__pyx_v_field->name);
+    __Pyx_DECREF(__pyx_v_field->name);
+    __pyx_v_field->name = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":176
+ *         field.fid = entry[0]
+ *         field.name = entry[2]
+ *         field.type = compile_type(entry[1], entry[3], pending)             # <<<<<<<<<<<<<<
+ *         spec.fields.append(field)
+ *         spec.by_id[field.fid] = field
+ */
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_entry, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 176, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_entry, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_8 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_compile_type(__pyx_t_7, __pyx_t_1, __pyx_v_pending)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 176, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_GIVEREF(__pyx_t_8);
+    __Pyx_GOTREF(__pyx_v_field->type);
+    __Pyx_DECREF(((PyObject *)__pyx_v_field->type));
+    __pyx_v_field->type = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_8);
+    __pyx_t_8 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":177
+ *         field.name = entry[2]
+ *         field.type = compile_type(entry[1], entry[3], pending)
+ *         spec.fields.append(field)             # <<<<<<<<<<<<<<
+ *         spec.by_id[field.fid] = field
+ *     return spec
+ */
+    if (unlikely(__pyx_v_spec->fields == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+      __PYX_ERR(0, 177, __pyx_L1_error)
+    }
+    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_spec->fields, ((PyObject *)__pyx_v_field)); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 177, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":178
+ *         field.type = compile_type(entry[1], entry[3], pending)
+ *         spec.fields.append(field)
+ *         spec.by_id[field.fid] = field             # <<<<<<<<<<<<<<
+ *     return spec
+ * 
+ */
+    if (unlikely(__pyx_v_spec->by_id == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 178, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_v_field->fid); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 178, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (unlikely(PyDict_SetItem(__pyx_v_spec->by_id, __pyx_t_8, ((PyObject *)__pyx_v_field)) < 0)) __PYX_ERR(0, 178, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":170
+ *     spec.fields = []
+ *     spec.by_id = {}
+ *     for entry in thrift_spec or ():             # <<<<<<<<<<<<<<
+ *         if entry is None:
+ *             continue
+ */
+    __pyx_L6_continue:;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":179
+ *         spec.fields.append(field)
+ *         spec.by_id[field.fid] = field
+ *     return spec             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_spec));
+  __pyx_r = __pyx_v_spec;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":161
+ * 
+ * 
+ * cdef StructSpec compile_struct(object cls, object thrift_spec, dict pending):             # <<<<<<<<<<<<<<
+ *     cdef StructSpec spec = structs.get(cls) or pending.get(cls)
+ *     cdef FieldSpec field
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.compile_struct", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_spec);
+  __Pyx_XDECREF((PyObject *)__pyx_v_field);
+  __Pyx_XDECREF(__pyx_v_entry);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":182
+ * 
+ * 
+ * cdef StructSpec get_struct(object cls, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Return compiled specification of given struct. Compiled structs are
+ *     published only when all nested ones are ready.
+ */
+
+static struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_f_12thriftworker_9protocols_5codec_get_struct(PyObject *__pyx_v_cls, PyObject *__pyx_v_thrift_spec) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_spec = 0;
+  PyObject *__pyx_v_pending = 0;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_struct", 0);
+
+  /* "thriftworker/protocols/codec.pyx":187
+ * 
+ *     """
+ *     cdef StructSpec spec = structs.get(cls)             # <<<<<<<<<<<<<<
+ *     cdef dict pending
+ *     if spec is None:
+ */
+  if (unlikely(__pyx_v_12thriftworker_9protocols_5codec_structs == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 187, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_v_12thriftworker_9protocols_5codec_structs, __pyx_v_cls, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_12thriftworker_9protocols_5codec_StructSpec))))) __PYX_ERR(0, 187, __pyx_L1_error)
+  __pyx_v_spec = ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":189
+ *     cdef StructSpec spec = structs.get(cls)
+ *     cdef dict pending
+ *     if spec is None:             # <<<<<<<<<<<<<<
+ *         pending = {}
+ *         spec = compile_struct(cls, thrift_spec, pending)
+ */
+  __pyx_t_2 = (((PyObject *)__pyx_v_spec) == Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "thriftworker/protocols/codec.pyx":190
+ *     cdef dict pending
+ *     if spec is None:
+ *         pending = {}             # <<<<<<<<<<<<<<
+ *         spec = compile_struct(cls, thrift_spec, pending)
+ *         structs.update(pending)
+ */
+    __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_v_pending = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":191
+ *     if spec is None:
+ *         pending = {}
+ *         spec = compile_struct(cls, thrift_spec, pending)             # <<<<<<<<<<<<<<
+ *         structs.update(pending)
+ *     return spec
+ */
+    __pyx_t_1 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_compile_struct(__pyx_v_cls, __pyx_v_thrift_spec, __pyx_v_pending)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_spec, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":192
+ *         pending = {}
+ *         spec = compile_struct(cls, thrift_spec, pending)
+ *         structs.update(pending)             # <<<<<<<<<<<<<<
+ *     return spec
+ * 
+ */
+    __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_update, __pyx_v_12thriftworker_9protocols_5codec_structs, __pyx_v_pending); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":189
+ *     cdef StructSpec spec = structs.get(cls)
+ *     cdef dict pending
+ *     if spec is None:             # <<<<<<<<<<<<<<
+ *         pending = {}
+ *         spec = compile_struct(cls, thrift_spec, pending)
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":193
+ *         spec = compile_struct(cls, thrift_spec, pending)
+ *         structs.update(pending)
+ *     return spec             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_spec));
+  __pyx_r = __pyx_v_spec;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":182
+ * 
+ * 
+ * cdef StructSpec get_struct(object cls, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Return compiled specification of given struct. Compiled structs are
+ *     published only when all nested ones are ready.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.get_struct", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_spec);
+  __Pyx_XDECREF(__pyx_v_pending);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":207
+ *     cdef Py_ssize_t capacity
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.size = 0
+ *         self.capacity = 256
+ */
+
+/* Python wrapper */
+static int __pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer___cinit__(((struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer___cinit__(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "thriftworker/protocols/codec.pyx":208
+ * 
+ *     def __cinit__(self):
+ *         self.size = 0             # <<<<<<<<<<<<<<
+ *         self.capacity = 256
+ *         self.data = <char *>PyMem_Malloc(self.capacity)
+ */
+  __pyx_v_self->size = 0;
+
+  /* "thriftworker/protocols/codec.pyx":209
+ *     def __cinit__(self):
+ *         self.size = 0
+ *         self.capacity = 256             # <<<<<<<<<<<<<<
+ *         self.data = <char *>PyMem_Malloc(self.capacity)
+ *         if self.data is NULL:
+ */
+  __pyx_v_self->capacity = 0x100;
+
+  /* "thriftworker/protocols/codec.pyx":210
+ *         self.size = 0
+ *         self.capacity = 256
+ *         self.data = <char *>PyMem_Malloc(self.capacity)             # <<<<<<<<<<<<<<
+ *         if self.data is NULL:
+ *             raise MemoryError()
+ */
+  __pyx_v_self->data = ((char *)PyMem_Malloc(__pyx_v_self->capacity));
+
+  /* "thriftworker/protocols/codec.pyx":211
+ *         self.capacity = 256
+ *         self.data = <char *>PyMem_Malloc(self.capacity)
+ *         if self.data is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_self->data == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "thriftworker/protocols/codec.pyx":212
+ *         self.data = <char *>PyMem_Malloc(self.capacity)
+ *         if self.data is NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 212, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":211
+ *         self.capacity = 256
+ *         self.data = <char *>PyMem_Malloc(self.capacity)
+ *         if self.data is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ * 
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":207
+ *     cdef Py_ssize_t capacity
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self.size = 0
+ *         self.capacity = 256
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":214
+ *             raise MemoryError()
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.data)
+ * 
+ */
+
+/* Python wrapper */
+static void __pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_3__dealloc__(PyObject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_2__dealloc__(((struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_2__dealloc__(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "thriftworker/protocols/codec.pyx":215
+ * 
+ *     def __dealloc__(self):
+ *         PyMem_Free(self.data)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int reserve(self, Py_ssize_t length) except -1:
+ */
+  PyMem_Free(__pyx_v_self->data);
+
+  /* "thriftworker/protocols/codec.pyx":214
+ *             raise MemoryError()
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.data)
+ * 
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "thriftworker/protocols/codec.pyx":217
+ *         PyMem_Free(self.data)
+ * 
+ *     cdef int reserve(self, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t capacity = self.capacity
+ *         cdef char *data
+ */
+
+static int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_reserve(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, Py_ssize_t __pyx_v_length) {
+  Py_ssize_t __pyx_v_capacity;
+  char *__pyx_v_data;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("reserve", 0);
+
+  /* "thriftworker/protocols/codec.pyx":218
+ * 
+ *     cdef int reserve(self, Py_ssize_t length) except -1:
+ *         cdef Py_ssize_t capacity = self.capacity             # <<<<<<<<<<<<<<
+ *         cdef char *data
+ *         if self.size + length <= capacity:
+ */
+  __pyx_t_1 = __pyx_v_self->capacity;
+  __pyx_v_capacity = __pyx_t_1;
+
+  /* "thriftworker/protocols/codec.pyx":220
+ *         cdef Py_ssize_t capacity = self.capacity
+ *         cdef char *data
+ *         if self.size + length <= capacity:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         while self.size + length > capacity:
+ */
+  __pyx_t_2 = (((__pyx_v_self->size + __pyx_v_length) <= __pyx_v_capacity) != 0);
+  if (__pyx_t_2) {
+
+    /* "thriftworker/protocols/codec.pyx":221
+ *         cdef char *data
+ *         if self.size + length <= capacity:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         while self.size + length > capacity:
+ *             capacity *= 2
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":220
+ *         cdef Py_ssize_t capacity = self.capacity
+ *         cdef char *data
+ *         if self.size + length <= capacity:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         while self.size + length > capacity:
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":222
+ *         if self.size + length <= capacity:
+ *             return 0
+ *         while self.size + length > capacity:             # <<<<<<<<<<<<<<
+ *             capacity *= 2
+ *         data = <char *>PyMem_Realloc(self.data, capacity)
+ */
+  while (1) {
+    __pyx_t_2 = (((__pyx_v_self->size + __pyx_v_length) > __pyx_v_capacity) != 0);
+    if (!__pyx_t_2) break;
+
+    /* "thriftworker/protocols/codec.pyx":223
+ *             return 0
+ *         while self.size + length > capacity:
+ *             capacity *= 2             # <<<<<<<<<<<<<<
+ *         data = <char *>PyMem_Realloc(self.data, capacity)
+ *         if data is NULL:
+ */
+    __pyx_v_capacity = (__pyx_v_capacity * 2);
+  }
+
+  /* "thriftworker/protocols/codec.pyx":224
+ *         while self.size + length > capacity:
+ *             capacity *= 2
+ *         data = <char *>PyMem_Realloc(self.data, capacity)             # <<<<<<<<<<<<<<
+ *         if data is NULL:
+ *             raise MemoryError()
+ */
+  __pyx_v_data = ((char *)PyMem_Realloc(__pyx_v_self->data, __pyx_v_capacity));
+
+  /* "thriftworker/protocols/codec.pyx":225
+ *             capacity *= 2
+ *         data = <char *>PyMem_Realloc(self.data, capacity)
+ *         if data is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         self.data = data
+ */
+  __pyx_t_2 = ((__pyx_v_data == NULL) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "thriftworker/protocols/codec.pyx":226
+ *         data = <char *>PyMem_Realloc(self.data, capacity)
+ *         if data is NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         self.data = data
+ *         self.capacity = capacity
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 226, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":225
+ *             capacity *= 2
+ *         data = <char *>PyMem_Realloc(self.data, capacity)
+ *         if data is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         self.data = data
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":227
+ *         if data is NULL:
+ *             raise MemoryError()
+ *         self.data = data             # <<<<<<<<<<<<<<
+ *         self.capacity = capacity
+ *         return 0
+ */
+  __pyx_v_self->data = __pyx_v_data;
+
+  /* "thriftworker/protocols/codec.pyx":228
+ *             raise MemoryError()
+ *         self.data = data
+ *         self.capacity = capacity             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->capacity = __pyx_v_capacity;
+
+  /* "thriftworker/protocols/codec.pyx":229
+ *         self.data = data
+ *         self.capacity = capacity
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int write_byte(self, uint8_t value) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":217
+ *         PyMem_Free(self.data)
+ * 
+ *     cdef int reserve(self, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t capacity = self.capacity
+ *         cdef char *data
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.reserve", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":231
+ *         return 0
+ * 
+ *     cdef inline int write_byte(self, uint8_t value) except -1:             # <<<<<<<<<<<<<<
+ *         self.reserve(1)
+ *         self.data[self.size] = <char>value
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, uint8_t __pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_byte", 0);
+
+  /* "thriftworker/protocols/codec.pyx":232
+ * 
+ *     cdef inline int write_byte(self, uint8_t value) except -1:
+ *         self.reserve(1)             # <<<<<<<<<<<<<<
+ *         self.data[self.size] = <char>value
+ *         self.size += 1
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self->__pyx_vtab)->reserve(__pyx_v_self, 1); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 232, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":233
+ *     cdef inline int write_byte(self, uint8_t value) except -1:
+ *         self.reserve(1)
+ *         self.data[self.size] = <char>value             # <<<<<<<<<<<<<<
+ *         self.size += 1
+ *         return 0
+ */
+  (__pyx_v_self->data[__pyx_v_self->size]) = ((char)__pyx_v_value);
+
+  /* "thriftworker/protocols/codec.pyx":234
+ *         self.reserve(1)
+ *         self.data[self.size] = <char>value
+ *         self.size += 1             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->size = (__pyx_v_self->size + 1);
+
+  /* "thriftworker/protocols/codec.pyx":235
+ *         self.data[self.size] = <char>value
+ *         self.size += 1
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int write_raw(self, const char *value,
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":231
+ *         return 0
+ * 
+ *     cdef inline int write_byte(self, uint8_t value) except -1:             # <<<<<<<<<<<<<<
+ *         self.reserve(1)
+ *         self.data[self.size] = <char>value
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.write_byte", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":237
+ *         return 0
+ * 
+ *     cdef inline int write_raw(self, const char *value,             # <<<<<<<<<<<<<<
+ *                               Py_ssize_t length) except -1:
+ *         self.reserve(length)
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_raw(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, char const *__pyx_v_value, Py_ssize_t __pyx_v_length) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_raw", 0);
+
+  /* "thriftworker/protocols/codec.pyx":239
+ *     cdef inline int write_raw(self, const char *value,
+ *                               Py_ssize_t length) except -1:
+ *         self.reserve(length)             # <<<<<<<<<<<<<<
+ *         memcpy(self.data + self.size, value, length)
+ *         self.size += length
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self->__pyx_vtab)->reserve(__pyx_v_self, __pyx_v_length); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 239, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":240
+ *                               Py_ssize_t length) except -1:
+ *         self.reserve(length)
+ *         memcpy(self.data + self.size, value, length)             # <<<<<<<<<<<<<<
+ *         self.size += length
+ *         return 0
+ */
+  (void)(memcpy((__pyx_v_self->data + __pyx_v_self->size), __pyx_v_value, __pyx_v_length));
+
+  /* "thriftworker/protocols/codec.pyx":241
+ *         self.reserve(length)
+ *         memcpy(self.data + self.size, value, length)
+ *         self.size += length             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->size = (__pyx_v_self->size + __pyx_v_length);
+
+  /* "thriftworker/protocols/codec.pyx":242
+ *         memcpy(self.data + self.size, value, length)
+ *         self.size += length
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int write_big(self, uint64_t value, int length) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":237
+ *         return 0
+ * 
+ *     cdef inline int write_raw(self, const char *value,             # <<<<<<<<<<<<<<
+ *                               Py_ssize_t length) except -1:
+ *         self.reserve(length)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.write_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":244
+ *         return 0
+ * 
+ *     cdef inline int write_big(self, uint64_t value, int length) except -1:             # <<<<<<<<<<<<<<
+ *         """Write big-endian integer of given length."""
+ *         cdef int i
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, uint64_t __pyx_v_value, int __pyx_v_length) {
+  int __pyx_v_i;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_big", 0);
+
+  /* "thriftworker/protocols/codec.pyx":247
+ *         """Write big-endian integer of given length."""
+ *         cdef int i
+ *         self.reserve(length)             # <<<<<<<<<<<<<<
+ *         for i in range(length):
+ *             self.data[self.size + i] = \
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self->__pyx_vtab)->reserve(__pyx_v_self, __pyx_v_length); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 247, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":248
+ *         cdef int i
+ *         self.reserve(length)
+ *         for i in range(length):             # <<<<<<<<<<<<<<
+ *             self.data[self.size + i] = \
+ *                 <char>((value >> (8 * (length - i - 1))) & 0xff)
+ */
+  __pyx_t_1 = __pyx_v_length;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "thriftworker/protocols/codec.pyx":249
+ *         self.reserve(length)
+ *         for i in range(length):
+ *             self.data[self.size + i] = \             # <<<<<<<<<<<<<<
+ *                 <char>((value >> (8 * (length - i - 1))) & 0xff)
+ *         self.size += length
+ */
+    (__pyx_v_self->data[(__pyx_v_self->size + __pyx_v_i)]) = ((char)((__pyx_v_value >> (8 * ((__pyx_v_length - __pyx_v_i) - 1))) & 0xff));
+  }
+
+  /* "thriftworker/protocols/codec.pyx":251
+ *             self.data[self.size + i] = \
+ *                 <char>((value >> (8 * (length - i - 1))) & 0xff)
+ *         self.size += length             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->size = (__pyx_v_self->size + __pyx_v_length);
+
+  /* "thriftworker/protocols/codec.pyx":252
+ *                 <char>((value >> (8 * (length - i - 1))) & 0xff)
+ *         self.size += length
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int write_little(self, uint64_t value, int length) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":244
+ *         return 0
+ * 
+ *     cdef inline int write_big(self, uint64_t value, int length) except -1:             # <<<<<<<<<<<<<<
+ *         """Write big-endian integer of given length."""
+ *         cdef int i
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.write_big", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":254
+ *         return 0
+ * 
+ *     cdef inline int write_little(self, uint64_t value, int length) except -1:             # <<<<<<<<<<<<<<
+ *         """Write little-endian integer of given length."""
+ *         cdef int i
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_little(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, uint64_t __pyx_v_value, int __pyx_v_length) {
+  int __pyx_v_i;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_little", 0);
+
+  /* "thriftworker/protocols/codec.pyx":257
+ *         """Write little-endian integer of given length."""
+ *         cdef int i
+ *         self.reserve(length)             # <<<<<<<<<<<<<<
+ *         for i in range(length):
+ *             self.data[self.size + i] = <char>((value >> (8 * i)) & 0xff)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self->__pyx_vtab)->reserve(__pyx_v_self, __pyx_v_length); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 257, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":258
+ *         cdef int i
+ *         self.reserve(length)
+ *         for i in range(length):             # <<<<<<<<<<<<<<
+ *             self.data[self.size + i] = <char>((value >> (8 * i)) & 0xff)
+ *         self.size += length
+ */
+  __pyx_t_1 = __pyx_v_length;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "thriftworker/protocols/codec.pyx":259
+ *         self.reserve(length)
+ *         for i in range(length):
+ *             self.data[self.size + i] = <char>((value >> (8 * i)) & 0xff)             # <<<<<<<<<<<<<<
+ *         self.size += length
+ *         return 0
+ */
+    (__pyx_v_self->data[(__pyx_v_self->size + __pyx_v_i)]) = ((char)((__pyx_v_value >> (8 * __pyx_v_i)) & 0xff));
+  }
+
+  /* "thriftworker/protocols/codec.pyx":260
+ *         for i in range(length):
+ *             self.data[self.size + i] = <char>((value >> (8 * i)) & 0xff)
+ *         self.size += length             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->size = (__pyx_v_self->size + __pyx_v_length);
+
+  /* "thriftworker/protocols/codec.pyx":261
+ *             self.data[self.size + i] = <char>((value >> (8 * i)) & 0xff)
+ *         self.size += length
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int write_varint(self, uint64_t value) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":254
+ *         return 0
+ * 
+ *     cdef inline int write_little(self, uint64_t value, int length) except -1:             # <<<<<<<<<<<<<<
+ *         """Write little-endian integer of given length."""
+ *         cdef int i
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.write_little", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":263
+ *         return 0
+ * 
+ *     cdef inline int write_varint(self, uint64_t value) except -1:             # <<<<<<<<<<<<<<
+ *         self.reserve(10)
+ *         while value > 0x7f:
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, uint64_t __pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_varint", 0);
+
+  /* "thriftworker/protocols/codec.pyx":264
+ * 
+ *     cdef inline int write_varint(self, uint64_t value) except -1:
+ *         self.reserve(10)             # <<<<<<<<<<<<<<
+ *         while value > 0x7f:
+ *             self.data[self.size] = <char>((value & 0x7f) | 0x80)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self->__pyx_vtab)->reserve(__pyx_v_self, 10); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 264, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":265
+ *     cdef inline int write_varint(self, uint64_t value) except -1:
+ *         self.reserve(10)
+ *         while value > 0x7f:             # <<<<<<<<<<<<<<
+ *             self.data[self.size] = <char>((value & 0x7f) | 0x80)
+ *             self.size += 1
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_value > 0x7f) != 0);
+    if (!__pyx_t_2) break;
+
+    /* "thriftworker/protocols/codec.pyx":266
+ *         self.reserve(10)
+ *         while value > 0x7f:
+ *             self.data[self.size] = <char>((value & 0x7f) | 0x80)             # <<<<<<<<<<<<<<
+ *             self.size += 1
+ *             value >>= 7
+ */
+    (__pyx_v_self->data[__pyx_v_self->size]) = ((char)((__pyx_v_value & 0x7f) | 0x80));
+
+    /* "thriftworker/protocols/codec.pyx":267
+ *         while value > 0x7f:
+ *             self.data[self.size] = <char>((value & 0x7f) | 0x80)
+ *             self.size += 1             # <<<<<<<<<<<<<<
+ *             value >>= 7
+ *         self.data[self.size] = <char>value
+ */
+    __pyx_v_self->size = (__pyx_v_self->size + 1);
+
+    /* "thriftworker/protocols/codec.pyx":268
+ *             self.data[self.size] = <char>((value & 0x7f) | 0x80)
+ *             self.size += 1
+ *             value >>= 7             # <<<<<<<<<<<<<<
+ *         self.data[self.size] = <char>value
+ *         self.size += 1
+ */
+    __pyx_v_value = (__pyx_v_value >> 7);
+  }
+
+  /* "thriftworker/protocols/codec.pyx":269
+ *             self.size += 1
+ *             value >>= 7
+ *         self.data[self.size] = <char>value             # <<<<<<<<<<<<<<
+ *         self.size += 1
+ *         return 0
+ */
+  (__pyx_v_self->data[__pyx_v_self->size]) = ((char)__pyx_v_value);
+
+  /* "thriftworker/protocols/codec.pyx":270
+ *             value >>= 7
+ *         self.data[self.size] = <char>value
+ *         self.size += 1             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->size = (__pyx_v_self->size + 1);
+
+  /* "thriftworker/protocols/codec.pyx":271
+ *         self.data[self.size] = <char>value
+ *         self.size += 1
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline bytes getvalue(self):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":263
+ *         return 0
+ * 
+ *     cdef inline int write_varint(self, uint64_t value) except -1:             # <<<<<<<<<<<<<<
+ *         self.reserve(10)
+ *         while value > 0x7f:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.write_varint", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":273
+ *         return 0
+ * 
+ *     cdef inline bytes getvalue(self):             # <<<<<<<<<<<<<<
+ *         return PyBytes_FromStringAndSize(self.data, self.size)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_getvalue(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("getvalue", 0);
+
+  /* "thriftworker/protocols/codec.pyx":274
+ * 
+ *     cdef inline bytes getvalue(self):
+ *         return PyBytes_FromStringAndSize(self.data, self.size)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_self->data, __pyx_v_self->size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":273
+ *         return 0
+ * 
+ *     cdef inline bytes getvalue(self):             # <<<<<<<<<<<<<<
+ *         return PyBytes_FromStringAndSize(self.data, self.size)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.getvalue", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_4__reduce_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_4__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_6__setstate_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_12OutputBuffer_6__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.OutputBuffer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":285
+ *     cdef Py_ssize_t length
+ * 
+ *     def __cinit__(self, bytes value, Py_ssize_t position):             # <<<<<<<<<<<<<<
+ *         self.value = value
+ *         self.data = <const unsigned char *>PyBytes_AS_STRING(value)
+ */
+
+/* Python wrapper */
+static int __pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_value = 0;
+  Py_ssize_t __pyx_v_position;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_value,&__pyx_n_s_position,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_value)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_position)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, 1); __PYX_ERR(0, 285, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 285, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_value = ((PyObject*)values[0]);
+    __pyx_v_position = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_position == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 285, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 285, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyBytes_Type), 1, "value", 1))) __PYX_ERR(0, 285, __pyx_L1_error)
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer___cinit__(((struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *)__pyx_v_self), __pyx_v_value, __pyx_v_position);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer___cinit__(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, PyObject *__pyx_v_value, Py_ssize_t __pyx_v_position) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "thriftworker/protocols/codec.pyx":286
+ * 
+ *     def __cinit__(self, bytes value, Py_ssize_t position):
+ *         self.value = value             # <<<<<<<<<<<<<<
+ *         self.data = <const unsigned char *>PyBytes_AS_STRING(value)
+ *         self.length = PyBytes_GET_SIZE(value)
+ */
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->value);
+  __Pyx_DECREF(__pyx_v_self->value);
+  __pyx_v_self->value = __pyx_v_value;
+
+  /* "thriftworker/protocols/codec.pyx":287
+ *     def __cinit__(self, bytes value, Py_ssize_t position):
+ *         self.value = value
+ *         self.data = <const unsigned char *>PyBytes_AS_STRING(value)             # <<<<<<<<<<<<<<
+ *         self.length = PyBytes_GET_SIZE(value)
+ *         if position < 0 or position > self.length:
+ */
+  __pyx_v_self->data = ((unsigned char const *)PyBytes_AS_STRING(__pyx_v_value));
+
+  /* "thriftworker/protocols/codec.pyx":288
+ *         self.value = value
+ *         self.data = <const unsigned char *>PyBytes_AS_STRING(value)
+ *         self.length = PyBytes_GET_SIZE(value)             # <<<<<<<<<<<<<<
+ *         if position < 0 or position > self.length:
+ *             raise ValueError('position out of range')
+ */
+  __pyx_v_self->length = PyBytes_GET_SIZE(__pyx_v_value);
+
+  /* "thriftworker/protocols/codec.pyx":289
+ *         self.data = <const unsigned char *>PyBytes_AS_STRING(value)
+ *         self.length = PyBytes_GET_SIZE(value)
+ *         if position < 0 or position > self.length:             # <<<<<<<<<<<<<<
+ *             raise ValueError('position out of range')
+ *         self.position = position
+ */
+  __pyx_t_2 = ((__pyx_v_position < 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_position > __pyx_v_self->length) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+    /* "thriftworker/protocols/codec.pyx":290
+ *         self.length = PyBytes_GET_SIZE(value)
+ *         if position < 0 or position > self.length:
+ *             raise ValueError('position out of range')             # <<<<<<<<<<<<<<
+ *         self.position = position
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 290, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":289
+ *         self.data = <const unsigned char *>PyBytes_AS_STRING(value)
+ *         self.length = PyBytes_GET_SIZE(value)
+ *         if position < 0 or position > self.length:             # <<<<<<<<<<<<<<
+ *             raise ValueError('position out of range')
+ *         self.position = position
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":291
+ *         if position < 0 or position > self.length:
+ *             raise ValueError('position out of range')
+ *         self.position = position             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int ensure(self, Py_ssize_t length) except -1:
+ */
+  __pyx_v_self->position = __pyx_v_position;
+
+  /* "thriftworker/protocols/codec.pyx":285
+ *     cdef Py_ssize_t length
+ * 
+ *     def __cinit__(self, bytes value, Py_ssize_t position):             # <<<<<<<<<<<<<<
+ *         self.value = value
+ *         self.data = <const unsigned char *>PyBytes_AS_STRING(value)
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":293
+ *         self.position = position
+ * 
+ *     cdef inline int ensure(self, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *         if length < 0 or self.length - self.position < length:
+ *             raise EOFError()
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, Py_ssize_t __pyx_v_length) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("ensure", 0);
+
+  /* "thriftworker/protocols/codec.pyx":294
+ * 
+ *     cdef inline int ensure(self, Py_ssize_t length) except -1:
+ *         if length < 0 or self.length - self.position < length:             # <<<<<<<<<<<<<<
+ *             raise EOFError()
+ *         return 0
+ */
+  __pyx_t_2 = ((__pyx_v_length < 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_self->length - __pyx_v_self->position) < __pyx_v_length) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+    /* "thriftworker/protocols/codec.pyx":295
+ *     cdef inline int ensure(self, Py_ssize_t length) except -1:
+ *         if length < 0 or self.length - self.position < length:
+ *             raise EOFError()             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_builtin_EOFError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 295, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":294
+ * 
+ *     cdef inline int ensure(self, Py_ssize_t length) except -1:
+ *         if length < 0 or self.length - self.position < length:             # <<<<<<<<<<<<<<
+ *             raise EOFError()
+ *         return 0
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":296
+ *         if length < 0 or self.length - self.position < length:
+ *             raise EOFError()
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline int read_byte(self) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":293
+ *         self.position = position
+ * 
+ *     cdef inline int ensure(self, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *         if length < 0 or self.length - self.position < length:
+ *             raise EOFError()
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.ensure", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":298
+ *         return 0
+ * 
+ *     cdef inline int read_byte(self) except -1:             # <<<<<<<<<<<<<<
+ *         self.ensure(1)
+ *         self.position += 1
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_byte", 0);
+
+  /* "thriftworker/protocols/codec.pyx":299
+ * 
+ *     cdef inline int read_byte(self) except -1:
+ *         self.ensure(1)             # <<<<<<<<<<<<<<
+ *         self.position += 1
+ *         return self.data[self.position - 1]
+ */
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_self, 1); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 299, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":300
+ *     cdef inline int read_byte(self) except -1:
+ *         self.ensure(1)
+ *         self.position += 1             # <<<<<<<<<<<<<<
+ *         return self.data[self.position - 1]
+ * 
+ */
+  __pyx_v_self->position = (__pyx_v_self->position + 1);
+
+  /* "thriftworker/protocols/codec.pyx":301
+ *         self.ensure(1)
+ *         self.position += 1
+ *         return self.data[self.position - 1]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline uint64_t read_big(self, int length) except? 0:
+ */
+  __pyx_r = (__pyx_v_self->data[(__pyx_v_self->position - 1)]);
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":298
+ *         return 0
+ * 
+ *     cdef inline int read_byte(self) except -1:             # <<<<<<<<<<<<<<
+ *         self.ensure(1)
+ *         self.position += 1
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.read_byte", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":303
+ *         return self.data[self.position - 1]
+ * 
+ *     cdef inline uint64_t read_big(self, int length) except? 0:             # <<<<<<<<<<<<<<
+ *         """Read big-endian integer of given length."""
+ *         cdef uint64_t value = 0
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, int __pyx_v_length) {
+  uint64_t __pyx_v_value;
+  int __pyx_v_i;
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_big", 0);
+
+  /* "thriftworker/protocols/codec.pyx":305
+ *     cdef inline uint64_t read_big(self, int length) except? 0:
+ *         """Read big-endian integer of given length."""
+ *         cdef uint64_t value = 0             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         self.ensure(length)
+ */
+  __pyx_v_value = 0;
+
+  /* "thriftworker/protocols/codec.pyx":307
+ *         cdef uint64_t value = 0
+ *         cdef int i
+ *         self.ensure(length)             # <<<<<<<<<<<<<<
+ *         for i in range(length):
+ *             value = (value << 8) | self.data[self.position + i]
+ */
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_self, __pyx_v_length); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 307, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":308
+ *         cdef int i
+ *         self.ensure(length)
+ *         for i in range(length):             # <<<<<<<<<<<<<<
+ *             value = (value << 8) | self.data[self.position + i]
+ *         self.position += length
+ */
+  __pyx_t_1 = __pyx_v_length;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "thriftworker/protocols/codec.pyx":309
+ *         self.ensure(length)
+ *         for i in range(length):
+ *             value = (value << 8) | self.data[self.position + i]             # <<<<<<<<<<<<<<
+ *         self.position += length
+ *         return value
+ */
+    __pyx_v_value = ((__pyx_v_value << 8) | (__pyx_v_self->data[(__pyx_v_self->position + __pyx_v_i)]));
+  }
+
+  /* "thriftworker/protocols/codec.pyx":310
+ *         for i in range(length):
+ *             value = (value << 8) | self.data[self.position + i]
+ *         self.position += length             # <<<<<<<<<<<<<<
+ *         return value
+ * 
+ */
+  __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_length);
+
+  /* "thriftworker/protocols/codec.pyx":311
+ *             value = (value << 8) | self.data[self.position + i]
+ *         self.position += length
+ *         return value             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline uint64_t read_little(self, int length) except? 0:
+ */
+  __pyx_r = __pyx_v_value;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":303
+ *         return self.data[self.position - 1]
+ * 
+ *     cdef inline uint64_t read_big(self, int length) except? 0:             # <<<<<<<<<<<<<<
+ *         """Read big-endian integer of given length."""
+ *         cdef uint64_t value = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.read_big", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":313
+ *         return value
+ * 
+ *     cdef inline uint64_t read_little(self, int length) except? 0:             # <<<<<<<<<<<<<<
+ *         """Read little-endian integer of given length."""
+ *         cdef uint64_t value = 0
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_little(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, int __pyx_v_length) {
+  uint64_t __pyx_v_value;
+  int __pyx_v_i;
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_little", 0);
+
+  /* "thriftworker/protocols/codec.pyx":315
+ *     cdef inline uint64_t read_little(self, int length) except? 0:
+ *         """Read little-endian integer of given length."""
+ *         cdef uint64_t value = 0             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         self.ensure(length)
+ */
+  __pyx_v_value = 0;
+
+  /* "thriftworker/protocols/codec.pyx":317
+ *         cdef uint64_t value = 0
+ *         cdef int i
+ *         self.ensure(length)             # <<<<<<<<<<<<<<
+ *         for i in range(length):
+ *             value |= <uint64_t>self.data[self.position + i] << (8 * i)
+ */
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_self, __pyx_v_length); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 317, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":318
+ *         cdef int i
+ *         self.ensure(length)
+ *         for i in range(length):             # <<<<<<<<<<<<<<
+ *             value |= <uint64_t>self.data[self.position + i] << (8 * i)
+ *         self.position += length
+ */
+  __pyx_t_1 = __pyx_v_length;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "thriftworker/protocols/codec.pyx":319
+ *         self.ensure(length)
+ *         for i in range(length):
+ *             value |= <uint64_t>self.data[self.position + i] << (8 * i)             # <<<<<<<<<<<<<<
+ *         self.position += length
+ *         return value
+ */
+    __pyx_v_value = (__pyx_v_value | (((uint64_t)(__pyx_v_self->data[(__pyx_v_self->position + __pyx_v_i)])) << (8 * __pyx_v_i)));
+  }
+
+  /* "thriftworker/protocols/codec.pyx":320
+ *         for i in range(length):
+ *             value |= <uint64_t>self.data[self.position + i] << (8 * i)
+ *         self.position += length             # <<<<<<<<<<<<<<
+ *         return value
+ * 
+ */
+  __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_length);
+
+  /* "thriftworker/protocols/codec.pyx":321
+ *             value |= <uint64_t>self.data[self.position + i] << (8 * i)
+ *         self.position += length
+ *         return value             # <<<<<<<<<<<<<<
+ * 
+ *     cdef inline uint64_t read_varint(self) except? 0:
+ */
+  __pyx_r = __pyx_v_value;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":313
+ *         return value
+ * 
+ *     cdef inline uint64_t read_little(self, int length) except? 0:             # <<<<<<<<<<<<<<
+ *         """Read little-endian integer of given length."""
+ *         cdef uint64_t value = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.read_little", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":323
+ *         return value
+ * 
+ *     cdef inline uint64_t read_varint(self) except? 0:             # <<<<<<<<<<<<<<
+ *         cdef uint64_t value = 0
+ *         cdef int shift = 0
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_value;
+  int __pyx_v_shift;
+  unsigned char __pyx_v_byte;
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_varint", 0);
+
+  /* "thriftworker/protocols/codec.pyx":324
+ * 
+ *     cdef inline uint64_t read_varint(self) except? 0:
+ *         cdef uint64_t value = 0             # <<<<<<<<<<<<<<
+ *         cdef int shift = 0
+ *         cdef unsigned char byte
+ */
+  __pyx_v_value = 0;
+
+  /* "thriftworker/protocols/codec.pyx":325
+ *     cdef inline uint64_t read_varint(self) except? 0:
+ *         cdef uint64_t value = 0
+ *         cdef int shift = 0             # <<<<<<<<<<<<<<
+ *         cdef unsigned char byte
+ *         while shift < 64:
+ */
+  __pyx_v_shift = 0;
+
+  /* "thriftworker/protocols/codec.pyx":327
+ *         cdef int shift = 0
+ *         cdef unsigned char byte
+ *         while shift < 64:             # <<<<<<<<<<<<<<
+ *             self.ensure(1)
+ *             byte = self.data[self.position]
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_shift < 64) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "thriftworker/protocols/codec.pyx":328
+ *         cdef unsigned char byte
+ *         while shift < 64:
+ *             self.ensure(1)             # <<<<<<<<<<<<<<
+ *             byte = self.data[self.position]
+ *             self.position += 1
+ */
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_self, 1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 328, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":329
+ *         while shift < 64:
+ *             self.ensure(1)
+ *             byte = self.data[self.position]             # <<<<<<<<<<<<<<
+ *             self.position += 1
+ *             value |= <uint64_t>(byte & 0x7f) << shift
+ */
+    __pyx_v_byte = (__pyx_v_self->data[__pyx_v_self->position]);
+
+    /* "thriftworker/protocols/codec.pyx":330
+ *             self.ensure(1)
+ *             byte = self.data[self.position]
+ *             self.position += 1             # <<<<<<<<<<<<<<
+ *             value |= <uint64_t>(byte & 0x7f) << shift
+ *             if not byte & 0x80:
+ */
+    __pyx_v_self->position = (__pyx_v_self->position + 1);
+
+    /* "thriftworker/protocols/codec.pyx":331
+ *             byte = self.data[self.position]
+ *             self.position += 1
+ *             value |= <uint64_t>(byte & 0x7f) << shift             # <<<<<<<<<<<<<<
+ *             if not byte & 0x80:
+ *                 return value
+ */
+    __pyx_v_value = (__pyx_v_value | (((uint64_t)(__pyx_v_byte & 0x7f)) << __pyx_v_shift));
+
+    /* "thriftworker/protocols/codec.pyx":332
+ *             self.position += 1
+ *             value |= <uint64_t>(byte & 0x7f) << shift
+ *             if not byte & 0x80:             # <<<<<<<<<<<<<<
+ *                 return value
+ *             shift += 7
+ */
+    __pyx_t_1 = ((!((__pyx_v_byte & 0x80) != 0)) != 0);
+    if (__pyx_t_1) {
+
+      /* "thriftworker/protocols/codec.pyx":333
+ *             value |= <uint64_t>(byte & 0x7f) << shift
+ *             if not byte & 0x80:
+ *                 return value             # <<<<<<<<<<<<<<
+ *             shift += 7
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,
+ */
+      __pyx_r = __pyx_v_value;
+      goto __pyx_L0;
+
+      /* "thriftworker/protocols/codec.pyx":332
+ *             self.position += 1
+ *             value |= <uint64_t>(byte & 0x7f) << shift
+ *             if not byte & 0x80:             # <<<<<<<<<<<<<<
+ *                 return value
+ *             shift += 7
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":334
+ *             if not byte & 0x80:
+ *                 return value
+ *             shift += 7             # <<<<<<<<<<<<<<
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                                  'varint is too long')
+ */
+    __pyx_v_shift = (__pyx_v_shift + 7);
+  }
+
+  /* "thriftworker/protocols/codec.pyx":335
+ *                 return value
+ *             shift += 7
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,             # <<<<<<<<<<<<<<
+ *                                  'varint is too long')
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_INVALID_DATA); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  __pyx_t_2 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_2 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_6, __pyx_kp_s_varint_is_too_long};
+    __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_2, 2+__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 335, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_6, __pyx_kp_s_varint_is_too_long};
+    __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_2, 2+__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 335, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 335, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_5) {
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_2, __pyx_t_6);
+    __Pyx_INCREF(__pyx_kp_s_varint_is_too_long);
+    __Pyx_GIVEREF(__pyx_kp_s_varint_is_too_long);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_2, __pyx_kp_s_varint_is_too_long);
+    __pyx_t_6 = 0;
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 335, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __PYX_ERR(0, 335, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":323
+ *         return value
+ * 
+ *     cdef inline uint64_t read_varint(self) except? 0:             # <<<<<<<<<<<<<<
+ *         cdef uint64_t value = 0
+ *         cdef int shift = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.read_varint", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":338
+ *                                  'varint is too long')
+ * 
+ *     cdef inline bytes read_raw(self, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *         self.ensure(length)
+ *         self.position += length
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_raw(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, Py_ssize_t __pyx_v_length) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_raw", 0);
+
+  /* "thriftworker/protocols/codec.pyx":339
+ * 
+ *     cdef inline bytes read_raw(self, Py_ssize_t length):
+ *         self.ensure(length)             # <<<<<<<<<<<<<<
+ *         self.position += length
+ *         return PyBytes_FromStringAndSize(
+ */
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_self, __pyx_v_length); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 339, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":340
+ *     cdef inline bytes read_raw(self, Py_ssize_t length):
+ *         self.ensure(length)
+ *         self.position += length             # <<<<<<<<<<<<<<
+ *         return PyBytes_FromStringAndSize(
+ *             <const char *>self.data + self.position - length, length)
+ */
+  __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_length);
+
+  /* "thriftworker/protocols/codec.pyx":341
+ *         self.ensure(length)
+ *         self.position += length
+ *         return PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *             <const char *>self.data + self.position - length, length)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+
+  /* "thriftworker/protocols/codec.pyx":342
+ *         self.position += length
+ *         return PyBytes_FromStringAndSize(
+ *             <const char *>self.data + self.position - length, length)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = PyBytes_FromStringAndSize(((((char const *)__pyx_v_self->data) + __pyx_v_self->position) - __pyx_v_length), __pyx_v_length); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":338
+ *                                  'varint is too long')
+ * 
+ *     cdef inline bytes read_raw(self, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *         self.ensure(length)
+ *         self.position += length
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.read_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer_2__reduce_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer_4__setstate_cython__(((struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_11InputBuffer_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.InputBuffer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":345
+ * 
+ * 
+ * cdef inline uint64_t zigzag(int64_t value):             # <<<<<<<<<<<<<<
+ *     return (<uint64_t>value << 1) ^ <uint64_t>(value >> 63)
+ * 
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_zigzag(int64_t __pyx_v_value) {
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("zigzag", 0);
+
+  /* "thriftworker/protocols/codec.pyx":346
+ * 
+ * cdef inline uint64_t zigzag(int64_t value):
+ *     return (<uint64_t>value << 1) ^ <uint64_t>(value >> 63)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((((uint64_t)__pyx_v_value) << 1) ^ ((uint64_t)(__pyx_v_value >> 63)));
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":345
+ * 
+ * 
+ * cdef inline uint64_t zigzag(int64_t value):             # <<<<<<<<<<<<<<
+ *     return (<uint64_t>value << 1) ^ <uint64_t>(value >> 63)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":349
+ * 
+ * 
+ * cdef inline int64_t unzigzag(uint64_t value):             # <<<<<<<<<<<<<<
+ *     return <int64_t>(value >> 1) ^ -<int64_t>(value & 1)
+ * 
+ */
+
+static CYTHON_INLINE int64_t __pyx_f_12thriftworker_9protocols_5codec_unzigzag(uint64_t __pyx_v_value) {
+  int64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unzigzag", 0);
+
+  /* "thriftworker/protocols/codec.pyx":350
+ * 
+ * cdef inline int64_t unzigzag(uint64_t value):
+ *     return <int64_t>(value >> 1) ^ -<int64_t>(value & 1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (((int64_t)(__pyx_v_value >> 1)) ^ (-((int64_t)(__pyx_v_value & 1))));
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":349
+ * 
+ * 
+ * cdef inline int64_t unzigzag(uint64_t value):             # <<<<<<<<<<<<<<
+ *     return <int64_t>(value >> 1) ^ -<int64_t>(value & 1)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":353
+ * 
+ * 
+ * cdef inline uint64_t double_bits(double value):             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &value, sizeof(bits))
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_12thriftworker_9protocols_5codec_double_bits(double __pyx_v_value) {
+  uint64_t __pyx_v_bits;
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("double_bits", 0);
+
+  /* "thriftworker/protocols/codec.pyx":355
+ * cdef inline uint64_t double_bits(double value):
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &value, sizeof(bits))             # <<<<<<<<<<<<<<
+ *     return bits
+ * 
+ */
+  (void)(memcpy((&__pyx_v_bits), (&__pyx_v_value), (sizeof(__pyx_v_bits))));
+
+  /* "thriftworker/protocols/codec.pyx":356
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &value, sizeof(bits))
+ *     return bits             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_bits;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":353
+ * 
+ * 
+ * cdef inline uint64_t double_bits(double value):             # <<<<<<<<<<<<<<
+ *     cdef uint64_t bits
+ *     memcpy(&bits, &value, sizeof(bits))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":359
+ * 
+ * 
+ * cdef inline double bits_double(uint64_t bits):             # <<<<<<<<<<<<<<
+ *     cdef double value
+ *     memcpy(&value, &bits, sizeof(value))
+ */
+
+static CYTHON_INLINE double __pyx_f_12thriftworker_9protocols_5codec_bits_double(uint64_t __pyx_v_bits) {
+  double __pyx_v_value;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("bits_double", 0);
+
+  /* "thriftworker/protocols/codec.pyx":361
+ * cdef inline double bits_double(uint64_t bits):
+ *     cdef double value
+ *     memcpy(&value, &bits, sizeof(value))             # <<<<<<<<<<<<<<
+ *     return value
+ * 
+ */
+  (void)(memcpy((&__pyx_v_value), (&__pyx_v_bits), (sizeof(__pyx_v_value))));
+
+  /* "thriftworker/protocols/codec.pyx":362
+ *     cdef double value
+ *     memcpy(&value, &bits, sizeof(value))
+ *     return value             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_value;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":359
+ * 
+ * 
+ * cdef inline double bits_double(uint64_t bits):             # <<<<<<<<<<<<<<
+ *     cdef double value
+ *     memcpy(&value, &bits, sizeof(value))
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":365
+ * 
+ * 
+ * cdef inline bytes to_bytes(object value):             # <<<<<<<<<<<<<<
+ *     if isinstance(value, unicode):
+ *         return (<unicode>value).encode('utf-8')
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_12thriftworker_9protocols_5codec_to_bytes(PyObject *__pyx_v_value) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("to_bytes", 0);
+
+  /* "thriftworker/protocols/codec.pyx":366
+ * 
+ * cdef inline bytes to_bytes(object value):
+ *     if isinstance(value, unicode):             # <<<<<<<<<<<<<<
+ *         return (<unicode>value).encode('utf-8')
+ *     return value
+ */
+  __pyx_t_1 = PyUnicode_Check(__pyx_v_value); 
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "thriftworker/protocols/codec.pyx":367
+ * cdef inline bytes to_bytes(object value):
+ *     if isinstance(value, unicode):
+ *         return (<unicode>value).encode('utf-8')             # <<<<<<<<<<<<<<
+ *     return value
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    if (unlikely(__pyx_v_value == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
+      __PYX_ERR(0, 367, __pyx_L1_error)
+    }
+    __pyx_t_3 = PyUnicode_AsUTF8String(((PyObject*)__pyx_v_value)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 367, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = ((PyObject*)__pyx_t_3);
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":366
+ * 
+ * cdef inline bytes to_bytes(object value):
+ *     if isinstance(value, unicode):             # <<<<<<<<<<<<<<
+ *         return (<unicode>value).encode('utf-8')
+ *     return value
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":368
+ *     if isinstance(value, unicode):
+ *         return (<unicode>value).encode('utf-8')
+ *     return value             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  if (!(likely(PyBytes_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(0, 368, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_v_value);
+  __pyx_r = ((PyObject*)__pyx_v_value);
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":365
+ * 
+ * 
+ * cdef inline bytes to_bytes(object value):             # <<<<<<<<<<<<<<
+ *     if isinstance(value, unicode):
+ *         return (<unicode>value).encode('utf-8')
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.to_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":371
+ * 
+ * 
+ * cdef inline int check_type(int expected, int received) except -1:             # <<<<<<<<<<<<<<
+ *     if expected != received:
+ *         raise TProtocolException(
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_check_type(int __pyx_v_expected, int __pyx_v_received) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("check_type", 0);
+
+  /* "thriftworker/protocols/codec.pyx":372
+ * 
+ * cdef inline int check_type(int expected, int received) except -1:
+ *     if expected != received:             # <<<<<<<<<<<<<<
+ *         raise TProtocolException(
+ *             TProtocolException.INVALID_DATA,
+ */
+  __pyx_t_1 = ((__pyx_v_expected != __pyx_v_received) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "thriftworker/protocols/codec.pyx":373
+ * cdef inline int check_type(int expected, int received) except -1:
+ *     if expected != received:
+ *         raise TProtocolException(             # <<<<<<<<<<<<<<
+ *             TProtocolException.INVALID_DATA,
+ *             'expected type {0}, received {1}'.format(expected, received))
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 373, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+
+    /* "thriftworker/protocols/codec.pyx":374
+ *     if expected != received:
+ *         raise TProtocolException(
+ *             TProtocolException.INVALID_DATA,             # <<<<<<<<<<<<<<
+ *             'expected type {0}, received {1}'.format(expected, received))
+ *     return 0
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_INVALID_DATA); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":375
+ *         raise TProtocolException(
+ *             TProtocolException.INVALID_DATA,
+ *             'expected type {0}, received {1}'.format(expected, received))             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_expected_type_0_received_1, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_expected); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_v_received); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = NULL;
+    __pyx_t_10 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+        __pyx_t_10 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_6)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_t_7, __pyx_t_8};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 375, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_9, __pyx_t_7, __pyx_t_8};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 375, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_11 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 375, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      if (__pyx_t_9) {
+        __Pyx_GIVEREF(__pyx_t_9); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_9); __pyx_t_9 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_10, __pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_8);
+      PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_10, __pyx_t_8);
+      __pyx_t_7 = 0;
+      __pyx_t_8 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_11, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 375, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = NULL;
+    __pyx_t_10 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_10 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_11 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 373, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_10, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_10, __pyx_t_4);
+      __pyx_t_5 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_11, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 373, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":372
+ * 
+ * cdef inline int check_type(int expected, int received) except -1:
+ *     if expected != received:             # <<<<<<<<<<<<<<
+ *         raise TProtocolException(
+ *             TProtocolException.INVALID_DATA,
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":376
+ *             TProtocolException.INVALID_DATA,
+ *             'expected type {0}, received {1}'.format(expected, received))
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":371
+ * 
+ * 
+ * cdef inline int check_type(int expected, int received) except -1:             # <<<<<<<<<<<<<<
+ *     if expected != received:
+ *         raise TProtocolException(
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.check_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":379
+ * 
+ * 
+ * cdef inline int check_size(int64_t size) except -1:             # <<<<<<<<<<<<<<
+ *     if size < 0:
+ *         raise TProtocolException(TProtocolException.NEGATIVE_SIZE,
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_check_size(int64_t __pyx_v_size) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("check_size", 0);
+
+  /* "thriftworker/protocols/codec.pyx":380
+ * 
+ * cdef inline int check_size(int64_t size) except -1:
+ *     if size < 0:             # <<<<<<<<<<<<<<
+ *         raise TProtocolException(TProtocolException.NEGATIVE_SIZE,
+ *                                  'negative size {0}'.format(size))
+ */
+  __pyx_t_1 = ((__pyx_v_size < 0) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "thriftworker/protocols/codec.pyx":381
+ * cdef inline int check_size(int64_t size) except -1:
+ *     if size < 0:
+ *         raise TProtocolException(TProtocolException.NEGATIVE_SIZE,             # <<<<<<<<<<<<<<
+ *                                  'negative size {0}'.format(size))
+ *     return 0
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 381, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 381, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_NEGATIVE_SIZE); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 381, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":382
+ *     if size < 0:
+ *         raise TProtocolException(TProtocolException.NEGATIVE_SIZE,
+ *                                  'negative size {0}'.format(size))             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_negative_size_0, __pyx_n_s_format); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 382, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyInt_From_int64_t(__pyx_v_size); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 382, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_8, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 382, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = NULL;
+    __pyx_t_9 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_9 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 2+__pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 381, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_t_5, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_9, 2+__pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 381, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_9); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 381, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6); __pyx_t_6 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_9, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_9, __pyx_t_4);
+      __pyx_t_5 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 381, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 381, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":380
+ * 
+ * cdef inline int check_size(int64_t size) except -1:
+ *     if size < 0:             # <<<<<<<<<<<<<<
+ *         raise TProtocolException(TProtocolException.NEGATIVE_SIZE,
+ *                                  'negative size {0}'.format(size))
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":383
+ *         raise TProtocolException(TProtocolException.NEGATIVE_SIZE,
+ *                                  'negative size {0}'.format(size))
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":379
+ * 
+ * 
+ * cdef inline int check_size(int64_t size) except -1:             # <<<<<<<<<<<<<<
+ *     if size < 0:
+ *         raise TProtocolException(TProtocolException.NEGATIVE_SIZE,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.check_size", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":386
+ * 
+ * 
+ * cdef inline int check_depth(int depth) except -1:             # <<<<<<<<<<<<<<
+ *     if depth > MAX_DEPTH:
+ *         raise TProtocolException(TProtocolException.DEPTH_LIMIT,
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_check_depth(int __pyx_v_depth) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("check_depth", 0);
+
+  /* "thriftworker/protocols/codec.pyx":387
+ * 
+ * cdef inline int check_depth(int depth) except -1:
+ *     if depth > MAX_DEPTH:             # <<<<<<<<<<<<<<
+ *         raise TProtocolException(TProtocolException.DEPTH_LIMIT,
+ *                                  'too deep nesting')
+ */
+  __pyx_t_1 = ((__pyx_v_depth > __pyx_e_12thriftworker_9protocols_5codec_MAX_DEPTH) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "thriftworker/protocols/codec.pyx":388
+ * cdef inline int check_depth(int depth) except -1:
+ *     if depth > MAX_DEPTH:
+ *         raise TProtocolException(TProtocolException.DEPTH_LIMIT,             # <<<<<<<<<<<<<<
+ *                                  'too deep nesting')
+ *     return 0
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 388, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 388, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_DEPTH_LIMIT); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 388, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    __pyx_t_6 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_5, __pyx_kp_s_too_deep_nesting};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 388, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_5, __pyx_kp_s_too_deep_nesting};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 388, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 388, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__pyx_t_4) {
+        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_5);
+      __Pyx_INCREF(__pyx_kp_s_too_deep_nesting);
+      __Pyx_GIVEREF(__pyx_kp_s_too_deep_nesting);
+      PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_kp_s_too_deep_nesting);
+      __pyx_t_5 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 388, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 388, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":387
+ * 
+ * cdef inline int check_depth(int depth) except -1:
+ *     if depth > MAX_DEPTH:             # <<<<<<<<<<<<<<
+ *         raise TProtocolException(TProtocolException.DEPTH_LIMIT,
+ *                                  'too deep nesting')
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":390
+ *         raise TProtocolException(TProtocolException.DEPTH_LIMIT,
+ *                                  'too deep nesting')
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":386
+ * 
+ * 
+ * cdef inline int check_depth(int depth) except -1:             # <<<<<<<<<<<<<<
+ *     if depth > MAX_DEPTH:
+ *         raise TProtocolException(TProtocolException.DEPTH_LIMIT,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.check_depth", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":397
+ * #-----------------------------------------------------------------------------
+ * 
+ * cdef int write_binary_value(OutputBuffer out, TypeSpec spec,             # <<<<<<<<<<<<<<
+ *                             object value) except -1:
+ *     cdef int ttype = spec.ttype
+ */
+
+static int __pyx_f_12thriftworker_9protocols_5codec_write_binary_value(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_out, struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_spec, PyObject *__pyx_v_value) {
+  int __pyx_v_ttype;
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_item = NULL;
+  PyObject *__pyx_v_key = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  uint8_t __pyx_t_2;
+  int __pyx_t_3;
+  int8_t __pyx_t_4;
+  int16_t __pyx_t_5;
+  int32_t __pyx_t_6;
+  int64_t __pyx_t_7;
+  double __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  Py_ssize_t __pyx_t_10;
+  PyObject *(*__pyx_t_11)(PyObject *);
+  PyObject *__pyx_t_12 = NULL;
+  Py_ssize_t __pyx_t_13;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_t_15;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_binary_value", 0);
+
+  /* "thriftworker/protocols/codec.pyx":399
+ * cdef int write_binary_value(OutputBuffer out, TypeSpec spec,
+ *                             object value) except -1:
+ *     cdef int ttype = spec.ttype             # <<<<<<<<<<<<<<
+ *     cdef bytes data
+ *     if ttype == T_BOOL:
+ */
+  __pyx_t_1 = __pyx_v_spec->ttype;
+  __pyx_v_ttype = __pyx_t_1;
+
+  /* "thriftworker/protocols/codec.pyx":401
+ *     cdef int ttype = spec.ttype
+ *     cdef bytes data
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         out.write_byte(1 if value else 0)
+ *     elif ttype == T_BYTE:
+ */
+  switch (__pyx_v_ttype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BOOL:
+
+    /* "thriftworker/protocols/codec.pyx":402
+ *     cdef bytes data
+ *     if ttype == T_BOOL:
+ *         out.write_byte(1 if value else 0)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_BYTE:
+ *         out.write_byte(<uint8_t><int8_t>value)
+ */
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 402, __pyx_L1_error)
+    if (__pyx_t_3) {
+      __pyx_t_2 = 1;
+    } else {
+      __pyx_t_2 = 0;
+    }
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, __pyx_t_2); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 402, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":401
+ *     cdef int ttype = spec.ttype
+ *     cdef bytes data
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         out.write_byte(1 if value else 0)
+ *     elif ttype == T_BYTE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BYTE:
+
+    /* "thriftworker/protocols/codec.pyx":404
+ *         out.write_byte(1 if value else 0)
+ *     elif ttype == T_BYTE:
+ *         out.write_byte(<uint8_t><int8_t>value)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I16:
+ *         out.write_big(<uint64_t><int16_t>value, 2)
+ */
+    __pyx_t_4 = __Pyx_PyInt_As_int8_t(__pyx_v_value); if (unlikely((__pyx_t_4 == ((int8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 404, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, ((uint8_t)((int8_t)__pyx_t_4))); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 404, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":403
+ *     if ttype == T_BOOL:
+ *         out.write_byte(1 if value else 0)
+ *     elif ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         out.write_byte(<uint8_t><int8_t>value)
+ *     elif ttype == T_I16:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I16:
+
+    /* "thriftworker/protocols/codec.pyx":406
+ *         out.write_byte(<uint8_t><int8_t>value)
+ *     elif ttype == T_I16:
+ *         out.write_big(<uint64_t><int16_t>value, 2)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I32:
+ *         out.write_big(<uint64_t><int32_t>value, 4)
+ */
+    __pyx_t_5 = __Pyx_PyInt_As_int16_t(__pyx_v_value); if (unlikely((__pyx_t_5 == ((int16_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 406, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(__pyx_v_out, ((uint64_t)((int16_t)__pyx_t_5)), 2); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 406, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":405
+ *     elif ttype == T_BYTE:
+ *         out.write_byte(<uint8_t><int8_t>value)
+ *     elif ttype == T_I16:             # <<<<<<<<<<<<<<
+ *         out.write_big(<uint64_t><int16_t>value, 2)
+ *     elif ttype == T_I32:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I32:
+
+    /* "thriftworker/protocols/codec.pyx":408
+ *         out.write_big(<uint64_t><int16_t>value, 2)
+ *     elif ttype == T_I32:
+ *         out.write_big(<uint64_t><int32_t>value, 4)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I64:
+ *         out.write_big(<uint64_t><int64_t>value, 8)
+ */
+    __pyx_t_6 = __Pyx_PyInt_As_int32_t(__pyx_v_value); if (unlikely((__pyx_t_6 == ((int32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 408, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(__pyx_v_out, ((uint64_t)((int32_t)__pyx_t_6)), 4); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 408, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":407
+ *     elif ttype == T_I16:
+ *         out.write_big(<uint64_t><int16_t>value, 2)
+ *     elif ttype == T_I32:             # <<<<<<<<<<<<<<
+ *         out.write_big(<uint64_t><int32_t>value, 4)
+ *     elif ttype == T_I64:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I64:
+
+    /* "thriftworker/protocols/codec.pyx":410
+ *         out.write_big(<uint64_t><int32_t>value, 4)
+ *     elif ttype == T_I64:
+ *         out.write_big(<uint64_t><int64_t>value, 8)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_DOUBLE:
+ *         out.write_big(double_bits(value), 8)
+ */
+    __pyx_t_7 = __Pyx_PyInt_As_int64_t(__pyx_v_value); if (unlikely((__pyx_t_7 == ((int64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 410, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(__pyx_v_out, ((uint64_t)((int64_t)__pyx_t_7)), 8); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 410, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":409
+ *     elif ttype == T_I32:
+ *         out.write_big(<uint64_t><int32_t>value, 4)
+ *     elif ttype == T_I64:             # <<<<<<<<<<<<<<
+ *         out.write_big(<uint64_t><int64_t>value, 8)
+ *     elif ttype == T_DOUBLE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE:
+
+    /* "thriftworker/protocols/codec.pyx":412
+ *         out.write_big(<uint64_t><int64_t>value, 8)
+ *     elif ttype == T_DOUBLE:
+ *         out.write_big(double_bits(value), 8)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRING:
+ *         data = to_bytes(value)
+ */
+    __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_value); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 412, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(__pyx_v_out, __pyx_f_12thriftworker_9protocols_5codec_double_bits(__pyx_t_8), 8); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 412, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":411
+ *     elif ttype == T_I64:
+ *         out.write_big(<uint64_t><int64_t>value, 8)
+ *     elif ttype == T_DOUBLE:             # <<<<<<<<<<<<<<
+ *         out.write_big(double_bits(value), 8)
+ *     elif ttype == T_STRING:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRING:
+
+    /* "thriftworker/protocols/codec.pyx":414
+ *         out.write_big(double_bits(value), 8)
+ *     elif ttype == T_STRING:
+ *         data = to_bytes(value)             # <<<<<<<<<<<<<<
+ *         out.write_big(<uint64_t>PyBytes_GET_SIZE(data), 4)
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ */
+    __pyx_t_9 = __pyx_f_12thriftworker_9protocols_5codec_to_bytes(__pyx_v_value); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 414, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_v_data = ((PyObject*)__pyx_t_9);
+    __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":415
+ *     elif ttype == T_STRING:
+ *         data = to_bytes(value)
+ *         out.write_big(<uint64_t>PyBytes_GET_SIZE(data), 4)             # <<<<<<<<<<<<<<
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *     elif ttype == T_STRUCT:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(__pyx_v_out, ((uint64_t)PyBytes_GET_SIZE(__pyx_v_data)), 4); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 415, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":416
+ *         data = to_bytes(value)
+ *         out.write_big(<uint64_t>PyBytes_GET_SIZE(data), 4)
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRUCT:
+ *         write_binary_struct(out, spec.struct, value)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_raw(__pyx_v_out, PyBytes_AS_STRING(__pyx_v_data), PyBytes_GET_SIZE(__pyx_v_data)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 416, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":413
+ *     elif ttype == T_DOUBLE:
+ *         out.write_big(double_bits(value), 8)
+ *     elif ttype == T_STRING:             # <<<<<<<<<<<<<<
+ *         data = to_bytes(value)
+ *         out.write_big(<uint64_t>PyBytes_GET_SIZE(data), 4)
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":418
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *     elif ttype == T_STRUCT:
+ *         write_binary_struct(out, spec.struct, value)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         out.write_byte(spec.value.ttype)
+ */
+    __pyx_t_9 = ((PyObject *)__pyx_v_spec->__pyx_struct);
+    __Pyx_INCREF(__pyx_t_9);
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_write_binary_struct(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_9), __pyx_v_value); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 418, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":417
+ *         out.write_big(<uint64_t>PyBytes_GET_SIZE(data), 4)
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *     elif ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         write_binary_struct(out, spec.struct, value)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":419
+ *     elif ttype == T_STRUCT:
+ *         write_binary_struct(out, spec.struct, value)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         out.write_byte(spec.value.ttype)
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_SET:
+
+    /* "thriftworker/protocols/codec.pyx":420
+ *         write_binary_struct(out, spec.struct, value)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         out.write_byte(spec.value.ttype)             # <<<<<<<<<<<<<<
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ *         for item in value:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, __pyx_v_spec->value->ttype); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 420, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":421
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         out.write_byte(spec.value.ttype)
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)             # <<<<<<<<<<<<<<
+ *         for item in value:
+ *             write_binary_value(out, spec.value, item)
+ */
+    __pyx_t_10 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_10 == ((Py_ssize_t)-1))) __PYX_ERR(0, 421, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(__pyx_v_out, ((uint64_t)((int32_t)__pyx_t_10)), 4); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 421, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":422
+ *         out.write_byte(spec.value.ttype)
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ *         for item in value:             # <<<<<<<<<<<<<<
+ *             write_binary_value(out, spec.value, item)
+ *     elif ttype == T_MAP:
+ */
+    if (likely(PyList_CheckExact(__pyx_v_value)) || PyTuple_CheckExact(__pyx_v_value)) {
+      __pyx_t_9 = __pyx_v_value; __Pyx_INCREF(__pyx_t_9); __pyx_t_10 = 0;
+      __pyx_t_11 = NULL;
+    } else {
+      __pyx_t_10 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_v_value); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 422, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_11 = Py_TYPE(__pyx_t_9)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 422, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_11)) {
+        if (likely(PyList_CheckExact(__pyx_t_9))) {
+          if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_9)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_12 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_10); __Pyx_INCREF(__pyx_t_12); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 422, __pyx_L1_error)
+          #else
+          __pyx_t_12 = PySequence_ITEM(__pyx_t_9, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 422, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          #endif
+        } else {
+          if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_9)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_12 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_10); __Pyx_INCREF(__pyx_t_12); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 422, __pyx_L1_error)
+          #else
+          __pyx_t_12 = PySequence_ITEM(__pyx_t_9, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 422, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          #endif
+        }
+      } else {
+        __pyx_t_12 = __pyx_t_11(__pyx_t_9);
+        if (unlikely(!__pyx_t_12)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 422, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_12);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_12);
+      __pyx_t_12 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":423
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ *         for item in value:
+ *             write_binary_value(out, spec.value, item)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_MAP:
+ *         out.write_byte(spec.key.ttype)
+ */
+      __pyx_t_12 = ((PyObject *)__pyx_v_spec->value);
+      __Pyx_INCREF(__pyx_t_12);
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_write_binary_value(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_12), __pyx_v_item); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 423, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":422
+ *         out.write_byte(spec.value.ttype)
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ *         for item in value:             # <<<<<<<<<<<<<<
+ *             write_binary_value(out, spec.value, item)
+ *     elif ttype == T_MAP:
+ */
+    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":419
+ *     elif ttype == T_STRUCT:
+ *         write_binary_struct(out, spec.struct, value)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         out.write_byte(spec.value.ttype)
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":425
+ *             write_binary_value(out, spec.value, item)
+ *     elif ttype == T_MAP:
+ *         out.write_byte(spec.key.ttype)             # <<<<<<<<<<<<<<
+ *         out.write_byte(spec.value.ttype)
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, __pyx_v_spec->key->ttype); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 425, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":426
+ *     elif ttype == T_MAP:
+ *         out.write_byte(spec.key.ttype)
+ *         out.write_byte(spec.value.ttype)             # <<<<<<<<<<<<<<
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ *         for key, item in value.iteritems():
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, __pyx_v_spec->value->ttype); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 426, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":427
+ *         out.write_byte(spec.key.ttype)
+ *         out.write_byte(spec.value.ttype)
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)             # <<<<<<<<<<<<<<
+ *         for key, item in value.iteritems():
+ *             write_binary_value(out, spec.key, key)
+ */
+    __pyx_t_10 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_10 == ((Py_ssize_t)-1))) __PYX_ERR(0, 427, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(__pyx_v_out, ((uint64_t)((int32_t)__pyx_t_10)), 4); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 427, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":428
+ *         out.write_byte(spec.value.ttype)
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ *         for key, item in value.iteritems():             # <<<<<<<<<<<<<<
+ *             write_binary_value(out, spec.key, key)
+ *             write_binary_value(out, spec.value, item)
+ */
+    __pyx_t_10 = 0;
+    if (unlikely(__pyx_v_value == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "iteritems");
+      __PYX_ERR(0, 428, __pyx_L1_error)
+    }
+    __pyx_t_12 = __Pyx_dict_iterator(__pyx_v_value, 0, __pyx_n_s_iteritems, (&__pyx_t_13), (&__pyx_t_1)); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 428, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_XDECREF(__pyx_t_9);
+    __pyx_t_9 = __pyx_t_12;
+    __pyx_t_12 = 0;
+    while (1) {
+      __pyx_t_15 = __Pyx_dict_iter_next(__pyx_t_9, __pyx_t_13, &__pyx_t_10, &__pyx_t_12, &__pyx_t_14, NULL, __pyx_t_1);
+      if (unlikely(__pyx_t_15 == 0)) break;
+      if (unlikely(__pyx_t_15 == -1)) __PYX_ERR(0, 428, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_12);
+      __pyx_t_12 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_14);
+      __pyx_t_14 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":429
+ *         out.write_big(<uint64_t><int32_t>len(value), 4)
+ *         for key, item in value.iteritems():
+ *             write_binary_value(out, spec.key, key)             # <<<<<<<<<<<<<<
+ *             write_binary_value(out, spec.value, item)
+ *     return 0
+ */
+      __pyx_t_14 = ((PyObject *)__pyx_v_spec->key);
+      __Pyx_INCREF(__pyx_t_14);
+      __pyx_t_15 = __pyx_f_12thriftworker_9protocols_5codec_write_binary_value(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_14), __pyx_v_key); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 429, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":430
+ *         for key, item in value.iteritems():
+ *             write_binary_value(out, spec.key, key)
+ *             write_binary_value(out, spec.value, item)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+      __pyx_t_14 = ((PyObject *)__pyx_v_spec->value);
+      __Pyx_INCREF(__pyx_t_14);
+      __pyx_t_15 = __pyx_f_12thriftworker_9protocols_5codec_write_binary_value(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_14), __pyx_v_item); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 430, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":424
+ *         for item in value:
+ *             write_binary_value(out, spec.value, item)
+ *     elif ttype == T_MAP:             # <<<<<<<<<<<<<<
+ *         out.write_byte(spec.key.ttype)
+ *         out.write_byte(spec.value.ttype)
+ */
+    break;
+    default: break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":431
+ *             write_binary_value(out, spec.key, key)
+ *             write_binary_value(out, spec.value, item)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":397
+ * #-----------------------------------------------------------------------------
+ * 
+ * cdef int write_binary_value(OutputBuffer out, TypeSpec spec,             # <<<<<<<<<<<<<<
+ *                             object value) except -1:
+ *     cdef int ttype = spec.ttype
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.write_binary_value", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":434
+ * 
+ * 
+ * cdef int write_binary_struct(OutputBuffer out, StructSpec spec,             # <<<<<<<<<<<<<<
+ *                              object obj) except -1:
+ *     cdef FieldSpec field
+ */
+
+static int __pyx_f_12thriftworker_9protocols_5codec_write_binary_struct(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_out, struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_spec, PyObject *__pyx_v_obj) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_field = 0;
+  PyObject *__pyx_v_value = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_binary_struct", 0);
+
+  /* "thriftworker/protocols/codec.pyx":437
+ *                              object obj) except -1:
+ *     cdef FieldSpec field
+ *     for field in spec.fields:             # <<<<<<<<<<<<<<
+ *         value = getattr(obj, field.name)
+ *         if value is None:
+ */
+  if (unlikely(__pyx_v_spec->fields == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 437, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_spec->fields; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 437, __pyx_L1_error)
+    #else
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 437, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_12thriftworker_9protocols_5codec_FieldSpec))))) __PYX_ERR(0, 437, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_field, ((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":438
+ *     cdef FieldSpec field
+ *     for field in spec.fields:
+ *         value = getattr(obj, field.name)             # <<<<<<<<<<<<<<
+ *         if value is None:
+ *             continue
+ */
+    __pyx_t_3 = __pyx_v_field->name;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_GetAttr(__pyx_v_obj, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 438, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":439
+ *     for field in spec.fields:
+ *         value = getattr(obj, field.name)
+ *         if value is None:             # <<<<<<<<<<<<<<
+ *             continue
+ *         out.write_byte(field.type.ttype)
+ */
+    __pyx_t_5 = (__pyx_v_value == Py_None);
+    __pyx_t_6 = (__pyx_t_5 != 0);
+    if (__pyx_t_6) {
+
+      /* "thriftworker/protocols/codec.pyx":440
+ *         value = getattr(obj, field.name)
+ *         if value is None:
+ *             continue             # <<<<<<<<<<<<<<
+ *         out.write_byte(field.type.ttype)
+ *         out.write_big(<uint64_t><int16_t>field.fid, 2)
+ */
+      goto __pyx_L3_continue;
+
+      /* "thriftworker/protocols/codec.pyx":439
+ *     for field in spec.fields:
+ *         value = getattr(obj, field.name)
+ *         if value is None:             # <<<<<<<<<<<<<<
+ *             continue
+ *         out.write_byte(field.type.ttype)
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":441
+ *         if value is None:
+ *             continue
+ *         out.write_byte(field.type.ttype)             # <<<<<<<<<<<<<<
+ *         out.write_big(<uint64_t><int16_t>field.fid, 2)
+ *         write_binary_value(out, field.type, value)
+ */
+    __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, __pyx_v_field->type->ttype); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 441, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":442
+ *             continue
+ *         out.write_byte(field.type.ttype)
+ *         out.write_big(<uint64_t><int16_t>field.fid, 2)             # <<<<<<<<<<<<<<
+ *         write_binary_value(out, field.type, value)
+ *     out.write_byte(T_STOP)
+ */
+    __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big(__pyx_v_out, ((uint64_t)((int16_t)__pyx_v_field->fid)), 2); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 442, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":443
+ *         out.write_byte(field.type.ttype)
+ *         out.write_big(<uint64_t><int16_t>field.fid, 2)
+ *         write_binary_value(out, field.type, value)             # <<<<<<<<<<<<<<
+ *     out.write_byte(T_STOP)
+ *     return 0
+ */
+    __pyx_t_4 = ((PyObject *)__pyx_v_field->type);
+    __Pyx_INCREF(__pyx_t_4);
+    __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_write_binary_value(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_4), __pyx_v_value); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":437
+ *                              object obj) except -1:
+ *     cdef FieldSpec field
+ *     for field in spec.fields:             # <<<<<<<<<<<<<<
+ *         value = getattr(obj, field.name)
+ *         if value is None:
+ */
+    __pyx_L3_continue:;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":444
+ *         out.write_big(<uint64_t><int16_t>field.fid, 2)
+ *         write_binary_value(out, field.type, value)
+ *     out.write_byte(T_STOP)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+  __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, __pyx_e_12thriftworker_9protocols_5codec_T_STOP); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 444, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":445
+ *         write_binary_value(out, field.type, value)
+ *     out.write_byte(T_STOP)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":434
+ * 
+ * 
+ * cdef int write_binary_struct(OutputBuffer out, StructSpec spec,             # <<<<<<<<<<<<<<
+ *                              object obj) except -1:
+ *     cdef FieldSpec field
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.write_binary_struct", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_field);
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":448
+ * 
+ * 
+ * cdef object read_binary_value(InputBuffer inp, TypeSpec spec):             # <<<<<<<<<<<<<<
+ *     cdef int ttype = spec.ttype
+ *     cdef int etype, ktype, vtype
+ */
+
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec_read_binary_value(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp, struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_spec) {
+  int __pyx_v_ttype;
+  int __pyx_v_etype;
+  int __pyx_v_ktype;
+  int __pyx_v_vtype;
+  int32_t __pyx_v_size;
+  CYTHON_UNUSED int32_t __pyx_v_i;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  uint64_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int32_t __pyx_t_6;
+  int32_t __pyx_t_7;
+  int32_t __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_binary_value", 0);
+
+  /* "thriftworker/protocols/codec.pyx":449
+ * 
+ * cdef object read_binary_value(InputBuffer inp, TypeSpec spec):
+ *     cdef int ttype = spec.ttype             # <<<<<<<<<<<<<<
+ *     cdef int etype, ktype, vtype
+ *     cdef int32_t size
+ */
+  __pyx_t_1 = __pyx_v_spec->ttype;
+  __pyx_v_ttype = __pyx_t_1;
+
+  /* "thriftworker/protocols/codec.pyx":453
+ *     cdef int32_t size
+ *     cdef int32_t i
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         return inp.read_byte() != 0
+ *     elif ttype == T_BYTE:
+ */
+  switch (__pyx_v_ttype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BOOL:
+
+    /* "thriftworker/protocols/codec.pyx":454
+ *     cdef int32_t i
+ *     if ttype == T_BOOL:
+ *         return inp.read_byte() != 0             # <<<<<<<<<<<<<<
+ *     elif ttype == T_BYTE:
+ *         return <int8_t>inp.read_byte()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 454, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_t_1 != 0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 454, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":453
+ *     cdef int32_t size
+ *     cdef int32_t i
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         return inp.read_byte() != 0
+ *     elif ttype == T_BYTE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BYTE:
+
+    /* "thriftworker/protocols/codec.pyx":456
+ *         return inp.read_byte() != 0
+ *     elif ttype == T_BYTE:
+ *         return <int8_t>inp.read_byte()             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I16:
+ *         return <int16_t>inp.read_big(2)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 456, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int8_t(((int8_t)__pyx_t_1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 456, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":455
+ *     if ttype == T_BOOL:
+ *         return inp.read_byte() != 0
+ *     elif ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         return <int8_t>inp.read_byte()
+ *     elif ttype == T_I16:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I16:
+
+    /* "thriftworker/protocols/codec.pyx":458
+ *         return <int8_t>inp.read_byte()
+ *     elif ttype == T_I16:
+ *         return <int16_t>inp.read_big(2)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I32:
+ *         return <int32_t>inp.read_big(4)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 2); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 458, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int16_t(((int16_t)__pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 458, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":457
+ *     elif ttype == T_BYTE:
+ *         return <int8_t>inp.read_byte()
+ *     elif ttype == T_I16:             # <<<<<<<<<<<<<<
+ *         return <int16_t>inp.read_big(2)
+ *     elif ttype == T_I32:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I32:
+
+    /* "thriftworker/protocols/codec.pyx":460
+ *         return <int16_t>inp.read_big(2)
+ *     elif ttype == T_I32:
+ *         return <int32_t>inp.read_big(4)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I64:
+ *         return <int64_t>inp.read_big(8)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 4); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 460, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int32_t(((int32_t)__pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 460, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":459
+ *     elif ttype == T_I16:
+ *         return <int16_t>inp.read_big(2)
+ *     elif ttype == T_I32:             # <<<<<<<<<<<<<<
+ *         return <int32_t>inp.read_big(4)
+ *     elif ttype == T_I64:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I64:
+
+    /* "thriftworker/protocols/codec.pyx":462
+ *         return <int32_t>inp.read_big(4)
+ *     elif ttype == T_I64:
+ *         return <int64_t>inp.read_big(8)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_DOUBLE:
+ *         return bits_double(inp.read_big(8))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 8); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 462, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int64_t(((int64_t)__pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 462, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":461
+ *     elif ttype == T_I32:
+ *         return <int32_t>inp.read_big(4)
+ *     elif ttype == T_I64:             # <<<<<<<<<<<<<<
+ *         return <int64_t>inp.read_big(8)
+ *     elif ttype == T_DOUBLE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE:
+
+    /* "thriftworker/protocols/codec.pyx":464
+ *         return <int64_t>inp.read_big(8)
+ *     elif ttype == T_DOUBLE:
+ *         return bits_double(inp.read_big(8))             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRING:
+ *         size = <int32_t>inp.read_big(4)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 8); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 464, __pyx_L1_error)
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_f_12thriftworker_9protocols_5codec_bits_double(__pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 464, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":463
+ *     elif ttype == T_I64:
+ *         return <int64_t>inp.read_big(8)
+ *     elif ttype == T_DOUBLE:             # <<<<<<<<<<<<<<
+ *         return bits_double(inp.read_big(8))
+ *     elif ttype == T_STRING:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRING:
+
+    /* "thriftworker/protocols/codec.pyx":466
+ *         return bits_double(inp.read_big(8))
+ *     elif ttype == T_STRING:
+ *         size = <int32_t>inp.read_big(4)             # <<<<<<<<<<<<<<
+ *         check_size(size)
+ *         return inp.read_raw(size)
+ */
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 4); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 466, __pyx_L1_error)
+    __pyx_v_size = ((int32_t)__pyx_t_3);
+
+    /* "thriftworker/protocols/codec.pyx":467
+ *     elif ttype == T_STRING:
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)             # <<<<<<<<<<<<<<
+ *         return inp.read_raw(size)
+ *     elif ttype == T_STRUCT:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_size(__pyx_v_size); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 467, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":468
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ *         return inp.read_raw(size)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRUCT:
+ *         return read_binary_struct(inp, spec.struct, None)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_raw(__pyx_v_inp, __pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 468, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":465
+ *     elif ttype == T_DOUBLE:
+ *         return bits_double(inp.read_big(8))
+ *     elif ttype == T_STRING:             # <<<<<<<<<<<<<<
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":470
+ *         return inp.read_raw(size)
+ *     elif ttype == T_STRUCT:
+ *         return read_binary_struct(inp, spec.struct, None)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         etype = inp.read_byte()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((PyObject *)__pyx_v_spec->__pyx_struct);
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_4 = __pyx_f_12thriftworker_9protocols_5codec_read_binary_struct(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_2), Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 470, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_4;
+    __pyx_t_4 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":469
+ *         check_size(size)
+ *         return inp.read_raw(size)
+ *     elif ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         return read_binary_struct(inp, spec.struct, None)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":471
+ *     elif ttype == T_STRUCT:
+ *         return read_binary_struct(inp, spec.struct, None)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         etype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_SET:
+
+    /* "thriftworker/protocols/codec.pyx":472
+ *         return read_binary_struct(inp, spec.struct, None)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         etype = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 472, __pyx_L1_error)
+    __pyx_v_etype = __pyx_t_1;
+
+    /* "thriftworker/protocols/codec.pyx":473
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         etype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)             # <<<<<<<<<<<<<<
+ *         check_size(size)
+ *         if size:
+ */
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 4); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 473, __pyx_L1_error)
+    __pyx_v_size = ((int32_t)__pyx_t_3);
+
+    /* "thriftworker/protocols/codec.pyx":474
+ *         etype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)             # <<<<<<<<<<<<<<
+ *         if size:
+ *             check_type(spec.value.ttype, etype)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_size(__pyx_v_size); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 474, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":475
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             check_type(spec.value.ttype, etype)
+ *         if ttype == T_LIST:
+ */
+    __pyx_t_5 = (__pyx_v_size != 0);
+    if (__pyx_t_5) {
+
+      /* "thriftworker/protocols/codec.pyx":476
+ *         check_size(size)
+ *         if size:
+ *             check_type(spec.value.ttype, etype)             # <<<<<<<<<<<<<<
+ *         if ttype == T_LIST:
+ *             return [read_binary_value(inp, spec.value) for i in range(size)]
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_type(__pyx_v_spec->value->ttype, __pyx_v_etype); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 476, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":475
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             check_type(spec.value.ttype, etype)
+ *         if ttype == T_LIST:
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":477
+ *         if size:
+ *             check_type(spec.value.ttype, etype)
+ *         if ttype == T_LIST:             # <<<<<<<<<<<<<<
+ *             return [read_binary_value(inp, spec.value) for i in range(size)]
+ *         return set([read_binary_value(inp, spec.value)
+ */
+    __pyx_t_5 = ((__pyx_v_ttype == __pyx_e_12thriftworker_9protocols_5codec_T_LIST) != 0);
+    if (__pyx_t_5) {
+
+      /* "thriftworker/protocols/codec.pyx":478
+ *             check_type(spec.value.ttype, etype)
+ *         if ttype == T_LIST:
+ *             return [read_binary_value(inp, spec.value) for i in range(size)]             # <<<<<<<<<<<<<<
+ *         return set([read_binary_value(inp, spec.value)
+ *                     for i in range(size)])
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 478, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = __pyx_v_size;
+      __pyx_t_7 = __pyx_t_6;
+      for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+        __pyx_v_i = __pyx_t_8;
+        __pyx_t_2 = ((PyObject *)__pyx_v_spec->value);
+        __Pyx_INCREF(__pyx_t_2);
+        __pyx_t_9 = __pyx_f_12thriftworker_9protocols_5codec_read_binary_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_2)); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 478, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_4, (PyObject*)__pyx_t_9))) __PYX_ERR(0, 478, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      }
+      __pyx_r = __pyx_t_4;
+      __pyx_t_4 = 0;
+      goto __pyx_L0;
+
+      /* "thriftworker/protocols/codec.pyx":477
+ *         if size:
+ *             check_type(spec.value.ttype, etype)
+ *         if ttype == T_LIST:             # <<<<<<<<<<<<<<
+ *             return [read_binary_value(inp, spec.value) for i in range(size)]
+ *         return set([read_binary_value(inp, spec.value)
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":479
+ *         if ttype == T_LIST:
+ *             return [read_binary_value(inp, spec.value) for i in range(size)]
+ *         return set([read_binary_value(inp, spec.value)             # <<<<<<<<<<<<<<
+ *                     for i in range(size)])
+ *     elif ttype == T_MAP:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 479, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+
+    /* "thriftworker/protocols/codec.pyx":480
+ *             return [read_binary_value(inp, spec.value) for i in range(size)]
+ *         return set([read_binary_value(inp, spec.value)
+ *                     for i in range(size)])             # <<<<<<<<<<<<<<
+ *     elif ttype == T_MAP:
+ *         ktype = inp.read_byte()
+ */
+    __pyx_t_6 = __pyx_v_size;
+    __pyx_t_7 = __pyx_t_6;
+    for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+      __pyx_v_i = __pyx_t_8;
+
+      /* "thriftworker/protocols/codec.pyx":479
+ *         if ttype == T_LIST:
+ *             return [read_binary_value(inp, spec.value) for i in range(size)]
+ *         return set([read_binary_value(inp, spec.value)             # <<<<<<<<<<<<<<
+ *                     for i in range(size)])
+ *     elif ttype == T_MAP:
+ */
+      __pyx_t_9 = ((PyObject *)__pyx_v_spec->value);
+      __Pyx_INCREF(__pyx_t_9);
+      __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_read_binary_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_9)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 479, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_4, (PyObject*)__pyx_t_2))) __PYX_ERR(0, 479, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    }
+    __pyx_t_2 = PySet_New(__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 479, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":471
+ *     elif ttype == T_STRUCT:
+ *         return read_binary_struct(inp, spec.struct, None)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         etype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":482
+ *                     for i in range(size)])
+ *     elif ttype == T_MAP:
+ *         ktype = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         vtype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 482, __pyx_L1_error)
+    __pyx_v_ktype = __pyx_t_1;
+
+    /* "thriftworker/protocols/codec.pyx":483
+ *     elif ttype == T_MAP:
+ *         ktype = inp.read_byte()
+ *         vtype = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 483, __pyx_L1_error)
+    __pyx_v_vtype = __pyx_t_1;
+
+    /* "thriftworker/protocols/codec.pyx":484
+ *         ktype = inp.read_byte()
+ *         vtype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)             # <<<<<<<<<<<<<<
+ *         check_size(size)
+ *         if size:
+ */
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 4); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 484, __pyx_L1_error)
+    __pyx_v_size = ((int32_t)__pyx_t_3);
+
+    /* "thriftworker/protocols/codec.pyx":485
+ *         vtype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)             # <<<<<<<<<<<<<<
+ *         if size:
+ *             check_type(spec.key.ttype, ktype)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_size(__pyx_v_size); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 485, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":486
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             check_type(spec.key.ttype, ktype)
+ *             check_type(spec.value.ttype, vtype)
+ */
+    __pyx_t_5 = (__pyx_v_size != 0);
+    if (__pyx_t_5) {
+
+      /* "thriftworker/protocols/codec.pyx":487
+ *         check_size(size)
+ *         if size:
+ *             check_type(spec.key.ttype, ktype)             # <<<<<<<<<<<<<<
+ *             check_type(spec.value.ttype, vtype)
+ *         result = {}
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_type(__pyx_v_spec->key->ttype, __pyx_v_ktype); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 487, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":488
+ *         if size:
+ *             check_type(spec.key.ttype, ktype)
+ *             check_type(spec.value.ttype, vtype)             # <<<<<<<<<<<<<<
+ *         result = {}
+ *         for i in range(size):
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_type(__pyx_v_spec->value->ttype, __pyx_v_vtype); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 488, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":486
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             check_type(spec.key.ttype, ktype)
+ *             check_type(spec.value.ttype, vtype)
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":489
+ *             check_type(spec.key.ttype, ktype)
+ *             check_type(spec.value.ttype, vtype)
+ *         result = {}             # <<<<<<<<<<<<<<
+ *         for i in range(size):
+ *             key = read_binary_value(inp, spec.key)
+ */
+    __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 489, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_v_result = ((PyObject*)__pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":490
+ *             check_type(spec.value.ttype, vtype)
+ *         result = {}
+ *         for i in range(size):             # <<<<<<<<<<<<<<
+ *             key = read_binary_value(inp, spec.key)
+ *             result[key] = read_binary_value(inp, spec.value)
+ */
+    __pyx_t_6 = __pyx_v_size;
+    __pyx_t_7 = __pyx_t_6;
+    for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+      __pyx_v_i = __pyx_t_8;
+
+      /* "thriftworker/protocols/codec.pyx":491
+ *         result = {}
+ *         for i in range(size):
+ *             key = read_binary_value(inp, spec.key)             # <<<<<<<<<<<<<<
+ *             result[key] = read_binary_value(inp, spec.value)
+ *         return result
+ */
+      __pyx_t_2 = ((PyObject *)__pyx_v_spec->key);
+      __Pyx_INCREF(__pyx_t_2);
+      __pyx_t_4 = __pyx_f_12thriftworker_9protocols_5codec_read_binary_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_2)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 491, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_4);
+      __pyx_t_4 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":492
+ *         for i in range(size):
+ *             key = read_binary_value(inp, spec.key)
+ *             result[key] = read_binary_value(inp, spec.value)             # <<<<<<<<<<<<<<
+ *         return result
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ */
+      __pyx_t_4 = ((PyObject *)__pyx_v_spec->value);
+      __Pyx_INCREF(__pyx_t_4);
+      __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_read_binary_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_4)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 492, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(PyDict_SetItem(__pyx_v_result, __pyx_v_key, __pyx_t_2) < 0)) __PYX_ERR(0, 492, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    }
+
+    /* "thriftworker/protocols/codec.pyx":493
+ *             key = read_binary_value(inp, spec.key)
+ *             result[key] = read_binary_value(inp, spec.value)
+ *         return result             # <<<<<<<<<<<<<<
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                              'unknown type {0}'.format(ttype))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_result);
+    __pyx_r = __pyx_v_result;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":481
+ *         return set([read_binary_value(inp, spec.value)
+ *                     for i in range(size)])
+ *     elif ttype == T_MAP:             # <<<<<<<<<<<<<<
+ *         ktype = inp.read_byte()
+ *         vtype = inp.read_byte()
+ */
+    break;
+    default: break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":494
+ *             result[key] = read_binary_value(inp, spec.value)
+ *         return result
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,             # <<<<<<<<<<<<<<
+ *                              'unknown type {0}'.format(ttype))
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_INVALID_DATA); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":495
+ *         return result
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                              'unknown type {0}'.format(ttype))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_unknown_type_0, __pyx_n_s_format); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 495, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_ttype); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 495, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_11))) {
+    __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_11);
+    if (likely(__pyx_t_13)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_11);
+      __Pyx_INCREF(__pyx_t_13);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_11, function);
+    }
+  }
+  __pyx_t_9 = (__pyx_t_13) ? __Pyx_PyObject_Call2Args(__pyx_t_11, __pyx_t_13, __pyx_t_12) : __Pyx_PyObject_CallOneArg(__pyx_t_11, __pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 495, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_11 = NULL;
+  __pyx_t_1 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_11)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_11);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_1 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_11, __pyx_t_10, __pyx_t_9};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 494, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_11, __pyx_t_10, __pyx_t_9};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 494, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_12 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 494, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    if (__pyx_t_11) {
+      __Pyx_GIVEREF(__pyx_t_11); PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_11); __pyx_t_11 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_12, 0+__pyx_t_1, __pyx_t_10);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_12, 1+__pyx_t_1, __pyx_t_9);
+    __pyx_t_10 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_12, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 494, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __PYX_ERR(0, 494, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":448
+ * 
+ * 
+ * cdef object read_binary_value(InputBuffer inp, TypeSpec spec):             # <<<<<<<<<<<<<<
+ *     cdef int ttype = spec.ttype
+ *     cdef int etype, ktype, vtype
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.read_binary_value", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":498
+ * 
+ * 
+ * cdef int skip_binary(InputBuffer inp, int ttype, int depth) except -1:             # <<<<<<<<<<<<<<
+ *     cdef int32_t size
+ *     cdef int32_t i
+ */
+
+static int __pyx_f_12thriftworker_9protocols_5codec_skip_binary(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp, int __pyx_v_ttype, int __pyx_v_depth) {
+  int32_t __pyx_v_size;
+  CYTHON_UNUSED int32_t __pyx_v_i;
+  int __pyx_v_etype;
+  int __pyx_v_ktype;
+  int __pyx_v_vtype;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  uint64_t __pyx_t_2;
+  int __pyx_t_3;
+  int32_t __pyx_t_4;
+  int32_t __pyx_t_5;
+  int32_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("skip_binary", 0);
+
+  /* "thriftworker/protocols/codec.pyx":502
+ *     cdef int32_t i
+ *     cdef int etype, ktype, vtype
+ *     check_depth(depth)             # <<<<<<<<<<<<<<
+ *     if ttype == T_BOOL or ttype == T_BYTE:
+ *         inp.ensure(1)
+ */
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_depth(__pyx_v_depth); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 502, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":503
+ *     cdef int etype, ktype, vtype
+ *     check_depth(depth)
+ *     if ttype == T_BOOL or ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         inp.ensure(1)
+ *         inp.position += 1
+ */
+  switch (__pyx_v_ttype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BOOL:
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BYTE:
+
+    /* "thriftworker/protocols/codec.pyx":504
+ *     check_depth(depth)
+ *     if ttype == T_BOOL or ttype == T_BYTE:
+ *         inp.ensure(1)             # <<<<<<<<<<<<<<
+ *         inp.position += 1
+ *     elif ttype == T_I16:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_inp, 1); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 504, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":505
+ *     if ttype == T_BOOL or ttype == T_BYTE:
+ *         inp.ensure(1)
+ *         inp.position += 1             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I16:
+ *         inp.ensure(2)
+ */
+    __pyx_v_inp->position = (__pyx_v_inp->position + 1);
+
+    /* "thriftworker/protocols/codec.pyx":503
+ *     cdef int etype, ktype, vtype
+ *     check_depth(depth)
+ *     if ttype == T_BOOL or ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         inp.ensure(1)
+ *         inp.position += 1
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I16:
+
+    /* "thriftworker/protocols/codec.pyx":507
+ *         inp.position += 1
+ *     elif ttype == T_I16:
+ *         inp.ensure(2)             # <<<<<<<<<<<<<<
+ *         inp.position += 2
+ *     elif ttype == T_I32:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_inp, 2); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 507, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":508
+ *     elif ttype == T_I16:
+ *         inp.ensure(2)
+ *         inp.position += 2             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I32:
+ *         inp.ensure(4)
+ */
+    __pyx_v_inp->position = (__pyx_v_inp->position + 2);
+
+    /* "thriftworker/protocols/codec.pyx":506
+ *         inp.ensure(1)
+ *         inp.position += 1
+ *     elif ttype == T_I16:             # <<<<<<<<<<<<<<
+ *         inp.ensure(2)
+ *         inp.position += 2
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I32:
+
+    /* "thriftworker/protocols/codec.pyx":510
+ *         inp.position += 2
+ *     elif ttype == T_I32:
+ *         inp.ensure(4)             # <<<<<<<<<<<<<<
+ *         inp.position += 4
+ *     elif ttype == T_I64 or ttype == T_DOUBLE:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_inp, 4); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 510, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":511
+ *     elif ttype == T_I32:
+ *         inp.ensure(4)
+ *         inp.position += 4             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I64 or ttype == T_DOUBLE:
+ *         inp.ensure(8)
+ */
+    __pyx_v_inp->position = (__pyx_v_inp->position + 4);
+
+    /* "thriftworker/protocols/codec.pyx":509
+ *         inp.ensure(2)
+ *         inp.position += 2
+ *     elif ttype == T_I32:             # <<<<<<<<<<<<<<
+ *         inp.ensure(4)
+ *         inp.position += 4
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I64:
+
+    /* "thriftworker/protocols/codec.pyx":512
+ *         inp.ensure(4)
+ *         inp.position += 4
+ *     elif ttype == T_I64 or ttype == T_DOUBLE:             # <<<<<<<<<<<<<<
+ *         inp.ensure(8)
+ *         inp.position += 8
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE:
+
+    /* "thriftworker/protocols/codec.pyx":513
+ *         inp.position += 4
+ *     elif ttype == T_I64 or ttype == T_DOUBLE:
+ *         inp.ensure(8)             # <<<<<<<<<<<<<<
+ *         inp.position += 8
+ *     elif ttype == T_STRING:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_inp, 8); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 513, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":514
+ *     elif ttype == T_I64 or ttype == T_DOUBLE:
+ *         inp.ensure(8)
+ *         inp.position += 8             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRING:
+ *         size = <int32_t>inp.read_big(4)
+ */
+    __pyx_v_inp->position = (__pyx_v_inp->position + 8);
+
+    /* "thriftworker/protocols/codec.pyx":512
+ *         inp.ensure(4)
+ *         inp.position += 4
+ *     elif ttype == T_I64 or ttype == T_DOUBLE:             # <<<<<<<<<<<<<<
+ *         inp.ensure(8)
+ *         inp.position += 8
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRING:
+
+    /* "thriftworker/protocols/codec.pyx":516
+ *         inp.position += 8
+ *     elif ttype == T_STRING:
+ *         size = <int32_t>inp.read_big(4)             # <<<<<<<<<<<<<<
+ *         check_size(size)
+ *         inp.ensure(size)
+ */
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 4); if (unlikely(__pyx_t_2 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 516, __pyx_L1_error)
+    __pyx_v_size = ((int32_t)__pyx_t_2);
+
+    /* "thriftworker/protocols/codec.pyx":517
+ *     elif ttype == T_STRING:
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)             # <<<<<<<<<<<<<<
+ *         inp.ensure(size)
+ *         inp.position += size
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_size(__pyx_v_size); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 517, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":518
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ *         inp.ensure(size)             # <<<<<<<<<<<<<<
+ *         inp.position += size
+ *     elif ttype == T_STRUCT:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_inp, __pyx_v_size); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 518, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":519
+ *         check_size(size)
+ *         inp.ensure(size)
+ *         inp.position += size             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRUCT:
+ *         while True:
+ */
+    __pyx_v_inp->position = (__pyx_v_inp->position + __pyx_v_size);
+
+    /* "thriftworker/protocols/codec.pyx":515
+ *         inp.ensure(8)
+ *         inp.position += 8
+ *     elif ttype == T_STRING:             # <<<<<<<<<<<<<<
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":521
+ *         inp.position += size
+ *     elif ttype == T_STRUCT:
+ *         while True:             # <<<<<<<<<<<<<<
+ *             etype = inp.read_byte()
+ *             if etype == T_STOP:
+ */
+    while (1) {
+
+      /* "thriftworker/protocols/codec.pyx":522
+ *     elif ttype == T_STRUCT:
+ *         while True:
+ *             etype = inp.read_byte()             # <<<<<<<<<<<<<<
+ *             if etype == T_STOP:
+ *                 break
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 522, __pyx_L1_error)
+      __pyx_v_etype = __pyx_t_1;
+
+      /* "thriftworker/protocols/codec.pyx":523
+ *         while True:
+ *             etype = inp.read_byte()
+ *             if etype == T_STOP:             # <<<<<<<<<<<<<<
+ *                 break
+ *             inp.read_big(2)
+ */
+      __pyx_t_3 = ((__pyx_v_etype == __pyx_e_12thriftworker_9protocols_5codec_T_STOP) != 0);
+      if (__pyx_t_3) {
+
+        /* "thriftworker/protocols/codec.pyx":524
+ *             etype = inp.read_byte()
+ *             if etype == T_STOP:
+ *                 break             # <<<<<<<<<<<<<<
+ *             inp.read_big(2)
+ *             skip_binary(inp, etype, depth + 1)
+ */
+        goto __pyx_L4_break;
+
+        /* "thriftworker/protocols/codec.pyx":523
+ *         while True:
+ *             etype = inp.read_byte()
+ *             if etype == T_STOP:             # <<<<<<<<<<<<<<
+ *                 break
+ *             inp.read_big(2)
+ */
+      }
+
+      /* "thriftworker/protocols/codec.pyx":525
+ *             if etype == T_STOP:
+ *                 break
+ *             inp.read_big(2)             # <<<<<<<<<<<<<<
+ *             skip_binary(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+      __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 2); if (unlikely(__pyx_t_2 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 525, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":526
+ *                 break
+ *             inp.read_big(2)
+ *             skip_binary(inp, etype, depth + 1)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         etype = inp.read_byte()
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_skip_binary(__pyx_v_inp, __pyx_v_etype, (__pyx_v_depth + 1)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 526, __pyx_L1_error)
+    }
+    __pyx_L4_break:;
+
+    /* "thriftworker/protocols/codec.pyx":520
+ *         inp.ensure(size)
+ *         inp.position += size
+ *     elif ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         while True:
+ *             etype = inp.read_byte()
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":527
+ *             inp.read_big(2)
+ *             skip_binary(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         etype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_SET:
+
+    /* "thriftworker/protocols/codec.pyx":528
+ *             skip_binary(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         etype = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 528, __pyx_L1_error)
+    __pyx_v_etype = __pyx_t_1;
+
+    /* "thriftworker/protocols/codec.pyx":529
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         etype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)             # <<<<<<<<<<<<<<
+ *         check_size(size)
+ *         for i in range(size):
+ */
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 4); if (unlikely(__pyx_t_2 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 529, __pyx_L1_error)
+    __pyx_v_size = ((int32_t)__pyx_t_2);
+
+    /* "thriftworker/protocols/codec.pyx":530
+ *         etype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)             # <<<<<<<<<<<<<<
+ *         for i in range(size):
+ *             skip_binary(inp, etype, depth + 1)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_size(__pyx_v_size); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 530, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":531
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ *         for i in range(size):             # <<<<<<<<<<<<<<
+ *             skip_binary(inp, etype, depth + 1)
+ *     elif ttype == T_MAP:
+ */
+    __pyx_t_4 = __pyx_v_size;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "thriftworker/protocols/codec.pyx":532
+ *         check_size(size)
+ *         for i in range(size):
+ *             skip_binary(inp, etype, depth + 1)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_MAP:
+ *         ktype = inp.read_byte()
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_skip_binary(__pyx_v_inp, __pyx_v_etype, (__pyx_v_depth + 1)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 532, __pyx_L1_error)
+    }
+
+    /* "thriftworker/protocols/codec.pyx":527
+ *             inp.read_big(2)
+ *             skip_binary(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         etype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":534
+ *             skip_binary(inp, etype, depth + 1)
+ *     elif ttype == T_MAP:
+ *         ktype = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         vtype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 534, __pyx_L1_error)
+    __pyx_v_ktype = __pyx_t_1;
+
+    /* "thriftworker/protocols/codec.pyx":535
+ *     elif ttype == T_MAP:
+ *         ktype = inp.read_byte()
+ *         vtype = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 535, __pyx_L1_error)
+    __pyx_v_vtype = __pyx_t_1;
+
+    /* "thriftworker/protocols/codec.pyx":536
+ *         ktype = inp.read_byte()
+ *         vtype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)             # <<<<<<<<<<<<<<
+ *         check_size(size)
+ *         for i in range(size):
+ */
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 4); if (unlikely(__pyx_t_2 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 536, __pyx_L1_error)
+    __pyx_v_size = ((int32_t)__pyx_t_2);
+
+    /* "thriftworker/protocols/codec.pyx":537
+ *         vtype = inp.read_byte()
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)             # <<<<<<<<<<<<<<
+ *         for i in range(size):
+ *             skip_binary(inp, ktype, depth + 1)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_size(__pyx_v_size); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 537, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":538
+ *         size = <int32_t>inp.read_big(4)
+ *         check_size(size)
+ *         for i in range(size):             # <<<<<<<<<<<<<<
+ *             skip_binary(inp, ktype, depth + 1)
+ *             skip_binary(inp, vtype, depth + 1)
+ */
+    __pyx_t_4 = __pyx_v_size;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "thriftworker/protocols/codec.pyx":539
+ *         check_size(size)
+ *         for i in range(size):
+ *             skip_binary(inp, ktype, depth + 1)             # <<<<<<<<<<<<<<
+ *             skip_binary(inp, vtype, depth + 1)
+ *     else:
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_skip_binary(__pyx_v_inp, __pyx_v_ktype, (__pyx_v_depth + 1)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 539, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":540
+ *         for i in range(size):
+ *             skip_binary(inp, ktype, depth + 1)
+ *             skip_binary(inp, vtype, depth + 1)             # <<<<<<<<<<<<<<
+ *     else:
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_skip_binary(__pyx_v_inp, __pyx_v_vtype, (__pyx_v_depth + 1)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 540, __pyx_L1_error)
+    }
+
+    /* "thriftworker/protocols/codec.pyx":533
+ *         for i in range(size):
+ *             skip_binary(inp, etype, depth + 1)
+ *     elif ttype == T_MAP:             # <<<<<<<<<<<<<<
+ *         ktype = inp.read_byte()
+ *         vtype = inp.read_byte()
+ */
+    break;
+    default:
+
+    /* "thriftworker/protocols/codec.pyx":542
+ *             skip_binary(inp, vtype, depth + 1)
+ *     else:
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,             # <<<<<<<<<<<<<<
+ *                                  'unknown type {0}'.format(ttype))
+ *     return 0
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 542, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 542, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_INVALID_DATA); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 542, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":543
+ *     else:
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                                  'unknown type {0}'.format(ttype))             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+    __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_unknown_type_0, __pyx_n_s_format); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 543, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_ttype); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 543, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_13 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_11))) {
+      __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_11);
+      if (likely(__pyx_t_13)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_11);
+        __Pyx_INCREF(__pyx_t_13);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_11, function);
+      }
+    }
+    __pyx_t_9 = (__pyx_t_13) ? __Pyx_PyObject_Call2Args(__pyx_t_11, __pyx_t_13, __pyx_t_12) : __Pyx_PyObject_CallOneArg(__pyx_t_11, __pyx_t_12);
+    __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 543, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_11 = NULL;
+    __pyx_t_1 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_11)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_11);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+        __pyx_t_1 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_8)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_11, __pyx_t_10, __pyx_t_9};
+      __pyx_t_7 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 542, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_11, __pyx_t_10, __pyx_t_9};
+      __pyx_t_7 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 542, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_12 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 542, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      if (__pyx_t_11) {
+        __Pyx_GIVEREF(__pyx_t_11); PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_11); __pyx_t_11 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_10);
+      PyTuple_SET_ITEM(__pyx_t_12, 0+__pyx_t_1, __pyx_t_10);
+      __Pyx_GIVEREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_12, 1+__pyx_t_1, __pyx_t_9);
+      __pyx_t_10 = 0;
+      __pyx_t_9 = 0;
+      __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_12, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 542, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_Raise(__pyx_t_7, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __PYX_ERR(0, 542, __pyx_L1_error)
+    break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":544
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                                  'unknown type {0}'.format(ttype))
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":498
+ * 
+ * 
+ * cdef int skip_binary(InputBuffer inp, int ttype, int depth) except -1:             # <<<<<<<<<<<<<<
+ *     cdef int32_t size
+ *     cdef int32_t i
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.skip_binary", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":547
+ * 
+ * 
+ * cdef object read_binary_struct(InputBuffer inp, StructSpec spec, object obj):             # <<<<<<<<<<<<<<
+ *     cdef FieldSpec field
+ *     cdef int ttype
+ */
+
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec_read_binary_struct(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp, struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_spec, PyObject *__pyx_v_obj) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_field = 0;
+  int __pyx_v_ttype;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  uint64_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_binary_struct", 0);
+  __Pyx_INCREF(__pyx_v_obj);
+
+  /* "thriftworker/protocols/codec.pyx":550
+ *     cdef FieldSpec field
+ *     cdef int ttype
+ *     if obj is None:             # <<<<<<<<<<<<<<
+ *         obj = spec.cls()
+ *     while True:
+ */
+  __pyx_t_1 = (__pyx_v_obj == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "thriftworker/protocols/codec.pyx":551
+ *     cdef int ttype
+ *     if obj is None:
+ *         obj = spec.cls()             # <<<<<<<<<<<<<<
+ *     while True:
+ *         ttype = inp.read_byte()
+ */
+    __Pyx_INCREF(__pyx_v_spec->cls);
+    __pyx_t_4 = __pyx_v_spec->cls; __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 551, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_obj, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":550
+ *     cdef FieldSpec field
+ *     cdef int ttype
+ *     if obj is None:             # <<<<<<<<<<<<<<
+ *         obj = spec.cls()
+ *     while True:
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":552
+ *     if obj is None:
+ *         obj = spec.cls()
+ *     while True:             # <<<<<<<<<<<<<<
+ *         ttype = inp.read_byte()
+ *         if ttype == T_STOP:
+ */
+  while (1) {
+
+    /* "thriftworker/protocols/codec.pyx":553
+ *         obj = spec.cls()
+ *     while True:
+ *         ttype = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         if ttype == T_STOP:
+ *             break
+ */
+    __pyx_t_6 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 553, __pyx_L1_error)
+    __pyx_v_ttype = __pyx_t_6;
+
+    /* "thriftworker/protocols/codec.pyx":554
+ *     while True:
+ *         ttype = inp.read_byte()
+ *         if ttype == T_STOP:             # <<<<<<<<<<<<<<
+ *             break
+ *         field = spec.lookup(<int16_t>inp.read_big(2))
+ */
+    __pyx_t_2 = ((__pyx_v_ttype == __pyx_e_12thriftworker_9protocols_5codec_T_STOP) != 0);
+    if (__pyx_t_2) {
+
+      /* "thriftworker/protocols/codec.pyx":555
+ *         ttype = inp.read_byte()
+ *         if ttype == T_STOP:
+ *             break             # <<<<<<<<<<<<<<
+ *         field = spec.lookup(<int16_t>inp.read_big(2))
+ *         if field is None or field.type.ttype != ttype:
+ */
+      goto __pyx_L5_break;
+
+      /* "thriftworker/protocols/codec.pyx":554
+ *     while True:
+ *         ttype = inp.read_byte()
+ *         if ttype == T_STOP:             # <<<<<<<<<<<<<<
+ *             break
+ *         field = spec.lookup(<int16_t>inp.read_big(2))
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":556
+ *         if ttype == T_STOP:
+ *             break
+ *         field = spec.lookup(<int16_t>inp.read_big(2))             # <<<<<<<<<<<<<<
+ *         if field is None or field.type.ttype != ttype:
+ *             skip_binary(inp, ttype, 0)
+ */
+    __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big(__pyx_v_inp, 2); if (unlikely(__pyx_t_7 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 556, __pyx_L1_error)
+    __pyx_t_3 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_10StructSpec_lookup(__pyx_v_spec, ((int16_t)__pyx_t_7))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 556, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_field, ((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":557
+ *             break
+ *         field = spec.lookup(<int16_t>inp.read_big(2))
+ *         if field is None or field.type.ttype != ttype:             # <<<<<<<<<<<<<<
+ *             skip_binary(inp, ttype, 0)
+ *             continue
+ */
+    __pyx_t_1 = (((PyObject *)__pyx_v_field) == Py_None);
+    __pyx_t_8 = (__pyx_t_1 != 0);
+    if (!__pyx_t_8) {
+    } else {
+      __pyx_t_2 = __pyx_t_8;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_8 = ((__pyx_v_field->type->ttype != __pyx_v_ttype) != 0);
+    __pyx_t_2 = __pyx_t_8;
+    __pyx_L8_bool_binop_done:;
+    if (__pyx_t_2) {
+
+      /* "thriftworker/protocols/codec.pyx":558
+ *         field = spec.lookup(<int16_t>inp.read_big(2))
+ *         if field is None or field.type.ttype != ttype:
+ *             skip_binary(inp, ttype, 0)             # <<<<<<<<<<<<<<
+ *             continue
+ *         setattr(obj, field.name, read_binary_value(inp, field.type))
+ */
+      __pyx_t_6 = __pyx_f_12thriftworker_9protocols_5codec_skip_binary(__pyx_v_inp, __pyx_v_ttype, 0); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 558, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":559
+ *         if field is None or field.type.ttype != ttype:
+ *             skip_binary(inp, ttype, 0)
+ *             continue             # <<<<<<<<<<<<<<
+ *         setattr(obj, field.name, read_binary_value(inp, field.type))
+ *     return obj
+ */
+      goto __pyx_L4_continue;
+
+      /* "thriftworker/protocols/codec.pyx":557
+ *             break
+ *         field = spec.lookup(<int16_t>inp.read_big(2))
+ *         if field is None or field.type.ttype != ttype:             # <<<<<<<<<<<<<<
+ *             skip_binary(inp, ttype, 0)
+ *             continue
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":560
+ *             skip_binary(inp, ttype, 0)
+ *             continue
+ *         setattr(obj, field.name, read_binary_value(inp, field.type))             # <<<<<<<<<<<<<<
+ *     return obj
+ * 
+ */
+    __pyx_t_3 = __pyx_v_field->name;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = ((PyObject *)__pyx_v_field->type);
+    __Pyx_INCREF(__pyx_t_4);
+    __pyx_t_5 = __pyx_f_12thriftworker_9protocols_5codec_read_binary_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 560, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_9 = PyObject_SetAttr(__pyx_v_obj, __pyx_t_3, __pyx_t_5); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 560, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_L4_continue:;
+  }
+  __pyx_L5_break:;
+
+  /* "thriftworker/protocols/codec.pyx":561
+ *             continue
+ *         setattr(obj, field.name, read_binary_value(inp, field.type))
+ *     return obj             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_r = __pyx_v_obj;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":547
+ * 
+ * 
+ * cdef object read_binary_struct(InputBuffer inp, StructSpec spec, object obj):             # <<<<<<<<<<<<<<
+ *     cdef FieldSpec field
+ *     cdef int ttype
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.read_binary_struct", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_field);
+  __Pyx_XDECREF(__pyx_v_obj);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":564
+ * 
+ * 
+ * def encode_binary(object obj, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Serialize struct with binary protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_1encode_binary(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_12thriftworker_9protocols_5codec_encode_binary[] = "Serialize struct with binary protocol.";
+static PyMethodDef __pyx_mdef_12thriftworker_9protocols_5codec_1encode_binary = {"encode_binary", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_12thriftworker_9protocols_5codec_1encode_binary, METH_VARARGS|METH_KEYWORDS, __pyx_doc_12thriftworker_9protocols_5codec_encode_binary};
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_1encode_binary(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_thrift_spec = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("encode_binary (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_thrift_spec,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_thrift_spec)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("encode_binary", 1, 2, 2, 1); __PYX_ERR(0, 564, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "encode_binary") < 0)) __PYX_ERR(0, 564, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_thrift_spec = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("encode_binary", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 564, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.encode_binary", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_encode_binary(__pyx_self, __pyx_v_obj, __pyx_v_thrift_spec);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_encode_binary(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_thrift_spec) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_out = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("encode_binary", 0);
+
+  /* "thriftworker/protocols/codec.pyx":566
+ * def encode_binary(object obj, object thrift_spec):
+ *     """Serialize struct with binary protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()             # <<<<<<<<<<<<<<
+ *     write_binary_struct(out, get_struct(obj.__class__, thrift_spec), obj)
+ *     return out.getvalue()
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_OutputBuffer)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 566, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_out = ((struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":567
+ *     """Serialize struct with binary protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ *     write_binary_struct(out, get_struct(obj.__class__, thrift_spec), obj)             # <<<<<<<<<<<<<<
+ *     return out.getvalue()
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_obj, __pyx_n_s_class); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 567, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_get_struct(__pyx_t_1, __pyx_v_thrift_spec)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 567, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_write_binary_struct(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_2), __pyx_v_obj); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 567, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":568
+ *     cdef OutputBuffer out = OutputBuffer()
+ *     write_binary_struct(out, get_struct(obj.__class__, thrift_spec), obj)
+ *     return out.getvalue()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_getvalue(__pyx_v_out); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 568, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":564
+ * 
+ * 
+ * def encode_binary(object obj, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Serialize struct with binary protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.encode_binary", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_out);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":571
+ * 
+ * 
+ * def decode_binary(object obj, object thrift_spec, bytes data,             # <<<<<<<<<<<<<<
+ *                   Py_ssize_t position=0):
+ *     """Read struct serialized with binary protocol from given position of
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_3decode_binary(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_12thriftworker_9protocols_5codec_2decode_binary[] = "Read struct serialized with binary protocol from given position of\n    data. Return position after struct.\n\n    ";
+static PyMethodDef __pyx_mdef_12thriftworker_9protocols_5codec_3decode_binary = {"decode_binary", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_12thriftworker_9protocols_5codec_3decode_binary, METH_VARARGS|METH_KEYWORDS, __pyx_doc_12thriftworker_9protocols_5codec_2decode_binary};
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_3decode_binary(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_thrift_spec = 0;
+  PyObject *__pyx_v_data = 0;
+  Py_ssize_t __pyx_v_position;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("decode_binary (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_thrift_spec,&__pyx_n_s_data,&__pyx_n_s_position,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_thrift_spec)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("decode_binary", 0, 3, 4, 1); __PYX_ERR(0, 571, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_data)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("decode_binary", 0, 3, 4, 2); __PYX_ERR(0, 571, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_position);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "decode_binary") < 0)) __PYX_ERR(0, 571, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_thrift_spec = values[1];
+    __pyx_v_data = ((PyObject*)values[2]);
+    if (values[3]) {
+      __pyx_v_position = __Pyx_PyIndex_AsSsize_t(values[3]); if (unlikely((__pyx_v_position == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 572, __pyx_L3_error)
+    } else {
+      __pyx_v_position = ((Py_ssize_t)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("decode_binary", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 571, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.decode_binary", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_data), (&PyBytes_Type), 1, "data", 1))) __PYX_ERR(0, 571, __pyx_L1_error)
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_2decode_binary(__pyx_self, __pyx_v_obj, __pyx_v_thrift_spec, __pyx_v_data, __pyx_v_position);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_2decode_binary(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_thrift_spec, PyObject *__pyx_v_data, Py_ssize_t __pyx_v_position) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("decode_binary", 0);
+
+  /* "thriftworker/protocols/codec.pyx":577
+ * 
+ *     """
+ *     cdef InputBuffer inp = InputBuffer(data, position)             # <<<<<<<<<<<<<<
+ *     read_binary_struct(inp, get_struct(obj.__class__, thrift_spec), obj)
+ *     return inp.position
+ */
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_data);
+  __Pyx_GIVEREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_data);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_InputBuffer), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_inp = ((struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":578
+ *     """
+ *     cdef InputBuffer inp = InputBuffer(data, position)
+ *     read_binary_struct(inp, get_struct(obj.__class__, thrift_spec), obj)             # <<<<<<<<<<<<<<
+ *     return inp.position
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_obj, __pyx_n_s_class); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 578, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_get_struct(__pyx_t_1, __pyx_v_thrift_spec)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 578, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_read_binary_struct(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_2), __pyx_v_obj); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 578, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":579
+ *     cdef InputBuffer inp = InputBuffer(data, position)
+ *     read_binary_struct(inp, get_struct(obj.__class__, thrift_spec), obj)
+ *     return inp.position             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_inp->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 579, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":571
+ * 
+ * 
+ * def decode_binary(object obj, object thrift_spec, bytes data,             # <<<<<<<<<<<<<<
+ *                   Py_ssize_t position=0):
+ *     """Read struct serialized with binary protocol from given position of
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.decode_binary", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_inp);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":586
+ * #-----------------------------------------------------------------------------
+ * 
+ * cdef inline int write_compact_size(OutputBuffer out, int ctype,             # <<<<<<<<<<<<<<
+ *                                    Py_ssize_t size) except -1:
+ *     if size <= 14:
+ */
+
+static CYTHON_INLINE int __pyx_f_12thriftworker_9protocols_5codec_write_compact_size(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_out, int __pyx_v_ctype, Py_ssize_t __pyx_v_size) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_compact_size", 0);
+
+  /* "thriftworker/protocols/codec.pyx":588
+ * cdef inline int write_compact_size(OutputBuffer out, int ctype,
+ *                                    Py_ssize_t size) except -1:
+ *     if size <= 14:             # <<<<<<<<<<<<<<
+ *         out.write_byte(<uint8_t>(size << 4 | ctype))
+ *     else:
+ */
+  __pyx_t_1 = ((__pyx_v_size <= 14) != 0);
+  if (__pyx_t_1) {
+
+    /* "thriftworker/protocols/codec.pyx":589
+ *                                    Py_ssize_t size) except -1:
+ *     if size <= 14:
+ *         out.write_byte(<uint8_t>(size << 4 | ctype))             # <<<<<<<<<<<<<<
+ *     else:
+ *         out.write_byte(<uint8_t>(0xf0 | ctype))
+ */
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, ((uint8_t)((__pyx_v_size << 4) | __pyx_v_ctype))); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 589, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":588
+ * cdef inline int write_compact_size(OutputBuffer out, int ctype,
+ *                                    Py_ssize_t size) except -1:
+ *     if size <= 14:             # <<<<<<<<<<<<<<
+ *         out.write_byte(<uint8_t>(size << 4 | ctype))
+ *     else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":591
+ *         out.write_byte(<uint8_t>(size << 4 | ctype))
+ *     else:
+ *         out.write_byte(<uint8_t>(0xf0 | ctype))             # <<<<<<<<<<<<<<
+ *         out.write_varint(<uint64_t><int32_t>size)
+ *     return 0
+ */
+  /*else*/ {
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, ((uint8_t)(0xf0 | __pyx_v_ctype))); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 591, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":592
+ *     else:
+ *         out.write_byte(<uint8_t>(0xf0 | ctype))
+ *         out.write_varint(<uint64_t><int32_t>size)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(__pyx_v_out, ((uint64_t)((int32_t)__pyx_v_size))); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 592, __pyx_L1_error)
+  }
+  __pyx_L3:;
+
+  /* "thriftworker/protocols/codec.pyx":593
+ *         out.write_byte(<uint8_t>(0xf0 | ctype))
+ *         out.write_varint(<uint64_t><int32_t>size)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":586
+ * #-----------------------------------------------------------------------------
+ * 
+ * cdef inline int write_compact_size(OutputBuffer out, int ctype,             # <<<<<<<<<<<<<<
+ *                                    Py_ssize_t size) except -1:
+ *     if size <= 14:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.write_compact_size", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":596
+ * 
+ * 
+ * cdef int write_compact_value(OutputBuffer out, TypeSpec spec,             # <<<<<<<<<<<<<<
+ *                              object value) except -1:
+ *     cdef int ttype = spec.ttype
+ */
+
+static int __pyx_f_12thriftworker_9protocols_5codec_write_compact_value(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_out, struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_spec, PyObject *__pyx_v_value) {
+  int __pyx_v_ttype;
+  Py_ssize_t __pyx_v_size;
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_item = NULL;
+  PyObject *__pyx_v_key = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int8_t __pyx_t_4;
+  int16_t __pyx_t_5;
+  int32_t __pyx_t_6;
+  int64_t __pyx_t_7;
+  double __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  Py_ssize_t __pyx_t_10;
+  PyObject *(*__pyx_t_11)(PyObject *);
+  PyObject *__pyx_t_12 = NULL;
+  Py_ssize_t __pyx_t_13;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_t_15;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_compact_value", 0);
+
+  /* "thriftworker/protocols/codec.pyx":598
+ * cdef int write_compact_value(OutputBuffer out, TypeSpec spec,
+ *                              object value) except -1:
+ *     cdef int ttype = spec.ttype             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t size
+ *     cdef bytes data
+ */
+  __pyx_t_1 = __pyx_v_spec->ttype;
+  __pyx_v_ttype = __pyx_t_1;
+
+  /* "thriftworker/protocols/codec.pyx":601
+ *     cdef Py_ssize_t size
+ *     cdef bytes data
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         out.write_byte(C_TRUE if value else C_FALSE)
+ *     elif ttype == T_BYTE:
+ */
+  switch (__pyx_v_ttype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BOOL:
+
+    /* "thriftworker/protocols/codec.pyx":602
+ *     cdef bytes data
+ *     if ttype == T_BOOL:
+ *         out.write_byte(C_TRUE if value else C_FALSE)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_BYTE:
+ *         out.write_byte(<uint8_t><int8_t>value)
+ */
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 602, __pyx_L1_error)
+    if (__pyx_t_3) {
+      __pyx_t_2 = __pyx_e_12thriftworker_9protocols_5codec_C_TRUE;
+    } else {
+      __pyx_t_2 = __pyx_e_12thriftworker_9protocols_5codec_C_FALSE;
+    }
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, __pyx_t_2); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 602, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":601
+ *     cdef Py_ssize_t size
+ *     cdef bytes data
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         out.write_byte(C_TRUE if value else C_FALSE)
+ *     elif ttype == T_BYTE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BYTE:
+
+    /* "thriftworker/protocols/codec.pyx":604
+ *         out.write_byte(C_TRUE if value else C_FALSE)
+ *     elif ttype == T_BYTE:
+ *         out.write_byte(<uint8_t><int8_t>value)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I16:
+ *         out.write_varint(zigzag(<int16_t>value))
+ */
+    __pyx_t_4 = __Pyx_PyInt_As_int8_t(__pyx_v_value); if (unlikely((__pyx_t_4 == ((int8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 604, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, ((uint8_t)((int8_t)__pyx_t_4))); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 604, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":603
+ *     if ttype == T_BOOL:
+ *         out.write_byte(C_TRUE if value else C_FALSE)
+ *     elif ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         out.write_byte(<uint8_t><int8_t>value)
+ *     elif ttype == T_I16:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I16:
+
+    /* "thriftworker/protocols/codec.pyx":606
+ *         out.write_byte(<uint8_t><int8_t>value)
+ *     elif ttype == T_I16:
+ *         out.write_varint(zigzag(<int16_t>value))             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I32:
+ *         out.write_varint(zigzag(<int32_t>value))
+ */
+    __pyx_t_5 = __Pyx_PyInt_As_int16_t(__pyx_v_value); if (unlikely((__pyx_t_5 == ((int16_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 606, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(__pyx_v_out, __pyx_f_12thriftworker_9protocols_5codec_zigzag(((int16_t)__pyx_t_5))); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 606, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":605
+ *     elif ttype == T_BYTE:
+ *         out.write_byte(<uint8_t><int8_t>value)
+ *     elif ttype == T_I16:             # <<<<<<<<<<<<<<
+ *         out.write_varint(zigzag(<int16_t>value))
+ *     elif ttype == T_I32:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I32:
+
+    /* "thriftworker/protocols/codec.pyx":608
+ *         out.write_varint(zigzag(<int16_t>value))
+ *     elif ttype == T_I32:
+ *         out.write_varint(zigzag(<int32_t>value))             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I64:
+ *         out.write_varint(zigzag(<int64_t>value))
+ */
+    __pyx_t_6 = __Pyx_PyInt_As_int32_t(__pyx_v_value); if (unlikely((__pyx_t_6 == ((int32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 608, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(__pyx_v_out, __pyx_f_12thriftworker_9protocols_5codec_zigzag(((int32_t)__pyx_t_6))); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 608, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":607
+ *     elif ttype == T_I16:
+ *         out.write_varint(zigzag(<int16_t>value))
+ *     elif ttype == T_I32:             # <<<<<<<<<<<<<<
+ *         out.write_varint(zigzag(<int32_t>value))
+ *     elif ttype == T_I64:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I64:
+
+    /* "thriftworker/protocols/codec.pyx":610
+ *         out.write_varint(zigzag(<int32_t>value))
+ *     elif ttype == T_I64:
+ *         out.write_varint(zigzag(<int64_t>value))             # <<<<<<<<<<<<<<
+ *     elif ttype == T_DOUBLE:
+ *         out.write_little(double_bits(value), 8)
+ */
+    __pyx_t_7 = __Pyx_PyInt_As_int64_t(__pyx_v_value); if (unlikely((__pyx_t_7 == ((int64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 610, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(__pyx_v_out, __pyx_f_12thriftworker_9protocols_5codec_zigzag(((int64_t)__pyx_t_7))); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 610, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":609
+ *     elif ttype == T_I32:
+ *         out.write_varint(zigzag(<int32_t>value))
+ *     elif ttype == T_I64:             # <<<<<<<<<<<<<<
+ *         out.write_varint(zigzag(<int64_t>value))
+ *     elif ttype == T_DOUBLE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE:
+
+    /* "thriftworker/protocols/codec.pyx":612
+ *         out.write_varint(zigzag(<int64_t>value))
+ *     elif ttype == T_DOUBLE:
+ *         out.write_little(double_bits(value), 8)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRING:
+ *         data = to_bytes(value)
+ */
+    __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_value); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 612, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_little(__pyx_v_out, __pyx_f_12thriftworker_9protocols_5codec_double_bits(__pyx_t_8), 8); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 612, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":611
+ *     elif ttype == T_I64:
+ *         out.write_varint(zigzag(<int64_t>value))
+ *     elif ttype == T_DOUBLE:             # <<<<<<<<<<<<<<
+ *         out.write_little(double_bits(value), 8)
+ *     elif ttype == T_STRING:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRING:
+
+    /* "thriftworker/protocols/codec.pyx":614
+ *         out.write_little(double_bits(value), 8)
+ *     elif ttype == T_STRING:
+ *         data = to_bytes(value)             # <<<<<<<<<<<<<<
+ *         out.write_varint(<uint64_t>PyBytes_GET_SIZE(data))
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ */
+    __pyx_t_9 = __pyx_f_12thriftworker_9protocols_5codec_to_bytes(__pyx_v_value); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 614, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_v_data = ((PyObject*)__pyx_t_9);
+    __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":615
+ *     elif ttype == T_STRING:
+ *         data = to_bytes(value)
+ *         out.write_varint(<uint64_t>PyBytes_GET_SIZE(data))             # <<<<<<<<<<<<<<
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *     elif ttype == T_STRUCT:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(__pyx_v_out, ((uint64_t)PyBytes_GET_SIZE(__pyx_v_data))); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 615, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":616
+ *         data = to_bytes(value)
+ *         out.write_varint(<uint64_t>PyBytes_GET_SIZE(data))
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRUCT:
+ *         write_compact_struct(out, spec.struct, value)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_raw(__pyx_v_out, PyBytes_AS_STRING(__pyx_v_data), PyBytes_GET_SIZE(__pyx_v_data)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 616, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":613
+ *     elif ttype == T_DOUBLE:
+ *         out.write_little(double_bits(value), 8)
+ *     elif ttype == T_STRING:             # <<<<<<<<<<<<<<
+ *         data = to_bytes(value)
+ *         out.write_varint(<uint64_t>PyBytes_GET_SIZE(data))
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":618
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *     elif ttype == T_STRUCT:
+ *         write_compact_struct(out, spec.struct, value)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         write_compact_size(out, spec.value.ctype, len(value))
+ */
+    __pyx_t_9 = ((PyObject *)__pyx_v_spec->__pyx_struct);
+    __Pyx_INCREF(__pyx_t_9);
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_write_compact_struct(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_9), __pyx_v_value); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 618, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":617
+ *         out.write_varint(<uint64_t>PyBytes_GET_SIZE(data))
+ *         out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *     elif ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         write_compact_struct(out, spec.struct, value)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":619
+ *     elif ttype == T_STRUCT:
+ *         write_compact_struct(out, spec.struct, value)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         write_compact_size(out, spec.value.ctype, len(value))
+ *         for item in value:
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_SET:
+
+    /* "thriftworker/protocols/codec.pyx":620
+ *         write_compact_struct(out, spec.struct, value)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         write_compact_size(out, spec.value.ctype, len(value))             # <<<<<<<<<<<<<<
+ *         for item in value:
+ *             write_compact_value(out, spec.value, item)
+ */
+    __pyx_t_10 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_10 == ((Py_ssize_t)-1))) __PYX_ERR(0, 620, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_write_compact_size(__pyx_v_out, __pyx_v_spec->value->ctype, __pyx_t_10); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 620, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":621
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         write_compact_size(out, spec.value.ctype, len(value))
+ *         for item in value:             # <<<<<<<<<<<<<<
+ *             write_compact_value(out, spec.value, item)
+ *     elif ttype == T_MAP:
+ */
+    if (likely(PyList_CheckExact(__pyx_v_value)) || PyTuple_CheckExact(__pyx_v_value)) {
+      __pyx_t_9 = __pyx_v_value; __Pyx_INCREF(__pyx_t_9); __pyx_t_10 = 0;
+      __pyx_t_11 = NULL;
+    } else {
+      __pyx_t_10 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_v_value); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 621, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_11 = Py_TYPE(__pyx_t_9)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 621, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_11)) {
+        if (likely(PyList_CheckExact(__pyx_t_9))) {
+          if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_9)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_12 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_10); __Pyx_INCREF(__pyx_t_12); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 621, __pyx_L1_error)
+          #else
+          __pyx_t_12 = PySequence_ITEM(__pyx_t_9, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 621, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          #endif
+        } else {
+          if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_9)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_12 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_10); __Pyx_INCREF(__pyx_t_12); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 621, __pyx_L1_error)
+          #else
+          __pyx_t_12 = PySequence_ITEM(__pyx_t_9, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 621, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          #endif
+        }
+      } else {
+        __pyx_t_12 = __pyx_t_11(__pyx_t_9);
+        if (unlikely(!__pyx_t_12)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 621, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_12);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_12);
+      __pyx_t_12 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":622
+ *         write_compact_size(out, spec.value.ctype, len(value))
+ *         for item in value:
+ *             write_compact_value(out, spec.value, item)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_MAP:
+ *         size = len(value)
+ */
+      __pyx_t_12 = ((PyObject *)__pyx_v_spec->value);
+      __Pyx_INCREF(__pyx_t_12);
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_write_compact_value(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_12), __pyx_v_item); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 622, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":621
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         write_compact_size(out, spec.value.ctype, len(value))
+ *         for item in value:             # <<<<<<<<<<<<<<
+ *             write_compact_value(out, spec.value, item)
+ *     elif ttype == T_MAP:
+ */
+    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":619
+ *     elif ttype == T_STRUCT:
+ *         write_compact_struct(out, spec.struct, value)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         write_compact_size(out, spec.value.ctype, len(value))
+ *         for item in value:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":624
+ *             write_compact_value(out, spec.value, item)
+ *     elif ttype == T_MAP:
+ *         size = len(value)             # <<<<<<<<<<<<<<
+ *         if size == 0:
+ *             out.write_byte(0)
+ */
+    __pyx_t_10 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_10 == ((Py_ssize_t)-1))) __PYX_ERR(0, 624, __pyx_L1_error)
+    __pyx_v_size = __pyx_t_10;
+
+    /* "thriftworker/protocols/codec.pyx":625
+ *     elif ttype == T_MAP:
+ *         size = len(value)
+ *         if size == 0:             # <<<<<<<<<<<<<<
+ *             out.write_byte(0)
+ *             return 0
+ */
+    __pyx_t_3 = ((__pyx_v_size == 0) != 0);
+    if (__pyx_t_3) {
+
+      /* "thriftworker/protocols/codec.pyx":626
+ *         size = len(value)
+ *         if size == 0:
+ *             out.write_byte(0)             # <<<<<<<<<<<<<<
+ *             return 0
+ *         out.write_varint(<uint64_t><int32_t>size)
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, 0); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 626, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":627
+ *         if size == 0:
+ *             out.write_byte(0)
+ *             return 0             # <<<<<<<<<<<<<<
+ *         out.write_varint(<uint64_t><int32_t>size)
+ *         out.write_byte(<uint8_t>(spec.key.ctype << 4 | spec.value.ctype))
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "thriftworker/protocols/codec.pyx":625
+ *     elif ttype == T_MAP:
+ *         size = len(value)
+ *         if size == 0:             # <<<<<<<<<<<<<<
+ *             out.write_byte(0)
+ *             return 0
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":628
+ *             out.write_byte(0)
+ *             return 0
+ *         out.write_varint(<uint64_t><int32_t>size)             # <<<<<<<<<<<<<<
+ *         out.write_byte(<uint8_t>(spec.key.ctype << 4 | spec.value.ctype))
+ *         for key, item in value.iteritems():
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(__pyx_v_out, ((uint64_t)((int32_t)__pyx_v_size))); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 628, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":629
+ *             return 0
+ *         out.write_varint(<uint64_t><int32_t>size)
+ *         out.write_byte(<uint8_t>(spec.key.ctype << 4 | spec.value.ctype))             # <<<<<<<<<<<<<<
+ *         for key, item in value.iteritems():
+ *             write_compact_value(out, spec.key, key)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, ((uint8_t)((__pyx_v_spec->key->ctype << 4) | __pyx_v_spec->value->ctype))); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 629, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":630
+ *         out.write_varint(<uint64_t><int32_t>size)
+ *         out.write_byte(<uint8_t>(spec.key.ctype << 4 | spec.value.ctype))
+ *         for key, item in value.iteritems():             # <<<<<<<<<<<<<<
+ *             write_compact_value(out, spec.key, key)
+ *             write_compact_value(out, spec.value, item)
+ */
+    __pyx_t_10 = 0;
+    if (unlikely(__pyx_v_value == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "iteritems");
+      __PYX_ERR(0, 630, __pyx_L1_error)
+    }
+    __pyx_t_12 = __Pyx_dict_iterator(__pyx_v_value, 0, __pyx_n_s_iteritems, (&__pyx_t_13), (&__pyx_t_1)); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 630, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_XDECREF(__pyx_t_9);
+    __pyx_t_9 = __pyx_t_12;
+    __pyx_t_12 = 0;
+    while (1) {
+      __pyx_t_15 = __Pyx_dict_iter_next(__pyx_t_9, __pyx_t_13, &__pyx_t_10, &__pyx_t_12, &__pyx_t_14, NULL, __pyx_t_1);
+      if (unlikely(__pyx_t_15 == 0)) break;
+      if (unlikely(__pyx_t_15 == -1)) __PYX_ERR(0, 630, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_12);
+      __pyx_t_12 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_14);
+      __pyx_t_14 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":631
+ *         out.write_byte(<uint8_t>(spec.key.ctype << 4 | spec.value.ctype))
+ *         for key, item in value.iteritems():
+ *             write_compact_value(out, spec.key, key)             # <<<<<<<<<<<<<<
+ *             write_compact_value(out, spec.value, item)
+ *     return 0
+ */
+      __pyx_t_14 = ((PyObject *)__pyx_v_spec->key);
+      __Pyx_INCREF(__pyx_t_14);
+      __pyx_t_15 = __pyx_f_12thriftworker_9protocols_5codec_write_compact_value(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_14), __pyx_v_key); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 631, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":632
+ *         for key, item in value.iteritems():
+ *             write_compact_value(out, spec.key, key)
+ *             write_compact_value(out, spec.value, item)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+      __pyx_t_14 = ((PyObject *)__pyx_v_spec->value);
+      __Pyx_INCREF(__pyx_t_14);
+      __pyx_t_15 = __pyx_f_12thriftworker_9protocols_5codec_write_compact_value(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_14), __pyx_v_item); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 632, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":623
+ *         for item in value:
+ *             write_compact_value(out, spec.value, item)
+ *     elif ttype == T_MAP:             # <<<<<<<<<<<<<<
+ *         size = len(value)
+ *         if size == 0:
+ */
+    break;
+    default: break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":633
+ *             write_compact_value(out, spec.key, key)
+ *             write_compact_value(out, spec.value, item)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":596
+ * 
+ * 
+ * cdef int write_compact_value(OutputBuffer out, TypeSpec spec,             # <<<<<<<<<<<<<<
+ *                              object value) except -1:
+ *     cdef int ttype = spec.ttype
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.write_compact_value", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":636
+ * 
+ * 
+ * cdef int write_compact_struct(OutputBuffer out, StructSpec spec,             # <<<<<<<<<<<<<<
+ *                               object obj) except -1:
+ *     cdef FieldSpec field
+ */
+
+static int __pyx_f_12thriftworker_9protocols_5codec_write_compact_struct(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_out, struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_spec, PyObject *__pyx_v_obj) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_field = 0;
+  int __pyx_v_last_fid;
+  int __pyx_v_delta;
+  int __pyx_v_ctype;
+  PyObject *__pyx_v_value = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_compact_struct", 0);
+
+  /* "thriftworker/protocols/codec.pyx":639
+ *                               object obj) except -1:
+ *     cdef FieldSpec field
+ *     cdef int last_fid = 0             # <<<<<<<<<<<<<<
+ *     cdef int delta, ctype
+ *     for field in spec.fields:
+ */
+  __pyx_v_last_fid = 0;
+
+  /* "thriftworker/protocols/codec.pyx":641
+ *     cdef int last_fid = 0
+ *     cdef int delta, ctype
+ *     for field in spec.fields:             # <<<<<<<<<<<<<<
+ *         value = getattr(obj, field.name)
+ *         if value is None:
+ */
+  if (unlikely(__pyx_v_spec->fields == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 641, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_spec->fields; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 641, __pyx_L1_error)
+    #else
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 641, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_12thriftworker_9protocols_5codec_FieldSpec))))) __PYX_ERR(0, 641, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_field, ((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":642
+ *     cdef int delta, ctype
+ *     for field in spec.fields:
+ *         value = getattr(obj, field.name)             # <<<<<<<<<<<<<<
+ *         if value is None:
+ *             continue
+ */
+    __pyx_t_3 = __pyx_v_field->name;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_GetAttr(__pyx_v_obj, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 642, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":643
+ *     for field in spec.fields:
+ *         value = getattr(obj, field.name)
+ *         if value is None:             # <<<<<<<<<<<<<<
+ *             continue
+ *         ctype = field.type.ctype
+ */
+    __pyx_t_5 = (__pyx_v_value == Py_None);
+    __pyx_t_6 = (__pyx_t_5 != 0);
+    if (__pyx_t_6) {
+
+      /* "thriftworker/protocols/codec.pyx":644
+ *         value = getattr(obj, field.name)
+ *         if value is None:
+ *             continue             # <<<<<<<<<<<<<<
+ *         ctype = field.type.ctype
+ *         if field.type.ttype == T_BOOL:
+ */
+      goto __pyx_L3_continue;
+
+      /* "thriftworker/protocols/codec.pyx":643
+ *     for field in spec.fields:
+ *         value = getattr(obj, field.name)
+ *         if value is None:             # <<<<<<<<<<<<<<
+ *             continue
+ *         ctype = field.type.ctype
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":645
+ *         if value is None:
+ *             continue
+ *         ctype = field.type.ctype             # <<<<<<<<<<<<<<
+ *         if field.type.ttype == T_BOOL:
+ *             ctype = C_TRUE if value else C_FALSE
+ */
+    __pyx_t_7 = __pyx_v_field->type->ctype;
+    __pyx_v_ctype = __pyx_t_7;
+
+    /* "thriftworker/protocols/codec.pyx":646
+ *             continue
+ *         ctype = field.type.ctype
+ *         if field.type.ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *             ctype = C_TRUE if value else C_FALSE
+ *         delta = field.fid - last_fid
+ */
+    __pyx_t_6 = ((__pyx_v_field->type->ttype == __pyx_e_12thriftworker_9protocols_5codec_T_BOOL) != 0);
+    if (__pyx_t_6) {
+
+      /* "thriftworker/protocols/codec.pyx":647
+ *         ctype = field.type.ctype
+ *         if field.type.ttype == T_BOOL:
+ *             ctype = C_TRUE if value else C_FALSE             # <<<<<<<<<<<<<<
+ *         delta = field.fid - last_fid
+ *         if 0 < delta <= 15:
+ */
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 647, __pyx_L1_error)
+      if (__pyx_t_6) {
+        __pyx_t_8 = __pyx_e_12thriftworker_9protocols_5codec_C_TRUE;
+      } else {
+        __pyx_t_8 = __pyx_e_12thriftworker_9protocols_5codec_C_FALSE;
+      }
+      __pyx_v_ctype = __pyx_t_8;
+
+      /* "thriftworker/protocols/codec.pyx":646
+ *             continue
+ *         ctype = field.type.ctype
+ *         if field.type.ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *             ctype = C_TRUE if value else C_FALSE
+ *         delta = field.fid - last_fid
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":648
+ *         if field.type.ttype == T_BOOL:
+ *             ctype = C_TRUE if value else C_FALSE
+ *         delta = field.fid - last_fid             # <<<<<<<<<<<<<<
+ *         if 0 < delta <= 15:
+ *             out.write_byte(<uint8_t>(delta << 4 | ctype))
+ */
+    __pyx_v_delta = (__pyx_v_field->fid - __pyx_v_last_fid);
+
+    /* "thriftworker/protocols/codec.pyx":649
+ *             ctype = C_TRUE if value else C_FALSE
+ *         delta = field.fid - last_fid
+ *         if 0 < delta <= 15:             # <<<<<<<<<<<<<<
+ *             out.write_byte(<uint8_t>(delta << 4 | ctype))
+ *         else:
+ */
+    __pyx_t_6 = (0 < __pyx_v_delta);
+    if (__pyx_t_6) {
+      __pyx_t_6 = (__pyx_v_delta <= 15);
+    }
+    __pyx_t_5 = (__pyx_t_6 != 0);
+    if (__pyx_t_5) {
+
+      /* "thriftworker/protocols/codec.pyx":650
+ *         delta = field.fid - last_fid
+ *         if 0 < delta <= 15:
+ *             out.write_byte(<uint8_t>(delta << 4 | ctype))             # <<<<<<<<<<<<<<
+ *         else:
+ *             out.write_byte(<uint8_t>ctype)
+ */
+      __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, ((uint8_t)((__pyx_v_delta << 4) | __pyx_v_ctype))); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 650, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":649
+ *             ctype = C_TRUE if value else C_FALSE
+ *         delta = field.fid - last_fid
+ *         if 0 < delta <= 15:             # <<<<<<<<<<<<<<
+ *             out.write_byte(<uint8_t>(delta << 4 | ctype))
+ *         else:
+ */
+      goto __pyx_L7;
+    }
+
+    /* "thriftworker/protocols/codec.pyx":652
+ *             out.write_byte(<uint8_t>(delta << 4 | ctype))
+ *         else:
+ *             out.write_byte(<uint8_t>ctype)             # <<<<<<<<<<<<<<
+ *             out.write_varint(zigzag(<int16_t>field.fid))
+ *         last_fid = field.fid
+ */
+    /*else*/ {
+      __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, ((uint8_t)__pyx_v_ctype)); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 652, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":653
+ *         else:
+ *             out.write_byte(<uint8_t>ctype)
+ *             out.write_varint(zigzag(<int16_t>field.fid))             # <<<<<<<<<<<<<<
+ *         last_fid = field.fid
+ *         if field.type.ttype != T_BOOL:
+ */
+      __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint(__pyx_v_out, __pyx_f_12thriftworker_9protocols_5codec_zigzag(((int16_t)__pyx_v_field->fid))); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 653, __pyx_L1_error)
+    }
+    __pyx_L7:;
+
+    /* "thriftworker/protocols/codec.pyx":654
+ *             out.write_byte(<uint8_t>ctype)
+ *             out.write_varint(zigzag(<int16_t>field.fid))
+ *         last_fid = field.fid             # <<<<<<<<<<<<<<
+ *         if field.type.ttype != T_BOOL:
+ *             write_compact_value(out, field.type, value)
+ */
+    __pyx_t_7 = __pyx_v_field->fid;
+    __pyx_v_last_fid = __pyx_t_7;
+
+    /* "thriftworker/protocols/codec.pyx":655
+ *             out.write_varint(zigzag(<int16_t>field.fid))
+ *         last_fid = field.fid
+ *         if field.type.ttype != T_BOOL:             # <<<<<<<<<<<<<<
+ *             write_compact_value(out, field.type, value)
+ *     out.write_byte(C_STOP)
+ */
+    __pyx_t_5 = ((__pyx_v_field->type->ttype != __pyx_e_12thriftworker_9protocols_5codec_T_BOOL) != 0);
+    if (__pyx_t_5) {
+
+      /* "thriftworker/protocols/codec.pyx":656
+ *         last_fid = field.fid
+ *         if field.type.ttype != T_BOOL:
+ *             write_compact_value(out, field.type, value)             # <<<<<<<<<<<<<<
+ *     out.write_byte(C_STOP)
+ *     return 0
+ */
+      __pyx_t_4 = ((PyObject *)__pyx_v_field->type);
+      __Pyx_INCREF(__pyx_t_4);
+      __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_write_compact_value(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_4), __pyx_v_value); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 656, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":655
+ *             out.write_varint(zigzag(<int16_t>field.fid))
+ *         last_fid = field.fid
+ *         if field.type.ttype != T_BOOL:             # <<<<<<<<<<<<<<
+ *             write_compact_value(out, field.type, value)
+ *     out.write_byte(C_STOP)
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":641
+ *     cdef int last_fid = 0
+ *     cdef int delta, ctype
+ *     for field in spec.fields:             # <<<<<<<<<<<<<<
+ *         value = getattr(obj, field.name)
+ *         if value is None:
+ */
+    __pyx_L3_continue:;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":657
+ *         if field.type.ttype != T_BOOL:
+ *             write_compact_value(out, field.type, value)
+ *     out.write_byte(C_STOP)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+  __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte(__pyx_v_out, __pyx_e_12thriftworker_9protocols_5codec_C_STOP); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 657, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":658
+ *             write_compact_value(out, field.type, value)
+ *     out.write_byte(C_STOP)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":636
+ * 
+ * 
+ * cdef int write_compact_struct(OutputBuffer out, StructSpec spec,             # <<<<<<<<<<<<<<
+ *                               object obj) except -1:
+ *     cdef FieldSpec field
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.write_compact_struct", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_field);
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":661
+ * 
+ * 
+ * cdef inline int64_t read_compact_size(InputBuffer inp) except? -1:             # <<<<<<<<<<<<<<
+ *     cdef int64_t size = <int32_t>inp.read_varint()
+ *     check_size(size)
+ */
+
+static CYTHON_INLINE int64_t __pyx_f_12thriftworker_9protocols_5codec_read_compact_size(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp) {
+  int64_t __pyx_v_size;
+  int64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  uint64_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_compact_size", 0);
+
+  /* "thriftworker/protocols/codec.pyx":662
+ * 
+ * cdef inline int64_t read_compact_size(InputBuffer inp) except? -1:
+ *     cdef int64_t size = <int32_t>inp.read_varint()             # <<<<<<<<<<<<<<
+ *     check_size(size)
+ *     return size
+ */
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 662, __pyx_L1_error)
+  __pyx_v_size = ((int32_t)__pyx_t_1);
+
+  /* "thriftworker/protocols/codec.pyx":663
+ * cdef inline int64_t read_compact_size(InputBuffer inp) except? -1:
+ *     cdef int64_t size = <int32_t>inp.read_varint()
+ *     check_size(size)             # <<<<<<<<<<<<<<
+ *     return size
+ * 
+ */
+  __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_check_size(__pyx_v_size); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 663, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":664
+ *     cdef int64_t size = <int32_t>inp.read_varint()
+ *     check_size(size)
+ *     return size             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_size;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":661
+ * 
+ * 
+ * cdef inline int64_t read_compact_size(InputBuffer inp) except? -1:             # <<<<<<<<<<<<<<
+ *     cdef int64_t size = <int32_t>inp.read_varint()
+ *     check_size(size)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.read_compact_size", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1L;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":667
+ * 
+ * 
+ * cdef object read_compact_value(InputBuffer inp, TypeSpec spec):             # <<<<<<<<<<<<<<
+ *     cdef int ttype = spec.ttype
+ *     cdef int header
+ */
+
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec_read_compact_value(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp, struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v_spec) {
+  int __pyx_v_ttype;
+  int __pyx_v_header;
+  int64_t __pyx_v_size;
+  CYTHON_UNUSED int64_t __pyx_v_i;
+  PyObject *__pyx_v_result = NULL;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  uint64_t __pyx_t_3;
+  int64_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int64_t __pyx_t_8;
+  int64_t __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_compact_value", 0);
+
+  /* "thriftworker/protocols/codec.pyx":668
+ * 
+ * cdef object read_compact_value(InputBuffer inp, TypeSpec spec):
+ *     cdef int ttype = spec.ttype             # <<<<<<<<<<<<<<
+ *     cdef int header
+ *     cdef int64_t size
+ */
+  __pyx_t_1 = __pyx_v_spec->ttype;
+  __pyx_v_ttype = __pyx_t_1;
+
+  /* "thriftworker/protocols/codec.pyx":672
+ *     cdef int64_t size
+ *     cdef int64_t i
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         return inp.read_byte() == C_TRUE
+ *     elif ttype == T_BYTE:
+ */
+  switch (__pyx_v_ttype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BOOL:
+
+    /* "thriftworker/protocols/codec.pyx":673
+ *     cdef int64_t i
+ *     if ttype == T_BOOL:
+ *         return inp.read_byte() == C_TRUE             # <<<<<<<<<<<<<<
+ *     elif ttype == T_BYTE:
+ *         return <int8_t>inp.read_byte()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 673, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_t_1 == __pyx_e_12thriftworker_9protocols_5codec_C_TRUE)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 673, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":672
+ *     cdef int64_t size
+ *     cdef int64_t i
+ *     if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *         return inp.read_byte() == C_TRUE
+ *     elif ttype == T_BYTE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BYTE:
+
+    /* "thriftworker/protocols/codec.pyx":675
+ *         return inp.read_byte() == C_TRUE
+ *     elif ttype == T_BYTE:
+ *         return <int8_t>inp.read_byte()             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I16:
+ *         return <int16_t>unzigzag(inp.read_varint())
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 675, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int8_t(((int8_t)__pyx_t_1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 675, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":674
+ *     if ttype == T_BOOL:
+ *         return inp.read_byte() == C_TRUE
+ *     elif ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         return <int8_t>inp.read_byte()
+ *     elif ttype == T_I16:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I16:
+
+    /* "thriftworker/protocols/codec.pyx":677
+ *         return <int8_t>inp.read_byte()
+ *     elif ttype == T_I16:
+ *         return <int16_t>unzigzag(inp.read_varint())             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I32:
+ *         return <int32_t>unzigzag(inp.read_varint())
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(__pyx_v_inp); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 677, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int16_t(((int16_t)__pyx_f_12thriftworker_9protocols_5codec_unzigzag(__pyx_t_3))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 677, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":676
+ *     elif ttype == T_BYTE:
+ *         return <int8_t>inp.read_byte()
+ *     elif ttype == T_I16:             # <<<<<<<<<<<<<<
+ *         return <int16_t>unzigzag(inp.read_varint())
+ *     elif ttype == T_I32:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I32:
+
+    /* "thriftworker/protocols/codec.pyx":679
+ *         return <int16_t>unzigzag(inp.read_varint())
+ *     elif ttype == T_I32:
+ *         return <int32_t>unzigzag(inp.read_varint())             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I64:
+ *         return unzigzag(inp.read_varint())
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(__pyx_v_inp); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 679, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int32_t(((int32_t)__pyx_f_12thriftworker_9protocols_5codec_unzigzag(__pyx_t_3))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 679, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":678
+ *     elif ttype == T_I16:
+ *         return <int16_t>unzigzag(inp.read_varint())
+ *     elif ttype == T_I32:             # <<<<<<<<<<<<<<
+ *         return <int32_t>unzigzag(inp.read_varint())
+ *     elif ttype == T_I64:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I64:
+
+    /* "thriftworker/protocols/codec.pyx":681
+ *         return <int32_t>unzigzag(inp.read_varint())
+ *     elif ttype == T_I64:
+ *         return unzigzag(inp.read_varint())             # <<<<<<<<<<<<<<
+ *     elif ttype == T_DOUBLE:
+ *         return bits_double(inp.read_little(8))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(__pyx_v_inp); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 681, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int64_t(__pyx_f_12thriftworker_9protocols_5codec_unzigzag(__pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 681, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":680
+ *     elif ttype == T_I32:
+ *         return <int32_t>unzigzag(inp.read_varint())
+ *     elif ttype == T_I64:             # <<<<<<<<<<<<<<
+ *         return unzigzag(inp.read_varint())
+ *     elif ttype == T_DOUBLE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE:
+
+    /* "thriftworker/protocols/codec.pyx":683
+ *         return unzigzag(inp.read_varint())
+ *     elif ttype == T_DOUBLE:
+ *         return bits_double(inp.read_little(8))             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRING:
+ *         return inp.read_raw(read_compact_size(inp))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_little(__pyx_v_inp, 8); if (unlikely(__pyx_t_3 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 683, __pyx_L1_error)
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_f_12thriftworker_9protocols_5codec_bits_double(__pyx_t_3)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 683, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":682
+ *     elif ttype == T_I64:
+ *         return unzigzag(inp.read_varint())
+ *     elif ttype == T_DOUBLE:             # <<<<<<<<<<<<<<
+ *         return bits_double(inp.read_little(8))
+ *     elif ttype == T_STRING:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRING:
+
+    /* "thriftworker/protocols/codec.pyx":685
+ *         return bits_double(inp.read_little(8))
+ *     elif ttype == T_STRING:
+ *         return inp.read_raw(read_compact_size(inp))             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRUCT:
+ *         return read_compact_struct(inp, spec.struct, None)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_4 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_size(__pyx_v_inp); if (unlikely(__pyx_t_4 == ((int64_t)-1L) && PyErr_Occurred())) __PYX_ERR(0, 685, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_raw(__pyx_v_inp, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 685, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":684
+ *     elif ttype == T_DOUBLE:
+ *         return bits_double(inp.read_little(8))
+ *     elif ttype == T_STRING:             # <<<<<<<<<<<<<<
+ *         return inp.read_raw(read_compact_size(inp))
+ *     elif ttype == T_STRUCT:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":687
+ *         return inp.read_raw(read_compact_size(inp))
+ *     elif ttype == T_STRUCT:
+ *         return read_compact_struct(inp, spec.struct, None)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         header = inp.read_byte()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((PyObject *)__pyx_v_spec->__pyx_struct);
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_5 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_struct(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_2), Py_None); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 687, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_5;
+    __pyx_t_5 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":686
+ *     elif ttype == T_STRING:
+ *         return inp.read_raw(read_compact_size(inp))
+ *     elif ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         return read_compact_struct(inp, spec.struct, None)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":688
+ *     elif ttype == T_STRUCT:
+ *         return read_compact_struct(inp, spec.struct, None)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         header = inp.read_byte()
+ *         size = header >> 4
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_SET:
+
+    /* "thriftworker/protocols/codec.pyx":689
+ *         return read_compact_struct(inp, spec.struct, None)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         header = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         size = header >> 4
+ *         if size == 15:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 689, __pyx_L1_error)
+    __pyx_v_header = __pyx_t_1;
+
+    /* "thriftworker/protocols/codec.pyx":690
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         header = inp.read_byte()
+ *         size = header >> 4             # <<<<<<<<<<<<<<
+ *         if size == 15:
+ *             size = read_compact_size(inp)
+ */
+    __pyx_v_size = (__pyx_v_header >> 4);
+
+    /* "thriftworker/protocols/codec.pyx":691
+ *         header = inp.read_byte()
+ *         size = header >> 4
+ *         if size == 15:             # <<<<<<<<<<<<<<
+ *             size = read_compact_size(inp)
+ *         if size:
+ */
+    __pyx_t_6 = ((__pyx_v_size == 15) != 0);
+    if (__pyx_t_6) {
+
+      /* "thriftworker/protocols/codec.pyx":692
+ *         size = header >> 4
+ *         if size == 15:
+ *             size = read_compact_size(inp)             # <<<<<<<<<<<<<<
+ *         if size:
+ *             check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ */
+      __pyx_t_4 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_size(__pyx_v_inp); if (unlikely(__pyx_t_4 == ((int64_t)-1L) && PyErr_Occurred())) __PYX_ERR(0, 692, __pyx_L1_error)
+      __pyx_v_size = __pyx_t_4;
+
+      /* "thriftworker/protocols/codec.pyx":691
+ *         header = inp.read_byte()
+ *         size = header >> 4
+ *         if size == 15:             # <<<<<<<<<<<<<<
+ *             size = read_compact_size(inp)
+ *         if size:
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":693
+ *         if size == 15:
+ *             size = read_compact_size(inp)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ *         if ttype == T_LIST:
+ */
+    __pyx_t_6 = (__pyx_v_size != 0);
+    if (__pyx_t_6) {
+
+      /* "thriftworker/protocols/codec.pyx":694
+ *             size = read_compact_size(inp)
+ *         if size:
+ *             check_type(spec.value.ttype, to_ttype(header & 0x0f))             # <<<<<<<<<<<<<<
+ *         if ttype == T_LIST:
+ *             return [read_compact_value(inp, spec.value) for i in range(size)]
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_to_ttype((__pyx_v_header & 0x0f)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 694, __pyx_L1_error)
+      __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_check_type(__pyx_v_spec->value->ttype, __pyx_t_1); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 694, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":693
+ *         if size == 15:
+ *             size = read_compact_size(inp)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ *         if ttype == T_LIST:
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":695
+ *         if size:
+ *             check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ *         if ttype == T_LIST:             # <<<<<<<<<<<<<<
+ *             return [read_compact_value(inp, spec.value) for i in range(size)]
+ *         return set([read_compact_value(inp, spec.value)
+ */
+    __pyx_t_6 = ((__pyx_v_ttype == __pyx_e_12thriftworker_9protocols_5codec_T_LIST) != 0);
+    if (__pyx_t_6) {
+
+      /* "thriftworker/protocols/codec.pyx":696
+ *             check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ *         if ttype == T_LIST:
+ *             return [read_compact_value(inp, spec.value) for i in range(size)]             # <<<<<<<<<<<<<<
+ *         return set([read_compact_value(inp, spec.value)
+ *                     for i in range(size)])
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 696, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_4 = __pyx_v_size;
+      __pyx_t_8 = __pyx_t_4;
+      for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+        __pyx_v_i = __pyx_t_9;
+        __pyx_t_2 = ((PyObject *)__pyx_v_spec->value);
+        __Pyx_INCREF(__pyx_t_2);
+        __pyx_t_10 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_2)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 696, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_10))) __PYX_ERR(0, 696, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      }
+      __pyx_r = __pyx_t_5;
+      __pyx_t_5 = 0;
+      goto __pyx_L0;
+
+      /* "thriftworker/protocols/codec.pyx":695
+ *         if size:
+ *             check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ *         if ttype == T_LIST:             # <<<<<<<<<<<<<<
+ *             return [read_compact_value(inp, spec.value) for i in range(size)]
+ *         return set([read_compact_value(inp, spec.value)
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":697
+ *         if ttype == T_LIST:
+ *             return [read_compact_value(inp, spec.value) for i in range(size)]
+ *         return set([read_compact_value(inp, spec.value)             # <<<<<<<<<<<<<<
+ *                     for i in range(size)])
+ *     elif ttype == T_MAP:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 697, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+
+    /* "thriftworker/protocols/codec.pyx":698
+ *             return [read_compact_value(inp, spec.value) for i in range(size)]
+ *         return set([read_compact_value(inp, spec.value)
+ *                     for i in range(size)])             # <<<<<<<<<<<<<<
+ *     elif ttype == T_MAP:
+ *         size = read_compact_size(inp)
+ */
+    __pyx_t_4 = __pyx_v_size;
+    __pyx_t_8 = __pyx_t_4;
+    for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_i = __pyx_t_9;
+
+      /* "thriftworker/protocols/codec.pyx":697
+ *         if ttype == T_LIST:
+ *             return [read_compact_value(inp, spec.value) for i in range(size)]
+ *         return set([read_compact_value(inp, spec.value)             # <<<<<<<<<<<<<<
+ *                     for i in range(size)])
+ *     elif ttype == T_MAP:
+ */
+      __pyx_t_10 = ((PyObject *)__pyx_v_spec->value);
+      __Pyx_INCREF(__pyx_t_10);
+      __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_10)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 697, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_5, (PyObject*)__pyx_t_2))) __PYX_ERR(0, 697, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    }
+    __pyx_t_2 = PySet_New(__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 697, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":688
+ *     elif ttype == T_STRUCT:
+ *         return read_compact_struct(inp, spec.struct, None)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         header = inp.read_byte()
+ *         size = header >> 4
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":700
+ *                     for i in range(size)])
+ *     elif ttype == T_MAP:
+ *         size = read_compact_size(inp)             # <<<<<<<<<<<<<<
+ *         result = {}
+ *         if not size:
+ */
+    __pyx_t_4 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_size(__pyx_v_inp); if (unlikely(__pyx_t_4 == ((int64_t)-1L) && PyErr_Occurred())) __PYX_ERR(0, 700, __pyx_L1_error)
+    __pyx_v_size = __pyx_t_4;
+
+    /* "thriftworker/protocols/codec.pyx":701
+ *     elif ttype == T_MAP:
+ *         size = read_compact_size(inp)
+ *         result = {}             # <<<<<<<<<<<<<<
+ *         if not size:
+ *             return result
+ */
+    __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 701, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_v_result = ((PyObject*)__pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":702
+ *         size = read_compact_size(inp)
+ *         result = {}
+ *         if not size:             # <<<<<<<<<<<<<<
+ *             return result
+ *         header = inp.read_byte()
+ */
+    __pyx_t_6 = ((!(__pyx_v_size != 0)) != 0);
+    if (__pyx_t_6) {
+
+      /* "thriftworker/protocols/codec.pyx":703
+ *         result = {}
+ *         if not size:
+ *             return result             # <<<<<<<<<<<<<<
+ *         header = inp.read_byte()
+ *         check_type(spec.key.ttype, to_ttype(header >> 4))
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_v_result);
+      __pyx_r = __pyx_v_result;
+      goto __pyx_L0;
+
+      /* "thriftworker/protocols/codec.pyx":702
+ *         size = read_compact_size(inp)
+ *         result = {}
+ *         if not size:             # <<<<<<<<<<<<<<
+ *             return result
+ *         header = inp.read_byte()
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":704
+ *         if not size:
+ *             return result
+ *         header = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         check_type(spec.key.ttype, to_ttype(header >> 4))
+ *         check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ */
+    __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 704, __pyx_L1_error)
+    __pyx_v_header = __pyx_t_7;
+
+    /* "thriftworker/protocols/codec.pyx":705
+ *             return result
+ *         header = inp.read_byte()
+ *         check_type(spec.key.ttype, to_ttype(header >> 4))             # <<<<<<<<<<<<<<
+ *         check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ *         for i in range(size):
+ */
+    __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_to_ttype((__pyx_v_header >> 4)); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 705, __pyx_L1_error)
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_type(__pyx_v_spec->key->ttype, __pyx_t_7); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 705, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":706
+ *         header = inp.read_byte()
+ *         check_type(spec.key.ttype, to_ttype(header >> 4))
+ *         check_type(spec.value.ttype, to_ttype(header & 0x0f))             # <<<<<<<<<<<<<<
+ *         for i in range(size):
+ *             key = read_compact_value(inp, spec.key)
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_to_ttype((__pyx_v_header & 0x0f)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 706, __pyx_L1_error)
+    __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_check_type(__pyx_v_spec->value->ttype, __pyx_t_1); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 706, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":707
+ *         check_type(spec.key.ttype, to_ttype(header >> 4))
+ *         check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ *         for i in range(size):             # <<<<<<<<<<<<<<
+ *             key = read_compact_value(inp, spec.key)
+ *             result[key] = read_compact_value(inp, spec.value)
+ */
+    __pyx_t_4 = __pyx_v_size;
+    __pyx_t_8 = __pyx_t_4;
+    for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_i = __pyx_t_9;
+
+      /* "thriftworker/protocols/codec.pyx":708
+ *         check_type(spec.value.ttype, to_ttype(header & 0x0f))
+ *         for i in range(size):
+ *             key = read_compact_value(inp, spec.key)             # <<<<<<<<<<<<<<
+ *             result[key] = read_compact_value(inp, spec.value)
+ *         return result
+ */
+      __pyx_t_2 = ((PyObject *)__pyx_v_spec->key);
+      __Pyx_INCREF(__pyx_t_2);
+      __pyx_t_5 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_2)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 708, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_5);
+      __pyx_t_5 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":709
+ *         for i in range(size):
+ *             key = read_compact_value(inp, spec.key)
+ *             result[key] = read_compact_value(inp, spec.value)             # <<<<<<<<<<<<<<
+ *         return result
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ */
+      __pyx_t_5 = ((PyObject *)__pyx_v_spec->value);
+      __Pyx_INCREF(__pyx_t_5);
+      __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_5)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 709, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(PyDict_SetItem(__pyx_v_result, __pyx_v_key, __pyx_t_2) < 0)) __PYX_ERR(0, 709, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    }
+
+    /* "thriftworker/protocols/codec.pyx":710
+ *             key = read_compact_value(inp, spec.key)
+ *             result[key] = read_compact_value(inp, spec.value)
+ *         return result             # <<<<<<<<<<<<<<
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                              'unknown type {0}'.format(ttype))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_result);
+    __pyx_r = __pyx_v_result;
+    goto __pyx_L0;
+
+    /* "thriftworker/protocols/codec.pyx":699
+ *         return set([read_compact_value(inp, spec.value)
+ *                     for i in range(size)])
+ *     elif ttype == T_MAP:             # <<<<<<<<<<<<<<
+ *         size = read_compact_size(inp)
+ *         result = {}
+ */
+    break;
+    default: break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":711
+ *             result[key] = read_compact_value(inp, spec.value)
+ *         return result
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,             # <<<<<<<<<<<<<<
+ *                              'unknown type {0}'.format(ttype))
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 711, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 711, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_INVALID_DATA); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 711, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":712
+ *         return result
+ *     raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                              'unknown type {0}'.format(ttype))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_unknown_type_0, __pyx_n_s_format); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 712, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = __Pyx_PyInt_From_int(__pyx_v_ttype); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 712, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_12))) {
+    __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_12);
+    if (likely(__pyx_t_14)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_12);
+      __Pyx_INCREF(__pyx_t_14);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_12, function);
+    }
+  }
+  __pyx_t_10 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_12, __pyx_t_14, __pyx_t_13) : __Pyx_PyObject_CallOneArg(__pyx_t_12, __pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 712, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = NULL;
+  __pyx_t_7 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_12 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_12)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_12);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_5)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_12, __pyx_t_11, __pyx_t_10};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_12, __pyx_t_11, __pyx_t_10};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_13 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    if (__pyx_t_12) {
+      __Pyx_GIVEREF(__pyx_t_12); PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_12); __pyx_t_12 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_11);
+    PyTuple_SET_ITEM(__pyx_t_13, 0+__pyx_t_7, __pyx_t_11);
+    __Pyx_GIVEREF(__pyx_t_10);
+    PyTuple_SET_ITEM(__pyx_t_13, 1+__pyx_t_7, __pyx_t_10);
+    __pyx_t_11 = 0;
+    __pyx_t_10 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 711, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __PYX_ERR(0, 711, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":667
+ * 
+ * 
+ * cdef object read_compact_value(InputBuffer inp, TypeSpec spec):             # <<<<<<<<<<<<<<
+ *     cdef int ttype = spec.ttype
+ *     cdef int header
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.read_compact_value", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_result);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":715
+ * 
+ * 
+ * cdef int skip_compact(InputBuffer inp, int ttype, int depth) except -1:             # <<<<<<<<<<<<<<
+ *     cdef int header
+ *     cdef int etype = T_STOP, ktype = T_STOP, vtype = T_STOP
+ */
+
+static int __pyx_f_12thriftworker_9protocols_5codec_skip_compact(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp, int __pyx_v_ttype, int __pyx_v_depth) {
+  int __pyx_v_header;
+  int __pyx_v_etype;
+  int __pyx_v_ktype;
+  int __pyx_v_vtype;
+  int64_t __pyx_v_size;
+  CYTHON_UNUSED int64_t __pyx_v_i;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  uint64_t __pyx_t_2;
+  int64_t __pyx_t_3;
+  int __pyx_t_4;
+  int64_t __pyx_t_5;
+  int64_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("skip_compact", 0);
+
+  /* "thriftworker/protocols/codec.pyx":717
+ * cdef int skip_compact(InputBuffer inp, int ttype, int depth) except -1:
+ *     cdef int header
+ *     cdef int etype = T_STOP, ktype = T_STOP, vtype = T_STOP             # <<<<<<<<<<<<<<
+ *     cdef int64_t size
+ *     cdef int64_t i
+ */
+  __pyx_v_etype = __pyx_e_12thriftworker_9protocols_5codec_T_STOP;
+  __pyx_v_ktype = __pyx_e_12thriftworker_9protocols_5codec_T_STOP;
+  __pyx_v_vtype = __pyx_e_12thriftworker_9protocols_5codec_T_STOP;
+
+  /* "thriftworker/protocols/codec.pyx":720
+ *     cdef int64_t size
+ *     cdef int64_t i
+ *     check_depth(depth)             # <<<<<<<<<<<<<<
+ *     if ttype == T_BOOL or ttype == T_BYTE:
+ *         inp.ensure(1)
+ */
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_check_depth(__pyx_v_depth); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 720, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":721
+ *     cdef int64_t i
+ *     check_depth(depth)
+ *     if ttype == T_BOOL or ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         inp.ensure(1)
+ *         inp.position += 1
+ */
+  switch (__pyx_v_ttype) {
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BOOL:
+    case __pyx_e_12thriftworker_9protocols_5codec_T_BYTE:
+
+    /* "thriftworker/protocols/codec.pyx":722
+ *     check_depth(depth)
+ *     if ttype == T_BOOL or ttype == T_BYTE:
+ *         inp.ensure(1)             # <<<<<<<<<<<<<<
+ *         inp.position += 1
+ *     elif ttype == T_I16 or ttype == T_I32 or ttype == T_I64:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_inp, 1); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 722, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":723
+ *     if ttype == T_BOOL or ttype == T_BYTE:
+ *         inp.ensure(1)
+ *         inp.position += 1             # <<<<<<<<<<<<<<
+ *     elif ttype == T_I16 or ttype == T_I32 or ttype == T_I64:
+ *         inp.read_varint()
+ */
+    __pyx_v_inp->position = (__pyx_v_inp->position + 1);
+
+    /* "thriftworker/protocols/codec.pyx":721
+ *     cdef int64_t i
+ *     check_depth(depth)
+ *     if ttype == T_BOOL or ttype == T_BYTE:             # <<<<<<<<<<<<<<
+ *         inp.ensure(1)
+ *         inp.position += 1
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I16:
+
+    /* "thriftworker/protocols/codec.pyx":724
+ *         inp.ensure(1)
+ *         inp.position += 1
+ *     elif ttype == T_I16 or ttype == T_I32 or ttype == T_I64:             # <<<<<<<<<<<<<<
+ *         inp.read_varint()
+ *     elif ttype == T_DOUBLE:
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I32:
+    case __pyx_e_12thriftworker_9protocols_5codec_T_I64:
+
+    /* "thriftworker/protocols/codec.pyx":725
+ *         inp.position += 1
+ *     elif ttype == T_I16 or ttype == T_I32 or ttype == T_I64:
+ *         inp.read_varint()             # <<<<<<<<<<<<<<
+ *     elif ttype == T_DOUBLE:
+ *         inp.ensure(8)
+ */
+    __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(__pyx_v_inp); if (unlikely(__pyx_t_2 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 725, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":724
+ *         inp.ensure(1)
+ *         inp.position += 1
+ *     elif ttype == T_I16 or ttype == T_I32 or ttype == T_I64:             # <<<<<<<<<<<<<<
+ *         inp.read_varint()
+ *     elif ttype == T_DOUBLE:
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_DOUBLE:
+
+    /* "thriftworker/protocols/codec.pyx":727
+ *         inp.read_varint()
+ *     elif ttype == T_DOUBLE:
+ *         inp.ensure(8)             # <<<<<<<<<<<<<<
+ *         inp.position += 8
+ *     elif ttype == T_STRING:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_inp, 8); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 727, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":728
+ *     elif ttype == T_DOUBLE:
+ *         inp.ensure(8)
+ *         inp.position += 8             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRING:
+ *         size = read_compact_size(inp)
+ */
+    __pyx_v_inp->position = (__pyx_v_inp->position + 8);
+
+    /* "thriftworker/protocols/codec.pyx":726
+ *     elif ttype == T_I16 or ttype == T_I32 or ttype == T_I64:
+ *         inp.read_varint()
+ *     elif ttype == T_DOUBLE:             # <<<<<<<<<<<<<<
+ *         inp.ensure(8)
+ *         inp.position += 8
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRING:
+
+    /* "thriftworker/protocols/codec.pyx":730
+ *         inp.position += 8
+ *     elif ttype == T_STRING:
+ *         size = read_compact_size(inp)             # <<<<<<<<<<<<<<
+ *         inp.ensure(size)
+ *         inp.position += size
+ */
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_size(__pyx_v_inp); if (unlikely(__pyx_t_3 == ((int64_t)-1L) && PyErr_Occurred())) __PYX_ERR(0, 730, __pyx_L1_error)
+    __pyx_v_size = __pyx_t_3;
+
+    /* "thriftworker/protocols/codec.pyx":731
+ *     elif ttype == T_STRING:
+ *         size = read_compact_size(inp)
+ *         inp.ensure(size)             # <<<<<<<<<<<<<<
+ *         inp.position += size
+ *     elif ttype == T_STRUCT:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure(__pyx_v_inp, __pyx_v_size); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 731, __pyx_L1_error)
+
+    /* "thriftworker/protocols/codec.pyx":732
+ *         size = read_compact_size(inp)
+ *         inp.ensure(size)
+ *         inp.position += size             # <<<<<<<<<<<<<<
+ *     elif ttype == T_STRUCT:
+ *         while True:
+ */
+    __pyx_v_inp->position = (__pyx_v_inp->position + __pyx_v_size);
+
+    /* "thriftworker/protocols/codec.pyx":729
+ *         inp.ensure(8)
+ *         inp.position += 8
+ *     elif ttype == T_STRING:             # <<<<<<<<<<<<<<
+ *         size = read_compact_size(inp)
+ *         inp.ensure(size)
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_STRUCT:
+
+    /* "thriftworker/protocols/codec.pyx":734
+ *         inp.position += size
+ *     elif ttype == T_STRUCT:
+ *         while True:             # <<<<<<<<<<<<<<
+ *             header = inp.read_byte()
+ *             if header & 0x0f == C_STOP:
+ */
+    while (1) {
+
+      /* "thriftworker/protocols/codec.pyx":735
+ *     elif ttype == T_STRUCT:
+ *         while True:
+ *             header = inp.read_byte()             # <<<<<<<<<<<<<<
+ *             if header & 0x0f == C_STOP:
+ *                 break
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 735, __pyx_L1_error)
+      __pyx_v_header = __pyx_t_1;
+
+      /* "thriftworker/protocols/codec.pyx":736
+ *         while True:
+ *             header = inp.read_byte()
+ *             if header & 0x0f == C_STOP:             # <<<<<<<<<<<<<<
+ *                 break
+ *             if not header >> 4:
+ */
+      __pyx_t_4 = (((__pyx_v_header & 0x0f) == __pyx_e_12thriftworker_9protocols_5codec_C_STOP) != 0);
+      if (__pyx_t_4) {
+
+        /* "thriftworker/protocols/codec.pyx":737
+ *             header = inp.read_byte()
+ *             if header & 0x0f == C_STOP:
+ *                 break             # <<<<<<<<<<<<<<
+ *             if not header >> 4:
+ *                 inp.read_varint()
+ */
+        goto __pyx_L4_break;
+
+        /* "thriftworker/protocols/codec.pyx":736
+ *         while True:
+ *             header = inp.read_byte()
+ *             if header & 0x0f == C_STOP:             # <<<<<<<<<<<<<<
+ *                 break
+ *             if not header >> 4:
+ */
+      }
+
+      /* "thriftworker/protocols/codec.pyx":738
+ *             if header & 0x0f == C_STOP:
+ *                 break
+ *             if not header >> 4:             # <<<<<<<<<<<<<<
+ *                 inp.read_varint()
+ *             etype = to_ttype(header & 0x0f)
+ */
+      __pyx_t_4 = ((!((__pyx_v_header >> 4) != 0)) != 0);
+      if (__pyx_t_4) {
+
+        /* "thriftworker/protocols/codec.pyx":739
+ *                 break
+ *             if not header >> 4:
+ *                 inp.read_varint()             # <<<<<<<<<<<<<<
+ *             etype = to_ttype(header & 0x0f)
+ *             if etype != T_BOOL:
+ */
+        __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(__pyx_v_inp); if (unlikely(__pyx_t_2 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 739, __pyx_L1_error)
+
+        /* "thriftworker/protocols/codec.pyx":738
+ *             if header & 0x0f == C_STOP:
+ *                 break
+ *             if not header >> 4:             # <<<<<<<<<<<<<<
+ *                 inp.read_varint()
+ *             etype = to_ttype(header & 0x0f)
+ */
+      }
+
+      /* "thriftworker/protocols/codec.pyx":740
+ *             if not header >> 4:
+ *                 inp.read_varint()
+ *             etype = to_ttype(header & 0x0f)             # <<<<<<<<<<<<<<
+ *             if etype != T_BOOL:
+ *                 skip_compact(inp, etype, depth + 1)
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_to_ttype((__pyx_v_header & 0x0f)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 740, __pyx_L1_error)
+      __pyx_v_etype = __pyx_t_1;
+
+      /* "thriftworker/protocols/codec.pyx":741
+ *                 inp.read_varint()
+ *             etype = to_ttype(header & 0x0f)
+ *             if etype != T_BOOL:             # <<<<<<<<<<<<<<
+ *                 skip_compact(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+      __pyx_t_4 = ((__pyx_v_etype != __pyx_e_12thriftworker_9protocols_5codec_T_BOOL) != 0);
+      if (__pyx_t_4) {
+
+        /* "thriftworker/protocols/codec.pyx":742
+ *             etype = to_ttype(header & 0x0f)
+ *             if etype != T_BOOL:
+ *                 skip_compact(inp, etype, depth + 1)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         header = inp.read_byte()
+ */
+        __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_skip_compact(__pyx_v_inp, __pyx_v_etype, (__pyx_v_depth + 1)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 742, __pyx_L1_error)
+
+        /* "thriftworker/protocols/codec.pyx":741
+ *                 inp.read_varint()
+ *             etype = to_ttype(header & 0x0f)
+ *             if etype != T_BOOL:             # <<<<<<<<<<<<<<
+ *                 skip_compact(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ */
+      }
+    }
+    __pyx_L4_break:;
+
+    /* "thriftworker/protocols/codec.pyx":733
+ *         inp.ensure(size)
+ *         inp.position += size
+ *     elif ttype == T_STRUCT:             # <<<<<<<<<<<<<<
+ *         while True:
+ *             header = inp.read_byte()
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_LIST:
+
+    /* "thriftworker/protocols/codec.pyx":743
+ *             if etype != T_BOOL:
+ *                 skip_compact(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         header = inp.read_byte()
+ *         size = header >> 4
+ */
+    case __pyx_e_12thriftworker_9protocols_5codec_T_SET:
+
+    /* "thriftworker/protocols/codec.pyx":744
+ *                 skip_compact(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         header = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         size = header >> 4
+ *         if size == 15:
+ */
+    __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 744, __pyx_L1_error)
+    __pyx_v_header = __pyx_t_1;
+
+    /* "thriftworker/protocols/codec.pyx":745
+ *     elif ttype == T_LIST or ttype == T_SET:
+ *         header = inp.read_byte()
+ *         size = header >> 4             # <<<<<<<<<<<<<<
+ *         if size == 15:
+ *             size = read_compact_size(inp)
+ */
+    __pyx_v_size = (__pyx_v_header >> 4);
+
+    /* "thriftworker/protocols/codec.pyx":746
+ *         header = inp.read_byte()
+ *         size = header >> 4
+ *         if size == 15:             # <<<<<<<<<<<<<<
+ *             size = read_compact_size(inp)
+ *         if size:
+ */
+    __pyx_t_4 = ((__pyx_v_size == 15) != 0);
+    if (__pyx_t_4) {
+
+      /* "thriftworker/protocols/codec.pyx":747
+ *         size = header >> 4
+ *         if size == 15:
+ *             size = read_compact_size(inp)             # <<<<<<<<<<<<<<
+ *         if size:
+ *             etype = to_ttype(header & 0x0f)
+ */
+      __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_size(__pyx_v_inp); if (unlikely(__pyx_t_3 == ((int64_t)-1L) && PyErr_Occurred())) __PYX_ERR(0, 747, __pyx_L1_error)
+      __pyx_v_size = __pyx_t_3;
+
+      /* "thriftworker/protocols/codec.pyx":746
+ *         header = inp.read_byte()
+ *         size = header >> 4
+ *         if size == 15:             # <<<<<<<<<<<<<<
+ *             size = read_compact_size(inp)
+ *         if size:
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":748
+ *         if size == 15:
+ *             size = read_compact_size(inp)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             etype = to_ttype(header & 0x0f)
+ *         for i in range(size):
+ */
+    __pyx_t_4 = (__pyx_v_size != 0);
+    if (__pyx_t_4) {
+
+      /* "thriftworker/protocols/codec.pyx":749
+ *             size = read_compact_size(inp)
+ *         if size:
+ *             etype = to_ttype(header & 0x0f)             # <<<<<<<<<<<<<<
+ *         for i in range(size):
+ *             skip_compact(inp, etype, depth + 1)
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_to_ttype((__pyx_v_header & 0x0f)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 749, __pyx_L1_error)
+      __pyx_v_etype = __pyx_t_1;
+
+      /* "thriftworker/protocols/codec.pyx":748
+ *         if size == 15:
+ *             size = read_compact_size(inp)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             etype = to_ttype(header & 0x0f)
+ *         for i in range(size):
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":750
+ *         if size:
+ *             etype = to_ttype(header & 0x0f)
+ *         for i in range(size):             # <<<<<<<<<<<<<<
+ *             skip_compact(inp, etype, depth + 1)
+ *     elif ttype == T_MAP:
+ */
+    __pyx_t_3 = __pyx_v_size;
+    __pyx_t_5 = __pyx_t_3;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "thriftworker/protocols/codec.pyx":751
+ *             etype = to_ttype(header & 0x0f)
+ *         for i in range(size):
+ *             skip_compact(inp, etype, depth + 1)             # <<<<<<<<<<<<<<
+ *     elif ttype == T_MAP:
+ *         size = read_compact_size(inp)
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_skip_compact(__pyx_v_inp, __pyx_v_etype, (__pyx_v_depth + 1)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 751, __pyx_L1_error)
+    }
+
+    /* "thriftworker/protocols/codec.pyx":743
+ *             if etype != T_BOOL:
+ *                 skip_compact(inp, etype, depth + 1)
+ *     elif ttype == T_LIST or ttype == T_SET:             # <<<<<<<<<<<<<<
+ *         header = inp.read_byte()
+ *         size = header >> 4
+ */
+    break;
+    case __pyx_e_12thriftworker_9protocols_5codec_T_MAP:
+
+    /* "thriftworker/protocols/codec.pyx":753
+ *             skip_compact(inp, etype, depth + 1)
+ *     elif ttype == T_MAP:
+ *         size = read_compact_size(inp)             # <<<<<<<<<<<<<<
+ *         if size:
+ *             header = inp.read_byte()
+ */
+    __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_size(__pyx_v_inp); if (unlikely(__pyx_t_3 == ((int64_t)-1L) && PyErr_Occurred())) __PYX_ERR(0, 753, __pyx_L1_error)
+    __pyx_v_size = __pyx_t_3;
+
+    /* "thriftworker/protocols/codec.pyx":754
+ *     elif ttype == T_MAP:
+ *         size = read_compact_size(inp)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             header = inp.read_byte()
+ *             ktype = to_ttype(header >> 4)
+ */
+    __pyx_t_4 = (__pyx_v_size != 0);
+    if (__pyx_t_4) {
+
+      /* "thriftworker/protocols/codec.pyx":755
+ *         size = read_compact_size(inp)
+ *         if size:
+ *             header = inp.read_byte()             # <<<<<<<<<<<<<<
+ *             ktype = to_ttype(header >> 4)
+ *             vtype = to_ttype(header & 0x0f)
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 755, __pyx_L1_error)
+      __pyx_v_header = __pyx_t_1;
+
+      /* "thriftworker/protocols/codec.pyx":756
+ *         if size:
+ *             header = inp.read_byte()
+ *             ktype = to_ttype(header >> 4)             # <<<<<<<<<<<<<<
+ *             vtype = to_ttype(header & 0x0f)
+ *         for i in range(size):
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_to_ttype((__pyx_v_header >> 4)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 756, __pyx_L1_error)
+      __pyx_v_ktype = __pyx_t_1;
+
+      /* "thriftworker/protocols/codec.pyx":757
+ *             header = inp.read_byte()
+ *             ktype = to_ttype(header >> 4)
+ *             vtype = to_ttype(header & 0x0f)             # <<<<<<<<<<<<<<
+ *         for i in range(size):
+ *             skip_compact(inp, ktype, depth + 1)
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_to_ttype((__pyx_v_header & 0x0f)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 757, __pyx_L1_error)
+      __pyx_v_vtype = __pyx_t_1;
+
+      /* "thriftworker/protocols/codec.pyx":754
+ *     elif ttype == T_MAP:
+ *         size = read_compact_size(inp)
+ *         if size:             # <<<<<<<<<<<<<<
+ *             header = inp.read_byte()
+ *             ktype = to_ttype(header >> 4)
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":758
+ *             ktype = to_ttype(header >> 4)
+ *             vtype = to_ttype(header & 0x0f)
+ *         for i in range(size):             # <<<<<<<<<<<<<<
+ *             skip_compact(inp, ktype, depth + 1)
+ *             skip_compact(inp, vtype, depth + 1)
+ */
+    __pyx_t_3 = __pyx_v_size;
+    __pyx_t_5 = __pyx_t_3;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "thriftworker/protocols/codec.pyx":759
+ *             vtype = to_ttype(header & 0x0f)
+ *         for i in range(size):
+ *             skip_compact(inp, ktype, depth + 1)             # <<<<<<<<<<<<<<
+ *             skip_compact(inp, vtype, depth + 1)
+ *     else:
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_skip_compact(__pyx_v_inp, __pyx_v_ktype, (__pyx_v_depth + 1)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 759, __pyx_L1_error)
+
+      /* "thriftworker/protocols/codec.pyx":760
+ *         for i in range(size):
+ *             skip_compact(inp, ktype, depth + 1)
+ *             skip_compact(inp, vtype, depth + 1)             # <<<<<<<<<<<<<<
+ *     else:
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,
+ */
+      __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_skip_compact(__pyx_v_inp, __pyx_v_vtype, (__pyx_v_depth + 1)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 760, __pyx_L1_error)
+    }
+
+    /* "thriftworker/protocols/codec.pyx":752
+ *         for i in range(size):
+ *             skip_compact(inp, etype, depth + 1)
+ *     elif ttype == T_MAP:             # <<<<<<<<<<<<<<
+ *         size = read_compact_size(inp)
+ *         if size:
+ */
+    break;
+    default:
+
+    /* "thriftworker/protocols/codec.pyx":762
+ *             skip_compact(inp, vtype, depth + 1)
+ *     else:
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,             # <<<<<<<<<<<<<<
+ *                                  'unknown type {0}'.format(ttype))
+ *     return 0
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 762, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 762, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_INVALID_DATA); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 762, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":763
+ *     else:
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                                  'unknown type {0}'.format(ttype))             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+    __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_unknown_type_0, __pyx_n_s_format); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 763, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_ttype); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 763, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_13 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_11))) {
+      __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_11);
+      if (likely(__pyx_t_13)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_11);
+        __Pyx_INCREF(__pyx_t_13);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_11, function);
+      }
+    }
+    __pyx_t_9 = (__pyx_t_13) ? __Pyx_PyObject_Call2Args(__pyx_t_11, __pyx_t_13, __pyx_t_12) : __Pyx_PyObject_CallOneArg(__pyx_t_11, __pyx_t_12);
+    __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 763, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_11 = NULL;
+    __pyx_t_1 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_11)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_11);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+        __pyx_t_1 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_8)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_11, __pyx_t_10, __pyx_t_9};
+      __pyx_t_7 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 762, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_11, __pyx_t_10, __pyx_t_9};
+      __pyx_t_7 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 762, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_12 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 762, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      if (__pyx_t_11) {
+        __Pyx_GIVEREF(__pyx_t_11); PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_11); __pyx_t_11 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_10);
+      PyTuple_SET_ITEM(__pyx_t_12, 0+__pyx_t_1, __pyx_t_10);
+      __Pyx_GIVEREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_12, 1+__pyx_t_1, __pyx_t_9);
+      __pyx_t_10 = 0;
+      __pyx_t_9 = 0;
+      __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_12, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 762, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_Raise(__pyx_t_7, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __PYX_ERR(0, 762, __pyx_L1_error)
+    break;
+  }
+
+  /* "thriftworker/protocols/codec.pyx":764
+ *         raise TProtocolException(TProtocolException.INVALID_DATA,
+ *                                  'unknown type {0}'.format(ttype))
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":715
+ * 
+ * 
+ * cdef int skip_compact(InputBuffer inp, int ttype, int depth) except -1:             # <<<<<<<<<<<<<<
+ *     cdef int header
+ *     cdef int etype = T_STOP, ktype = T_STOP, vtype = T_STOP
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.skip_compact", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":767
+ * 
+ * 
+ * cdef object read_compact_struct(InputBuffer inp, StructSpec spec,             # <<<<<<<<<<<<<<
+ *                                 object obj):
+ *     cdef FieldSpec field
+ */
+
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec_read_compact_struct(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp, struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v_spec, PyObject *__pyx_v_obj) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v_field = 0;
+  int __pyx_v_header;
+  int __pyx_v_ctype;
+  int __pyx_v_ttype;
+  int __pyx_v_delta;
+  int __pyx_v_fid;
+  int __pyx_v_last_fid;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  uint64_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_compact_struct", 0);
+  __Pyx_INCREF(__pyx_v_obj);
+
+  /* "thriftworker/protocols/codec.pyx":772
+ *     cdef int header, ctype, ttype, delta
+ *     cdef int fid
+ *     cdef int last_fid = 0             # <<<<<<<<<<<<<<
+ *     if obj is None:
+ *         obj = spec.cls()
+ */
+  __pyx_v_last_fid = 0;
+
+  /* "thriftworker/protocols/codec.pyx":773
+ *     cdef int fid
+ *     cdef int last_fid = 0
+ *     if obj is None:             # <<<<<<<<<<<<<<
+ *         obj = spec.cls()
+ *     while True:
+ */
+  __pyx_t_1 = (__pyx_v_obj == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "thriftworker/protocols/codec.pyx":774
+ *     cdef int last_fid = 0
+ *     if obj is None:
+ *         obj = spec.cls()             # <<<<<<<<<<<<<<
+ *     while True:
+ *         header = inp.read_byte()
+ */
+    __Pyx_INCREF(__pyx_v_spec->cls);
+    __pyx_t_4 = __pyx_v_spec->cls; __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 774, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_obj, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":773
+ *     cdef int fid
+ *     cdef int last_fid = 0
+ *     if obj is None:             # <<<<<<<<<<<<<<
+ *         obj = spec.cls()
+ *     while True:
+ */
+  }
+
+  /* "thriftworker/protocols/codec.pyx":775
+ *     if obj is None:
+ *         obj = spec.cls()
+ *     while True:             # <<<<<<<<<<<<<<
+ *         header = inp.read_byte()
+ *         ctype = header & 0x0f
+ */
+  while (1) {
+
+    /* "thriftworker/protocols/codec.pyx":776
+ *         obj = spec.cls()
+ *     while True:
+ *         header = inp.read_byte()             # <<<<<<<<<<<<<<
+ *         ctype = header & 0x0f
+ *         if ctype == C_STOP:
+ */
+    __pyx_t_6 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte(__pyx_v_inp); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 776, __pyx_L1_error)
+    __pyx_v_header = __pyx_t_6;
+
+    /* "thriftworker/protocols/codec.pyx":777
+ *     while True:
+ *         header = inp.read_byte()
+ *         ctype = header & 0x0f             # <<<<<<<<<<<<<<
+ *         if ctype == C_STOP:
+ *             break
+ */
+    __pyx_v_ctype = (__pyx_v_header & 0x0f);
+
+    /* "thriftworker/protocols/codec.pyx":778
+ *         header = inp.read_byte()
+ *         ctype = header & 0x0f
+ *         if ctype == C_STOP:             # <<<<<<<<<<<<<<
+ *             break
+ *         delta = header >> 4
+ */
+    __pyx_t_2 = ((__pyx_v_ctype == __pyx_e_12thriftworker_9protocols_5codec_C_STOP) != 0);
+    if (__pyx_t_2) {
+
+      /* "thriftworker/protocols/codec.pyx":779
+ *         ctype = header & 0x0f
+ *         if ctype == C_STOP:
+ *             break             # <<<<<<<<<<<<<<
+ *         delta = header >> 4
+ *         if delta:
+ */
+      goto __pyx_L5_break;
+
+      /* "thriftworker/protocols/codec.pyx":778
+ *         header = inp.read_byte()
+ *         ctype = header & 0x0f
+ *         if ctype == C_STOP:             # <<<<<<<<<<<<<<
+ *             break
+ *         delta = header >> 4
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":780
+ *         if ctype == C_STOP:
+ *             break
+ *         delta = header >> 4             # <<<<<<<<<<<<<<
+ *         if delta:
+ *             fid = last_fid + delta
+ */
+    __pyx_v_delta = (__pyx_v_header >> 4);
+
+    /* "thriftworker/protocols/codec.pyx":781
+ *             break
+ *         delta = header >> 4
+ *         if delta:             # <<<<<<<<<<<<<<
+ *             fid = last_fid + delta
+ *         else:
+ */
+    __pyx_t_2 = (__pyx_v_delta != 0);
+    if (__pyx_t_2) {
+
+      /* "thriftworker/protocols/codec.pyx":782
+ *         delta = header >> 4
+ *         if delta:
+ *             fid = last_fid + delta             # <<<<<<<<<<<<<<
+ *         else:
+ *             fid = <int16_t>unzigzag(inp.read_varint())
+ */
+      __pyx_v_fid = (__pyx_v_last_fid + __pyx_v_delta);
+
+      /* "thriftworker/protocols/codec.pyx":781
+ *             break
+ *         delta = header >> 4
+ *         if delta:             # <<<<<<<<<<<<<<
+ *             fid = last_fid + delta
+ *         else:
+ */
+      goto __pyx_L7;
+    }
+
+    /* "thriftworker/protocols/codec.pyx":784
+ *             fid = last_fid + delta
+ *         else:
+ *             fid = <int16_t>unzigzag(inp.read_varint())             # <<<<<<<<<<<<<<
+ *         last_fid = fid
+ *         ttype = to_ttype(ctype)
+ */
+    /*else*/ {
+      __pyx_t_7 = __pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint(__pyx_v_inp); if (unlikely(__pyx_t_7 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 784, __pyx_L1_error)
+      __pyx_v_fid = ((int16_t)__pyx_f_12thriftworker_9protocols_5codec_unzigzag(__pyx_t_7));
+    }
+    __pyx_L7:;
+
+    /* "thriftworker/protocols/codec.pyx":785
+ *         else:
+ *             fid = <int16_t>unzigzag(inp.read_varint())
+ *         last_fid = fid             # <<<<<<<<<<<<<<
+ *         ttype = to_ttype(ctype)
+ *         field = spec.lookup(fid)
+ */
+    __pyx_v_last_fid = __pyx_v_fid;
+
+    /* "thriftworker/protocols/codec.pyx":786
+ *             fid = <int16_t>unzigzag(inp.read_varint())
+ *         last_fid = fid
+ *         ttype = to_ttype(ctype)             # <<<<<<<<<<<<<<
+ *         field = spec.lookup(fid)
+ *         if field is None or field.type.ttype != ttype:
+ */
+    __pyx_t_6 = __pyx_f_12thriftworker_9protocols_5codec_to_ttype(__pyx_v_ctype); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 786, __pyx_L1_error)
+    __pyx_v_ttype = __pyx_t_6;
+
+    /* "thriftworker/protocols/codec.pyx":787
+ *         last_fid = fid
+ *         ttype = to_ttype(ctype)
+ *         field = spec.lookup(fid)             # <<<<<<<<<<<<<<
+ *         if field is None or field.type.ttype != ttype:
+ *             if ttype != T_BOOL:
+ */
+    __pyx_t_3 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_10StructSpec_lookup(__pyx_v_spec, __pyx_v_fid)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 787, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_field, ((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "thriftworker/protocols/codec.pyx":788
+ *         ttype = to_ttype(ctype)
+ *         field = spec.lookup(fid)
+ *         if field is None or field.type.ttype != ttype:             # <<<<<<<<<<<<<<
+ *             if ttype != T_BOOL:
+ *                 skip_compact(inp, ttype, 0)
+ */
+    __pyx_t_1 = (((PyObject *)__pyx_v_field) == Py_None);
+    __pyx_t_8 = (__pyx_t_1 != 0);
+    if (!__pyx_t_8) {
+    } else {
+      __pyx_t_2 = __pyx_t_8;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_8 = ((__pyx_v_field->type->ttype != __pyx_v_ttype) != 0);
+    __pyx_t_2 = __pyx_t_8;
+    __pyx_L9_bool_binop_done:;
+    if (__pyx_t_2) {
+
+      /* "thriftworker/protocols/codec.pyx":789
+ *         field = spec.lookup(fid)
+ *         if field is None or field.type.ttype != ttype:
+ *             if ttype != T_BOOL:             # <<<<<<<<<<<<<<
+ *                 skip_compact(inp, ttype, 0)
+ *             continue
+ */
+      __pyx_t_2 = ((__pyx_v_ttype != __pyx_e_12thriftworker_9protocols_5codec_T_BOOL) != 0);
+      if (__pyx_t_2) {
+
+        /* "thriftworker/protocols/codec.pyx":790
+ *         if field is None or field.type.ttype != ttype:
+ *             if ttype != T_BOOL:
+ *                 skip_compact(inp, ttype, 0)             # <<<<<<<<<<<<<<
+ *             continue
+ *         if ttype == T_BOOL:
+ */
+        __pyx_t_6 = __pyx_f_12thriftworker_9protocols_5codec_skip_compact(__pyx_v_inp, __pyx_v_ttype, 0); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 790, __pyx_L1_error)
+
+        /* "thriftworker/protocols/codec.pyx":789
+ *         field = spec.lookup(fid)
+ *         if field is None or field.type.ttype != ttype:
+ *             if ttype != T_BOOL:             # <<<<<<<<<<<<<<
+ *                 skip_compact(inp, ttype, 0)
+ *             continue
+ */
+      }
+
+      /* "thriftworker/protocols/codec.pyx":791
+ *             if ttype != T_BOOL:
+ *                 skip_compact(inp, ttype, 0)
+ *             continue             # <<<<<<<<<<<<<<
+ *         if ttype == T_BOOL:
+ *             setattr(obj, field.name, ctype == C_TRUE)
+ */
+      goto __pyx_L4_continue;
+
+      /* "thriftworker/protocols/codec.pyx":788
+ *         ttype = to_ttype(ctype)
+ *         field = spec.lookup(fid)
+ *         if field is None or field.type.ttype != ttype:             # <<<<<<<<<<<<<<
+ *             if ttype != T_BOOL:
+ *                 skip_compact(inp, ttype, 0)
+ */
+    }
+
+    /* "thriftworker/protocols/codec.pyx":792
+ *                 skip_compact(inp, ttype, 0)
+ *             continue
+ *         if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *             setattr(obj, field.name, ctype == C_TRUE)
+ *         else:
+ */
+    __pyx_t_2 = ((__pyx_v_ttype == __pyx_e_12thriftworker_9protocols_5codec_T_BOOL) != 0);
+    if (__pyx_t_2) {
+
+      /* "thriftworker/protocols/codec.pyx":793
+ *             continue
+ *         if ttype == T_BOOL:
+ *             setattr(obj, field.name, ctype == C_TRUE)             # <<<<<<<<<<<<<<
+ *         else:
+ *             setattr(obj, field.name, read_compact_value(inp, field.type))
+ */
+      __pyx_t_3 = __pyx_v_field->name;
+      __Pyx_INCREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyBool_FromLong((__pyx_v_ctype == __pyx_e_12thriftworker_9protocols_5codec_C_TRUE)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 793, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_9 = PyObject_SetAttr(__pyx_v_obj, __pyx_t_3, __pyx_t_4); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 793, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "thriftworker/protocols/codec.pyx":792
+ *                 skip_compact(inp, ttype, 0)
+ *             continue
+ *         if ttype == T_BOOL:             # <<<<<<<<<<<<<<
+ *             setattr(obj, field.name, ctype == C_TRUE)
+ *         else:
+ */
+      goto __pyx_L12;
+    }
+
+    /* "thriftworker/protocols/codec.pyx":795
+ *             setattr(obj, field.name, ctype == C_TRUE)
+ *         else:
+ *             setattr(obj, field.name, read_compact_value(inp, field.type))             # <<<<<<<<<<<<<<
+ *     return obj
+ * 
+ */
+    /*else*/ {
+      __pyx_t_4 = __pyx_v_field->name;
+      __Pyx_INCREF(__pyx_t_4);
+      __pyx_t_3 = ((PyObject *)__pyx_v_field->type);
+      __Pyx_INCREF(__pyx_t_3);
+      __pyx_t_5 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_value(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_3)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 795, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_9 = PyObject_SetAttr(__pyx_v_obj, __pyx_t_4, __pyx_t_5); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 795, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+    __pyx_L12:;
+    __pyx_L4_continue:;
+  }
+  __pyx_L5_break:;
+
+  /* "thriftworker/protocols/codec.pyx":796
+ *         else:
+ *             setattr(obj, field.name, read_compact_value(inp, field.type))
+ *     return obj             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_obj);
+  __pyx_r = __pyx_v_obj;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":767
+ * 
+ * 
+ * cdef object read_compact_struct(InputBuffer inp, StructSpec spec,             # <<<<<<<<<<<<<<
+ *                                 object obj):
+ *     cdef FieldSpec field
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.read_compact_struct", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_field);
+  __Pyx_XDECREF(__pyx_v_obj);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":799
+ * 
+ * 
+ * def encode_compact(object obj, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Serialize struct with compact protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_5encode_compact(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_12thriftworker_9protocols_5codec_4encode_compact[] = "Serialize struct with compact protocol.";
+static PyMethodDef __pyx_mdef_12thriftworker_9protocols_5codec_5encode_compact = {"encode_compact", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_12thriftworker_9protocols_5codec_5encode_compact, METH_VARARGS|METH_KEYWORDS, __pyx_doc_12thriftworker_9protocols_5codec_4encode_compact};
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_5encode_compact(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_thrift_spec = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("encode_compact (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_thrift_spec,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_thrift_spec)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("encode_compact", 1, 2, 2, 1); __PYX_ERR(0, 799, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "encode_compact") < 0)) __PYX_ERR(0, 799, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_thrift_spec = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("encode_compact", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 799, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.encode_compact", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_4encode_compact(__pyx_self, __pyx_v_obj, __pyx_v_thrift_spec);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_4encode_compact(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_thrift_spec) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *__pyx_v_out = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("encode_compact", 0);
+
+  /* "thriftworker/protocols/codec.pyx":801
+ * def encode_compact(object obj, object thrift_spec):
+ *     """Serialize struct with compact protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()             # <<<<<<<<<<<<<<
+ *     write_compact_struct(out, get_struct(obj.__class__, thrift_spec), obj)
+ *     return out.getvalue()
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_OutputBuffer)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 801, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_out = ((struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":802
+ *     """Serialize struct with compact protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ *     write_compact_struct(out, get_struct(obj.__class__, thrift_spec), obj)             # <<<<<<<<<<<<<<
+ *     return out.getvalue()
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_obj, __pyx_n_s_class); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 802, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_get_struct(__pyx_t_1, __pyx_v_thrift_spec)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 802, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __pyx_f_12thriftworker_9protocols_5codec_write_compact_struct(__pyx_v_out, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_2), __pyx_v_obj); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 802, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":803
+ *     cdef OutputBuffer out = OutputBuffer()
+ *     write_compact_struct(out, get_struct(obj.__class__, thrift_spec), obj)
+ *     return out.getvalue()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_getvalue(__pyx_v_out); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 803, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":799
+ * 
+ * 
+ * def encode_compact(object obj, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Serialize struct with compact protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.encode_compact", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_out);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "thriftworker/protocols/codec.pyx":806
+ * 
+ * 
+ * def decode_compact(object obj, object thrift_spec, bytes data,             # <<<<<<<<<<<<<<
+ *                    Py_ssize_t position=0):
+ *     """Read struct serialized with compact protocol from given position of
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_7decode_compact(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_12thriftworker_9protocols_5codec_6decode_compact[] = "Read struct serialized with compact protocol from given position of\n    data. Return position after struct.\n\n    ";
+static PyMethodDef __pyx_mdef_12thriftworker_9protocols_5codec_7decode_compact = {"decode_compact", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_12thriftworker_9protocols_5codec_7decode_compact, METH_VARARGS|METH_KEYWORDS, __pyx_doc_12thriftworker_9protocols_5codec_6decode_compact};
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_7decode_compact(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_obj = 0;
+  PyObject *__pyx_v_thrift_spec = 0;
+  PyObject *__pyx_v_data = 0;
+  Py_ssize_t __pyx_v_position;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("decode_compact (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,&__pyx_n_s_thrift_spec,&__pyx_n_s_data,&__pyx_n_s_position,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_obj)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_thrift_spec)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("decode_compact", 0, 3, 4, 1); __PYX_ERR(0, 806, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_data)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("decode_compact", 0, 3, 4, 2); __PYX_ERR(0, 806, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_position);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "decode_compact") < 0)) __PYX_ERR(0, 806, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_obj = values[0];
+    __pyx_v_thrift_spec = values[1];
+    __pyx_v_data = ((PyObject*)values[2]);
+    if (values[3]) {
+      __pyx_v_position = __Pyx_PyIndex_AsSsize_t(values[3]); if (unlikely((__pyx_v_position == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 807, __pyx_L3_error)
+    } else {
+      __pyx_v_position = ((Py_ssize_t)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("decode_compact", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 806, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.decode_compact", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_data), (&PyBytes_Type), 1, "data", 1))) __PYX_ERR(0, 806, __pyx_L1_error)
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_6decode_compact(__pyx_self, __pyx_v_obj, __pyx_v_thrift_spec, __pyx_v_data, __pyx_v_position);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_6decode_compact(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_obj, PyObject *__pyx_v_thrift_spec, PyObject *__pyx_v_data, Py_ssize_t __pyx_v_position) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *__pyx_v_inp = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("decode_compact", 0);
+
+  /* "thriftworker/protocols/codec.pyx":812
+ * 
+ *     """
+ *     cdef InputBuffer inp = InputBuffer(data, position)             # <<<<<<<<<<<<<<
+ *     read_compact_struct(inp, get_struct(obj.__class__, thrift_spec), obj)
+ *     return inp.position
+ */
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 812, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 812, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_data);
+  __Pyx_GIVEREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_data);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_InputBuffer), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 812, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_inp = ((struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":813
+ *     """
+ *     cdef InputBuffer inp = InputBuffer(data, position)
+ *     read_compact_struct(inp, get_struct(obj.__class__, thrift_spec), obj)             # <<<<<<<<<<<<<<
+ *     return inp.position
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_obj, __pyx_n_s_class); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 813, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((PyObject *)__pyx_f_12thriftworker_9protocols_5codec_get_struct(__pyx_t_1, __pyx_v_thrift_spec)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 813, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_f_12thriftworker_9protocols_5codec_read_compact_struct(__pyx_v_inp, ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_2), __pyx_v_obj); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 813, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":814
+ *     cdef InputBuffer inp = InputBuffer(data, position)
+ *     read_compact_struct(inp, get_struct(obj.__class__, thrift_spec), obj)
+ *     return inp.position             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_inp->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 814, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "thriftworker/protocols/codec.pyx":806
+ * 
+ * 
+ * def decode_compact(object obj, object thrift_spec, bytes data,             # <<<<<<<<<<<<<<
+ *                    Py_ssize_t position=0):
+ *     """Read struct serialized with compact protocol from given position of
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.decode_compact", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_inp);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_TypeSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_9__pyx_unpickle_TypeSpec(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_12thriftworker_9protocols_5codec_9__pyx_unpickle_TypeSpec = {"__pyx_unpickle_TypeSpec", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_12thriftworker_9protocols_5codec_9__pyx_unpickle_TypeSpec, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_9__pyx_unpickle_TypeSpec(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_TypeSpec (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_TypeSpec", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_TypeSpec", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_TypeSpec") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_TypeSpec", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_TypeSpec", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_8__pyx_unpickle_TypeSpec(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_8__pyx_unpickle_TypeSpec(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_TypeSpec", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xfd374a6, 0x5147eee, 0x734ef0a):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xfd374a6, 0x5147eee, 0x734ef0a) = (ctype, key, struct, ttype, value))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__6, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xfd374a6, 0x5147eee, 0x734ef0a):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xfd374a6, 0x5147eee, 0x734ef0a) = (ctype, key, struct, ttype, value))" % __pyx_checksum)
+ *     __pyx_result = TypeSpec.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xfd374a6, 0x5147eee, 0x734ef0a):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xfd374a6, 0x5147eee, 0x734ef0a) = (ctype, key, struct, ttype, value))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = TypeSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xfd374a6, 0x5147eee, 0x734ef0a):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xfd374a6, 0x5147eee, 0x734ef0a) = (ctype, key, struct, ttype, value))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xfd374a6, 0x5147eee, 0x734ef0a) = (ctype, key, struct, ttype, value))" % __pyx_checksum)
+ *     __pyx_result = TypeSpec.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_TypeSpec__set_state(<TypeSpec> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_TypeSpec), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xfd374a6, 0x5147eee, 0x734ef0a) = (ctype, key, struct, ttype, value))" % __pyx_checksum)
+ *     __pyx_result = TypeSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_TypeSpec__set_state(<TypeSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = TypeSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_TypeSpec__set_state(<TypeSpec> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TypeSpec__set_state(TypeSpec __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_TypeSpec__set_state(((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xfd374a6, 0x5147eee, 0x734ef0a) = (ctype, key, struct, ttype, value))" % __pyx_checksum)
+ *     __pyx_result = TypeSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_TypeSpec__set_state(<TypeSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_TypeSpec__set_state(<TypeSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_TypeSpec__set_state(TypeSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.ctype = __pyx_state[0]; __pyx_result.key = __pyx_state[1]; __pyx_result.struct = __pyx_state[2]; __pyx_result.ttype = __pyx_state[3]; __pyx_result.value = __pyx_state[4]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_TypeSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_TypeSpec", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_TypeSpec__set_state(<TypeSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TypeSpec__set_state(TypeSpec __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.ctype = __pyx_state[0]; __pyx_result.key = __pyx_state[1]; __pyx_result.struct = __pyx_state[2]; __pyx_result.ttype = __pyx_state[3]; __pyx_result.value = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_TypeSpec__set_state(struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_TypeSpec__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TypeSpec__set_state(TypeSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.ctype = __pyx_state[0]; __pyx_result.key = __pyx_state[1]; __pyx_result.struct = __pyx_state[2]; __pyx_result.ttype = __pyx_state[3]; __pyx_result.value = __pyx_state[4]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[5])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->ctype = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_12thriftworker_9protocols_5codec_TypeSpec))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->key);
+  __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->key));
+  __pyx_v___pyx_result->key = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_12thriftworker_9protocols_5codec_StructSpec))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->__pyx_struct);
+  __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->__pyx_struct));
+  __pyx_v___pyx_result->__pyx_struct = ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->ttype = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_12thriftworker_9protocols_5codec_TypeSpec))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->value);
+  __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->value));
+  __pyx_v___pyx_result->value = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_TypeSpec__set_state(TypeSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.ctype = __pyx_state[0]; __pyx_result.key = __pyx_state[1]; __pyx_result.struct = __pyx_state[2]; __pyx_result.ttype = __pyx_state[3]; __pyx_result.value = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[5])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_4 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_5 = ((__pyx_t_4 > 5) != 0);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_3 = __pyx_t_5;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_5 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  __pyx_t_3 = __pyx_t_6;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.ctype = __pyx_state[0]; __pyx_result.key = __pyx_state[1]; __pyx_result.struct = __pyx_state[2]; __pyx_result.ttype = __pyx_state[3]; __pyx_result.value = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[5])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_update); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 5, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_9, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_TypeSpec__set_state(TypeSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.ctype = __pyx_state[0]; __pyx_result.key = __pyx_state[1]; __pyx_result.struct = __pyx_state[2]; __pyx_result.ttype = __pyx_state[3]; __pyx_result.value = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[5])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_TypeSpec__set_state(<TypeSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TypeSpec__set_state(TypeSpec __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.ctype = __pyx_state[0]; __pyx_result.key = __pyx_state[1]; __pyx_result.struct = __pyx_state[2]; __pyx_result.ttype = __pyx_state[3]; __pyx_result.value = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_TypeSpec__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_FieldSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_11__pyx_unpickle_FieldSpec(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_12thriftworker_9protocols_5codec_11__pyx_unpickle_FieldSpec = {"__pyx_unpickle_FieldSpec", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_12thriftworker_9protocols_5codec_11__pyx_unpickle_FieldSpec, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_11__pyx_unpickle_FieldSpec(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_FieldSpec (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_FieldSpec", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_FieldSpec", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_FieldSpec") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_FieldSpec", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_FieldSpec", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_10__pyx_unpickle_FieldSpec(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_10__pyx_unpickle_FieldSpec(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_FieldSpec", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xc7c5c28, 0x1ce2014, 0x3cdc14a):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xc7c5c28, 0x1ce2014, 0x3cdc14a) = (fid, name, type))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__7, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xc7c5c28, 0x1ce2014, 0x3cdc14a):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xc7c5c28, 0x1ce2014, 0x3cdc14a) = (fid, name, type))" % __pyx_checksum)
+ *     __pyx_result = FieldSpec.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xc7c5c28, 0x1ce2014, 0x3cdc14a):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xc7c5c28, 0x1ce2014, 0x3cdc14a) = (fid, name, type))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = FieldSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xc7c5c28, 0x1ce2014, 0x3cdc14a):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xc7c5c28, 0x1ce2014, 0x3cdc14a) = (fid, name, type))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xc7c5c28, 0x1ce2014, 0x3cdc14a) = (fid, name, type))" % __pyx_checksum)
+ *     __pyx_result = FieldSpec.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_FieldSpec__set_state(<FieldSpec> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_FieldSpec), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xc7c5c28, 0x1ce2014, 0x3cdc14a) = (fid, name, type))" % __pyx_checksum)
+ *     __pyx_result = FieldSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_FieldSpec__set_state(<FieldSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = FieldSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_FieldSpec__set_state(<FieldSpec> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_FieldSpec__set_state(FieldSpec __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_FieldSpec__set_state(((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xc7c5c28, 0x1ce2014, 0x3cdc14a) = (fid, name, type))" % __pyx_checksum)
+ *     __pyx_result = FieldSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_FieldSpec__set_state(<FieldSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_FieldSpec__set_state(<FieldSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_FieldSpec__set_state(FieldSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.fid = __pyx_state[0]; __pyx_result.name = __pyx_state[1]; __pyx_result.type = __pyx_state[2]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_FieldSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_FieldSpec", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_FieldSpec__set_state(<FieldSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_FieldSpec__set_state(FieldSpec __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.fid = __pyx_state[0]; __pyx_result.name = __pyx_state[1]; __pyx_result.type = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_FieldSpec__set_state(struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_FieldSpec__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_FieldSpec__set_state(FieldSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.fid = __pyx_state[0]; __pyx_result.name = __pyx_state[1]; __pyx_result.type = __pyx_state[2]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->fid = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->name);
+  __Pyx_DECREF(__pyx_v___pyx_result->name);
+  __pyx_v___pyx_result->name = __pyx_t_1;
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_12thriftworker_9protocols_5codec_TypeSpec))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->type);
+  __Pyx_DECREF(((PyObject *)__pyx_v___pyx_result->type));
+  __pyx_v___pyx_result->type = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_FieldSpec__set_state(FieldSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.fid = __pyx_state[0]; __pyx_result.name = __pyx_state[1]; __pyx_result.type = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_4 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_5 = ((__pyx_t_4 > 3) != 0);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_3 = __pyx_t_5;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_5 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  __pyx_t_3 = __pyx_t_6;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.fid = __pyx_state[0]; __pyx_result.name = __pyx_state[1]; __pyx_result.type = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_update); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_9, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_FieldSpec__set_state(FieldSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.fid = __pyx_state[0]; __pyx_result.name = __pyx_state[1]; __pyx_result.type = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_FieldSpec__set_state(<FieldSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_FieldSpec__set_state(FieldSpec __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.fid = __pyx_state[0]; __pyx_result.name = __pyx_state[1]; __pyx_result.type = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_FieldSpec__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_StructSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_13__pyx_unpickle_StructSpec(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_12thriftworker_9protocols_5codec_13__pyx_unpickle_StructSpec = {"__pyx_unpickle_StructSpec", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_12thriftworker_9protocols_5codec_13__pyx_unpickle_StructSpec, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_12thriftworker_9protocols_5codec_13__pyx_unpickle_StructSpec(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_StructSpec (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_StructSpec", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_StructSpec", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_StructSpec") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_StructSpec", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_StructSpec", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_12thriftworker_9protocols_5codec_12__pyx_unpickle_StructSpec(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12thriftworker_9protocols_5codec_12__pyx_unpickle_StructSpec(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_StructSpec", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xd5acf4f, 0xc55953b, 0x2775343):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xd5acf4f, 0xc55953b, 0x2775343) = (by_id, cls, fields))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__8, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xd5acf4f, 0xc55953b, 0x2775343):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xd5acf4f, 0xc55953b, 0x2775343) = (by_id, cls, fields))" % __pyx_checksum)
+ *     __pyx_result = StructSpec.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0xd5acf4f, 0xc55953b, 0x2775343):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xd5acf4f, 0xc55953b, 0x2775343) = (by_id, cls, fields))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = StructSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0xd5acf4f, 0xc55953b, 0x2775343):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xd5acf4f, 0xc55953b, 0x2775343) = (by_id, cls, fields))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xd5acf4f, 0xc55953b, 0x2775343) = (by_id, cls, fields))" % __pyx_checksum)
+ *     __pyx_result = StructSpec.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_StructSpec__set_state(<StructSpec> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_12thriftworker_9protocols_5codec_StructSpec), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xd5acf4f, 0xc55953b, 0x2775343) = (by_id, cls, fields))" % __pyx_checksum)
+ *     __pyx_result = StructSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_StructSpec__set_state(<StructSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = StructSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_StructSpec__set_state(<StructSpec> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StructSpec__set_state(StructSpec __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_StructSpec__set_state(((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xd5acf4f, 0xc55953b, 0x2775343) = (by_id, cls, fields))" % __pyx_checksum)
+ *     __pyx_result = StructSpec.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_StructSpec__set_state(<StructSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_StructSpec__set_state(<StructSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_StructSpec__set_state(StructSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.by_id = __pyx_state[0]; __pyx_result.cls = __pyx_state[1]; __pyx_result.fields = __pyx_state[2]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_StructSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_StructSpec", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_StructSpec__set_state(<StructSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StructSpec__set_state(StructSpec __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.by_id = __pyx_state[0]; __pyx_result.cls = __pyx_state[1]; __pyx_result.fields = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_12thriftworker_9protocols_5codec___pyx_unpickle_StructSpec__set_state(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_StructSpec__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StructSpec__set_state(StructSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.by_id = __pyx_state[0]; __pyx_result.cls = __pyx_state[1]; __pyx_result.fields = __pyx_state[2]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyDict_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->by_id);
+  __Pyx_DECREF(__pyx_v___pyx_result->by_id);
+  __pyx_v___pyx_result->by_id = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->cls);
+  __Pyx_DECREF(__pyx_v___pyx_result->cls);
+  __pyx_v___pyx_result->cls = __pyx_t_1;
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyList_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->fields);
+  __Pyx_DECREF(__pyx_v___pyx_result->fields);
+  __pyx_v___pyx_result->fields = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_StructSpec__set_state(StructSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.by_id = __pyx_state[0]; __pyx_result.cls = __pyx_state[1]; __pyx_result.fields = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_3 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_4 = ((__pyx_t_3 > 3) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  __pyx_t_2 = __pyx_t_5;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.by_id = __pyx_state[0]; __pyx_result.cls = __pyx_state[1]; __pyx_result.fields = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_update); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_8, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_StructSpec__set_state(StructSpec __pyx_result, tuple __pyx_state):
+ *     __pyx_result.by_id = __pyx_state[0]; __pyx_result.cls = __pyx_state[1]; __pyx_result.fields = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_StructSpec__set_state(<StructSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_StructSpec__set_state(StructSpec __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.by_id = __pyx_state[0]; __pyx_result.cls = __pyx_state[1]; __pyx_result.fields = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("thriftworker.protocols.codec.__pyx_unpickle_StructSpec__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_StructSpec __pyx_vtable_12thriftworker_9protocols_5codec_StructSpec;
+
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_StructSpec(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)o);
+  p->__pyx_vtab = __pyx_vtabptr_12thriftworker_9protocols_5codec_StructSpec;
+  p->cls = Py_None; Py_INCREF(Py_None);
+  p->fields = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->by_id = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_12thriftworker_9protocols_5codec_StructSpec(PyObject *o) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->cls);
+  Py_CLEAR(p->fields);
+  Py_CLEAR(p->by_id);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_12thriftworker_9protocols_5codec_StructSpec(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)o;
+  if (p->cls) {
+    e = (*v)(p->cls, a); if (e) return e;
+  }
+  if (p->fields) {
+    e = (*v)(p->fields, a); if (e) return e;
+  }
+  if (p->by_id) {
+    e = (*v)(p->by_id, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_12thriftworker_9protocols_5codec_StructSpec(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)o;
+  tmp = ((PyObject*)p->cls);
+  p->cls = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->fields);
+  p->fields = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->by_id);
+  p->by_id = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_12thriftworker_9protocols_5codec_StructSpec[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_10StructSpec_1__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_10StructSpec_3__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_12thriftworker_9protocols_5codec_StructSpec = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "thriftworker.protocols.codec.StructSpec", /*tp_name*/
+  sizeof(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_12thriftworker_9protocols_5codec_StructSpec, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "Struct class with its fields.", /*tp_doc*/
+  __pyx_tp_traverse_12thriftworker_9protocols_5codec_StructSpec, /*tp_traverse*/
+  __pyx_tp_clear_12thriftworker_9protocols_5codec_StructSpec, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_12thriftworker_9protocols_5codec_StructSpec, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_12thriftworker_9protocols_5codec_StructSpec, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_TypeSpec(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)o);
+  p->value = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)Py_None); Py_INCREF(Py_None);
+  p->key = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)Py_None); Py_INCREF(Py_None);
+  p->__pyx_struct = ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_12thriftworker_9protocols_5codec_TypeSpec(PyObject *o) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->value);
+  Py_CLEAR(p->key);
+  Py_CLEAR(p->__pyx_struct);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_12thriftworker_9protocols_5codec_TypeSpec(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)o;
+  if (p->value) {
+    e = (*v)(((PyObject *)p->value), a); if (e) return e;
+  }
+  if (p->key) {
+    e = (*v)(((PyObject *)p->key), a); if (e) return e;
+  }
+  if (p->__pyx_struct) {
+    e = (*v)(((PyObject *)p->__pyx_struct), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_12thriftworker_9protocols_5codec_TypeSpec(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)o;
+  tmp = ((PyObject*)p->value);
+  p->value = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->key);
+  p->key = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->__pyx_struct);
+  p->__pyx_struct = ((struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_12thriftworker_9protocols_5codec_TypeSpec[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_8TypeSpec_1__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_8TypeSpec_3__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_12thriftworker_9protocols_5codec_TypeSpec = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "thriftworker.protocols.codec.TypeSpec", /*tp_name*/
+  sizeof(struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_12thriftworker_9protocols_5codec_TypeSpec, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "Type of value with compiled arguments.", /*tp_doc*/
+  __pyx_tp_traverse_12thriftworker_9protocols_5codec_TypeSpec, /*tp_traverse*/
+  __pyx_tp_clear_12thriftworker_9protocols_5codec_TypeSpec, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_12thriftworker_9protocols_5codec_TypeSpec, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_12thriftworker_9protocols_5codec_TypeSpec, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_FieldSpec(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)o);
+  p->name = Py_None; Py_INCREF(Py_None);
+  p->type = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_12thriftworker_9protocols_5codec_FieldSpec(PyObject *o) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->name);
+  Py_CLEAR(p->type);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_12thriftworker_9protocols_5codec_FieldSpec(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)o;
+  if (p->name) {
+    e = (*v)(p->name, a); if (e) return e;
+  }
+  if (p->type) {
+    e = (*v)(((PyObject *)p->type), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_12thriftworker_9protocols_5codec_FieldSpec(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *)o;
+  tmp = ((PyObject*)p->name);
+  p->name = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->type);
+  p->type = ((struct __pyx_obj_12thriftworker_9protocols_5codec_TypeSpec *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_12thriftworker_9protocols_5codec_FieldSpec[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_9FieldSpec_1__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_9FieldSpec_3__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_12thriftworker_9protocols_5codec_FieldSpec = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "thriftworker.protocols.codec.FieldSpec", /*tp_name*/
+  sizeof(struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_12thriftworker_9protocols_5codec_FieldSpec, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "Field of struct.", /*tp_doc*/
+  __pyx_tp_traverse_12thriftworker_9protocols_5codec_FieldSpec, /*tp_traverse*/
+  __pyx_tp_clear_12thriftworker_9protocols_5codec_FieldSpec, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_12thriftworker_9protocols_5codec_FieldSpec, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_12thriftworker_9protocols_5codec_FieldSpec, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_OutputBuffer __pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer;
+
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_OutputBuffer(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *)o);
+  p->__pyx_vtab = __pyx_vtabptr_12thriftworker_9protocols_5codec_OutputBuffer;
+  if (unlikely(__pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_12thriftworker_9protocols_5codec_OutputBuffer(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyMethodDef __pyx_methods_12thriftworker_9protocols_5codec_OutputBuffer[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_5__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_12OutputBuffer_7__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_12thriftworker_9protocols_5codec_OutputBuffer = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "thriftworker.protocols.codec.OutputBuffer", /*tp_name*/
+  sizeof(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_12thriftworker_9protocols_5codec_OutputBuffer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "Growing output buffer.", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_12thriftworker_9protocols_5codec_OutputBuffer, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_12thriftworker_9protocols_5codec_OutputBuffer, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_12thriftworker_9protocols_5codec_InputBuffer __pyx_vtable_12thriftworker_9protocols_5codec_InputBuffer;
+
+static PyObject *__pyx_tp_new_12thriftworker_9protocols_5codec_InputBuffer(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *)o);
+  p->__pyx_vtab = __pyx_vtabptr_12thriftworker_9protocols_5codec_InputBuffer;
+  p->value = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  if (unlikely(__pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_1__cinit__(o, a, k) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_12thriftworker_9protocols_5codec_InputBuffer(PyObject *o) {
+  struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *p = (struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  Py_CLEAR(p->value);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyMethodDef __pyx_methods_12thriftworker_9protocols_5codec_InputBuffer[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_3__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_12thriftworker_9protocols_5codec_11InputBuffer_5__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_12thriftworker_9protocols_5codec_InputBuffer = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "thriftworker.protocols.codec.InputBuffer", /*tp_name*/
+  sizeof(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_12thriftworker_9protocols_5codec_InputBuffer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "Read values from bytes.", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_12thriftworker_9protocols_5codec_InputBuffer, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_12thriftworker_9protocols_5codec_InputBuffer, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_codec(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_codec},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "codec",
+    __pyx_k_Encode_and_decode_Thrift_structs, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_DEPTH_LIMIT, __pyx_k_DEPTH_LIMIT, sizeof(__pyx_k_DEPTH_LIMIT), 0, 0, 1, 1},
+  {&__pyx_n_s_EOFError, __pyx_k_EOFError, sizeof(__pyx_k_EOFError), 0, 0, 1, 1},
+  {&__pyx_n_s_FieldSpec, __pyx_k_FieldSpec, sizeof(__pyx_k_FieldSpec), 0, 0, 1, 1},
+  {&__pyx_n_s_INVALID_DATA, __pyx_k_INVALID_DATA, sizeof(__pyx_k_INVALID_DATA), 0, 0, 1, 1},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2, __pyx_k_Incompatible_checksums_0x_x_vs_0_2, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0_2), 0, 0, 1, 0},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_3, __pyx_k_Incompatible_checksums_0x_x_vs_0_3, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0_3), 0, 0, 1, 0},
+  {&__pyx_n_s_InputBuffer, __pyx_k_InputBuffer, sizeof(__pyx_k_InputBuffer), 0, 0, 1, 1},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s_NEGATIVE_SIZE, __pyx_k_NEGATIVE_SIZE, sizeof(__pyx_k_NEGATIVE_SIZE), 0, 0, 1, 1},
+  {&__pyx_n_s_OutputBuffer, __pyx_k_OutputBuffer, sizeof(__pyx_k_OutputBuffer), 0, 0, 1, 1},
+  {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_StructSpec, __pyx_k_StructSpec, sizeof(__pyx_k_StructSpec), 0, 0, 1, 1},
+  {&__pyx_n_s_TProtocolException, __pyx_k_TProtocolException, sizeof(__pyx_k_TProtocolException), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeSpec, __pyx_k_TypeSpec, sizeof(__pyx_k_TypeSpec), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_decode_binary, __pyx_k_decode_binary, sizeof(__pyx_k_decode_binary), 0, 0, 1, 1},
+  {&__pyx_n_s_decode_compact, __pyx_k_decode_compact, sizeof(__pyx_k_decode_compact), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_encode_binary, __pyx_k_encode_binary, sizeof(__pyx_k_encode_binary), 0, 0, 1, 1},
+  {&__pyx_n_s_encode_compact, __pyx_k_encode_compact, sizeof(__pyx_k_encode_compact), 0, 0, 1, 1},
+  {&__pyx_kp_s_expected_type_0_received_1, __pyx_k_expected_type_0_received_1, sizeof(__pyx_k_expected_type_0_received_1), 0, 0, 1, 0},
+  {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
+  {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_inp, __pyx_k_inp, sizeof(__pyx_k_inp), 0, 0, 1, 1},
+  {&__pyx_n_s_iteritems, __pyx_k_iteritems, sizeof(__pyx_k_iteritems), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_s_negative_size_0, __pyx_k_negative_size_0, sizeof(__pyx_k_negative_size_0), 0, 0, 1, 0},
+  {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
+  {&__pyx_n_s_out, __pyx_k_out, sizeof(__pyx_k_out), 0, 0, 1, 1},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_position, __pyx_k_position, sizeof(__pyx_k_position), 0, 0, 1, 1},
+  {&__pyx_kp_s_position_out_of_range, __pyx_k_position_out_of_range, sizeof(__pyx_k_position_out_of_range), 0, 0, 1, 0},
+  {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_FieldSpec, __pyx_k_pyx_unpickle_FieldSpec, sizeof(__pyx_k_pyx_unpickle_FieldSpec), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_StructSpec, __pyx_k_pyx_unpickle_StructSpec, sizeof(__pyx_k_pyx_unpickle_StructSpec), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_TypeSpec, __pyx_k_pyx_unpickle_TypeSpec, sizeof(__pyx_k_pyx_unpickle_TypeSpec), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_thrift_protocol_TProtocol, __pyx_k_thrift_protocol_TProtocol, sizeof(__pyx_k_thrift_protocol_TProtocol), 0, 0, 1, 1},
+  {&__pyx_n_s_thrift_spec, __pyx_k_thrift_spec, sizeof(__pyx_k_thrift_spec), 0, 0, 1, 1},
+  {&__pyx_n_s_thriftworker_protocols_codec, __pyx_k_thriftworker_protocols_codec, sizeof(__pyx_k_thriftworker_protocols_codec), 0, 0, 1, 1},
+  {&__pyx_kp_s_thriftworker_protocols_codec_pyx, __pyx_k_thriftworker_protocols_codec_pyx, sizeof(__pyx_k_thriftworker_protocols_codec_pyx), 0, 0, 1, 0},
+  {&__pyx_kp_s_too_deep_nesting, __pyx_k_too_deep_nesting, sizeof(__pyx_k_too_deep_nesting), 0, 0, 1, 0},
+  {&__pyx_kp_s_unknown_compact_type_0, __pyx_k_unknown_compact_type_0, sizeof(__pyx_k_unknown_compact_type_0), 0, 0, 1, 0},
+  {&__pyx_kp_s_unknown_type_0, __pyx_k_unknown_type_0, sizeof(__pyx_k_unknown_type_0), 0, 0, 1, 0},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+  {&__pyx_kp_s_varint_is_too_long, __pyx_k_varint_is_too_long, sizeof(__pyx_k_varint_is_too_long), 0, 0, 1, 0},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 212, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 290, __pyx_L1_error)
+  __pyx_builtin_EOFError = __Pyx_GetBuiltinName(__pyx_n_s_EOFError); if (!__pyx_builtin_EOFError) __PYX_ERR(0, 295, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "thriftworker/protocols/codec.pyx":290
+ *         self.length = PyBytes_GET_SIZE(value)
+ *         if position < 0 or position > self.length:
+ *             raise ValueError('position out of range')             # <<<<<<<<<<<<<<
+ *         self.position = position
+ * 
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_position_out_of_range); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_tuple__6 = PyTuple_Pack(3, __pyx_int_265516198, __pyx_int_85229294, __pyx_int_120909578); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__7 = PyTuple_Pack(3, __pyx_int_209476648, __pyx_int_30285844, __pyx_int_63816010); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__8 = PyTuple_Pack(3, __pyx_int_224055119, __pyx_int_206935355, __pyx_int_41374531); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "thriftworker/protocols/codec.pyx":564
+ * 
+ * 
+ * def encode_binary(object obj, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Serialize struct with binary protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ */
+  __pyx_tuple__9 = PyTuple_Pack(3, __pyx_n_s_obj, __pyx_n_s_thrift_spec, __pyx_n_s_out); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_thriftworker_protocols_codec_pyx, __pyx_n_s_encode_binary, 564, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 564, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":571
+ * 
+ * 
+ * def decode_binary(object obj, object thrift_spec, bytes data,             # <<<<<<<<<<<<<<
+ *                   Py_ssize_t position=0):
+ *     """Read struct serialized with binary protocol from given position of
+ */
+  __pyx_tuple__11 = PyTuple_Pack(5, __pyx_n_s_obj, __pyx_n_s_thrift_spec, __pyx_n_s_data, __pyx_n_s_position, __pyx_n_s_inp); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_thriftworker_protocols_codec_pyx, __pyx_n_s_decode_binary, 571, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 571, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":799
+ * 
+ * 
+ * def encode_compact(object obj, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Serialize struct with compact protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ */
+  __pyx_tuple__13 = PyTuple_Pack(3, __pyx_n_s_obj, __pyx_n_s_thrift_spec, __pyx_n_s_out); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 799, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(2, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_thriftworker_protocols_codec_pyx, __pyx_n_s_encode_compact, 799, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 799, __pyx_L1_error)
+
+  /* "thriftworker/protocols/codec.pyx":806
+ * 
+ * 
+ * def decode_compact(object obj, object thrift_spec, bytes data,             # <<<<<<<<<<<<<<
+ *                    Py_ssize_t position=0):
+ *     """Read struct serialized with compact protocol from given position of
+ */
+  __pyx_tuple__15 = PyTuple_Pack(5, __pyx_n_s_obj, __pyx_n_s_thrift_spec, __pyx_n_s_data, __pyx_n_s_position, __pyx_n_s_inp); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 806, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_thriftworker_protocols_codec_pyx, __pyx_n_s_decode_compact, 806, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 806, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_TypeSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__17 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_TypeSpec, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__19 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_FieldSpec, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__21 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_StructSpec, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  __pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
+  __pyx_umethod_PyDict_Type_update.type = (PyObject*)&PyDict_Type;
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_30285844 = PyInt_FromLong(30285844L); if (unlikely(!__pyx_int_30285844)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_41374531 = PyInt_FromLong(41374531L); if (unlikely(!__pyx_int_41374531)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_63816010 = PyInt_FromLong(63816010L); if (unlikely(!__pyx_int_63816010)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_85229294 = PyInt_FromLong(85229294L); if (unlikely(!__pyx_int_85229294)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_120909578 = PyInt_FromLong(120909578L); if (unlikely(!__pyx_int_120909578)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_206935355 = PyInt_FromLong(206935355L); if (unlikely(!__pyx_int_206935355)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_209476648 = PyInt_FromLong(209476648L); if (unlikely(!__pyx_int_209476648)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_224055119 = PyInt_FromLong(224055119L); if (unlikely(!__pyx_int_224055119)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_265516198 = PyInt_FromLong(265516198L); if (unlikely(!__pyx_int_265516198)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __pyx_v_12thriftworker_9protocols_5codec_structs = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_12thriftworker_9protocols_5codec_StructSpec = &__pyx_vtable_12thriftworker_9protocols_5codec_StructSpec;
+  __pyx_vtable_12thriftworker_9protocols_5codec_StructSpec.lookup = (struct __pyx_obj_12thriftworker_9protocols_5codec_FieldSpec *(*)(struct __pyx_obj_12thriftworker_9protocols_5codec_StructSpec *, int))__pyx_f_12thriftworker_9protocols_5codec_10StructSpec_lookup;
+  if (PyType_Ready(&__pyx_type_12thriftworker_9protocols_5codec_StructSpec) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_12thriftworker_9protocols_5codec_StructSpec.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_12thriftworker_9protocols_5codec_StructSpec.tp_dictoffset && __pyx_type_12thriftworker_9protocols_5codec_StructSpec.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_12thriftworker_9protocols_5codec_StructSpec.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_12thriftworker_9protocols_5codec_StructSpec.tp_dict, __pyx_vtabptr_12thriftworker_9protocols_5codec_StructSpec) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_StructSpec, (PyObject *)&__pyx_type_12thriftworker_9protocols_5codec_StructSpec) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_12thriftworker_9protocols_5codec_StructSpec) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_ptype_12thriftworker_9protocols_5codec_StructSpec = &__pyx_type_12thriftworker_9protocols_5codec_StructSpec;
+  if (PyType_Ready(&__pyx_type_12thriftworker_9protocols_5codec_TypeSpec) < 0) __PYX_ERR(0, 105, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_12thriftworker_9protocols_5codec_TypeSpec.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_12thriftworker_9protocols_5codec_TypeSpec.tp_dictoffset && __pyx_type_12thriftworker_9protocols_5codec_TypeSpec.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_12thriftworker_9protocols_5codec_TypeSpec.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_TypeSpec, (PyObject *)&__pyx_type_12thriftworker_9protocols_5codec_TypeSpec) < 0) __PYX_ERR(0, 105, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_12thriftworker_9protocols_5codec_TypeSpec) < 0) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_ptype_12thriftworker_9protocols_5codec_TypeSpec = &__pyx_type_12thriftworker_9protocols_5codec_TypeSpec;
+  if (PyType_Ready(&__pyx_type_12thriftworker_9protocols_5codec_FieldSpec) < 0) __PYX_ERR(0, 120, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_12thriftworker_9protocols_5codec_FieldSpec.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_12thriftworker_9protocols_5codec_FieldSpec.tp_dictoffset && __pyx_type_12thriftworker_9protocols_5codec_FieldSpec.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_12thriftworker_9protocols_5codec_FieldSpec.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_FieldSpec, (PyObject *)&__pyx_type_12thriftworker_9protocols_5codec_FieldSpec) < 0) __PYX_ERR(0, 120, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_12thriftworker_9protocols_5codec_FieldSpec) < 0) __PYX_ERR(0, 120, __pyx_L1_error)
+  __pyx_ptype_12thriftworker_9protocols_5codec_FieldSpec = &__pyx_type_12thriftworker_9protocols_5codec_FieldSpec;
+  __pyx_vtabptr_12thriftworker_9protocols_5codec_OutputBuffer = &__pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer;
+  __pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer.reserve = (int (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, Py_ssize_t))__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_reserve;
+  __pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer.write_byte = (int (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint8_t))__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_byte;
+  __pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer.write_raw = (int (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, char const *, Py_ssize_t))__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_raw;
+  __pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer.write_big = (int (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t, int))__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_big;
+  __pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer.write_little = (int (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t, int))__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_little;
+  __pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer.write_varint = (int (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *, uint64_t))__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_write_varint;
+  __pyx_vtable_12thriftworker_9protocols_5codec_OutputBuffer.getvalue = (PyObject *(*)(struct __pyx_obj_12thriftworker_9protocols_5codec_OutputBuffer *))__pyx_f_12thriftworker_9protocols_5codec_12OutputBuffer_getvalue;
+  if (PyType_Ready(&__pyx_type_12thriftworker_9protocols_5codec_OutputBuffer) < 0) __PYX_ERR(0, 200, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_12thriftworker_9protocols_5codec_OutputBuffer.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_12thriftworker_9protocols_5codec_OutputBuffer.tp_dictoffset && __pyx_type_12thriftworker_9protocols_5codec_OutputBuffer.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_12thriftworker_9protocols_5codec_OutputBuffer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_12thriftworker_9protocols_5codec_OutputBuffer.tp_dict, __pyx_vtabptr_12thriftworker_9protocols_5codec_OutputBuffer) < 0) __PYX_ERR(0, 200, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_OutputBuffer, (PyObject *)&__pyx_type_12thriftworker_9protocols_5codec_OutputBuffer) < 0) __PYX_ERR(0, 200, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_12thriftworker_9protocols_5codec_OutputBuffer) < 0) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_ptype_12thriftworker_9protocols_5codec_OutputBuffer = &__pyx_type_12thriftworker_9protocols_5codec_OutputBuffer;
+  __pyx_vtabptr_12thriftworker_9protocols_5codec_InputBuffer = &__pyx_vtable_12thriftworker_9protocols_5codec_InputBuffer;
+  __pyx_vtable_12thriftworker_9protocols_5codec_InputBuffer.ensure = (int (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, Py_ssize_t))__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_ensure;
+  __pyx_vtable_12thriftworker_9protocols_5codec_InputBuffer.read_byte = (int (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *))__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_byte;
+  __pyx_vtable_12thriftworker_9protocols_5codec_InputBuffer.read_big = (uint64_t (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, int))__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_big;
+  __pyx_vtable_12thriftworker_9protocols_5codec_InputBuffer.read_little = (uint64_t (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, int))__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_little;
+  __pyx_vtable_12thriftworker_9protocols_5codec_InputBuffer.read_varint = (uint64_t (*)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *))__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_varint;
+  __pyx_vtable_12thriftworker_9protocols_5codec_InputBuffer.read_raw = (PyObject *(*)(struct __pyx_obj_12thriftworker_9protocols_5codec_InputBuffer *, Py_ssize_t))__pyx_f_12thriftworker_9protocols_5codec_11InputBuffer_read_raw;
+  if (PyType_Ready(&__pyx_type_12thriftworker_9protocols_5codec_InputBuffer) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_12thriftworker_9protocols_5codec_InputBuffer.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_12thriftworker_9protocols_5codec_InputBuffer.tp_dictoffset && __pyx_type_12thriftworker_9protocols_5codec_InputBuffer.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_12thriftworker_9protocols_5codec_InputBuffer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_12thriftworker_9protocols_5codec_InputBuffer.tp_dict, __pyx_vtabptr_12thriftworker_9protocols_5codec_InputBuffer) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_InputBuffer, (PyObject *)&__pyx_type_12thriftworker_9protocols_5codec_InputBuffer) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_12thriftworker_9protocols_5codec_InputBuffer) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
+  __pyx_ptype_12thriftworker_9protocols_5codec_InputBuffer = &__pyx_type_12thriftworker_9protocols_5codec_InputBuffer;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_36(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_36(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_36(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_36); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initcodec(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initcodec(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_codec(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_codec(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_codec(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'codec' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_codec(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("codec", __pyx_methods, __pyx_k_Encode_and_decode_Thrift_structs, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_thriftworker__protocols__codec) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "thriftworker.protocols.codec")) {
+      if (unlikely(PyDict_SetItemString(modules, "thriftworker.protocols.codec", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "thriftworker/protocols/codec.pyx":9
+ *     PyBytes_FromStringAndSize
+ * 
+ * from thrift.protocol.TProtocol import TProtocolException             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_TProtocolException);
+  __Pyx_GIVEREF(__pyx_n_s_TProtocolException);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_TProtocolException);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_thrift_protocol_TProtocol, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_TProtocolException); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_TProtocolException, __pyx_t_1) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":144
+ * 
+ * # Compiled specifications of known structs.
+ * cdef dict structs = {}             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 144, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_XGOTREF(__pyx_v_12thriftworker_9protocols_5codec_structs);
+  __Pyx_DECREF_SET(__pyx_v_12thriftworker_9protocols_5codec_structs, ((PyObject*)__pyx_t_2));
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":564
+ * 
+ * 
+ * def encode_binary(object obj, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Serialize struct with binary protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_12thriftworker_9protocols_5codec_1encode_binary, NULL, __pyx_n_s_thriftworker_protocols_codec); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_encode_binary, __pyx_t_2) < 0) __PYX_ERR(0, 564, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":571
+ * 
+ * 
+ * def decode_binary(object obj, object thrift_spec, bytes data,             # <<<<<<<<<<<<<<
+ *                   Py_ssize_t position=0):
+ *     """Read struct serialized with binary protocol from given position of
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_12thriftworker_9protocols_5codec_3decode_binary, NULL, __pyx_n_s_thriftworker_protocols_codec); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_decode_binary, __pyx_t_2) < 0) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":799
+ * 
+ * 
+ * def encode_compact(object obj, object thrift_spec):             # <<<<<<<<<<<<<<
+ *     """Serialize struct with compact protocol."""
+ *     cdef OutputBuffer out = OutputBuffer()
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_12thriftworker_9protocols_5codec_5encode_compact, NULL, __pyx_n_s_thriftworker_protocols_codec); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 799, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_encode_compact, __pyx_t_2) < 0) __PYX_ERR(0, 799, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":806
+ * 
+ * 
+ * def decode_compact(object obj, object thrift_spec, bytes data,             # <<<<<<<<<<<<<<
+ *                    Py_ssize_t position=0):
+ *     """Read struct serialized with compact protocol from given position of
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_12thriftworker_9protocols_5codec_7decode_compact, NULL, __pyx_n_s_thriftworker_protocols_codec); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 806, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_decode_compact, __pyx_t_2) < 0) __PYX_ERR(0, 806, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_TypeSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_12thriftworker_9protocols_5codec_9__pyx_unpickle_TypeSpec, NULL, __pyx_n_s_thriftworker_protocols_codec); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_TypeSpec, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_TypeSpec__set_state(<TypeSpec> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_TypeSpec__set_state(TypeSpec __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.ctype = __pyx_state[0]; __pyx_result.key = __pyx_state[1]; __pyx_result.struct = __pyx_state[2]; __pyx_result.ttype = __pyx_state[3]; __pyx_result.value = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_12thriftworker_9protocols_5codec_11__pyx_unpickle_FieldSpec, NULL, __pyx_n_s_thriftworker_protocols_codec); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_FieldSpec, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_StructSpec(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_12thriftworker_9protocols_5codec_13__pyx_unpickle_StructSpec, NULL, __pyx_n_s_thriftworker_protocols_codec); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_StructSpec, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "thriftworker/protocols/codec.pyx":1
+ * """Encode and decode Thrift structs with compiled ``thrift_spec`` tables."""             # <<<<<<<<<<<<<<
+ * from libc.stdint cimport int8_t, int16_t, int32_t, int64_t, uint8_t, \
+ *     uint64_t
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init thriftworker.protocols.codec", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init thriftworker.protocols.codec");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* UnpackUnboundCMethod */
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    target->method = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION >= 3
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
+    #endif
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
+    }
+#endif
+    return 0;
+}
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    if (likely(cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return (*(cfunc->func))(self, arg);
+        } else if (PY_VERSION_HEX >= 0x030600B1 && flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+                return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, &arg, 1);
+            #else
+                return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+            #endif
+        } else if (PY_VERSION_HEX >= 0x030700A0 && flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+        }
+    }
+    return __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 1, arg);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(2, self, arg);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* CallUnboundCMethod2 */
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2) {
+    if (likely(cfunc->func)) {
+        PyObject *args[2] = {arg1, arg2};
+        if (cfunc->flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+            return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, args, 2);
+            #else
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+            #endif
+        }
+        #if PY_VERSION_HEX >= 0x030700A0
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+        #endif
+    }
+    return __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 0, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 1, arg2);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(3);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 1, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 2, arg2);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(3, self, arg1, arg2);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* dict_getitem_default */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
+    }
+    Py_INCREF(value);
+    if ((1));
+#else
+    if (PyString_CheckExact(key) || PyUnicode_CheckExact(key) || PyInt_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
+        }
+        Py_INCREF(value);
+    }
+#endif
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    }
+    return value;
+}
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kwdict,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kwdict, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    while (PyDict_Next(kwdict, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if ((!kw_allowed) && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* RaiseNoneIterError */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError */
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+/* UnpackTuple2 */
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_COMPILING_IN_PYPY
+    value1 = PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
+    }
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_COMPILING_IN_PYPY
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
+}
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = Py_TYPE(iter)->tp_iternext;
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+}
+
+/* dict_iter */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
+#elif PY_MAJOR_VERSION >= 3
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
+#endif
+    }
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
+#endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
+}
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (source_is_dict) {
+        PyObject *key, *value;
+        if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+            PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+            return -1;
+        }
+        if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+            return 0;
+        }
+        if (pitem) {
+            PyObject* tuple = PyTuple_New(2);
+            if (unlikely(!tuple)) {
+                return -1;
+            }
+            Py_INCREF(key);
+            Py_INCREF(value);
+            PyTuple_SET_ITEM(tuple, 0, key);
+            PyTuple_SET_ITEM(tuple, 1, value);
+            *pitem = tuple;
+        } else {
+            if (pkey) {
+                Py_INCREF(key);
+                *pkey = key;
+            }
+            if (pvalue) {
+                Py_INCREF(value);
+                *pvalue = value;
+            }
+        }
+        return 1;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyTuple_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyList_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyList_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
+        }
+    }
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
+    }
+    return 1;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_36
+#define __PYX_HAVE_RT_ImportType_0_29_36
+static PyTypeObject *__Pyx_ImportType_0_29_36(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_36 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_36 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_36 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int64_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int64_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int64_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int8_t __Pyx_PyInt_As_int8_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int8_t neg_one = (int8_t) -1, const_zero = (int8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int8_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int8_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int8_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int8_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int8_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int8_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) >= 2 * PyLong_SHIFT) {
+                            return (int8_t) (((((int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int8_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) >= 3 * PyLong_SHIFT) {
+                            return (int8_t) (((((((int8_t)digits[2]) << PyLong_SHIFT) | (int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int8_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) >= 4 * PyLong_SHIFT) {
+                            return (int8_t) (((((((((int8_t)digits[3]) << PyLong_SHIFT) | (int8_t)digits[2]) << PyLong_SHIFT) | (int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int8_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int8_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int8_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int8_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int8_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int8_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int8_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int8_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int8_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int8_t) (((int8_t)-1)*(((((int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int8_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int8_t) ((((((int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int8_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int8_t) (((int8_t)-1)*(((((((int8_t)digits[2]) << PyLong_SHIFT) | (int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int8_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int8_t) ((((((((int8_t)digits[2]) << PyLong_SHIFT) | (int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int8_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int8_t) (((int8_t)-1)*(((((((((int8_t)digits[3]) << PyLong_SHIFT) | (int8_t)digits[2]) << PyLong_SHIFT) | (int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int8_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int8_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int8_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int8_t) ((((((((((int8_t)digits[3]) << PyLong_SHIFT) | (int8_t)digits[2]) << PyLong_SHIFT) | (int8_t)digits[1]) << PyLong_SHIFT) | (int8_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int8_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int8_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int8_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int8_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int8_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int8_t) -1;
+        }
+    } else {
+        int8_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int8_t) -1;
+        val = __Pyx_PyInt_As_int8_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int8_t");
+    return (int8_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int8_t");
+    return (int8_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int16_t __Pyx_PyInt_As_int16_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int16_t neg_one = (int16_t) -1, const_zero = (int16_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int16_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int16_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int16_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int16_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int16_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int16_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) >= 2 * PyLong_SHIFT) {
+                            return (int16_t) (((((int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int16_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) >= 3 * PyLong_SHIFT) {
+                            return (int16_t) (((((((int16_t)digits[2]) << PyLong_SHIFT) | (int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int16_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) >= 4 * PyLong_SHIFT) {
+                            return (int16_t) (((((((((int16_t)digits[3]) << PyLong_SHIFT) | (int16_t)digits[2]) << PyLong_SHIFT) | (int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int16_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int16_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int16_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int16_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int16_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int16_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int16_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int16_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int16_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int16_t) (((int16_t)-1)*(((((int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int16_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int16_t) ((((((int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int16_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int16_t) (((int16_t)-1)*(((((((int16_t)digits[2]) << PyLong_SHIFT) | (int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int16_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int16_t) ((((((((int16_t)digits[2]) << PyLong_SHIFT) | (int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int16_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int16_t) (((int16_t)-1)*(((((((((int16_t)digits[3]) << PyLong_SHIFT) | (int16_t)digits[2]) << PyLong_SHIFT) | (int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int16_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int16_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int16_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int16_t) ((((((((((int16_t)digits[3]) << PyLong_SHIFT) | (int16_t)digits[2]) << PyLong_SHIFT) | (int16_t)digits[1]) << PyLong_SHIFT) | (int16_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int16_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int16_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int16_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int16_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int16_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int16_t) -1;
+        }
+    } else {
+        int16_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int16_t) -1;
+        val = __Pyx_PyInt_As_int16_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int16_t");
+    return (int16_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int16_t");
+    return (int16_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int32_t __Pyx_PyInt_As_int32_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int32_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int32_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int32_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int32_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int32_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int32_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 2 * PyLong_SHIFT) {
+                            return (int32_t) (((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int32_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 3 * PyLong_SHIFT) {
+                            return (int32_t) (((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int32_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 4 * PyLong_SHIFT) {
+                            return (int32_t) (((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int32_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int32_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int32_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int32_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int32_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int32_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int32_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int32_t) ((((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int32_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int32_t) ((((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int32_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int32_t) ((((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int32_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int32_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int32_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int32_t) -1;
+        }
+    } else {
+        int32_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int32_t) -1;
+        val = __Pyx_PyInt_As_int32_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int32_t");
+    return (int32_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int32_t");
+    return (int32_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int64_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int64_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 2 * PyLong_SHIFT) {
+                            return (int64_t) (((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 3 * PyLong_SHIFT) {
+                            return (int64_t) (((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 4 * PyLong_SHIFT) {
+                            return (int64_t) (((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int64_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int64_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int64_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) ((((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int64_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int64_t) -1;
+        }
+    } else {
+        int64_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int64_t) -1;
+        val = __Pyx_PyInt_As_int64_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int64_t");
+    return (int64_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int64_t");
+    return (int64_t) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int8_t(int8_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int8_t neg_one = (int8_t) -1, const_zero = (int8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int8_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int8_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int8_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int8_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int8_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int8_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int16_t(int16_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int16_t neg_one = (int16_t) -1, const_zero = (int16_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int16_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int16_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int16_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int16_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int16_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int16_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int32_t(int32_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int32_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int32_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int32_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int32_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int32_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
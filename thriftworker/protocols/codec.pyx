@@ -0,0 +1,814 @@
+"""Encode and decode Thrift structs with compiled ``thrift_spec`` tables."""
+from libc.stdint cimport int8_t, int16_t, int32_t, int64_t, uint8_t, \
+    uint64_t
+from libc.string cimport memcpy
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE, \
+    PyBytes_FromStringAndSize
+
+from thrift.protocol.TProtocol import TProtocolException
+
+
+cdef enum:
+    T_STOP = 0
+    T_BOOL = 2
+    T_BYTE = 3
+    T_DOUBLE = 4
+    T_I16 = 6
+    T_I32 = 8
+    T_I64 = 10
+    T_STRING = 11
+    T_STRUCT = 12
+    T_MAP = 13
+    T_SET = 14
+    T_LIST = 15
+
+    C_STOP = 0
+    C_TRUE = 1
+    C_FALSE = 2
+    C_BYTE = 3
+    C_I16 = 4
+    C_I32 = 5
+    C_I64 = 6
+    C_DOUBLE = 7
+    C_BINARY = 8
+    C_LIST = 9
+    C_SET = 10
+    C_MAP = 11
+    C_STRUCT = 12
+
+    # Limit nesting of skipped values.
+    MAX_DEPTH = 64
+
+
+cdef inline int to_ctype(int ttype) except -1:
+    if ttype == T_BOOL:
+        return C_TRUE
+    elif ttype == T_BYTE:
+        return C_BYTE
+    elif ttype == T_I16:
+        return C_I16
+    elif ttype == T_I32:
+        return C_I32
+    elif ttype == T_I64:
+        return C_I64
+    elif ttype == T_DOUBLE:
+        return C_DOUBLE
+    elif ttype == T_STRING:
+        return C_BINARY
+    elif ttype == T_STRUCT:
+        return C_STRUCT
+    elif ttype == T_MAP:
+        return C_MAP
+    elif ttype == T_SET:
+        return C_SET
+    elif ttype == T_LIST:
+        return C_LIST
+    raise TProtocolException(TProtocolException.INVALID_DATA,
+                             'unknown type {0}'.format(ttype))
+
+
+cdef inline int to_ttype(int ctype) except -1:
+    if ctype == C_TRUE or ctype == C_FALSE:
+        return T_BOOL
+    elif ctype == C_BYTE:
+        return T_BYTE
+    elif ctype == C_I16:
+        return T_I16
+    elif ctype == C_I32:
+        return T_I32
+    elif ctype == C_I64:
+        return T_I64
+    elif ctype == C_DOUBLE:
+        return T_DOUBLE
+    elif ctype == C_BINARY:
+        return T_STRING
+    elif ctype == C_LIST:
+        return T_LIST
+    elif ctype == C_SET:
+        return T_SET
+    elif ctype == C_MAP:
+        return T_MAP
+    elif ctype == C_STRUCT:
+        return T_STRUCT
+    raise TProtocolException(TProtocolException.INVALID_DATA,
+                             'unknown compact type {0}'.format(ctype))
+
+
+#-----------------------------------------------------------------------------
+# Compiled specification.
+#-----------------------------------------------------------------------------
+
+cdef class StructSpec
+
+
+cdef class TypeSpec:
+    """Type of value with compiled arguments."""
+
+    cdef int ttype
+    cdef int ctype
+
+    # Type of list and set elements or map values.
+    cdef TypeSpec value
+
+    # Type of map keys.
+    cdef TypeSpec key
+
+    cdef StructSpec struct
+
+
+cdef class FieldSpec:
+    """Field of struct."""
+
+    cdef int fid
+    cdef object name
+    cdef TypeSpec type
+
+
+cdef class StructSpec:
+    """Struct class with its fields."""
+
+    cdef object cls
+
+    # Fields in order of specification.
+    cdef list fields
+
+    # Fields by their identifiers.
+    cdef dict by_id
+
+    cdef inline FieldSpec lookup(self, int fid):
+        return self.by_id.get(fid)
+
+
+# Compiled specifications of known structs.
+cdef dict structs = {}
+
+
+cdef TypeSpec compile_type(int ttype, object args, dict pending):
+    cdef TypeSpec spec = TypeSpec()
+    spec.ttype = ttype
+    spec.ctype = to_ctype(ttype)
+    if ttype == T_STRUCT:
+        spec.struct = compile_struct(args[0], args[1], pending)
+    elif ttype == T_LIST or ttype == T_SET:
+        spec.value = compile_type(args[0], args[1], pending)
+    elif ttype == T_MAP:
+        spec.key = compile_type(args[0], args[1], pending)
+        spec.value = compile_type(args[2], args[3], pending)
+    return spec
+
+
+cdef StructSpec compile_struct(object cls, object thrift_spec, dict pending):
+    cdef StructSpec spec = structs.get(cls) or pending.get(cls)
+    cdef FieldSpec field
+    if spec is not None:
+        return spec
+    spec = pending[cls] = StructSpec()
+    spec.cls = cls
+    spec.fields = []
+    spec.by_id = {}
+    for entry in thrift_spec or ():
+        if entry is None:
+            continue
+        field = FieldSpec()
+        field.fid = entry[0]
+        field.name = entry[2]
+        field.type = compile_type(entry[1], entry[3], pending)
+        spec.fields.append(field)
+        spec.by_id[field.fid] = field
+    return spec
+
+
+cdef StructSpec get_struct(object cls, object thrift_spec):
+    """Return compiled specification of given struct. Compiled structs are
+    published only when all nested ones are ready.
+
+    """
+    cdef StructSpec spec = structs.get(cls)
+    cdef dict pending
+    if spec is None:
+        pending = {}
+        spec = compile_struct(cls, thrift_spec, pending)
+        structs.update(pending)
+    return spec
+
+
+#-----------------------------------------------------------------------------
+# Output and input buffers.
+#-----------------------------------------------------------------------------
+
+cdef class OutputBuffer:
+    """Growing output buffer."""
+
+    cdef char *data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+
+    def __cinit__(self):
+        self.size = 0
+        self.capacity = 256
+        self.data = <char *>PyMem_Malloc(self.capacity)
+        if self.data is NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        PyMem_Free(self.data)
+
+    cdef int reserve(self, Py_ssize_t length) except -1:
+        cdef Py_ssize_t capacity = self.capacity
+        cdef char *data
+        if self.size + length <= capacity:
+            return 0
+        while self.size + length > capacity:
+            capacity *= 2
+        data = <char *>PyMem_Realloc(self.data, capacity)
+        if data is NULL:
+            raise MemoryError()
+        self.data = data
+        self.capacity = capacity
+        return 0
+
+    cdef inline int write_byte(self, uint8_t value) except -1:
+        self.reserve(1)
+        self.data[self.size] = <char>value
+        self.size += 1
+        return 0
+
+    cdef inline int write_raw(self, const char *value,
+                              Py_ssize_t length) except -1:
+        self.reserve(length)
+        memcpy(self.data + self.size, value, length)
+        self.size += length
+        return 0
+
+    cdef inline int write_big(self, uint64_t value, int length) except -1:
+        """Write big-endian integer of given length."""
+        cdef int i
+        self.reserve(length)
+        for i in range(length):
+            self.data[self.size + i] = \
+                <char>((value >> (8 * (length - i - 1))) & 0xff)
+        self.size += length
+        return 0
+
+    cdef inline int write_little(self, uint64_t value, int length) except -1:
+        """Write little-endian integer of given length."""
+        cdef int i
+        self.reserve(length)
+        for i in range(length):
+            self.data[self.size + i] = <char>((value >> (8 * i)) & 0xff)
+        self.size += length
+        return 0
+
+    cdef inline int write_varint(self, uint64_t value) except -1:
+        self.reserve(10)
+        while value > 0x7f:
+            self.data[self.size] = <char>((value & 0x7f) | 0x80)
+            self.size += 1
+            value >>= 7
+        self.data[self.size] = <char>value
+        self.size += 1
+        return 0
+
+    cdef inline bytes getvalue(self):
+        return PyBytes_FromStringAndSize(self.data, self.size)
+
+
+cdef class InputBuffer:
+    """Read values from bytes."""
+
+    cdef bytes value
+    cdef const unsigned char *data
+    cdef Py_ssize_t position
+    cdef Py_ssize_t length
+
+    def __cinit__(self, bytes value, Py_ssize_t position):
+        self.value = value
+        self.data = <const unsigned char *>PyBytes_AS_STRING(value)
+        self.length = PyBytes_GET_SIZE(value)
+        if position < 0 or position > self.length:
+            raise ValueError('position out of range')
+        self.position = position
+
+    cdef inline int ensure(self, Py_ssize_t length) except -1:
+        if length < 0 or self.length - self.position < length:
+            raise EOFError()
+        return 0
+
+    cdef inline int read_byte(self) except -1:
+        self.ensure(1)
+        self.position += 1
+        return self.data[self.position - 1]
+
+    cdef inline uint64_t read_big(self, int length) except? 0:
+        """Read big-endian integer of given length."""
+        cdef uint64_t value = 0
+        cdef int i
+        self.ensure(length)
+        for i in range(length):
+            value = (value << 8) | self.data[self.position + i]
+        self.position += length
+        return value
+
+    cdef inline uint64_t read_little(self, int length) except? 0:
+        """Read little-endian integer of given length."""
+        cdef uint64_t value = 0
+        cdef int i
+        self.ensure(length)
+        for i in range(length):
+            value |= <uint64_t>self.data[self.position + i] << (8 * i)
+        self.position += length
+        return value
+
+    cdef inline uint64_t read_varint(self) except? 0:
+        cdef uint64_t value = 0
+        cdef int shift = 0
+        cdef unsigned char byte
+        while shift < 64:
+            self.ensure(1)
+            byte = self.data[self.position]
+            self.position += 1
+            value |= <uint64_t>(byte & 0x7f) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+        raise TProtocolException(TProtocolException.INVALID_DATA,
+                                 'varint is too long')
+
+    cdef inline bytes read_raw(self, Py_ssize_t length):
+        self.ensure(length)
+        self.position += length
+        return PyBytes_FromStringAndSize(
+            <const char *>self.data + self.position - length, length)
+
+
+cdef inline uint64_t zigzag(int64_t value):
+    return (<uint64_t>value << 1) ^ <uint64_t>(value >> 63)
+
+
+cdef inline int64_t unzigzag(uint64_t value):
+    return <int64_t>(value >> 1) ^ -<int64_t>(value & 1)
+
+
+cdef inline uint64_t double_bits(double value):
+    cdef uint64_t bits
+    memcpy(&bits, &value, sizeof(bits))
+    return bits
+
+
+cdef inline double bits_double(uint64_t bits):
+    cdef double value
+    memcpy(&value, &bits, sizeof(value))
+    return value
+
+
+cdef inline bytes to_bytes(object value):
+    if isinstance(value, unicode):
+        return (<unicode>value).encode('utf-8')
+    return value
+
+
+cdef inline int check_type(int expected, int received) except -1:
+    if expected != received:
+        raise TProtocolException(
+            TProtocolException.INVALID_DATA,
+            'expected type {0}, received {1}'.format(expected, received))
+    return 0
+
+
+cdef inline int check_size(int64_t size) except -1:
+    if size < 0:
+        raise TProtocolException(TProtocolException.NEGATIVE_SIZE,
+                                 'negative size {0}'.format(size))
+    return 0
+
+
+cdef inline int check_depth(int depth) except -1:
+    if depth > MAX_DEPTH:
+        raise TProtocolException(TProtocolException.DEPTH_LIMIT,
+                                 'too deep nesting')
+    return 0
+
+
+#-----------------------------------------------------------------------------
+# Binary protocol.
+#-----------------------------------------------------------------------------
+
+cdef int write_binary_value(OutputBuffer out, TypeSpec spec,
+                            object value) except -1:
+    cdef int ttype = spec.ttype
+    cdef bytes data
+    if ttype == T_BOOL:
+        out.write_byte(1 if value else 0)
+    elif ttype == T_BYTE:
+        out.write_byte(<uint8_t><int8_t>value)
+    elif ttype == T_I16:
+        out.write_big(<uint64_t><int16_t>value, 2)
+    elif ttype == T_I32:
+        out.write_big(<uint64_t><int32_t>value, 4)
+    elif ttype == T_I64:
+        out.write_big(<uint64_t><int64_t>value, 8)
+    elif ttype == T_DOUBLE:
+        out.write_big(double_bits(value), 8)
+    elif ttype == T_STRING:
+        data = to_bytes(value)
+        out.write_big(<uint64_t>PyBytes_GET_SIZE(data), 4)
+        out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+    elif ttype == T_STRUCT:
+        write_binary_struct(out, spec.struct, value)
+    elif ttype == T_LIST or ttype == T_SET:
+        out.write_byte(spec.value.ttype)
+        out.write_big(<uint64_t><int32_t>len(value), 4)
+        for item in value:
+            write_binary_value(out, spec.value, item)
+    elif ttype == T_MAP:
+        out.write_byte(spec.key.ttype)
+        out.write_byte(spec.value.ttype)
+        out.write_big(<uint64_t><int32_t>len(value), 4)
+        for key, item in value.iteritems():
+            write_binary_value(out, spec.key, key)
+            write_binary_value(out, spec.value, item)
+    return 0
+
+
+cdef int write_binary_struct(OutputBuffer out, StructSpec spec,
+                             object obj) except -1:
+    cdef FieldSpec field
+    for field in spec.fields:
+        value = getattr(obj, field.name)
+        if value is None:
+            continue
+        out.write_byte(field.type.ttype)
+        out.write_big(<uint64_t><int16_t>field.fid, 2)
+        write_binary_value(out, field.type, value)
+    out.write_byte(T_STOP)
+    return 0
+
+
+cdef object read_binary_value(InputBuffer inp, TypeSpec spec):
+    cdef int ttype = spec.ttype
+    cdef int etype, ktype, vtype
+    cdef int32_t size
+    cdef int32_t i
+    if ttype == T_BOOL:
+        return inp.read_byte() != 0
+    elif ttype == T_BYTE:
+        return <int8_t>inp.read_byte()
+    elif ttype == T_I16:
+        return <int16_t>inp.read_big(2)
+    elif ttype == T_I32:
+        return <int32_t>inp.read_big(4)
+    elif ttype == T_I64:
+        return <int64_t>inp.read_big(8)
+    elif ttype == T_DOUBLE:
+        return bits_double(inp.read_big(8))
+    elif ttype == T_STRING:
+        size = <int32_t>inp.read_big(4)
+        check_size(size)
+        return inp.read_raw(size)
+    elif ttype == T_STRUCT:
+        return read_binary_struct(inp, spec.struct, None)
+    elif ttype == T_LIST or ttype == T_SET:
+        etype = inp.read_byte()
+        size = <int32_t>inp.read_big(4)
+        check_size(size)
+        if size:
+            check_type(spec.value.ttype, etype)
+        if ttype == T_LIST:
+            return [read_binary_value(inp, spec.value) for i in range(size)]
+        return set([read_binary_value(inp, spec.value)
+                    for i in range(size)])
+    elif ttype == T_MAP:
+        ktype = inp.read_byte()
+        vtype = inp.read_byte()
+        size = <int32_t>inp.read_big(4)
+        check_size(size)
+        if size:
+            check_type(spec.key.ttype, ktype)
+            check_type(spec.value.ttype, vtype)
+        result = {}
+        for i in range(size):
+            key = read_binary_value(inp, spec.key)
+            result[key] = read_binary_value(inp, spec.value)
+        return result
+    raise TProtocolException(TProtocolException.INVALID_DATA,
+                             'unknown type {0}'.format(ttype))
+
+
+cdef int skip_binary(InputBuffer inp, int ttype, int depth) except -1:
+    cdef int32_t size
+    cdef int32_t i
+    cdef int etype, ktype, vtype
+    check_depth(depth)
+    if ttype == T_BOOL or ttype == T_BYTE:
+        inp.ensure(1)
+        inp.position += 1
+    elif ttype == T_I16:
+        inp.ensure(2)
+        inp.position += 2
+    elif ttype == T_I32:
+        inp.ensure(4)
+        inp.position += 4
+    elif ttype == T_I64 or ttype == T_DOUBLE:
+        inp.ensure(8)
+        inp.position += 8
+    elif ttype == T_STRING:
+        size = <int32_t>inp.read_big(4)
+        check_size(size)
+        inp.ensure(size)
+        inp.position += size
+    elif ttype == T_STRUCT:
+        while True:
+            etype = inp.read_byte()
+            if etype == T_STOP:
+                break
+            inp.read_big(2)
+            skip_binary(inp, etype, depth + 1)
+    elif ttype == T_LIST or ttype == T_SET:
+        etype = inp.read_byte()
+        size = <int32_t>inp.read_big(4)
+        check_size(size)
+        for i in range(size):
+            skip_binary(inp, etype, depth + 1)
+    elif ttype == T_MAP:
+        ktype = inp.read_byte()
+        vtype = inp.read_byte()
+        size = <int32_t>inp.read_big(4)
+        check_size(size)
+        for i in range(size):
+            skip_binary(inp, ktype, depth + 1)
+            skip_binary(inp, vtype, depth + 1)
+    else:
+        raise TProtocolException(TProtocolException.INVALID_DATA,
+                                 'unknown type {0}'.format(ttype))
+    return 0
+
+
+cdef object read_binary_struct(InputBuffer inp, StructSpec spec, object obj):
+    cdef FieldSpec field
+    cdef int ttype
+    if obj is None:
+        obj = spec.cls()
+    while True:
+        ttype = inp.read_byte()
+        if ttype == T_STOP:
+            break
+        field = spec.lookup(<int16_t>inp.read_big(2))
+        if field is None or field.type.ttype != ttype:
+            skip_binary(inp, ttype, 0)
+            continue
+        setattr(obj, field.name, read_binary_value(inp, field.type))
+    return obj
+
+
+def encode_binary(object obj, object thrift_spec):
+    """Serialize struct with binary protocol."""
+    cdef OutputBuffer out = OutputBuffer()
+    write_binary_struct(out, get_struct(obj.__class__, thrift_spec), obj)
+    return out.getvalue()
+
+
+def decode_binary(object obj, object thrift_spec, bytes data,
+                  Py_ssize_t position=0):
+    """Read struct serialized with binary protocol from given position of
+    data. Return position after struct.
+
+    """
+    cdef InputBuffer inp = InputBuffer(data, position)
+    read_binary_struct(inp, get_struct(obj.__class__, thrift_spec), obj)
+    return inp.position
+
+
+#-----------------------------------------------------------------------------
+# Compact protocol.
+#-----------------------------------------------------------------------------
+
+cdef inline int write_compact_size(OutputBuffer out, int ctype,
+                                   Py_ssize_t size) except -1:
+    if size <= 14:
+        out.write_byte(<uint8_t>(size << 4 | ctype))
+    else:
+        out.write_byte(<uint8_t>(0xf0 | ctype))
+        out.write_varint(<uint64_t><int32_t>size)
+    return 0
+
+
+cdef int write_compact_value(OutputBuffer out, TypeSpec spec,
+                             object value) except -1:
+    cdef int ttype = spec.ttype
+    cdef Py_ssize_t size
+    cdef bytes data
+    if ttype == T_BOOL:
+        out.write_byte(C_TRUE if value else C_FALSE)
+    elif ttype == T_BYTE:
+        out.write_byte(<uint8_t><int8_t>value)
+    elif ttype == T_I16:
+        out.write_varint(zigzag(<int16_t>value))
+    elif ttype == T_I32:
+        out.write_varint(zigzag(<int32_t>value))
+    elif ttype == T_I64:
+        out.write_varint(zigzag(<int64_t>value))
+    elif ttype == T_DOUBLE:
+        out.write_little(double_bits(value), 8)
+    elif ttype == T_STRING:
+        data = to_bytes(value)
+        out.write_varint(<uint64_t>PyBytes_GET_SIZE(data))
+        out.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+    elif ttype == T_STRUCT:
+        write_compact_struct(out, spec.struct, value)
+    elif ttype == T_LIST or ttype == T_SET:
+        write_compact_size(out, spec.value.ctype, len(value))
+        for item in value:
+            write_compact_value(out, spec.value, item)
+    elif ttype == T_MAP:
+        size = len(value)
+        if size == 0:
+            out.write_byte(0)
+            return 0
+        out.write_varint(<uint64_t><int32_t>size)
+        out.write_byte(<uint8_t>(spec.key.ctype << 4 | spec.value.ctype))
+        for key, item in value.iteritems():
+            write_compact_value(out, spec.key, key)
+            write_compact_value(out, spec.value, item)
+    return 0
+
+
+cdef int write_compact_struct(OutputBuffer out, StructSpec spec,
+                              object obj) except -1:
+    cdef FieldSpec field
+    cdef int last_fid = 0
+    cdef int delta, ctype
+    for field in spec.fields:
+        value = getattr(obj, field.name)
+        if value is None:
+            continue
+        ctype = field.type.ctype
+        if field.type.ttype == T_BOOL:
+            ctype = C_TRUE if value else C_FALSE
+        delta = field.fid - last_fid
+        if 0 < delta <= 15:
+            out.write_byte(<uint8_t>(delta << 4 | ctype))
+        else:
+            out.write_byte(<uint8_t>ctype)
+            out.write_varint(zigzag(<int16_t>field.fid))
+        last_fid = field.fid
+        if field.type.ttype != T_BOOL:
+            write_compact_value(out, field.type, value)
+    out.write_byte(C_STOP)
+    return 0
+
+
+cdef inline int64_t read_compact_size(InputBuffer inp) except? -1:
+    cdef int64_t size = <int32_t>inp.read_varint()
+    check_size(size)
+    return size
+
+
+cdef object read_compact_value(InputBuffer inp, TypeSpec spec):
+    cdef int ttype = spec.ttype
+    cdef int header
+    cdef int64_t size
+    cdef int64_t i
+    if ttype == T_BOOL:
+        return inp.read_byte() == C_TRUE
+    elif ttype == T_BYTE:
+        return <int8_t>inp.read_byte()
+    elif ttype == T_I16:
+        return <int16_t>unzigzag(inp.read_varint())
+    elif ttype == T_I32:
+        return <int32_t>unzigzag(inp.read_varint())
+    elif ttype == T_I64:
+        return unzigzag(inp.read_varint())
+    elif ttype == T_DOUBLE:
+        return bits_double(inp.read_little(8))
+    elif ttype == T_STRING:
+        return inp.read_raw(read_compact_size(inp))
+    elif ttype == T_STRUCT:
+        return read_compact_struct(inp, spec.struct, None)
+    elif ttype == T_LIST or ttype == T_SET:
+        header = inp.read_byte()
+        size = header >> 4
+        if size == 15:
+            size = read_compact_size(inp)
+        if size:
+            check_type(spec.value.ttype, to_ttype(header & 0x0f))
+        if ttype == T_LIST:
+            return [read_compact_value(inp, spec.value) for i in range(size)]
+        return set([read_compact_value(inp, spec.value)
+                    for i in range(size)])
+    elif ttype == T_MAP:
+        size = read_compact_size(inp)
+        result = {}
+        if not size:
+            return result
+        header = inp.read_byte()
+        check_type(spec.key.ttype, to_ttype(header >> 4))
+        check_type(spec.value.ttype, to_ttype(header & 0x0f))
+        for i in range(size):
+            key = read_compact_value(inp, spec.key)
+            result[key] = read_compact_value(inp, spec.value)
+        return result
+    raise TProtocolException(TProtocolException.INVALID_DATA,
+                             'unknown type {0}'.format(ttype))
+
+
+cdef int skip_compact(InputBuffer inp, int ttype, int depth) except -1:
+    cdef int header
+    cdef int etype = T_STOP, ktype = T_STOP, vtype = T_STOP
+    cdef int64_t size
+    cdef int64_t i
+    check_depth(depth)
+    if ttype == T_BOOL or ttype == T_BYTE:
+        inp.ensure(1)
+        inp.position += 1
+    elif ttype == T_I16 or ttype == T_I32 or ttype == T_I64:
+        inp.read_varint()
+    elif ttype == T_DOUBLE:
+        inp.ensure(8)
+        inp.position += 8
+    elif ttype == T_STRING:
+        size = read_compact_size(inp)
+        inp.ensure(size)
+        inp.position += size
+    elif ttype == T_STRUCT:
+        while True:
+            header = inp.read_byte()
+            if header & 0x0f == C_STOP:
+                break
+            if not header >> 4:
+                inp.read_varint()
+            etype = to_ttype(header & 0x0f)
+            if etype != T_BOOL:
+                skip_compact(inp, etype, depth + 1)
+    elif ttype == T_LIST or ttype == T_SET:
+        header = inp.read_byte()
+        size = header >> 4
+        if size == 15:
+            size = read_compact_size(inp)
+        if size:
+            etype = to_ttype(header & 0x0f)
+        for i in range(size):
+            skip_compact(inp, etype, depth + 1)
+    elif ttype == T_MAP:
+        size = read_compact_size(inp)
+        if size:
+            header = inp.read_byte()
+            ktype = to_ttype(header >> 4)
+            vtype = to_ttype(header & 0x0f)
+        for i in range(size):
+            skip_compact(inp, ktype, depth + 1)
+            skip_compact(inp, vtype, depth + 1)
+    else:
+        raise TProtocolException(TProtocolException.INVALID_DATA,
+                                 'unknown type {0}'.format(ttype))
+    return 0
+
+
+cdef object read_compact_struct(InputBuffer inp, StructSpec spec,
+                                object obj):
+    cdef FieldSpec field
+    cdef int header, ctype, ttype, delta
+    cdef int fid
+    cdef int last_fid = 0
+    if obj is None:
+        obj = spec.cls()
+    while True:
+        header = inp.read_byte()
+        ctype = header & 0x0f
+        if ctype == C_STOP:
+            break
+        delta = header >> 4
+        if delta:
+            fid = last_fid + delta
+        else:
+            fid = <int16_t>unzigzag(inp.read_varint())
+        last_fid = fid
+        ttype = to_ttype(ctype)
+        field = spec.lookup(fid)
+        if field is None or field.type.ttype != ttype:
+            if ttype != T_BOOL:
+                skip_compact(inp, ttype, 0)
+            continue
+        if ttype == T_BOOL:
+            setattr(obj, field.name, ctype == C_TRUE)
+        else:
+            setattr(obj, field.name, read_compact_value(inp, field.type))
+    return obj
+
+
+def encode_compact(object obj, object thrift_spec):
+    """Serialize struct with compact protocol."""
+    cdef OutputBuffer out = OutputBuffer()
+    write_compact_struct(out, get_struct(obj.__class__, thrift_spec), obj)
+    return out.getvalue()
+
+
+def decode_compact(object obj, object thrift_spec, bytes data,
+                   Py_ssize_t position=0):
+    """Read struct serialized with compact protocol from given position of
+    data. Return position after struct.
+
+    """
+    cdef InputBuffer inp = InputBuffer(data, position)
+    read_compact_struct(inp, get_struct(obj.__class__, thrift_spec), obj)
+    return inp.position
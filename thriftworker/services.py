@@ -1,9 +1,69 @@
 """Store processor and protocol for each service."""
 from __future__ import absolute_import
 
+import sys
+import logging
+from inspect import getargspec
 from collections import namedtuple
+from cStringIO import StringIO
+from threading import local
 
+from thrift.Thrift import TApplicationException, TMessageType
 from thrift.transport.TTransport import TMemoryBuffer
+from thrift.protocol.TCompactProtocol import TCompactProtocolFactory
+from thrift.protocol.TJSONProtocol import TJSONProtocolFactory
+
+from .transports.message import BINARY, BINARY_NON_STRICT, COMPACT, JSON, \
+    peek_message
+from .utils.future import Future
+
+logger = logging.getLogger(__name__)
+
+#: Factories of protocols detected on connection, services may override them.
+DEFAULT_PROTOCOLS = {COMPACT: TCompactProtocolFactory(),
+                     JSON: TJSONProtocolFactory()}
+
+
+def argument_names(args_cls):
+    """Return names of fields of arguments struct in declaration order, in
+    which generated processors pass them to handler.
+
+    """
+    slots = getattr(args_cls, '__slots__', None)
+    if slots:
+        return tuple(slots)
+    return tuple(getargspec(args_cls.__init__).args[1:])
+
+
+def declared_field(result, exception):
+    """Return name of field of result struct that declare given exception
+    or ``None``.
+
+    """
+    for spec in result.thrift_spec[1:]:
+        if spec is not None and isinstance(exception, spec[3][0]):
+            return spec[2]
+    return None
+
+
+class ReusableBuffer(TMemoryBuffer):
+    """Memory buffer that may be reused by many requests. Only output
+    buffer is reused in place, input one is replaced for each request.
+
+    """
+
+    def reset(self, value=None):
+        """Start reading given value or start writing from scratch. Value
+        is wrapped in new read-only buffer, which doesn't copy it and is
+        cheaper than rewriting old buffer. Capacity of output buffer is
+        kept.
+
+        """
+        if value is not None:
+            self._buffer = StringIO(value)
+        else:
+            self._buffer.seek(0)
+            self._buffer.truncate()
 
 
 class Services(object):
@@ -15,10 +75,13 @@ class Services(object):
     app = None
 
     #: Holder of service processor and protocol factory.
-    Service = namedtuple('Service', 'processor proto_factory')
+    Service = namedtuple('Service', 'processor proto_factory shedding cache'
+                                    ' coalescing protocols batching deferred'
+                                    ' handler inline acceptor')
 
     def __init__(self):
         self.services = {}
+        self.multiplexed = {}
         self.proto_factory = self.app.protocol_factory
         super(Services, self).__init__()
 
@@ -34,27 +97,299 @@ class Services(object):
         """Is service with given name registered?"""
         return key in self.services
 
-    def register(self, service_name, processor, proto_factory=None):
-        """Register new processor for given service."""
-        service = self.Service(processor, proto_factory or self.proto_factory)
+    def register(self, service_name, processor, proto_factory=None,
+                 shedding=None, cache=None, coalescing=None, protocols=None,
+                 batching=None, deferred=None, handler=None, inline=False,
+                 acceptor=None):
+        """Register new processor for given service.
+
+        :param proto_factory: protocol factory, by default one of
+            application; factories of :mod:`thriftworker.protocols` help
+            only structs generated with ``thrift --gen py:dynamic``
+        :param shedding: instance of
+            :class:`thriftworker.workers.shedding.AdmissionQueue` that
+            bound queue of waiting requests and decide which of them
+            should be rejected
+        :param cache: instance of
+            :class:`thriftworker.utils.cache.ResponseCache` that store
+            responses of idempotent methods
+        :param coalescing: instance of
+            :class:`thriftworker.workers.coalescing.Coalescer` that attach
+            identical requests to the executing one
+        :param protocols: mapping of protocol identifiers from
+            :mod:`thriftworker.transports.message` to protocol factories,
+            used for connections that detected to use these protocols
+            instead of *proto_factory*, compact and JSON protocols have
+            default factories
+        :param batching: instance of
+            :class:`thriftworker.workers.batching.Batcher` that group
+            requests of some methods to process them with batch handlers
+        :param deferred: names of methods which handlers may return
+            :class:`thriftworker.utils.future.Future` and complete it
+            later from any thread, worker is released immediately
+        :param handler: handler of service, required to call deferred
+            methods
+        :param inline: process requests in loop instead of worker pool,
+            only for cheap handlers that must answer when pool is busy
+        :param acceptor: class or its name used to accept connections of
+            this service instead of default application acceptor
+
+        """
+        if deferred and handler is None:
+            raise ValueError('Handler is required for deferred methods')
+        service = self.Service(processor, proto_factory or self.proto_factory,
+                               shedding, cache, coalescing,
+                               dict(protocols or {}), batching,
+                               frozenset(deferred or ()), handler, inline,
+                               acceptor)
         self.services[service_name] = service
 
+    def register_multiplexed(self, service_name, services):
+        """Register name that serve many services with
+        :class:`TMultiplexedProtocol`. Requests are routed by prefix of
+        method name to registered services with given names.
+
+        :param services: names of services served by multiplexer
+
+        """
+        self.multiplexed[service_name] = tuple(services)
+
+    def create_factory_getter(self, service_name):
+        """Create function that return protocol factory for protocol
+        detected on connection.
+
+        :param service_name: name of served service
+
+        """
+        service = self.services[service_name]
+        proto_factory = service.proto_factory
+        protocols = dict(DEFAULT_PROTOCOLS)
+        protocols.update(service.protocols)
+        binary_factory = protocols.get(BINARY, proto_factory)
+
+        def inner_getter(protocol=None):
+            factory = protocols.get(protocol)
+            if factory is not None:
+                return factory
+            elif protocol == BINARY_NON_STRICT:
+                return binary_factory
+            return proto_factory
+
+        return inner_getter
+
     def create_processor(self, service_name):
         """Create function that will process incoming request and return
         payload that we should return.
 
         :param service_name: name of served service
 
+        """
+        processor = self.services[service_name].processor
+        get_factory = self.create_factory_getter(service_name)
+        # Transports and protocols are reused by requests processed in the
+        # same thread. Request takes them while being processed, so nested
+        # or interleaved request creates its own ones.
+        buffers = local()
+
+        def create_protocols(proto_factory):
+            in_transport, out_transport = ReusableBuffer(''), ReusableBuffer()
+            return (in_transport, out_transport,
+                    proto_factory.getProtocol(in_transport),
+                    proto_factory.getProtocol(out_transport))
+
+        def inner_processor(message_buffer, protocol=None):
+            proto_factory = get_factory(protocol)
+            try:
+                cache = buffers.protocols
+            except AttributeError:
+                cache = buffers.protocols = {}
+            # Factories may be old-style instances that are slow to hash,
+            # they live as long as service, so their ids are used.
+            key = id(proto_factory)
+            protocols = cache.pop(key, None) \
+                or create_protocols(proto_factory)
+            in_transport, out_transport, in_prot, out_prot = protocols
+            in_transport.reset(message_buffer.getvalue())
+            out_transport.reset()
+            method = processor.process(in_prot, out_prot)
+            response = out_transport.getvalue()
+            # Don't reuse protocols left in the middle of message on error.
+            cache[key] = protocols
+            return (method, response)
+
+        deferred = self.services[service_name].deferred
+        if deferred:
+            process = inner_processor
+            process_deferred = self.create_deferred_processor(service_name)
+
+            def inner_processor(message_buffer, protocol=None):
+                header = peek_message(message_buffer.getvalue())
+                if header is not None and header.name in deferred:
+                    return process_deferred(message_buffer, protocol)
+                return process(message_buffer, protocol)
+
+        return inner_processor
+
+    def create_call_codec(self, service_name):
+        """Create functions that read arguments of call and write result of
+        method. Argument and result structs are taken from module where
+        processor was generated.
+
+        :param service_name: name of served service
+
         """
         service = self.services[service_name]
-        proto_factory, processor = service.proto_factory, service.processor
+        module = sys.modules[service.processor.__class__.__module__]
+        get_factory = self.create_factory_getter(service_name)
+
+        def read_arguments(message_buffer, protocol=None):
+            """Return method name, message type, sequence id and arguments
+            struct of call.
 
-        def inner_processor(message_buffer):
+            """
             in_transport = TMemoryBuffer(message_buffer.getvalue())
+            in_prot = get_factory(protocol).getProtocol(in_transport)
+            method, message_type, seqid = in_prot.readMessageBegin()
+            args = getattr(module, method + '_args')()
+            args.read(in_prot)
+            in_prot.readMessageEnd()
+            return method, message_type, seqid, args
+
+        def write_result(method, seqid, value, protocol=None):
+            """Serialize reply with given value. Exceptions not declared by
+            method are written as :class:`TApplicationException`.
+
+            """
+            message_type = TMessageType.REPLY
+            result = getattr(module, method + '_result')()
+            if not isinstance(value, Exception):
+                result.success = value
+            else:
+                field = declared_field(result, value)
+                if field is not None:
+                    setattr(result, field, value)
+                else:
+                    message_type = TMessageType.EXCEPTION
+                    result = TApplicationException(
+                        TApplicationException.INTERNAL_ERROR, str(value))
             out_transport = TMemoryBuffer()
+            out_prot = get_factory(protocol).getProtocol(out_transport)
+            out_prot.writeMessageBegin(method, message_type, seqid)
+            result.write(out_prot)
+            out_prot.writeMessageEnd()
+            return out_transport.getvalue()
+
+        return read_arguments, write_result
+
+    def create_batch_processor(self, service_name):
+        """Create function that will process requests of one method with
+        single call of batch handler and return list of their payloads.
+
+        :param service_name: name of served service
+
+        """
+        handlers = self.services[service_name].batching.handlers
+        read_arguments, write_result = self.create_call_codec(service_name)
+
+        def inner_processor(method, messages):
+            calls = [read_arguments(message_buffer, protocol)
+                     for message_buffer, protocol in messages]
+            results = handlers[method]([call[3] for call in calls])
+            if len(results) != len(calls):
+                raise ValueError('Batch handler of {0} returned {1} results'
+                                 ' for {2} calls'.format(method, len(results),
+                                                         len(calls)))
+            return [write_result(method, call[2], value, protocol)
+                    for call, value, (_, protocol)
+                    in zip(calls, results, messages)]
+
+        return inner_processor
+
+    def create_deferred_processor(self, service_name):
+        """Create function that will call handler of deferred method. If
+        handler return :class:`thriftworker.utils.future.Future`, payload
+        is returned as future that will be completed when result will be
+        serialized.
+
+        :param service_name: name of served service
+
+        """
+        service = self.services[service_name]
+        handler = service.handler
+        module = sys.modules[service.processor.__class__.__module__]
+        read_arguments, write_result = self.create_call_codec(service_name)
+        names = {}
+
+        def inner_processor(message_buffer, protocol=None):
+            method, message_type, seqid, args = \
+                read_arguments(message_buffer, protocol)
+            try:
+                fields = names[method]
+            except KeyError:
+                fields = names[method] = argument_names(type(args))
+            try:
+                value = getattr(handler, method)(
+                    *[getattr(args, name) for name in fields])
+            except Exception as exc:
+                if declared_field(getattr(module, method + '_result'),
+                                  exc) is None:
+                    logger.exception(exc)
+                value = exc
+            if message_type == TMessageType.ONEWAY:
+                return (method, '')
+            elif not isinstance(value, Future):
+                return (method, write_result(method, seqid, value, protocol))
+
+            def inner_write(future):
+                exception = future.exception()
+                return write_result(
+                    method, seqid,
+                    future.result() if exception is None else exception,
+                    protocol)
+
+            return (method, value.chain(inner_write))
+
+        return inner_processor
+
+    def create_error_writer(self, service_name):
+        """Create function that will answer to incoming request with
+        :class:`TApplicationException` without processing it.
+
+        :param service_name: name of served service
+
+        """
+        get_factory = self.create_factory_getter(service_name)
+
+        def inner_writer(message_buffer, message,
+                         type=TApplicationException.INTERNAL_ERROR,
+                         protocol=None):
+            proto_factory = get_factory(protocol)
+            in_transport = TMemoryBuffer(message_buffer.getvalue())
             in_prot = proto_factory.getProtocol(in_transport)
+            method, message_type, seqid = in_prot.readMessageBegin()
+            if message_type == TMessageType.ONEWAY:
+                return (method, '')
+            out_transport = TMemoryBuffer()
             out_prot = proto_factory.getProtocol(out_transport)
-            method = processor.process(in_prot, out_prot)
+            out_prot.writeMessageBegin(method, TMessageType.EXCEPTION, seqid)
+            TApplicationException(type, message).write(out_prot)
+            out_prot.writeMessageEnd()
             return (method, out_transport.getvalue())
 
-        return inner_processor
+        return inner_writer
+
+    def create_header_writer(self, service_name):
+        """Create function that will serialize message header.
+
+        :param service_name: name of served service
+
+        """
+        get_factory = self.create_factory_getter(service_name)
+
+        def inner_writer(method, message_type, seqid, protocol=None):
+            out_transport = TMemoryBuffer()
+            out_prot = get_factory(protocol).getProtocol(out_transport)
+            out_prot.writeMessageBegin(method, message_type, seqid)
+            return out_transport.getvalue()
+
+        return inner_writer
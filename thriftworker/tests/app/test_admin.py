@@ -0,0 +1,125 @@
+from __future__ import absolute_import
+
+import json
+import socket
+from cStringIO import StringIO
+
+from mock import Mock
+from thrift.transport.TSocket import TSocket
+from thrift.transport.TTransport import TFramedTransport
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+
+from thriftworker.admin import AdminService
+from thriftworker.utils.cache import ResponseCache
+from thriftworker.workers.coalescing import Coalescer
+from thriftworker.tests.utils import TestCase, StartStopLoopMixin, \
+    start_stop_ctx
+from thriftworker.tests.workers.test_base import Worker
+
+
+class TestAdmin(StartStopLoopMixin, TestCase):
+
+    def setUp(self):
+        super(TestAdmin, self).setUp()
+        self.app.Admin().register('127.0.0.1', 0)
+        listeners = self.app.listeners
+        listeners.start()
+        self.addCleanup(listeners.stop)
+        self.port = listeners[0].port
+        acceptors = self.app.acceptors
+        acceptors.register(listeners[0].socket.fileno(), 'Admin')
+        acceptors.start_accepting()
+        self.addCleanup(acceptors.stop)
+
+    def request(self, path):
+        sock = socket.create_connection(('127.0.0.1', self.port), 5.0)
+        try:
+            sock.sendall('GET {0} HTTP/1.0\r\n\r\n'.format(path))
+            response = b''
+            while True:
+                data = sock.recv(4096)
+                if not data:
+                    break
+                response += data
+        finally:
+            sock.close()
+        head, _, body = response.partition(b'\r\n\r\n')
+        return head.split(b'\r\n', 1)[0], body
+
+    def test_http_state(self):
+        status, body = self.request('/state')
+        self.assertEqual(b'HTTP/1.0 200 OK', status)
+        state = json.loads(body)
+        self.assertEqual({'connections': 1, 'active': True},
+                         state['acceptors']['Admin'])
+        connection, = state['connections']
+        self.assertEqual(1, connection['inflight'])
+        self.assertEqual('Admin', connection['service'])
+        self.assertEqual(1, state['worker']['pool_size'])
+        self.assertIn('lag', state['loop'])
+
+    def test_http_stats(self):
+        self.app.counters['response_served'].add()
+        status, body = self.request('/stats?pretty')
+        self.assertEqual(b'HTTP/1.0 200 OK', status)
+        stats = json.loads(body)
+        self.assertEqual(1, stats['counters']['response_served']['count'])
+
+    def test_http_coalescing_stats(self):
+        coalescer = Coalescer(['method'])
+        self.app.services.register('Coalesced', Mock(), coalescing=coalescer)
+        for _ in xrange(4):
+            coalescer.attach(Mock(key=('method', 'args')))
+        stats = json.loads(self.request('/stats')[1])
+        self.assertEqual(4, stats['coalescing_counters']
+                         ['method.requests']['count'])
+        self.assertEqual(3, stats['coalescing_counters']
+                         ['method.coalesced']['count'])
+        self.assertEqual(0.75, stats['coalescing']['method']['ratio'])
+
+    def test_http_cache_stats(self):
+        cache = ResponseCache(['method'])
+        self.app.services.register('Cached', Mock(), cache=cache)
+        cache.set(('method', 'args'), (2, 'result'))
+        cache.get(('method', 'args'))
+        cache.get(('method', 'other'))
+        stats = json.loads(self.request('/stats')[1])['cache_counters']
+        self.assertEqual(1, stats['hits']['count'])
+        self.assertEqual(1, stats['misses']['count'])
+
+    def test_http_unknown(self):
+        status, _ = self.request('/unknown')
+        self.assertEqual(b'HTTP/1.0 404 Not Found', status)
+
+    def test_thrift(self):
+        transport = TFramedTransport(TSocket('127.0.0.1', self.port))
+        transport.open()
+        self.addCleanup(transport.close)
+        client = AdminService.Client(TBinaryProtocol(transport))
+        state = json.loads(client.getState())
+        self.assertEqual(1, state['acceptors']['Admin']['connections'])
+        stats = json.loads(client.getStats())
+        self.assertIn('Admin::getState', stats['execution_timers'])
+
+    def test_saturated_pool(self):
+        self.app.services.register('Busy', Mock())
+        source = socket.socket()
+        source.bind(('127.0.0.1', 0))
+        source.listen(1)
+        self.addCleanup(source.close)
+        acceptors = self.app.acceptors
+        acceptors.register(source.fileno(), 'Busy')
+        acceptors.start_accepting()
+        busy = [acceptor for acceptor in acceptors
+                if acceptor.name == 'Busy'][0]
+        worker = self.app.subclass_with_self(Worker)(Mock())
+        worker.pool_size = 1
+        with start_stop_ctx(worker), worker.concurrency:
+            # Only task that pool of size one can process is running.
+            producer = worker.create_producer('Busy')
+            producer(Mock(), StringIO(''), 1)
+            self.wait_for_predicate(lambda: busy.active)
+            self.assertFalse(busy.active)
+            status, body = self.request('/state')
+        self.assertEqual(b'HTTP/1.0 200 OK', status)
+        self.assertTrue(json.loads(body)['acceptors']['Admin']['active'])
@@ -0,0 +1,215 @@
+from __future__ import absolute_import
+
+import socket
+from struct import Struct
+
+from pyuv import TCP
+from thrift.Thrift import TApplicationException, TMessageType
+from thrift.transport.TTransport import TMemoryBuffer
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol, \
+    TBinaryProtocolFactory
+
+from thriftworker.constants import LENGTH_FORMAT, LENGTH_SIZE, MAX_FRAME_SIZE
+from thriftworker.exceptions import ClientError, ClientTimeout
+from thriftworker.tests.utils import GreenTest
+from thriftworker.transports.framed import FramedAcceptor
+from thriftworker.tests.workers.test_batching import score_args, \
+    score_result
+
+length_struct = Struct(LENGTH_FORMAT)
+
+
+class Client(object):
+    """Client in the way thrift generates it."""
+
+    def __init__(self, iprot, oprot=None):
+        self._iprot = self._oprot = iprot
+        if oprot is not None:
+            self._oprot = oprot
+        self._seqid = 0
+
+    def score(self, value):
+        self._oprot.writeMessageBegin('score', TMessageType.CALL,
+                                      self._seqid)
+        score_args(value).write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+        _, message_type, _ = self._iprot.readMessageBegin()
+        if message_type == TMessageType.EXCEPTION:
+            exception = TApplicationException()
+            exception.read(self._iprot)
+            raise exception
+        result = score_result()
+        result.read(self._iprot)
+        self._iprot.readMessageEnd()
+        return result.success
+
+
+class Server(object):
+    """Answer to calls of score in reverse order of their arrival, don't
+    answer to negative values.
+
+    """
+
+    def __init__(self, loop):
+        self.handle = TCP(loop)
+        self.handle.bind(('127.0.0.1', 0))
+        self.handle.listen(self.cb_connection)
+        self.address = self.handle.getsockname()
+        self.connections = []
+        self.calls = []
+        # Length sent instead of length of reply.
+        self.reply_length = None
+
+    def cb_connection(self, handle, error):
+        connection = TCP(handle.loop)
+        handle.accept(connection)
+        connection.start_read(self.cb_read)
+        self.connections.append(connection)
+
+    def cb_read(self, handle, data, error):
+        if error:
+            handle.close()
+            return
+        replies = []
+        while data:
+            length = length_struct.unpack_from(data)[0]
+            frame = data[LENGTH_SIZE:LENGTH_SIZE + length]
+            data = data[LENGTH_SIZE + length:]
+            protocol = TBinaryProtocol(TMemoryBuffer(frame))
+            name, _, seqid = protocol.readMessageBegin()
+            args = score_args()
+            args.read(protocol)
+            self.calls.append(seqid)
+            if args.value < 0:
+                continue
+            transport = TMemoryBuffer()
+            protocol = TBinaryProtocol(transport)
+            protocol.writeMessageBegin(name, TMessageType.REPLY, seqid)
+            score_result(success=args.value * 2).write(protocol)
+            protocol.writeMessageEnd()
+            reply = transport.getvalue()
+            replies.append(length_struct.pack(
+                self.reply_length or len(reply)) + reply)
+        for reply in reversed(replies):
+            handle.write(reply)
+
+    def close(self):
+        for connection in self.connections:
+            connection.close()
+        self.handle.close()
+
+
+class Processor(object):
+    """Answer to calls of score with doubled value."""
+
+    def process(self, iprot, oprot):
+        name, _, seqid = iprot.readMessageBegin()
+        args = score_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        oprot.writeMessageBegin(name, TMessageType.REPLY, seqid)
+        score_result(success=args.value * 2).write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+
+class TestClient(GreenTest):
+
+    def setUp(self):
+        super(TestClient, self).setUp()
+        self.server = None
+
+    def create_client(self, **options):
+        self.server = Server(self.loop)
+        client = self.hub.Client(Client, self.server.address,
+                                 proto_factory=TBinaryProtocolFactory(),
+                                 **options)
+        return client
+
+    def close(self, client):
+        client.close()
+        self.server.close()
+
+    def test_call(self):
+        client = self.create_client()
+        try:
+            self.assertEqual(42, client.score(21))
+            self.assertEqual(2, client.score(1))
+            self.assertEqual(1, len(client.pool))
+        finally:
+            self.close(client)
+
+    def test_pipelining(self):
+        client = self.create_client(pool_size=2)
+        try:
+            greenlets = [self.hub.spawn(client.score, value)
+                         for value in xrange(10)]
+            self.assertEqual([value * 2 for value in xrange(10)],
+                             [greenlet.get() for greenlet in greenlets])
+            self.assertEqual(2, len(client.pool))
+            self.assertEqual(10, len(self.server.calls))
+        finally:
+            self.close(client)
+
+    def test_timeout(self):
+        client = self.create_client(timeout=0.05)
+        try:
+            self.assertRaises(ClientTimeout, client.score, -1)
+            self.assertEqual(4, client.score(2))
+        finally:
+            self.close(client)
+
+    def test_oversize_frame(self):
+        client = self.create_client()
+        self.server.reply_length = MAX_FRAME_SIZE + 1
+        try:
+            self.assertRaises(ClientError, client.score, 1)
+            self.assertEqual(0, len(client.pool))
+        finally:
+            self.close(client)
+
+    def test_connection_refused(self):
+        client = self.create_client()
+        self.server.close()
+        self.assertRaises(ClientError, client.score, 1)
+        self.assertEqual(0, len(client.pool))
+
+    def test_unknown_method(self):
+        client = self.create_client()
+        try:
+            self.assertRaises(AttributeError, getattr, client, 'unknown')
+        finally:
+            self.close(client)
+
+
+class TestFramedServer(GreenTest):
+
+    def setUp(self):
+        super(TestFramedServer, self).setUp()
+        self.app.services.register('Score', Processor())
+        worker = self.app.worker
+        worker.start()
+        self.addCleanup(worker.stop)
+        source = socket.socket()
+        source.bind(('127.0.0.1', 0))
+        source.listen(0)
+        self.addCleanup(source.close)
+        self.address = source.getsockname()
+        Acceptor = self.app.subclass_with_self(FramedAcceptor)
+        self.acceptor = Acceptor(name='Score', descriptor=source.fileno())
+
+    def test_pipelining(self):
+        self.acceptor.start()
+        client = self.hub.Client(Client, self.address, pool_size=1,
+                                 timeout=5.0,
+                                 proto_factory=TBinaryProtocolFactory())
+        try:
+            greenlets = [self.hub.spawn(client.score, value)
+                         for value in xrange(10)]
+            self.assertEqual([value * 2 for value in xrange(10)],
+                             [greenlet.get() for greenlet in greenlets])
+            self.assertEqual(1, len(client.pool))
+        finally:
+            client.close()
+            self.acceptor.stop()
@@ -0,0 +1,118 @@
+from __future__ import absolute_import
+
+import socket
+
+from thriftworker.exporters.prometheus import render
+from thriftworker.exporters.statsd import format_metrics, pack
+from thriftworker.utils.stats import Counters, Timers
+from thriftworker.tests.utils import TestCase, StartStopLoopMixin
+
+
+class TestCollector(StartStopLoopMixin, TestCase):
+
+    def test_collect(self):
+        collector = self.app.collector
+        self.app.counters['response_served'].add()
+        self.app.execution_timers['method'].add(0.5)
+        first = collector.collect()
+        self.assertEqual(1, first.deltas['counters']['response_served'].count)
+        # Stats of application stay cumulative.
+        self.assertEqual(1, self.app.counters['response_served'].count)
+        self.app.execution_timers['method'].add(1.5)
+        second = collector.collect()
+        self.assertIs(second, collector.snapshot)
+        delta = second.deltas['execution_timers']['method']
+        self.assertEqual((1, 1.5), (delta.count, delta.sum))
+        self.assertEqual(0, second.deltas['counters']['response_served'].count)
+        totals = second.totals['execution_timers']['method']
+        self.assertEqual(2, totals.count)
+        self.assertEqual(2.0, totals.sum)
+        # Previous snapshot isn't changed.
+        self.assertEqual(1, first.totals['execution_timers']['method'].count)
+
+    def test_callbacks(self):
+        snapshots = []
+        self.app.collector.add_callback(snapshots.append)
+        snapshot = self.app.collector.collect()
+        self.assertEqual([snapshot], snapshots)
+
+
+class TestFormats(TestCase):
+
+    def setUp(self):
+        super(TestFormats, self).setUp()
+        counters, timers = Counters(), Timers(quantiles=[0.5, 0.999])
+        counters['served'].add()
+        timers['a"b'].add(2.0)
+        self.stats = {'counters': counters, 'timers': timers}
+
+    def test_render(self):
+        self.assertEqual(
+            '# TYPE tw_counters summary\n'
+            'tw_counters_sum{name="served"} 1.0\n'
+            'tw_counters_count{name="served"} 1\n'
+            '# TYPE tw_timers summary\n'
+            'tw_timers{name="a\\"b",quantile="0.5"} 2.0\n'
+            'tw_timers{name="a\\"b",quantile="0.999"} 2.0\n'
+            'tw_timers_sum{name="a\\"b"} 2.0\n'
+            'tw_timers_count{name="a\\"b"} 1\n',
+            render(self.stats, 'tw'))
+
+    def test_format_metrics(self):
+        self.assertEqual(['tw.counters.served.count:1|c',
+                          'tw.counters.served.sum:1.0|c',
+                          'tw.timers.a_b.count:1|c',
+                          'tw.timers.a_b.mean:2.0|g',
+                          'tw.timers.a_b.max:2.0|g',
+                          'tw.timers.a_b.p50:2.0|g',
+                          'tw.timers.a_b.p99_9:2.0|g'],
+                         format_metrics(self.stats, 'tw'))
+
+    def test_format_reserved_key(self):
+        counters = Counters()
+        counters['peer 1:80|x@y\t'].add()
+        self.assertEqual(['tw.peers.peer_1_80_x_y_.count:1|c',
+                          'tw.peers.peer_1_80_x_y_.sum:1.0|c'],
+                         format_metrics({'peers': counters}, 'tw'))
+
+    def test_pack(self):
+        self.assertEqual(['a:1|c\nb:2|c', 'c:3|c'],
+                         pack(['a:1|c', 'b:2|c', 'c:3|c'], 12))
+
+
+class TestExporters(StartStopLoopMixin, TestCase):
+
+    def test_prometheus(self):
+        exporter = self.app.PrometheusExporter(('127.0.0.1', 0))
+        exporter.start()
+        self.addCleanup(exporter.stop)
+        self.addCleanup(self.app.collector.stop)
+        self.app.counters['response_served'].add()
+        self.app.collector.collect()
+        sock = socket.create_connection(('127.0.0.1', exporter.port), 5.0)
+        self.addCleanup(sock.close)
+        sock.sendall(b'GET /metrics HTTP/1.0\r\n\r\n')
+        response = b''
+        while True:
+            data = sock.recv(4096)
+            if not data:
+                break
+            response += data
+        self.assertTrue(response.startswith(b'HTTP/1.0 200 OK\r\n'))
+        self.assertIn(b'thriftworker_counters_count{name="response_served"} 1',
+                      response)
+
+    def test_statsd(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(sock.close)
+        sock.bind(('127.0.0.1', 0))
+        sock.settimeout(5.0)
+        exporter = self.app.StatsdExporter(sock.getsockname())
+        exporter.start()
+        self.addCleanup(exporter.stop)
+        self.addCleanup(self.app.collector.stop)
+        self.app.counters['response_served'].add()
+        self.app.collector.collect()
+        self.assertEqual(b'thriftworker.counters.response_served.count:1|c\n'
+                         b'thriftworker.counters.response_served.sum:1.0|c',
+                         sock.recv(4096))
@@ -1,8 +1,12 @@
 from __future__ import absolute_import
 
+import time
+
 from greenlet import GreenletExit
+from mock import patch
 
-from thriftworker.hub import sleep
+from thriftworker.hub import sleep, with_timeout
+from thriftworker.exceptions import Timeout, PoolFull
 from thriftworker.tests.utils import TestCase, CustomAppMixin, \
     start_stop_ctx, GreenTest
 
@@ -34,6 +38,39 @@ class TestHub(CustomAppMixin, TestCase):
         with self.context():
             hub.wakeup()
 
+    def test_lag_monitor(self):
+        hub = self.hub
+        monitor = hub.lag_monitor
+        monitor.interval = 0.01
+        with self.context():
+            monitor.start()
+            self.assertTrue(monitor.started)
+            hub.callback(time.sleep, 0.05)
+            self.wait_for_predicate(
+                lambda: self.app.loop_lag['timer'].max < 30)
+            monitor.stop()
+        lag = self.app.loop_lag
+        self.assertGreaterEqual(lag['timer'].max, 30)
+        self.assertGreaterEqual(lag['callback'].count, 1)
+        self.assertIsNone(hub._async_queue.timer)
+        self.assertNotIn('send', vars(hub._async_queue))
+
+    def test_stall_dump(self):
+        hub = self.hub
+        monitor = hub.lag_monitor
+        monitor.interval, monitor.threshold = 0.01, 0.05
+
+        def block_loop():
+            time.sleep(0.2)
+
+        with patch('thriftworker.hub.lag.logger') as logger, self.context():
+            monitor.start()
+            hub.callback(block_loop)
+            self.wait_for_predicate(lambda: not logger.warning.called)
+            monitor.stop()
+        self.assertEqual(1, monitor.stalls)
+        self.assertIn('block_loop', logger.warning.call_args[0][-1])
+
 
 class TestGreenlet(GreenTest):
 
@@ -167,3 +204,51 @@ class TestGreenlet(GreenTest):
 
     def test_kill_running_noblock(self):
         self._test_kill_running(block=False)
+
+
+class TestTimers(GreenTest):
+
+    def test_order(self):
+        fired = []
+        timers = self.hub.timers
+        for delay in (0.03, 0.01, 0.02):
+            timers.schedule(delay, fired.append, delay)
+        timers.schedule(0.015, fired.append, 'cancelled').cancel()
+        sleep(0.05)
+        self.assertEqual([0.01, 0.02, 0.03], fired)
+        self.assertEqual(0, len(timers))
+
+    def test_with_timeout(self):
+        self.assertEqual(1, with_timeout(0.05, lambda: sleep(0.001) or 1))
+        with self.assertRaises(Timeout):
+            with_timeout(0.01, sleep, 1)
+        # Cancelled timeout doesn't fire later.
+        with_timeout(0.01, lambda: None)
+        sleep(0.02)
+
+
+class TestGreenletPool(GreenTest):
+
+    def test_size(self):
+        pool = self.hub.GreenletPool(2)
+        running = []
+
+        def run(value):
+            running.append(len(pool))
+            sleep(0.01)
+            return value
+
+        greenlets = [pool.spawn(run, value) for value in xrange(5)]
+        self.assertEqual(2, len(pool))
+        self.assertEqual(3, len(pool.queue))
+        pool.join()
+        self.assertEqual(range(5), [greenlet.get() for greenlet in greenlets])
+        self.assertEqual(0, len(pool))
+        self.assertTrue(all(count <= 2 for count in running))
+
+    def test_backlog(self):
+        pool = self.hub.GreenletPool(1, backlog=1)
+        pool.spawn(sleep, 0.01)
+        pool.spawn(sleep, 0.01)
+        self.assertRaises(PoolFull, pool.spawn, sleep, 0.01)
+        pool.join()
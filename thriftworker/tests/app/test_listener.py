@@ -76,3 +76,13 @@ class TestListeners(ListenersMixin, TestCase):
                           listeners[1].channel], listeners.channels)
         self.assertEqual({0: listeners[0],
                           1: listeners[1]}, listeners.enumerated)
+
+    def test_start_stop(self):
+        listeners = self.Listeners()
+        for name in ('SomeService', 'OtherService'):
+            listeners.register(name, 'localhost', 0)
+        listeners.start()
+        self.assertTrue(all(listener.started for listener in listeners))
+        self.assertNotEqual(listeners[0].port, listeners[1].port)
+        listeners.stop()
+        self.assertFalse(any(listener.started for listener in listeners))
@@ -1,10 +1,17 @@
 from __future__ import absolute_import
 
 from cStringIO import StringIO
+from threading import Thread
 
 from mock import Mock
+from thrift.Thrift import TApplicationException, TMessageType
+from thrift.transport.TTransport import TMemoryBuffer
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
 
+from thriftworker.services import DEFAULT_PROTOCOLS
 from thriftworker.tests.utils import TestCase, CustomAppMixin
+from thriftworker.transports.message import BINARY, BINARY_NON_STRICT, \
+    COMPACT, JSON
 
 
 class TestServices(CustomAppMixin, TestCase):
@@ -28,3 +35,62 @@ class TestServices(CustomAppMixin, TestCase):
         self.assertEqual((None, ''), process(StringIO(b'xxxx')))
         self.assertTrue(process_mock.called)
         self.assertEqual(1, process_mock.call_count)
+
+    def test_processor_reuse_protocols(self):
+        self.services.register(self.service_name, self.processor)
+        protocols = []
+
+        def process(in_prot, out_prot):
+            protocols.append((in_prot, out_prot))
+            out_prot.trans.write(in_prot.trans.read(4))
+
+        self.processor.process = process
+        process = self.services.create_processor(self.service_name)
+        self.assertEqual((None, 'xxxx'), process(StringIO(b'xxxx')))
+        self.assertEqual((None, 'yy'), process(StringIO(b'yy')))
+        self.assertEqual(protocols[0], protocols[1])
+        thread = Thread(target=process, args=(StringIO(b'zz'),))
+        thread.start()
+        thread.join()
+        self.assertNotEqual(protocols[0], protocols[2])
+
+    def test_processor_drop_protocols_on_error(self):
+        self.services.register(self.service_name, self.processor)
+        protocols = []
+
+        def process(in_prot, out_prot):
+            protocols.append(in_prot)
+            raise ValueError()
+
+        self.processor.process = process
+        process = self.services.create_processor(self.service_name)
+        for _ in xrange(2):
+            with self.assertRaises(ValueError):
+                process(StringIO(b'xxxx'))
+        self.assertIsNot(protocols[0], protocols[1])
+
+    def test_factory_getter(self):
+        binary, compact = Mock(), Mock()
+        self.services.register(self.service_name, self.processor,
+                               protocols={BINARY: binary, COMPACT: compact})
+        get_factory = self.services.create_factory_getter(self.service_name)
+        self.assertIs(compact, get_factory(COMPACT))
+        self.assertIs(binary, get_factory(BINARY_NON_STRICT))
+        self.assertIs(DEFAULT_PROTOCOLS[JSON], get_factory(JSON))
+        self.assertIs(self.services.proto_factory, get_factory())
+
+    def test_error_writer(self):
+        self.services.register(self.service_name, self.processor)
+        write_error = self.services.create_error_writer(self.service_name)
+        in_transport = TMemoryBuffer()
+        in_prot = TBinaryProtocol(in_transport)
+        in_prot.writeMessageBegin('method', TMessageType.CALL, 5)
+        method, payload = write_error(StringIO(in_transport.getvalue()),
+                                      'overloaded')
+        self.assertEqual('method', method)
+        out_prot = TBinaryProtocol(TMemoryBuffer(payload))
+        self.assertEqual(('method', TMessageType.EXCEPTION, 5),
+                         out_prot.readMessageBegin())
+        exc = TApplicationException()
+        exc.read(out_prot)
+        self.assertEqual('overloaded', exc.message)
@@ -0,0 +1,150 @@
+from __future__ import absolute_import
+
+from thrift.Thrift import TType
+from thrift.protocol.TBase import TBase
+from thrift.protocol.TProtocol import TProtocolBase
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.protocol.TCompactProtocol import TCompactProtocol
+from thrift.transport.TTransport import TMemoryBuffer
+
+from thriftworker.tests.utils import TestCase
+from thriftworker.protocols import BinaryProtocol, CompactProtocol
+from thriftworker.protocols.codec import encode_binary, decode_binary, \
+    encode_compact, decode_compact
+
+
+class Item(TBase):
+
+    __slots__ = ['id', 'name', 'enabled']
+
+    thrift_spec = (
+        None,
+        (1, TType.I32, 'id', None, None),
+        (2, TType.STRING, 'name', None, None),
+        (3, TType.BOOL, 'enabled', None, None),
+    )
+
+    def __init__(self, id=None, name=None, enabled=None):
+        self.id = id
+        self.name = name
+        self.enabled = enabled
+
+
+class Bag(TBase):
+
+    __slots__ = ['byte', 'short', 'long', 'real', 'items', 'tags',
+                 'scores', 'flags', 'item', 'far']
+
+    thrift_spec = (
+        None,
+        (1, TType.BYTE, 'byte', None, None),
+        (2, TType.I16, 'short', None, None),
+        (3, TType.I64, 'long', None, None),
+        (4, TType.DOUBLE, 'real', None, None),
+        (5, TType.LIST, 'items', (TType.STRUCT, (Item, Item.thrift_spec)),
+         None),
+        (6, TType.SET, 'tags', (TType.STRING, None), None),
+        (7, TType.MAP, 'scores', (TType.STRING, None, TType.I64, None),
+         None),
+        (8, TType.MAP, 'flags', (TType.I32, None, TType.LIST,
+                                 (TType.BOOL, None)), None),
+        (9, TType.STRUCT, 'item', (Item, Item.thrift_spec), None),
+    ) + (None,) * 10 + (
+        (20, TType.I32, 'far', None, None),
+    )
+
+    def __init__(self, byte=None, short=None, long=None, real=None,
+                 items=None, tags=None, scores=None, flags=None, item=None,
+                 far=None):
+        self.byte = byte
+        self.short = short
+        self.long = long
+        self.real = real
+        self.items = items
+        self.tags = tags
+        self.scores = scores
+        self.flags = flags
+        self.item = item
+        self.far = far
+
+
+class Short(TBase):
+
+    __slots__ = ['id', 'count']
+
+    thrift_spec = (
+        None,
+        (1, TType.I32, 'id', None, None),
+        (2, TType.I64, 'count', None, None),
+    )
+
+    def __init__(self, id=None, count=None):
+        self.id = id
+        self.count = count
+
+
+def create_bag():
+    return Bag(byte=-5, short=-300, long=-(2 ** 40), real=1.5,
+               items=[Item(1, 'first', True), Item(-2, 'second', False)],
+               tags=set(['a', 'b']), scores={'x': 2 ** 33, 'y': -1},
+               flags={1: [True, False] * 10, -1: []},
+               item=Item(id=3), far=7)
+
+
+class CodecMixin(object):
+
+    Protocol = BaseProtocol = None
+    encode = decode = None
+
+    def serialize(self, protocol_class, obj):
+        trans = TMemoryBuffer()
+        protocol = protocol_class(trans)
+        TProtocolBase.writeStruct(protocol, obj, obj.thrift_spec) \
+            if protocol_class is self.BaseProtocol else obj.write(protocol)
+        return trans.getvalue()
+
+    def test_compatible_encoding(self):
+        bag = create_bag()
+        self.assertEqual(self.serialize(self.BaseProtocol, bag),
+                         self.serialize(self.Protocol, bag))
+
+    def test_round_trip(self):
+        bag = create_bag()
+        data = self.serialize(self.Protocol, bag)
+        protocol = self.Protocol(TMemoryBuffer(data + 'tail'))
+        result = Bag()
+        result.read(protocol)
+        self.assertEqual(bag, result)
+        self.assertEqual('tail', protocol.trans.read(4))
+
+    def test_unicode(self):
+        self.assertEqual(self.encode(Item(name='\xd1\x84'), Item.thrift_spec),
+                         self.encode(Item(name=u'\u0444'), Item.thrift_spec))
+
+    def test_skip_unknown(self):
+        data = self.encode(Item(1, 'name', True), Item.thrift_spec)
+        result = Short()
+        self.assertEqual(len(data), self.decode(result, Short.thrift_spec,
+                                                data))
+        self.assertEqual(Short(1), result)
+
+    def test_truncated(self):
+        data = self.encode(create_bag(), Bag.thrift_spec)
+        with self.assertRaises(EOFError):
+            self.decode(Bag(), Bag.thrift_spec, data[:-1])
+
+
+class TestBinaryCodec(CodecMixin, TestCase):
+
+    Protocol = BinaryProtocol
+    BaseProtocol = TBinaryProtocol
+    encode = staticmethod(encode_binary)
+    decode = staticmethod(decode_binary)
+
+
+class TestCompactCodec(CodecMixin, TestCase):
+
+    Protocol = CompactProtocol
+    BaseProtocol = TCompactProtocol
+    encode = staticmethod(encode_compact)
+    decode = staticmethod(decode_compact)
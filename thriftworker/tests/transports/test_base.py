@@ -14,7 +14,8 @@ class EchoConnection(object):
     OPENED = 0x1
     CLOSED = 0x2
 
-    def __init__(self, producer, loop, client, peer, on_close):
+    def __init__(self, producer, loop, client, peer, on_close,
+                 peer_requests=None, peer_responses=None, read_sizes=None):
         self.state = self.OPENED
         self.producer = producer
         self.loop = loop
@@ -0,0 +1,120 @@
+from __future__ import absolute_import
+
+import socket
+import struct
+
+from thrift.Thrift import TMessageType, TType
+from thrift.transport.TTransport import TMemoryBuffer
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+
+from thriftworker.constants import MAX_FRAME_SIZE
+from thriftworker.tests.utils import TestCase
+from thriftworker.transports.buffered import BufferedAcceptor
+
+from .utils import AcceptorMixin
+
+
+class TestBufferedAcceptor(AcceptorMixin, TestCase):
+
+    Acceptor = BufferedAcceptor
+
+    @staticmethod
+    def create_message(data, strict=True):
+        trans = TMemoryBuffer()
+        proto = TBinaryProtocol(trans, strictWrite=strict)
+        proto.writeMessageBegin('method', TMessageType.CALL, 1)
+        proto.writeStructBegin('args')
+        proto.writeFieldBegin('data', TType.STRING, 1)
+        proto.writeString(data)
+        proto.writeFieldEnd()
+        proto.writeFieldBegin('numbers', TType.LIST, 2)
+        proto.writeListBegin(TType.I32, 3)
+        for i in xrange(3):
+            proto.writeI32(i)
+        proto.writeListEnd()
+        proto.writeFieldEnd()
+        proto.writeFieldBegin('nested', TType.MAP, 3)
+        proto.writeMapBegin(TType.STRING, TType.LIST, 1)
+        proto.writeString('key')
+        proto.writeListBegin(TType.STRUCT, 2)
+        for i in xrange(2):
+            proto.writeStructBegin('item')
+            proto.writeFieldBegin('flag', TType.BOOL, 1)
+            proto.writeBool(True)
+            proto.writeFieldEnd()
+            proto.writeFieldStop()
+            proto.writeStructEnd()
+        proto.writeListEnd()
+        proto.writeMapEnd()
+        proto.writeFieldEnd()
+        proto.writeFieldStop()
+        proto.writeStructEnd()
+        proto.writeMessageEnd()
+        return trans.getvalue()
+
+    @staticmethod
+    def process(in_prot, out_prot):
+        in_prot.readMessageBegin()
+        in_prot.readStructBegin()
+        in_prot.readFieldBegin()
+        data = in_prot.readString()
+        out_prot.writeString(data)
+
+    @staticmethod
+    def decode_message(data):
+        return TBinaryProtocol(TMemoryBuffer(data)).readString()
+
+    def test_connection(self):
+        payload = b'xxxx'
+        self.processor.process = self.process
+
+        source = socket.socket()
+        acceptor = self.Acceptor(name=self.service_name,
+                                 descriptor=source.fileno())
+        with self.maybe_connect(source, acceptor) as client:
+            client.send(self.create_message(payload))
+            response = client.recv(4 + len(payload))
+
+        self.assertEqual(payload, self.decode_message(response))
+
+    def test_partial_messages(self):
+        payloads = [b'first', b'second']
+        self.processor.process = self.process
+
+        source = socket.socket()
+        acceptor = self.Acceptor(name=self.service_name,
+                                 descriptor=source.fileno())
+        with self.maybe_connect(source, acceptor) as client:
+            first = self.create_message(payloads[0], strict=False)
+            message = first + self.create_message(payloads[1])
+            for i in xrange(len(message)):
+                # send message byte by byte and wake-up loop
+                client.send(message[i:i + 1])
+                self.wakeup_loop()
+                if i == len(first) - 1:
+                    response = client.recv(4 + len(payloads[0]))
+            self.assertEqual(payloads[0], self.decode_message(response))
+            response = client.recv(4 + len(payloads[1]))
+            self.assertEqual(payloads[1], self.decode_message(response))
+
+    def test_garbage(self):
+        source = socket.socket()
+        acceptor = self.Acceptor(name=self.service_name,
+                                 descriptor=source.fileno())
+
+        with self.maybe_connect(source, acceptor) as client:
+            client.send(b'GET / HTTP/1.1\r\n\r\n')
+            self.assertEqual('', client.recv(4))
+
+    def test_oversize_message(self):
+        source = socket.socket()
+        acceptor = self.Acceptor(name=self.service_name,
+                                 descriptor=source.fileno())
+
+        message = self.create_message(b'')
+        # Replace length of string with length that exceeds limit.
+        position = message.index(struct.pack('!i', 0))
+        message = message[:position] + struct.pack('!i', MAX_FRAME_SIZE)
+        with self.maybe_connect(source, acceptor) as client:
+            client.send(message)
+            self.assertEqual('', client.recv(4))
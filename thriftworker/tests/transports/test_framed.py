@@ -4,11 +4,15 @@ import socket
 import struct
 from mock import Mock
 from thrift.transport.TTransport import TMemoryBuffer
+from thrift.Thrift import TMessageType
 from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.protocol.TCompactProtocol import TCompactProtocol, \
+    TCompactProtocolFactory
 
 from thriftworker.tests.utils import TestCase
 from thriftworker.transports.framed import FramedAcceptor
-from thriftworker.constants import LENGTH_FORMAT, LENGTH_SIZE
+from thriftworker.transports.message import COMPACT
+from thriftworker.constants import LENGTH_FORMAT, LENGTH_SIZE, MAX_FRAME_SIZE
 
 from .utils import AcceptorMixin
 
@@ -53,6 +57,74 @@ class TestFramedAcceptor(AcceptorMixin, TestCase):
 
         self.assertEqual(payload, decoded_payload)
 
+    def test_traffic(self):
+        self.processor.process = lambda in_prot, out_prot: \
+            out_prot.writeString(in_prot.readString())
+        request = self.encode_length(self.create_message(b'xxxx'))
+
+        source = socket.socket()
+        acceptor = self.Acceptor(name=self.service_name,
+                                 descriptor=source.fileno())
+        with self.maybe_connect(source, acceptor) as client:
+            client.send(request)
+            client.recv(len(request))
+            connection = list(acceptor)[0]
+            self.assertEqual(len(request), connection.bytes_in)
+            self.assertEqual(len(request), connection.bytes_out)
+            self.assertEqual(1, connection.frames_in)
+            self.assertEqual(1, connection.frames_out)
+            self.assertGreaterEqual(connection.age, 0)
+            self.assertGreaterEqual(connection.idle, 0)
+
+        host = connection.peer[0]
+        self.assertEqual(1, self.app.peer_requests[host].count)
+        self.assertEqual(len(request) - LENGTH_SIZE,
+                         self.app.peer_requests[host].sum)
+        self.assertEqual(len(request), self.app.peer_responses[host].sum)
+        self.assertEqual(len(request),
+                         self.app.read_sizes[self.service_name].sum)
+        # Write is measured when response is passed to socket.
+        self.assertEqual(1, self.app.write_timers[
+            self.service_name + '::unknown'].count)
+
+    def check_compact(self, **options):
+        protocols = []
+
+        def process(in_prot, out_prot):
+            protocols.append(in_prot.__class__)
+            method, message_type, seqid = in_prot.readMessageBegin()
+            out_prot.writeMessageBegin(method, TMessageType.REPLY, seqid)
+            out_prot.writeMessageEnd()
+
+        self.processor.process = process
+        self.app.services.register(self.service_name, self.processor,
+                                   **options)
+
+        trans = TMemoryBuffer()
+        proto = TCompactProtocol(trans)
+        proto.writeMessageBegin('method', TMessageType.CALL, 1)
+        proto.writeString(b'xxxx')
+        proto.writeMessageEnd()
+
+        source = socket.socket()
+        acceptor = self.Acceptor(name=self.service_name,
+                                 descriptor=source.fileno())
+        with self.maybe_connect(source, acceptor) as client:
+            client.send(self.encode_length(trans.getvalue()))
+            length = self.decode_length(client.recv(LENGTH_SIZE))
+            proto = TCompactProtocol(TMemoryBuffer(client.recv(length)))
+            self.assertEqual(('method', TMessageType.REPLY, 1),
+                             proto.readMessageBegin())
+            self.assertEqual(COMPACT, list(acceptor)[0].protocol)
+
+        self.assertEqual([TCompactProtocol], protocols)
+
+    def test_detect_protocol(self):
+        self.check_compact(protocols={COMPACT: TCompactProtocolFactory()})
+
+    def test_default_compact(self):
+        self.check_compact()
+
     def test_negative_length(self):
         source = socket.socket()
         acceptor = self.Acceptor(name=self.service_name,
@@ -62,6 +134,15 @@ class TestFramedAcceptor(AcceptorMixin, TestCase):
             client.send(struct.pack(LENGTH_FORMAT, -1))
             self.assertEqual('', client.recv(4))
 
+    def test_oversize_length(self):
+        source = socket.socket()
+        acceptor = self.Acceptor(name=self.service_name,
+                                 descriptor=source.fileno())
+
+        with self.maybe_connect(source, acceptor) as client:
+            client.send(struct.pack(LENGTH_FORMAT, MAX_FRAME_SIZE + 1))
+            self.assertEqual('', client.recv(4))
+
     def test_zero_length(self):
         source = socket.socket()
         acceptor = self.Acceptor(name=self.service_name,
@@ -0,0 +1,112 @@
+from __future__ import absolute_import
+
+import zlib
+import socket
+import struct
+
+from mock import patch
+from thrift.Thrift import TMessageType
+from thrift.transport.TTransport import TMemoryBuffer
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+
+from thriftworker.tests.utils import TestCase
+from thriftworker.transports.header import HeaderAcceptor
+from thriftworker.transports.header.connection import parse_frame, \
+    HeaderError
+from thriftworker.constants import COMPRESSION_THRESHOLD, LENGTH_SIZE
+
+from . import test_framed
+
+ZLIB = 1
+
+
+def varint(value):
+    result = ''
+    while value > 0x7f:
+        result += chr((value & 0x7f) | 0x80)
+        value >>= 7
+    return result + chr(value)
+
+
+def create_frame(payload, transforms=(), headers=None, seqid=1):
+    header = varint(0) + varint(len(transforms)) + \
+        ''.join(varint(transform) for transform in transforms)
+    if headers:
+        header += varint(1) + varint(len(headers)) + ''.join(
+            varint(len(key)) + key + varint(len(value)) + value
+            for key, value in headers.items())
+    header += '\0' * (-len(header) % 4)
+    if ZLIB in transforms:
+        payload = zlib.compress(payload)
+    return struct.pack('!HHIH', 0x0fff, 0, seqid, len(header) // 4) + \
+        header + payload
+
+
+def create_message(data):
+    trans = TMemoryBuffer()
+    proto = TBinaryProtocol(trans)
+    proto.writeMessageBegin('method', TMessageType.CALL, 1)
+    proto.writeString(data)
+    proto.writeMessageEnd()
+    return trans.getvalue()
+
+
+class TestFrame(TestCase):
+
+    def test_parse(self):
+        frame = parse_frame(create_frame('payload', [ZLIB],
+                                         {'trace': 'abc'}, seqid=7))
+        self.assertEqual(7, frame.seqid)
+        self.assertEqual(0, frame.protocol)
+        self.assertEqual((ZLIB,), frame.transforms)
+        self.assertEqual({'trace': 'abc'}, frame.headers)
+        self.assertEqual('payload', frame.getvalue())
+
+    def test_unknown_transform(self):
+        with self.assertRaises(HeaderError):
+            parse_frame(create_frame('payload', [3]))
+
+    def test_decompression_limit(self):
+        frame = parse_frame(create_frame('x' * 4096, [ZLIB]))
+        with patch('thriftworker.transports.header.connection.MAX_FRAME_SIZE',
+                   1024):
+            with self.assertRaises(HeaderError):
+                frame.getvalue()
+        self.assertEqual('x' * 4096, frame.getvalue())
+
+    def test_encode(self):
+        frame = parse_frame(create_frame('payload', [ZLIB]))
+        small, large = 'x', 'x' * COMPRESSION_THRESHOLD
+        self.assertEqual(create_frame(small), frame.encode(small))
+        encoded = frame.encode(large)
+        self.assertEqual(create_frame(large, [ZLIB]), encoded)
+        self.assertIs(encoded, frame.encode(large))
+        frame = parse_frame(create_frame('payload'))
+        self.assertEqual(create_frame(large), frame.encode(large))
+
+
+class TestHeaderAcceptor(test_framed.TestFramedAcceptor):
+
+    Acceptor = HeaderAcceptor
+
+    def test_header_connection(self):
+        payload = 'x' * COMPRESSION_THRESHOLD
+        self.processor.process = lambda in_prot, out_prot: \
+            out_prot.writeString(in_prot.readMessageBegin()[0] +
+                                 in_prot.readString())
+
+        source = socket.socket()
+        acceptor = self.Acceptor(name=self.service_name,
+                                 descriptor=source.fileno())
+        with self.maybe_connect(source, acceptor) as client:
+            client.send(self.encode_length(create_frame(
+                create_message(payload), [ZLIB], {'trace': 'abc'})))
+            length = self.decode_length(client.recv(LENGTH_SIZE))
+            data = ''
+            while len(data) < length:
+                data += client.recv(length - len(data))
+
+        frame = parse_frame(data)
+        self.assertEqual((ZLIB,), frame.transforms)
+        self.assertEqual('method' + payload,
+                         self.decode_message(frame.getvalue()))
@@ -0,0 +1,80 @@
+from __future__ import absolute_import
+
+from thrift.Thrift import TMessageType
+from thrift.transport.TTransport import TMemoryBuffer
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.protocol.TCompactProtocol import TCompactProtocol
+from thrift.protocol.TJSONProtocol import TJSONProtocol
+
+from thriftworker.tests.utils import TestCase
+from thriftworker.transports.message import peek_message, MessageHeader, \
+    detect_protocol, BINARY, BINARY_NON_STRICT, COMPACT, JSON
+
+
+class TestPeekMessage(TestCase):
+
+    @staticmethod
+    def create_message(protocol_class, name, message_type, seqid, **options):
+        trans = TMemoryBuffer()
+        proto = protocol_class(trans, **options)
+        proto.writeMessageBegin(name, message_type, seqid)
+        header = trans.getvalue()
+        proto.writeString('arguments')
+        proto.writeMessageEnd()
+        return header, trans.getvalue()
+
+    def test_binary(self):
+        header, message = self.create_message(
+            TBinaryProtocol, 'method', TMessageType.CALL, 42)
+        self.assertEqual(
+            MessageHeader('method', TMessageType.CALL, 42, len(header),
+                          BINARY, True),
+            peek_message(message))
+
+    def test_binary_without_version(self):
+        header, message = self.create_message(
+            TBinaryProtocol, 'method', TMessageType.ONEWAY, 7,
+            strictWrite=False)
+        self.assertEqual(
+            MessageHeader('method', TMessageType.ONEWAY, 7, len(header),
+                          BINARY, False),
+            peek_message(message))
+
+    def test_compact(self):
+        header, message = self.create_message(
+            TCompactProtocol, 'method', TMessageType.REPLY, 300)
+        self.assertEqual(
+            MessageHeader('method', TMessageType.REPLY, 300, len(header),
+                          COMPACT, True),
+            peek_message(message))
+
+    def test_json(self):
+        header, message = self.create_message(
+            TJSONProtocol, 'method', TMessageType.CALL, -3)
+        self.assertEqual(
+            MessageHeader('method', TMessageType.CALL, -3, len(header),
+                          JSON, True),
+            peek_message(message))
+        self.assertIsNone(peek_message(header))
+
+    def test_detect_protocol(self):
+        for protocol_class, options, protocol in [
+                (TBinaryProtocol, {}, BINARY),
+                (TBinaryProtocol, {'strictWrite': False}, BINARY_NON_STRICT),
+                (TCompactProtocol, {}, COMPACT),
+                (TJSONProtocol, {}, JSON)]:
+            _, message = self.create_message(
+                protocol_class, 'method', TMessageType.CALL, 1, **options)
+            self.assertEqual(protocol,
+                             detect_protocol(peek_message(message)))
+
+    def test_truncated(self):
+        header, _ = self.create_message(
+            TBinaryProtocol, 'method', TMessageType.CALL, 1)
+        self.assertIsNone(peek_message(header[:-1]))
+        self.assertIsNotNone(peek_message(header))
+
+    def test_garbage(self):
+        self.assertIsNone(peek_message(b''))
+        self.assertIsNone(peek_message(b'\xff\xff\xff\xff\x00'))
+        self.assertIsNone(peek_message(b'GET / HTTP/1.1\r\n'))
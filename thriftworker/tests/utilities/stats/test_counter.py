@@ -1,7 +1,9 @@
 from __future__ import absolute_import
 
+import pickle
+
 from thriftworker.tests.utils import TestCase
-from thriftworker.utils.stats import Counter
+from thriftworker.utils.stats import Counter, Counters
 
 
 class TestCounter(TestCase):
@@ -28,3 +30,61 @@ class TestCounter(TestCase):
         self.counter.add()
         self.counter.add()
         self.assertEqual(2, len(self.counter))
+
+    def test_merge(self):
+        other = Counter()
+        self.counter.add(2)
+        other.add(1)
+        other.add(3)
+        self.counter.merge(other)
+        self.assertEqual(3, self.counter.count)
+        self.assertEqual(1, self.counter.min)
+        self.assertEqual(3, self.counter.max)
+
+    def test_snapshot(self):
+        self.counter.add(5)
+        snapshot = self.counter.snapshot(reset=True)
+        self.assertEqual(5, int(snapshot))
+        self.assertEqual(0, len(self.counter))
+
+    def test_pickle(self):
+        self.counter.add(2)
+        self.counter.add(4)
+        counter = pickle.loads(pickle.dumps(self.counter))
+        self.assertEqual((2, 6, 20, 2, 4),
+                         (counter.count, counter.sum, counter.squared_sum,
+                          counter.min, counter.max))
+
+    def test_subtract(self):
+        self.counter.add(2)
+        previous = self.counter.snapshot()
+        self.counter.add(3)
+        self.counter.add(4)
+        delta = self.counter.snapshot().subtract(previous)
+        self.assertEqual((2, 7), (delta.count, delta.sum))
+        self.assertEqual(0, self.counter.snapshot().subtract(
+            self.counter).count)
+        # Counter was reset after previous snapshot.
+        self.assertEqual(1, Counter().snapshot().merge(previous).subtract(
+            self.counter).count)
+
+
+class TestCounters(TestCase):
+
+    def test_snapshot(self):
+        counters = Counters()
+        counters['a'].add()
+        snapshot = counters.snapshot(reset=True)
+        self.assertEqual(1, snapshot.to_dict()['a']['count'])
+        self.assertEqual(0, counters.to_dict()['a']['count'])
+
+    def test_subtract(self):
+        counters = Counters()
+        counters['a'].add()
+        previous = counters.snapshot()
+        counters['a'].add()
+        counters['b'].add()
+        delta = counters.snapshot().subtract(previous)
+        self.assertEqual({'a': 1, 'b': 1},
+                         {key: counter.count for key, counter in
+                          delta.items()})
@@ -0,0 +1,50 @@
+from __future__ import absolute_import
+
+import pickle
+
+from thriftworker.tests.utils import TestCase
+from thriftworker.utils.stats import HeavyHitters
+
+
+class TestHeavyHitters(TestCase):
+
+    def test_bounded(self):
+        hitters = HeavyHitters(capacity=2)
+        hitters.add('a', 10)
+        hitters.add('b', 1)
+        hitters.add('c', 5)
+        self.assertEqual(2, len(hitters))
+        self.assertEqual(['a', 'c'], [key for key, _ in hitters.top()])
+        # New key inherits samples of replaced one.
+        self.assertEqual(6, hitters['c'].sum)
+        self.assertEqual(1, hitters.errors['c'])
+        self.assertEqual(1, hitters.to_dict()['c']['error'])
+
+    def test_heavy_key_kept(self):
+        hitters = HeavyHitters(capacity=4)
+        for i in range(100):
+            hitters.add('heavy', 10)
+            hitters.add('light{0}'.format(i))
+        self.assertEqual(4, len(hitters))
+        self.assertEqual(('heavy', 1000), (hitters.top(1)[0][0],
+                                           hitters.top(1)[0][1].sum))
+
+    def test_snapshot(self):
+        hitters = HeavyHitters(capacity=2)
+        hitters.add('a', 3)
+        snapshot = hitters.snapshot(reset=True)
+        self.assertIsInstance(snapshot, HeavyHitters)
+        self.assertEqual(2, snapshot.capacity)
+        self.assertEqual(3, snapshot['a'].sum)
+        self.assertEqual(0, len(hitters))
+        snapshot.merge(HeavyHitters().merge({'b': snapshot['a']}))
+        self.assertEqual(['a', 'b'], sorted(snapshot))
+
+    def test_pickle(self):
+        hitters = HeavyHitters(capacity=1)
+        hitters.add('a', 1)
+        hitters.add('b', 2)
+        hitters = pickle.loads(pickle.dumps(hitters))
+        self.assertEqual(1, hitters.capacity)
+        self.assertEqual(3, hitters['b'].sum)
+        self.assertEqual({'b': 1}, hitters.errors)
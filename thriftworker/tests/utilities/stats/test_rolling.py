@@ -0,0 +1,84 @@
+from __future__ import absolute_import
+
+import pickle
+
+from thriftworker.tests.utils import TestCase
+from thriftworker.utils.stats import RollingCounter, RollingTimer, \
+    Counters, Timers
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRolling(TestCase):
+
+    def setUp(self):
+        super(TestRolling, self).setUp()
+        self.clock = Clock()
+
+    def test_rotate(self):
+        counter = RollingCounter(period=10, buckets=5, clock=self.clock)
+        counter.add(1)
+        self.clock.now = 4.0
+        counter.add(2)
+        self.assertEqual(3, int(counter.snapshot()))
+        self.clock.now = 10.0
+        self.assertEqual(2, int(counter.snapshot()))
+        self.clock.now = 14.0
+        self.assertEqual(0, int(counter.snapshot()))
+
+    def test_long_pause(self):
+        timer = RollingTimer(period=10, buckets=5, clock=self.clock)
+        timer += 1
+        self.clock.now = 1000.0
+        self.assertEqual(0, timer.snapshot().count)
+        timer += 3
+        self.assertEqual(3, timer.snapshot().max)
+
+    def test_snapshot_reset(self):
+        timer = RollingTimer(period=10, buckets=5, clock=self.clock)
+        timer.add(1)
+        self.clock.now = 2.0
+        timer.add(2)
+        snapshot = timer.snapshot(reset=True)
+        self.assertEqual(2, snapshot.count)
+        self.assertEqual(1, snapshot.min)
+        self.assertEqual(0, timer.snapshot().count)
+
+    def test_merge(self):
+        timer, other = RollingTimer(), RollingTimer()
+        timer.add(1)
+        other.add(2)
+        timer.merge(other)
+        self.assertEqual(2, timer.snapshot().count)
+
+    def test_bad_period(self):
+        with self.assertRaises(ValueError):
+            RollingCounter(period=0)
+
+    def test_collections(self):
+        counters = Counters(period=60)
+        counters['a'] += 2
+        self.assertEqual(2, counters.to_dict()['a']['sum'])
+        timers = Timers(period=60)
+        timers['a'] += 2
+        self.assertEqual(2, timers.to_dict()['a']['max'])
+
+    def test_pickle(self):
+        counters = pickle.loads(pickle.dumps(Counters(period=60)))
+        counters['a'] += 2
+        counters = pickle.loads(pickle.dumps(counters))
+        self.assertEqual(60, counters.period)
+        self.assertEqual(2, counters.to_dict()['a']['sum'])
+        counters['a'] += 1
+        self.assertEqual(3, counters.to_dict()['a']['sum'])
+        timers = Timers(period=60)
+        timers['a'] += 2
+        timers = pickle.loads(pickle.dumps(timers))
+        self.assertEqual(2, timers.to_dict()['a']['max'])
@@ -1,7 +1,9 @@
 from __future__ import absolute_import
 
+import pickle
+
 from thriftworker.tests.utils import TestCase
-from thriftworker.utils.stats import Timer
+from thriftworker.utils.stats import Timer, Timers
 
 
 class TestTimer(TestCase):
@@ -28,3 +30,91 @@ class TestTimer(TestCase):
         self.timer.add(1.0)
         self.timer.add(1.0)
         self.assertEqual(2, len(self.timer))
+
+    def test_min_max(self):
+        for sample in (3.0, 1.0, 2.0):
+            self.timer.add(sample)
+        self.assertEqual(1.0, self.timer.min)
+        self.assertEqual(3.0, self.timer.max)
+
+    def test_quantiles(self):
+        timer = Timer(quantiles=[0.9999, 0.5])
+        self.assertEqual((0.5, 0.9999), timer.quantiles)
+        for sample in range(1, 10001):
+            timer.add(sample / 1000.0)
+        self.assertAlmostEqual(5.0, timer.query(0.5), delta=5.0 * 0.01)
+        self.assertAlmostEqual(9.999, timer.query(0.9999),
+                               delta=9.999 * 0.01)
+        self.assertEqual(['p50', 'p99.99'], sorted(timer.query_all()))
+
+    def test_bad_quantiles(self):
+        with self.assertRaises(ValueError):
+            Timer(quantiles=[1.0])
+
+    def test_merge(self):
+        other = Timer()
+        for sample in range(1, 101):
+            (self.timer if sample % 2 else other).add(sample)
+        self.timer.merge(other)
+        self.assertEqual(100, self.timer.count)
+        self.assertEqual(1, self.timer.min)
+        self.assertEqual(100, self.timer.max)
+        self.assertAlmostEqual(99, self.timer.query(0.99), delta=1)
+
+    def test_merge_different_accuracy(self):
+        with self.assertRaises(ValueError):
+            self.timer.merge(Timer(eps=0.05))
+
+    def test_snapshot(self):
+        self.timer.add(1)
+        snapshot = self.timer.snapshot(reset=True)
+        self.assertEqual(1, snapshot.count)
+        self.assertEqual(1, snapshot.query(0.5))
+        self.assertEqual(0, self.timer.count)
+        self.assertEqual(0, self.timer.query(0.5))
+
+    def test_subtract(self):
+        for sample in range(1, 51):
+            self.timer.add(sample)
+        previous = self.timer.snapshot()
+        for sample in range(51, 101):
+            self.timer.add(sample)
+        delta = self.timer.snapshot().subtract(previous)
+        self.assertEqual(50, delta.count)
+        self.assertEqual(sum(range(51, 101)), delta.sum)
+        self.assertAlmostEqual(51, delta.min, delta=1)
+        self.assertEqual(100, delta.max)
+        self.assertAlmostEqual(75, delta.query(0.5), delta=1)
+        empty = self.timer.snapshot().subtract(self.timer)
+        self.assertEqual((0, 0), (empty.count, empty.query(0.5)))
+        with self.assertRaises(ValueError):
+            delta.subtract(Timer(eps=0.05))
+
+    def test_pickle(self):
+        for sample in range(1, 101):
+            self.timer.add(sample)
+        timer = pickle.loads(pickle.dumps(self.timer))
+        self.assertEqual(self.timer.count, timer.count)
+        self.assertEqual(self.timer.query(0.5), timer.query(0.5))
+        self.assertEqual(self.timer.quantiles, timer.quantiles)
+
+
+class TestTimers(TestCase):
+
+    def test_merge(self):
+        timers, other = Timers(quantiles=[0.999]), Timers(quantiles=[0.999])
+        timers['a'].add(1)
+        other['a'].add(2)
+        other['b'].add(3)
+        timers.merge(other)
+        self.assertEqual(2, timers['a'].count)
+        stats = timers.to_dict()
+        self.assertEqual({'p99.9': 3.0}, stats['b']['quantiles'])
+
+    def test_snapshot(self):
+        timers = Timers(quantiles=[0.9])
+        timers['a'].add(1)
+        snapshot = timers.snapshot(reset=True)
+        self.assertEqual((0.9,), snapshot['a'].quantiles)
+        self.assertEqual(1, snapshot['a'].count)
+        self.assertEqual(0, timers['a'].count)
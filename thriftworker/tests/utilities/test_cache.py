@@ -0,0 +1,58 @@
+from __future__ import absolute_import
+
+from mock import patch
+
+from thriftworker.tests.utils import TestCase
+from thriftworker.utils.cache import ResponseCache
+
+
+class TestResponseCache(TestCase):
+
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.cache = ResponseCache(['method'], maxsize=32, ttl=10)
+
+    def test_contains(self):
+        self.assertIn('method', self.cache)
+        self.assertNotIn('other', self.cache)
+
+    def test_get_set(self):
+        key, value = ('method', 'args'), (2, 'result')
+        self.assertIsNone(self.cache.get(key))
+        self.cache.set(key, value)
+        self.assertEqual(value, self.cache.get(key))
+        self.assertEqual(1, self.cache.hits.count)
+        self.assertEqual(1, self.cache.misses.count)
+        self.assertEqual(len('method' 'args' 'result'), self.cache.size)
+
+    def test_eviction(self):
+        first, second = ('method', 'a' * 12), ('method', 'b' * 12)
+        self.cache.set(first, (2, 'x'))
+        self.cache.set(second, (2, 'y'))
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual(1, self.cache.evictions.count)
+        self.assertIsNone(self.cache.get(first))
+        self.assertEqual((2, 'y'), self.cache.get(second))
+
+    def test_stats(self):
+        first, second = ('method', 'a' * 12), ('method', 'b' * 12)
+        self.cache.set(first, (2, 'x'))
+        self.cache.get(first)
+        self.cache.set(second, (2, 'y'))
+        self.cache.get(first)
+        stats = self.cache.stats()
+        self.assertEqual({'hits': 1, 'misses': 1, 'evictions': 1},
+                         {key: counter.count
+                          for key, counter in stats.items()})
+
+    def test_too_large(self):
+        self.cache.set(('method', 'a' * 64), (2, ''))
+        self.assertEqual(0, len(self.cache))
+
+    def test_ttl(self):
+        key = ('method', 'args')
+        with patch('thriftworker.utils.cache.monotonic', return_value=0):
+            self.cache.set(key, (2, 'result'))
+        with patch('thriftworker.utils.cache.monotonic', return_value=11):
+            self.assertIsNone(self.cache.get(key))
+        self.assertEqual(0, self.cache.size)
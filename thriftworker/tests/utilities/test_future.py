@@ -0,0 +1,53 @@
+from __future__ import absolute_import
+
+from threading import Thread
+
+from mock import Mock
+
+from thriftworker.utils.future import Future
+from thriftworker.tests.utils import TestCase
+
+
+class TestFuture(TestCase):
+
+    def test_result(self):
+        future = Future()
+        self.assertFalse(future.done())
+        thread = Thread(target=future.set_result, args=(42,))
+        thread.start()
+        self.assertEqual(42, future.result(timeout=5.0))
+        thread.join()
+        self.assertTrue(future.done())
+        self.assertIsNone(future.exception())
+
+    def test_exception(self):
+        future = Future()
+        future.set_exception(ValueError('error'))
+        self.assertRaises(ValueError, future.result)
+        self.assertIsInstance(future.exception(), ValueError)
+
+    def test_timeout(self):
+        self.assertRaises(RuntimeError, Future().result, timeout=0.01)
+
+    def test_complete_twice(self):
+        future = Future()
+        future.set_result(1)
+        self.assertRaises(RuntimeError, future.set_result, 2)
+
+    def test_callbacks(self):
+        future = Future()
+        before, after = Mock(), Mock()
+        future.add_done_callback(before)
+        self.assertFalse(before.called)
+        future.set_result(1)
+        before.assert_called_once_with(future)
+        future.add_done_callback(after)
+        after.assert_called_once_with(future)
+
+    def test_chain(self):
+        future = Future()
+        chained = future.chain(lambda source: source.result() * 2)
+        failed = chained.chain(lambda source: 1 / 0)
+        future.set_result(21)
+        self.assertEqual(42, chained.result())
+        self.assertRaises(ZeroDivisionError, failed.result)
@@ -5,7 +5,8 @@ from pyuv import Async
 
 from thriftworker.tests.utils import TestCase, CustomAppMixin, \
     StartStopLoopMixin
-from thriftworker.utils.loop import in_loop
+from thriftworker.utils.loop import in_loop, submit, submit_many, \
+    wait_all
 
 
 class TestInLoop(StartStopLoopMixin, TestCase):
@@ -55,6 +56,37 @@ class TestInLoop(StartStopLoopMixin, TestCase):
         with self.assertRaises(CustomException):
             Entity().some_method()
 
+    def test_submit(self):
+        mock = Mock(return_value=42)
+
+        class Entity(object):
+
+            @in_loop
+            def some_method(self, arg):
+                return mock(arg)
+
+        self.assertEqual([42], wait_all([Entity().some_method.submit(1)]))
+        mock.assert_called_once_with(1)
+
+    def test_submit_many(self):
+        calls = []
+
+        def func(*args, **kwargs):
+            calls.append((args, kwargs))
+            return len(calls)
+
+        futures = submit_many([(func,), (func, (1,)), (func, (), {'a': 2})])
+        self.assertEqual([1, 2, 3], wait_all(futures))
+        self.assertEqual([((), {}), ((1,), {}), ((), {'a': 2})], calls)
+
+    def test_wait_all_exception(self):
+        mock = Mock(return_value=None)
+        futures = [submit(lambda: 1 / 0), submit(mock)]
+        with self.assertRaises(ZeroDivisionError):
+            wait_all(futures)
+        self.assertTrue(futures[1].done())
+        mock.assert_called_once_with()
+
 
 class TestOutsideLoop(CustomAppMixin, TestCase):
 
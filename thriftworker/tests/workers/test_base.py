@@ -1,8 +1,17 @@
 from __future__ import absolute_import
 
-from mock import Mock
+from cStringIO import StringIO
+
+from mock import Mock, patch
+from thrift.Thrift import TMessageType
+from thrift.transport.TTransport import TMemoryBuffer
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+from thrift.protocol.TMultiplexedProtocol import TMultiplexedProtocol
 
 from thriftworker.workers.base import BaseWorker
+from thriftworker.workers.shedding import RejectNewest
+from thriftworker.workers.coalescing import Coalescer
+from thriftworker.utils.cache import ResponseCache
 from thriftworker.tests.utils import TestCase, start_stop_ctx
 
 from .utils import WorkerMixin
@@ -42,7 +51,7 @@ class TestBaseWorker(WorkerMixin, TestCase):
 
     def test_callback(self):
         connection, data, request_id, result = \
-            Mock(), object(), object(), (None, object())
+            Mock(), object(), object(), (None, b'response')
         connection.is_waiting.return_value = True
         with start_stop_ctx(self.create_worker()) as worker:
             request = self.Worker.Request(
@@ -55,3 +64,183 @@ class TestBaseWorker(WorkerMixin, TestCase):
             self.assertTrue(args[0])
             self.assertIs(result[1], args[1])
             self.assertIs(request_id, args[2])
+
+    def test_timeline(self):
+        connection, data, request_id = Mock(), StringIO('data'), object()
+        processor = Mock(return_value=('method', 'response'))
+        with patch.object(self.app.services, 'create_processor',
+                          return_value=processor), \
+                start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer(self.service_name)
+            producer(connection, data, request_id)
+            task, callback = worker.consumer.call_args[0]
+            callback(task())
+            method_name = '{0}::method'.format(self.service_name)
+            self.assertNotIn(method_name, self.app.write_timers)
+            # Response is written to socket.
+            connection.ready.call_args[0][3](None)
+        for timers in (self.app.queue_timers, self.app.execution_timers,
+                       self.app.handback_timers, self.app.write_timers,
+                       self.app.dispatching_timers):
+            self.assertEqual(1, timers[method_name].count)
+            self.assertGreaterEqual(timers[method_name].min, 0)
+
+    def test_sizes(self):
+        connection, data, request_id = Mock(), StringIO('data'), object()
+        processor = Mock(return_value=('method', 'response'))
+        with patch.object(self.app.services, 'create_processor',
+                          return_value=processor), \
+                start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer(self.service_name)
+            producer(connection, data, request_id, None, None, 4)
+            task, callback = worker.consumer.call_args[0]
+            callback(task())
+            method_name = '{0}::method'.format(self.service_name)
+            # Size of response is known when it's written.
+            self.assertNotIn(method_name, self.app.response_sizes)
+            connection.ready.call_args[0][3](None)
+        self.assertEqual(4, self.app.request_sizes[method_name].sum)
+        self.assertEqual(len('response'),
+                         self.app.response_sizes[method_name].sum)
+
+    def test_shedding_producer(self):
+        self.app.services.register(self.service_name, self.processor,
+                                   shedding=RejectNewest(maxsize=1))
+        transport = TMemoryBuffer()
+        TBinaryProtocol(transport).writeMessageBegin(
+            'method', TMessageType.CALL, 0)
+        data = transport.getvalue()
+        with start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer(self.service_name)
+            connections = [Mock() for _ in xrange(worker.pool_size + 2)]
+            for request_id, connection in enumerate(connections):
+                producer(connection, StringIO(data), request_id)
+            self.assertEqual(worker.pool_size, worker.consumer.call_count)
+            self.assertFalse(connections[-2].ready.called)
+            self.assertEqual(1, connections[-1].ready.call_count)
+            method_name = self.service_name + '::method'
+            self.assertEqual(1, int(self.app.shedding_counters[method_name]))
+            all_ok, response, _, written = connections[-1].ready.call_args[0]
+            written(None)
+            self.assertEqual(len(response),
+                             self.app.response_sizes[method_name].sum)
+
+    def test_cache_producer(self):
+        cache = ResponseCache(['method'])
+        self.app.services.register(self.service_name, self.processor,
+                                   cache=cache)
+
+        def create_message(message_type, seqid, body):
+            transport = TMemoryBuffer()
+            TBinaryProtocol(transport).writeMessageBegin(
+                'method', message_type, seqid)
+            return transport.getvalue() + body
+
+        with start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer(self.service_name)
+            connection = Mock()
+            producer(connection, StringIO(
+                create_message(TMessageType.CALL, 1, 'args')), 1)
+            self.assertEqual(1, worker.consumer.call_count)
+            task, callback = worker.consumer.call_args[0]
+            response = create_message(TMessageType.REPLY, 1, 'result')
+            self.processor.process.return_value = 'method'
+            with patch('thriftworker.services.TMemoryBuffer.getvalue',
+                       return_value=response):
+                task()
+            callback(True)
+            self.assertEqual(1, len(cache))
+            producer(connection, StringIO(
+                create_message(TMessageType.CALL, 2, 'args')), 2)
+            self.assertEqual(1, worker.consumer.call_count)
+            self.assertEqual(
+                (True, create_message(TMessageType.REPLY, 2, 'result'), 2),
+                connection.ready.call_args[0][:3])
+            connection.ready.call_args[0][3](None)
+            self.assertEqual(1, self.app.response_sizes[
+                self.service_name + '::method'].count)
+
+    def test_coalescing_producer(self):
+        self.app.services.register(self.service_name, self.processor,
+                                   coalescing=Coalescer(['method']))
+
+        def create_message(message_type, seqid, body):
+            transport = TMemoryBuffer()
+            TBinaryProtocol(transport).writeMessageBegin(
+                'method', message_type, seqid)
+            return transport.getvalue() + body
+
+        with start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer(self.service_name)
+            leader, follower = Mock(), Mock()
+            producer(leader, StringIO(
+                create_message(TMessageType.CALL, 1, 'args')), 1)
+            producer(follower, StringIO(
+                create_message(TMessageType.CALL, 2, 'args')), 2)
+            self.assertEqual(1, worker.consumer.call_count)
+            task, callback = worker.consumer.call_args[0]
+            response = create_message(TMessageType.REPLY, 1, 'result')
+            self.processor.process.return_value = 'method'
+            with patch('thriftworker.services.TMemoryBuffer.getvalue',
+                       return_value=response):
+                task()
+            callback(True)
+            self.assertEqual((True, response, 1),
+                             leader.ready.call_args[0][:3])
+            self.assertEqual(
+                (True, create_message(TMessageType.REPLY, 2, 'result'), 2),
+                follower.ready.call_args[0][:3])
+
+    def test_shared_producer(self):
+        self.app.services.register(self.service_name, self.processor,
+                                   shedding=RejectNewest(maxsize=1))
+        self.app.services.register_multiplexed('Multiplexed',
+                                               [self.service_name])
+        worker = self.create_worker()
+        with patch.object(worker, '_create_producer',
+                          wraps=worker._create_producer) as create:
+            direct = worker.create_producer(self.service_name)
+            worker.create_producer('Multiplexed')
+            self.assertIs(direct, worker.create_producer(self.service_name))
+        self.assertEqual([self.service_name, 'Multiplexed'],
+                         [call[0][0] for call in create.call_args_list])
+
+    def test_multiplexed_producer(self):
+        self.app.services.register_multiplexed('Multiplexed',
+                                               [self.service_name])
+        transport = TMemoryBuffer()
+        TMultiplexedProtocol(TBinaryProtocol(transport), self.service_name) \
+            .writeMessageBegin('method', TMessageType.CALL, 5)
+        data = transport.getvalue() + 'args'
+        transport = TMemoryBuffer()
+        TBinaryProtocol(transport).writeMessageBegin(
+            'method', TMessageType.CALL, 5)
+        expected = transport.getvalue() + 'args'
+        with start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer('Multiplexed')
+            connection = Mock()
+            producer(connection, StringIO(data), 1)
+            self.assertEqual(1, worker.consumer.call_count)
+            task, callback = worker.consumer.call_args[0]
+            request = task.args[0]
+            self.assertEqual(self.service_name, request.service)
+            self.assertEqual('method', request.method)
+            self.assertEqual(expected, request.message_buffer.getvalue())
+            self.assertEqual(len(expected) - 4, request.header.size)
+
+    def test_multiplexed_unknown_service(self):
+        self.app.services.register_multiplexed('Multiplexed',
+                                               [self.service_name])
+        with start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer('Multiplexed')
+            for service in ('OtherService', None):
+                transport = TMemoryBuffer()
+                protocol = TBinaryProtocol(transport)
+                if service is not None:
+                    protocol = TMultiplexedProtocol(protocol, service)
+                protocol.writeMessageBegin('method', TMessageType.CALL, 1)
+                connection = Mock()
+                producer(connection, StringIO(transport.getvalue()), 1)
+                self.assertEqual((False, None, 1),
+                                 connection.ready.call_args[0])
+            self.assertFalse(worker.consumer.called)
@@ -0,0 +1,199 @@
+from __future__ import absolute_import
+
+from cStringIO import StringIO
+
+from mock import Mock
+from pyuv import Loop
+from thrift.Thrift import TApplicationException, TMessageType, TType
+from thrift.transport.TTransport import TMemoryBuffer
+from thrift.protocol.TBase import TBase, TExceptionBase
+from thrift.protocol.TBinaryProtocol import TBinaryProtocol
+
+from thriftworker.workers.base import BaseWorker
+from thriftworker.workers.batching import Batcher, Collector
+from thriftworker.tests.utils import TestCase, start_stop_ctx
+
+from .utils import WorkerMixin
+
+
+class ScoreError(TExceptionBase):
+
+    __slots__ = ['message']
+
+    thrift_spec = (
+        None,
+        (1, TType.STRING, 'message', None, None),
+    )
+
+    def __init__(self, message=None):
+        self.message = message
+
+
+class score_args(TBase):
+
+    __slots__ = ['value']
+
+    thrift_spec = (
+        None,
+        (1, TType.I32, 'value', None, None),
+    )
+
+    def __init__(self, value=None):
+        self.value = value
+
+
+class score_result(TBase):
+
+    __slots__ = ['success', 'error']
+
+    thrift_spec = (
+        (0, TType.I32, 'success', None, None),
+        (1, TType.STRUCT, 'error', (ScoreError, ScoreError.thrift_spec),
+         None),
+    )
+
+    def __init__(self, success=None, error=None):
+        self.success = success
+        self.error = error
+
+
+class Processor(object):
+    """Processor generated in this module."""
+
+
+class Request(object):
+
+    def __init__(self, method, receipt_time=0):
+        self.method = method
+        self.receipt_time = receipt_time
+
+
+def create_call(value, seqid):
+    transport = TMemoryBuffer()
+    protocol = TBinaryProtocol(transport)
+    protocol.writeMessageBegin('score', TMessageType.CALL, seqid)
+    score_args(value).write(protocol)
+    protocol.writeMessageEnd()
+    return transport.getvalue()
+
+
+def read_reply(data):
+    protocol = TBinaryProtocol(TMemoryBuffer(data))
+    method, message_type, seqid = protocol.readMessageBegin()
+    if message_type == TMessageType.EXCEPTION:
+        result = TApplicationException()
+    else:
+        result = score_result()
+    result.read(protocol)
+    return seqid, result
+
+
+class TestBatcher(TestCase):
+
+    def setUp(self):
+        super(TestBatcher, self).setUp()
+        self.batcher = Batcher({'score': Mock()}, window=5.0, maxsize=3)
+
+    def test_contains(self):
+        self.assertIn('score', self.batcher)
+        self.assertNotIn('other', self.batcher)
+
+    def test_put(self):
+        requests = [Request('score', i) for i in xrange(3)]
+        self.assertIsNone(self.batcher.put(requests[0]))
+        self.assertIsNone(self.batcher.put(requests[1]))
+        self.assertEqual(2, len(self.batcher))
+        self.assertEqual(requests, self.batcher.put(requests[2]))
+        self.assertEqual(0, len(self.batcher))
+        self.assertEqual(3, self.batcher.sizes['score'].max)
+        self.assertEqual(2, self.batcher.delays['score'].max)
+
+    def test_pop(self):
+        request = Request('score')
+        self.assertIsNone(self.batcher.pop('score', 0))
+        self.batcher.put(request)
+        self.assertEqual([request], self.batcher.pop('score', 4))
+        self.assertEqual(['score'], self.batcher.to_dict().keys())
+
+    def test_collector_window(self):
+        loop = Loop()
+        submit = Mock()
+        collector = Collector(loop, self.batcher, submit)
+        requests = [Request('score', loop.now()) for _ in xrange(2)]
+        for request in requests:
+            collector.put(request)
+        self.assertFalse(submit.called)
+        loop.run()
+        submit.assert_called_once_with('score', requests)
+
+    def test_collector_close(self):
+        loop = Loop()
+        submit = Mock()
+        collector = Collector(loop, self.batcher, submit)
+        request = Request('score', loop.now())
+        collector.put(request)
+        timer = collector.timers['score']
+        collector.close()
+        submit.assert_called_once_with('score', [request])
+        self.assertTrue(timer.closed)
+        self.assertEqual({}, collector.timers)
+
+
+class Worker(BaseWorker):
+
+    def __init__(self, consumer):
+        self.consumer = consumer
+        super(Worker, self).__init__()
+
+    def create_consumer(self):
+        return self.consumer
+
+
+class TestBatchingWorker(WorkerMixin, TestCase):
+
+    Worker = Worker
+
+    def test_batch(self):
+
+        def handler(arguments):
+            return [ScoreError('negative') if args.value < 0 else
+                    ValueError('zero') if args.value == 0 else
+                    args.value * 2 for args in arguments]
+
+        self.app.services.register(
+            self.service_name, Processor(),
+            batching=Batcher({'score': handler}, window=10000, maxsize=3))
+        connections = [Mock() for _ in xrange(3)]
+        with start_stop_ctx(self.Worker(Mock())) as worker:
+            producer = worker.create_producer(self.service_name)
+            for seqid, (value, connection) in enumerate(
+                    zip([21, -1, 0], connections)):
+                producer(connection, StringIO(create_call(value, seqid)),
+                         seqid)
+            self.assertEqual(1, worker.consumer.call_count)
+            task, callback = worker.consumer.call_args[0]
+            self.assertTrue(task())
+            callback(True)
+        replies = [read_reply(connection.ready.call_args[0][1])
+                   for connection in connections]
+        self.assertEqual((0, score_result(success=42)), replies[0])
+        self.assertEqual((1, score_result(error=ScoreError('negative'))),
+                         replies[1])
+        self.assertEqual(2, replies[2][0])
+        self.assertEqual(TApplicationException.INTERNAL_ERROR,
+                         replies[2][1].type)
+        self.assertEqual(3, self.app.execution_timers[
+            self.service_name + '::score'].count)
+        self.assertEqual(3, self.app.batch_sizes['score'].max)
+        self.assertEqual(1, self.app.batch_delays['score'].count)
+
+    def test_flush_on_stop(self):
+        self.app.services.register(
+            self.service_name, Processor(),
+            batching=Batcher({'score': lambda arguments: arguments},
+                             window=10000, maxsize=3))
+        with start_stop_ctx(self.Worker(Mock())) as worker:
+            producer = worker.create_producer(self.service_name)
+            producer(Mock(), StringIO(create_call(1, 0)), 0)
+            self.assertFalse(worker.consumer.called)
+        self.assertEqual(1, worker.consumer.call_count)
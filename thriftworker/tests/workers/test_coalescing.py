@@ -0,0 +1,53 @@
+from __future__ import absolute_import
+
+from thriftworker.workers.coalescing import Coalescer
+from thriftworker.tests.utils import TestCase
+
+
+class Request(object):
+
+    def __init__(self, key):
+        self.key = key
+
+
+class TestCoalescer(TestCase):
+
+    def setUp(self):
+        super(TestCoalescer, self).setUp()
+        self.coalescer = Coalescer(['method'])
+
+    def test_contains(self):
+        self.assertIn('method', self.coalescer)
+        self.assertNotIn('other', self.coalescer)
+
+    def test_attach(self):
+        leader = Request(('method', 'args'))
+        follower = Request(('method', 'args'))
+        other = Request(('method', 'other'))
+        self.assertFalse(self.coalescer.attach(leader))
+        self.assertTrue(self.coalescer.attach(follower))
+        self.assertFalse(self.coalescer.attach(other))
+        self.assertEqual(2, len(self.coalescer))
+        self.assertEqual([follower], self.coalescer.detach(leader))
+        self.assertEqual([], self.coalescer.detach(other))
+        self.assertEqual(0, len(self.coalescer))
+
+    def test_ratio(self):
+        self.assertEqual(0.0, self.coalescer.ratio('method'))
+        for _ in xrange(4):
+            self.coalescer.attach(Request(('method', 'args')))
+        self.assertEqual(0.75, self.coalescer.ratio('method'))
+        self.assertEqual({'method': {'requests': 4,
+                                     'coalesced': 3,
+                                     'ratio': 0.75}},
+                         self.coalescer.to_dict())
+
+    def test_stats(self):
+        for _ in xrange(2):
+            self.coalescer.attach(Request(('method', 'args')))
+        stats = self.coalescer.stats()
+        self.assertEqual(2, stats['method.requests'].count)
+        self.assertEqual(1, stats['method.coalesced'].count)
+        # Stats are copied.
+        self.coalescer.attach(Request(('method', 'args')))
+        self.assertEqual(2, stats['method.requests'].count)
@@ -0,0 +1,129 @@
+from __future__ import absolute_import
+
+from cStringIO import StringIO
+
+from mock import Mock, patch
+from thrift.Thrift import TApplicationException, TType
+
+from thriftworker.services import argument_names
+from thriftworker.workers.base import BaseWorker
+from thriftworker.utils.future import Future
+from thriftworker.tests.utils import TestCase, start_stop_ctx
+
+from .utils import WorkerMixin
+from .test_batching import Processor, ScoreError, score_result, \
+    create_call, read_reply
+
+
+class Worker(BaseWorker):
+
+    def __init__(self, consumer):
+        self.consumer = consumer
+        super(Worker, self).__init__()
+
+    def create_consumer(self):
+        return self.consumer
+
+
+class Handler(object):
+
+    def __init__(self):
+        self.futures = []
+
+    def score(self, value):
+        if value == 0:
+            raise ZeroDivisionError('zero')
+        if value < 0:
+            raise ScoreError('negative')
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+class swapped_args(object):
+
+    thrift_spec = (
+        None,
+        (1, TType.I32, 'a', None, None),
+        (2, TType.I32, 'c', None, None),
+        (3, TType.I32, 'b', None, None),
+    )
+
+    def __init__(self, a=None, b=None, c=None):
+        self.a, self.b, self.c = a, b, c
+
+
+class swapped_slots_args(swapped_args):
+
+    __slots__ = ['a', 'b', 'c']
+
+
+class TestArgumentNames(TestCase):
+
+    def test_declaration_order(self):
+        self.assertEqual(('a', 'b', 'c'), argument_names(swapped_args))
+        self.assertEqual(('a', 'b', 'c'), argument_names(swapped_slots_args))
+
+
+class TestDeferred(WorkerMixin, TestCase):
+
+    Worker = Worker
+
+    def setUp(self):
+        super(TestDeferred, self).setUp()
+        processor = Processor()
+        handler = Handler()
+        self.futures = handler.futures
+        self.app.services.register(self.service_name, processor,
+                                   deferred=['score'], handler=handler)
+
+    def process(self, worker, value, seqid):
+        producer = worker.create_producer(self.service_name)
+        connection = Mock()
+        # Create child mock before loop thread may access it.
+        connection.ready
+        producer(connection, StringIO(create_call(value, seqid)), seqid)
+        task, callback = worker.consumer.call_args[0]
+        self.assertTrue(task())
+        callback(True)
+        return connection
+
+    def test_deferred(self):
+        with start_stop_ctx(self.Worker(Mock())) as worker:
+            connection = self.process(worker, 21, 7)
+            self.assertFalse(connection.ready.called)
+            self.assertEqual(0, int(worker.concurrency))
+            self.futures[0].set_result(42)
+            self.wait_for_predicate(
+                lambda: not connection.ready.call_args_list)
+        self.assertEqual((7, score_result(success=42)),
+                         read_reply(connection.ready.call_args[0][1]))
+
+    def test_deferred_exception(self):
+        with start_stop_ctx(self.Worker(Mock())) as worker:
+            connection = self.process(worker, 21, 1)
+            self.futures[0].set_exception(ScoreError('late'))
+            self.wait_for_predicate(
+                lambda: not connection.ready.call_args_list)
+        self.assertEqual((1, score_result(error=ScoreError('late'))),
+                         read_reply(connection.ready.call_args[0][1]))
+
+    def test_immediate(self):
+        with start_stop_ctx(self.Worker(Mock())) as worker:
+            connection = self.process(worker, -1, 3)
+        self.assertEqual((3, score_result(error=ScoreError('negative'))),
+                         read_reply(connection.ready.call_args[0][1]))
+
+    def test_undeclared_exception(self):
+        with patch('thriftworker.services.logger') as logger, \
+                start_stop_ctx(self.Worker(Mock())) as worker:
+            connection = self.process(worker, 0, 5)
+        self.assertEqual(1, logger.exception.call_count)
+        seqid, result = read_reply(connection.ready.call_args[0][1])
+        self.assertEqual(5, seqid)
+        self.assertIsInstance(result, TApplicationException)
+
+    def test_handler_required(self):
+        with self.assertRaises(ValueError):
+            self.app.services.register('Other', Processor(),
+                                       deferred=['score'])
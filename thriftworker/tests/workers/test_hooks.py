@@ -0,0 +1,95 @@
+from __future__ import absolute_import
+
+from cStringIO import StringIO
+
+from mock import Mock, patch
+
+from thriftworker.workers.hooks import Hook, Hooks, EVENTS
+from thriftworker.tests.utils import TestCase, start_stop_ctx
+
+from .test_base import Worker
+from .utils import WorkerMixin
+
+
+class RecordingHook(Hook):
+
+    def __init__(self):
+        self.events = []
+
+    def __getattribute__(self, name):
+        if name in EVENTS:
+            return lambda request: self.events.append(name)
+        return super(RecordingHook, self).__getattribute__(name)
+
+
+class TestHooks(TestCase):
+
+    def test_register(self):
+        hooks = Hooks()
+        self.assertFalse(hooks)
+        hook = Hook()
+        hooks.register(hook, rate=3)
+        self.assertEqual([(hook, 3)], list(hooks))
+        self.assertRaises(ValueError, hooks.register, hook, rate=0)
+
+    def test_sample(self):
+        hooks = Hooks()
+        always, sometimes = Hook(), Hook()
+        hooks.register(always)
+        hooks.register(sometimes, rate=4)
+        samples = [hooks.sample() for _ in range(8)]
+        self.assertTrue(all(always in sample for sample in samples))
+        self.assertEqual(2, sum(sometimes in sample for sample in samples))
+
+    def test_failed_hook(self):
+        hooks = Hooks()
+        hook = Mock()
+        hook.received.side_effect = ValueError('boom')
+        hooks.register(hook)
+        Request = hooks.subclass(Worker.Request)
+        with patch('thriftworker.workers.hooks.logger') as logger:
+            request = Request(Mock(), Mock(), StringIO(''), 1, 'Service')
+        self.assertEqual(1, logger.exception.call_count)
+        self.assertEqual((hook,), request.hooks)
+
+
+class TestWorkerHooks(WorkerMixin, TestCase):
+
+    Worker = Worker
+
+    def create_worker(self):
+        return self.Worker(Mock())
+
+    def test_no_hooks(self):
+        worker = self.create_worker()
+        self.assertIs(self.Worker.Request, worker.request_cls)
+
+    def test_lifecycle(self):
+        hook = RecordingHook()
+        self.app.hooks.register(hook)
+        connection = Mock()
+        processor = Mock(return_value=('method', 'response'))
+        with patch.object(self.app.services, 'create_processor',
+                          return_value=processor), \
+                start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer(self.service_name)
+            producer(connection, StringIO('data'), 1)
+            task, callback = worker.consumer.call_args[0]
+            callback(task())
+        self.assertEqual(list(EVENTS), hook.events)
+        self.assertEqual(1, connection.ready.call_count)
+
+    def test_unsampled(self):
+        hook = RecordingHook()
+        self.app.hooks.register(hook, rate=2)
+        processor = Mock(return_value=('method', 'response'))
+        with patch.object(self.app.services, 'create_processor',
+                          return_value=processor), \
+                start_stop_ctx(self.create_worker()) as worker:
+            producer = worker.create_producer(self.service_name)
+            for request_id in range(2):
+                producer(Mock(), StringIO('data'), request_id)
+            for task, callback in (call[0] for call in
+                                   worker.consumer.call_args_list):
+                callback(task())
+        self.assertEqual(list(EVENTS), hook.events)
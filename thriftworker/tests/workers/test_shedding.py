@@ -0,0 +1,112 @@
+from __future__ import absolute_import
+
+from mock import Mock
+
+from thriftworker.workers.shedding import AdmissionQueue, RejectNewest, \
+    RejectOldest, CoDel, Admission
+from thriftworker.tests.utils import TestCase
+
+
+class Request(object):
+
+    def __init__(self, receipt_time=0):
+        self.receipt_time = receipt_time
+
+
+class TestAdmissionQueue(TestCase):
+
+    def test_abstract(self):
+        self.assertRaises(TypeError, AdmissionQueue)
+
+        class Queue(AdmissionQueue):
+
+            def put(self, request, now):
+                self.queue.append(request)
+
+        self.assertRaises(TypeError, Queue)
+
+
+class TestRejectNewest(TestCase):
+
+    def test_put(self):
+        queue = RejectNewest(maxsize=1)
+        first, second = Request(), Request()
+        self.assertIsNone(queue.put(first, 0))
+        self.assertIs(second, queue.put(second, 0))
+        self.assertEqual((first, []), queue.get(0))
+        self.assertEqual((None, []), queue.get(0))
+
+
+class TestRejectOldest(TestCase):
+
+    def test_put(self):
+        queue = RejectOldest(maxsize=1)
+        first, second = Request(), Request()
+        self.assertIsNone(queue.put(first, 0))
+        self.assertIs(first, queue.put(second, 0))
+        self.assertEqual((second, []), queue.get(0))
+
+
+class TestCoDel(TestCase):
+
+    def test_short_delay(self):
+        queue = CoDel(target=5, interval=100)
+        for i in xrange(3):
+            queue.put(Request(receipt_time=i), i)
+        for i in xrange(3):
+            request, shed = queue.get(i + 1)
+            self.assertIsNotNone(request)
+            self.assertEqual([], shed)
+
+    def test_long_delay(self):
+        queue = CoDel(target=5, interval=100)
+        requests = [Request(receipt_time=0) for _ in xrange(10)]
+        for request in requests:
+            queue.put(request, 0)
+        # delay above target, start to count interval
+        request, shed = queue.get(50)
+        self.assertIs(requests[0], request)
+        self.assertEqual([], shed)
+        # interval passed, shed request
+        request, shed = queue.get(200)
+        self.assertEqual([requests[1]], shed)
+        self.assertIs(requests[2], request)
+        self.assertTrue(queue.dropping)
+
+    def test_bounded(self):
+        queue = CoDel(maxsize=1)
+        first, second = Request(), Request()
+        self.assertIsNone(queue.put(first, 0))
+        self.assertIs(second, queue.put(second, 0))
+
+
+class TestAdmission(TestCase):
+
+    def setUp(self):
+        super(TestAdmission, self).setUp()
+        self.loop = Mock()
+        self.loop.now.return_value = 0
+        self.submit = Mock()
+        self.reject = Mock()
+        self.admission = Admission(self.loop, RejectNewest(maxsize=1), 1,
+                                   self.submit, self.reject)
+
+    def test_put(self):
+        first, second, third = Request(), Request(), Request()
+        self.admission.put(first)
+        self.submit.assert_called_once_with(first)
+        self.admission.put(second)
+        self.assertEqual(1, len(self.admission))
+        self.admission.put(third)
+        self.reject.assert_called_once_with(third)
+
+    def test_release(self):
+        first, second = Request(), Request()
+        self.admission.put(first)
+        self.admission.put(second)
+        self.admission.release()
+        self.assertEqual(2, self.submit.call_count)
+        self.assertIs(second, self.submit.call_args[0][0])
+        self.assertEqual(0, len(self.admission))
+        self.admission.release()
+        self.assertEqual(0, self.admission.active)
@@ -1,6 +1,9 @@
 from __future__ import absolute_import
 
-from thriftworker.workers.sync import SyncWorker
+from threading import Thread
+
+from thriftworker.workers.sync import SyncWorker, PoolTimers
+from thriftworker.utils.stats import Timers
 from thriftworker.tests.utils import TestCase
 
 from .utils import WorkerMixin
@@ -12,3 +15,31 @@ class TestSyncWorker(WorkerMixin, TestCase):
 
     def test_request(self):
         self.check_request(self.Worker())
+
+    def test_telemetry(self):
+        self.check_request(self.Worker())
+        timers = self.app.pool_timers
+        self.assertEqual(1, timers['queue_wait'].count)
+        busy = [key for key in timers if key.endswith('.busy')]
+        self.assertEqual(1, len(busy))
+        self.assertEqual(1, timers[busy[0]].count)
+
+
+class TestPoolTimers(TestCase):
+
+    def test_per_thread(self):
+        pool_timers = PoolTimers(Timers())
+        self.assertEqual(['queue_wait'], list(pool_timers.timers))
+        resolved = []
+
+        def resolve():
+            resolved.append((pool_timers.queue_wait, pool_timers.busy,
+                             pool_timers.busy))
+
+        thread = Thread(target=resolve, name='pool-thread')
+        thread.start()
+        thread.join()
+        queue_wait, busy, same = resolved[0]
+        self.assertIs(pool_timers.timers['queue_wait'], queue_wait)
+        self.assertIs(pool_timers.timers['pool-thread.busy'], busy)
+        self.assertIs(busy, same)
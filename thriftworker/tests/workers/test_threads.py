@@ -12,3 +12,25 @@ class TestThreadsWorker(WorkerMixin, TestCase):
 
     def test_request(self):
         self.check_request(self.Worker())
+
+    def test_telemetry(self):
+        self.check_request(self.Worker())
+        timers = self.app.pool_timers
+        for key in ('worker-0.busy', 'queue_wait'):
+            self.assertEqual(1, timers[key].count)
+        self.assertEqual(1, self.app.pool_counters['worker-0.completed'].count)
+        # Idle waits for request and for stop message.
+        self.assertEqual(2, timers['worker-0.idle'].count)
+        self.assertGreaterEqual(timers['lock_wait'].count, 2)
+
+    def test_queue_depth(self):
+        worker = self.Worker()
+        collector = self.app.collector
+        worker.start()
+        try:
+            collector.collect()
+        finally:
+            worker.stop()
+        self.assertEqual(1, self.app.pool_timers['queue_depth'].count)
+        self.assertEqual(0, self.app.pool_timers['queue_depth'].max)
+        self.assertEqual([], collector.samplers)
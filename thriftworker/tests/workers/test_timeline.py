@@ -0,0 +1,34 @@
+from __future__ import absolute_import
+
+from mock import patch
+
+from thriftworker.workers.timeline import Timeline, STAGES
+from thriftworker.tests.utils import TestCase
+
+
+class TestTimeline(TestCase):
+
+    def test_stages(self):
+        timeline = Timeline()
+        self.assertIsNotNone(timeline.received)
+        for stage in STAGES[1:]:
+            self.assertIsNone(getattr(timeline, stage))
+        timeline.mark('written')
+        self.assertGreaterEqual(timeline.written, timeline.received)
+
+    def test_elapsed(self):
+        with patch('thriftworker.workers.timeline.monotonic_ns',
+                   return_value=1000000):
+            timeline = Timeline()
+        self.assertIsNone(timeline.elapsed('received', 'started'))
+        with patch('thriftworker.workers.timeline.monotonic_ns',
+                   return_value=3500000):
+            timeline.mark('started')
+        self.assertEqual(2.5, timeline.elapsed('received', 'started'))
+
+    def test_intervals(self):
+        timeline = Timeline()
+        timeline.started, timeline.finished = 0, 2000000
+        self.assertEqual({'queue_wait': None, 'execution': 2.0,
+                          'handback': None, 'write': None},
+                         timeline.intervals())
@@ -21,10 +21,12 @@ class WorkerMixin(StartStopLoopMixin):
 
     def check_request(self, worker):
         connection, data, request_id = Mock(), StringIO(''), 1
+        # Create child mock before loop thread may access it.
+        ready = connection.ready
         with start_stop_ctx(worker):
             producer = worker.create_producer(self.service_name)
             producer(connection, data, request_id)
-            self.wait_for_predicate(lambda: not connection.ready.called)
+            self.wait_for_predicate(lambda: not ready.call_args_list)
             self.assertEqual(1, self.processor.process.call_count)
-            self.assertEqual(1, connection.ready.call_count)
-            self.assertEqual((True, '', 1), connection.ready.call_args[0])
+            self.assertEqual(1, ready.call_count)
+            self.assertEqual((True, '', 1), ready.call_args[0][:3])
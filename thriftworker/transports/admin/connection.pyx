@@ -0,0 +1,62 @@
+from io import BytesIO
+
+from thriftworker.transports.message import HTTP
+from thriftworker.transports.framed.connection cimport \
+    Connection as FramedConnection
+
+
+# First bytes of HTTP requests that we answer.
+cdef tuple HTTP_PREFIXES = (b'GET ', b'HEAD', b'POST')
+
+# Limit size of HTTP request head.
+cdef int MAX_REQUEST_SIZE = 8192
+
+
+cdef class Connection(FramedConnection):
+    """Connection that work with framed packets or plain HTTP requests.
+    Kind of connection is detected by first bytes, HTTP connection is
+    closed after response.
+
+    """
+
+    # Received part of HTTP request, ``None`` for framed connection.
+    cdef bytearray request
+
+    # Is kind of connection detected?
+    cdef bint detected
+
+    cdef object receive(self, object data):
+        if not self.detected:
+            self.detected = True
+            if data[:4] in HTTP_PREFIXES:
+                self.request = bytearray()
+        if self.request is None:
+            FramedConnection.receive(self, data)
+            return
+        if self.protocol is not None:
+            # Request is already passed to producer.
+            return
+        self.request.extend(data)
+        if b'\r\n\r\n' not in self.request:
+            if len(self.request) > MAX_REQUEST_SIZE:
+                self.close()
+            return
+        self.next_packet_id += 1
+        self.current_packet_id = self.next_packet_id
+        self.protocol = HTTP
+        self.produce(BytesIO(bytes(self.request)), len(self.request),
+                     self.current_packet_id, None, HTTP)
+
+    cdef object write(self, object data, object callback=None):
+        if self.request is None:
+            FramedConnection.write(self, data, callback)
+            return
+        self.account_write(len(data))
+        self.handle.write(data,
+                          self.write_done(self.cb_response_done, callback))
+
+    def cb_response_done(self, object handle, object error):
+        if error:
+            self.handle_error(error)
+        if not self.is_closed():
+            self.close()
@@ -13,7 +13,7 @@ from six import with_metaclass
 
 from thriftworker.constants import BACKLOG_SIZE
 from thriftworker.utils.mixin import LoopMixin, StartStopMixin
-from thriftworker.utils.loop import in_loop
+from thriftworker.utils.loop import in_loop, submit_many, wait_all
 from thriftworker.utils.decorators import cached_property
 from thriftworker.utils.waiter import Waiter
 
@@ -151,6 +151,9 @@ class BaseAcceptor(with_metaclass(ABCMeta, LoopMixin)):
         listen_fd = self._socket.fileno()
         worker = self.app.worker
         producer = worker.create_producer(service)
+        peer_requests = self.app.peer_requests
+        peer_responses = self.app.peer_responses
+        read_sizes = self.app.read_sizes[service]
 
         def on_close(connection):
             """Callback called when connection closed."""
@@ -177,7 +180,9 @@ class BaseAcceptor(with_metaclass(ABCMeta, LoopMixin)):
                 raise
             handle = TCP(loop)
             handle.open(fd)
-            connection = self.Connection(producer, loop, handle, addr, on_close)
+            connection = self.Connection(producer, loop, handle, addr, on_close,
+                                         peer_requests, peer_responses,
+                                         read_sizes)
             connections.register(connection)
 
         return inner_acceptor
@@ -225,8 +230,16 @@ class Acceptors(StartStopMixin, LoopMixin):
         return self.app.Acceptor
 
     def register(self, fd, name, backlog=None):
-        """Register new acceptor in pool."""
-        self._acceptors[name] = self.Acceptor(name, fd, backlog=backlog)
+        """Register new acceptor in pool. Service may specify its own
+        acceptor class.
+
+        """
+        Acceptor = self.Acceptor
+        services = self.app.services
+        if name in services and services[name].acceptor is not None:
+            Acceptor = self.app.subclass_with_self(services[name].acceptor,
+                                                   reverse='Acceptor')
+        self._acceptors[name] = Acceptor(name, fd, backlog=backlog)
 
     def start_by_name(self, name):
         """Start acceptor by name."""
@@ -238,15 +251,32 @@ class Acceptors(StartStopMixin, LoopMixin):
         acceptor = self._acceptors[name]
         self.app.hub.callback(acceptor.stop)
 
+    def _call_all(self, name, *args, **kwargs):
+        """Call given in-loop method of all registered acceptors with one
+        loop wakeup and wait for all of them. Acceptors of inline services
+        are skipped if `inline` is false.
+
+        """
+        acceptors = self._acceptors.items()
+        if not kwargs.get('inline', True):
+            services = self.app.services
+            acceptors = [(name_, acceptor) for name_, acceptor in acceptors
+                         if name_ not in services
+                         or not services[name_].inline]
+        wait_all(submit_many((getattr(acceptor, name).func, args)
+                             for _, acceptor in acceptors))
+
     def start_accepting(self):
         """Start all registered acceptors if needed."""
-        for acceptor in self._acceptors.values():
-            acceptor.start()
+        self._call_all('start')
+
+    def stop_accepting(self, callback=None, inline=True):
+        """Stop registered acceptors if needed. Acceptors of inline
+        services, like admin one, don't depend on worker pool, so they are
+        kept when `inline` is false.
 
-    def stop_accepting(self, callback=None):
-        """Stop all registered acceptors if needed."""
-        for acceptor in self._acceptors.values():
-            acceptor.stop(callback)
+        """
+        self._call_all('stop', callback, inline=inline)
 
     @property
     def connections_number(self):
@@ -273,5 +303,4 @@ class Acceptors(StartStopMixin, LoopMixin):
         if not self.empty:
             logger.warning('Not all connection closed!')
         # close existed connection
-        for acceptor in self:
-            acceptor.close()
+        self._call_all('close')
@@ -0,0 +1,314 @@
+from io import BytesIO
+
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_GET_SIZE
+
+from thriftworker.constants import MAX_FRAME_SIZE
+from thriftworker.transports.message cimport MessageHeader, peek_message, \
+    detect_protocol
+from thriftworker.transports.framed.connection cimport \
+    Connection as FramedConnection
+
+
+cdef enum:
+    T_STOP = 0
+    T_BOOL = 2
+    T_BYTE = 3
+    T_DOUBLE = 4
+    T_I16 = 6
+    T_I32 = 8
+    T_I64 = 10
+    T_STRING = 11
+    T_STRUCT = 12
+    T_MAP = 13
+    T_SET = 14
+    T_LIST = 15
+
+    MIN_MESSAGE_TYPE = 1
+    MAX_MESSAGE_TYPE = 4
+    MAX_NAME_LENGTH = 0xffff
+    BINARY_VERSION_MASK = 0xffff0000
+    BINARY_VERSION_1 = 0x80010000
+
+    # Limit nesting of values.
+    MAX_DEPTH = 64
+
+
+cdef enum StepKind:
+    # Read fields of struct until stop.
+    STEP_STRUCT = 0
+    # Read length of string.
+    STEP_STRING = 1
+    # Read header of list or set.
+    STEP_LIST_HEADER = 2
+    # Read header of map.
+    STEP_MAP_HEADER = 3
+    # Read elements of list or set.
+    STEP_LIST = 4
+    # Read keys and values of map.
+    STEP_MAP = 5
+    # Skip fixed number of bytes.
+    STEP_SKIP = 6
+
+
+cdef struct Step:
+    StepKind kind
+    int key_type
+    int value_type
+    long long remaining
+
+
+# Limit size of one message.
+cdef Py_ssize_t max_message_size = MAX_FRAME_SIZE
+
+
+class MessageError(ValueError):
+    """Message can't be parsed."""
+
+
+cdef inline int fixed_size(int ttype):
+    """Return size of value of given type or 0 if it isn't fixed."""
+    if ttype == T_BOOL or ttype == T_BYTE:
+        return 1
+    elif ttype == T_I16:
+        return 2
+    elif ttype == T_I32:
+        return 4
+    elif ttype == T_I64 or ttype == T_DOUBLE:
+        return 8
+    return 0
+
+
+cdef inline int read_i32(const unsigned char *buf):
+    return <int>((<unsigned int>buf[0] << 24) | (<unsigned int>buf[1] << 16) |
+                 (<unsigned int>buf[2] << 8) | <unsigned int>buf[3])
+
+
+cdef class MessageScanner:
+    """Find boundaries of binary messages in stream of bytes. Scanning
+    resumes where it stopped when more bytes arrive, so each byte is
+    examined once.
+
+    """
+
+    # Received bytes that don't form complete message yet.
+    cdef bytearray buffer
+
+    # Position of scanning in buffer.
+    cdef Py_ssize_t position
+
+    # Was message header read?
+    cdef bint header_done
+
+    # Stack of pending steps.
+    cdef Step stack[MAX_DEPTH]
+    cdef int depth
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.reset()
+
+    cdef void reset(self):
+        self.position = 0
+        self.header_done = False
+        self.depth = 0
+
+    cdef int push(self, StepKind kind, int key_type, int value_type,
+                  long long remaining) except -1:
+        if self.depth == MAX_DEPTH:
+            raise MessageError('too deep nesting')
+        if kind == STEP_SKIP:
+            self.check_size(remaining)
+        self.stack[self.depth].kind = kind
+        self.stack[self.depth].key_type = key_type
+        self.stack[self.depth].value_type = value_type
+        self.stack[self.depth].remaining = remaining
+        self.depth += 1
+        return 0
+
+    cdef int push_value(self, int ttype) except -1:
+        cdef int size = fixed_size(ttype)
+        if size:
+            return self.push(STEP_SKIP, 0, 0, size)
+        elif ttype == T_STRING:
+            return self.push(STEP_STRING, 0, 0, 0)
+        elif ttype == T_STRUCT:
+            return self.push(STEP_STRUCT, 0, 0, 0)
+        elif ttype == T_LIST or ttype == T_SET:
+            return self.push(STEP_LIST_HEADER, 0, 0, 0)
+        elif ttype == T_MAP:
+            return self.push(STEP_MAP_HEADER, 0, 0, 0)
+        raise MessageError('unknown type {0}'.format(ttype))
+
+    cdef int check_size(self, long long remaining) except -1:
+        """Fail if message can't fit in limit with given bytes."""
+        if self.position + remaining > max_message_size:
+            raise MessageError('message size exceeds {0} bytes'
+                               .format(max_message_size))
+        return 0
+
+    cdef bint scan_header(self, const unsigned char *buf,
+                          Py_ssize_t length) except -1:
+        """Skip message header, return ``False`` if it isn't received."""
+        cdef int version, name_length, message_type = 0
+        cdef Py_ssize_t size
+        if length < 4:
+            return False
+        version = read_i32(buf)
+        if version < 0:
+            if <unsigned int>version & BINARY_VERSION_MASK != \
+                    BINARY_VERSION_1:
+                raise MessageError('unsupported protocol or version')
+            message_type = version & 0xff
+            if length < 8:
+                return False
+            name_length = read_i32(buf + 4)
+            size = 12
+        else:
+            name_length = version
+            size = 9
+        if name_length < 0 or name_length > MAX_NAME_LENGTH:
+            raise MessageError('bad length of method name')
+        size += name_length
+        if length < size:
+            return False
+        if version >= 0:
+            message_type = buf[4 + name_length]
+        if not MIN_MESSAGE_TYPE <= message_type <= MAX_MESSAGE_TYPE:
+            raise MessageError('bad message type')
+        self.position = size
+        self.header_done = True
+        return self.push(STEP_STRUCT, 0, 0, 0) == 0
+
+    cdef bint scan(self) except -1:
+        """Continue scanning, return ``True`` if message received."""
+        cdef const unsigned char *buf = \
+            <const unsigned char *>PyByteArray_AS_STRING(self.buffer)
+        cdef Py_ssize_t length = PyByteArray_GET_SIZE(self.buffer)
+        cdef Py_ssize_t available
+        cdef Step *step
+        cdef int ttype, size
+        cdef long long count
+        if not self.header_done and not self.scan_header(buf, length):
+            return False
+        while self.depth:
+            step = &self.stack[self.depth - 1]
+            available = length - self.position
+            if step.kind == STEP_SKIP:
+                if available < step.remaining:
+                    self.position += available
+                    step.remaining -= available
+                    return False
+                self.position += step.remaining
+                self.depth -= 1
+            elif step.kind == STEP_STRUCT:
+                if available < 1:
+                    return False
+                ttype = buf[self.position]
+                if ttype == T_STOP:
+                    self.position += 1
+                    self.depth -= 1
+                    continue
+                if available < 3:
+                    return False
+                self.position += 3
+                self.push_value(ttype)
+            elif step.kind == STEP_STRING:
+                if available < 4:
+                    return False
+                count = read_i32(buf + self.position)
+                if count < 0:
+                    raise MessageError('negative string length')
+                self.position += 4
+                self.check_size(count)
+                step.kind = STEP_SKIP
+                step.remaining = count
+            elif step.kind == STEP_LIST_HEADER:
+                if available < 5:
+                    return False
+                ttype = buf[self.position]
+                count = read_i32(buf + self.position + 1)
+                if count < 0:
+                    raise MessageError('negative list size')
+                self.position += 5
+                size = fixed_size(ttype)
+                if size:
+                    # Skip all fixed size elements at once.
+                    self.check_size(count * size)
+                    step.kind = STEP_SKIP
+                    step.remaining = count * size
+                else:
+                    step.kind = STEP_LIST
+                    step.value_type = ttype
+                    step.remaining = count
+            elif step.kind == STEP_MAP_HEADER:
+                if available < 6:
+                    return False
+                step.key_type = buf[self.position]
+                step.value_type = buf[self.position + 1]
+                count = read_i32(buf + self.position + 2)
+                if count < 0:
+                    raise MessageError('negative map size')
+                self.position += 6
+                step.kind = STEP_MAP
+                step.remaining = count * 2
+            elif step.kind == STEP_LIST:
+                if not step.remaining:
+                    self.depth -= 1
+                    continue
+                step.remaining -= 1
+                self.push_value(step.value_type)
+            elif step.kind == STEP_MAP:
+                if not step.remaining:
+                    self.depth -= 1
+                    continue
+                step.remaining -= 1
+                self.push_value(step.value_type if step.remaining % 2 == 0
+                                else step.key_type)
+        return True
+
+    cdef bytes next_message(self, object data):
+        """Add received data and return complete message or ``None``."""
+        cdef bytes message
+        if data:
+            self.buffer.extend(data)
+        if not self.buffer or not self.scan():
+            if PyByteArray_GET_SIZE(self.buffer) > max_message_size:
+                raise MessageError('message size exceeds {0} bytes'
+                                   .format(max_message_size))
+            return None
+        message = bytes(self.buffer[:self.position])
+        del self.buffer[:self.position]
+        self.reset()
+        return message
+
+
+cdef class Connection(FramedConnection):
+    """Connection that work with messages without length prefix."""
+
+    cdef MessageScanner scanner
+
+    def __init__(self, object producer, object loop, object handle,
+                 object peer, object close_callback,
+                 object peer_requests=None, object peer_responses=None,
+                 object read_sizes=None):
+        self.scanner = MessageScanner()
+        FramedConnection.__init__(self, producer, loop, handle, peer,
+                                  close_callback, peer_requests,
+                                  peer_responses, read_sizes)
+
+    cdef object receive(self, object data):
+        cdef bytes message = self.scanner.next_message(data)
+        cdef MessageHeader header
+        while message is not None:
+            self.next_packet_id += 1
+            self.current_packet_id = self.next_packet_id
+            header = peek_message(message)
+            if self.protocol is None and header is not None:
+                self.protocol = detect_protocol(header)
+            self.produce(BytesIO(message), len(message),
+                         self.current_packet_id, header, self.protocol)
+            message = self.scanner.next_message(None)
+
+    cdef object write(self, object data, object callback=None):
+        self.account_write(len(data))
+        self.handle.write(data, self.write_done(self.cb_write_done, callback))
@@ -0,0 +1,98 @@
+from thriftworker.transports.message cimport MessageHeader
+
+
+cdef enum ReadState:
+    READ_LEN = 0
+    READ_PAYLOAD = 1
+    READ_DONE = 2
+
+
+cdef enum ConnectionState:
+    CONNECTION_READY = 0
+    CONNECTION_CLOSED = 1
+
+
+cdef class InputPacket:
+
+    # Number of input packet.
+    cdef int packet_id
+
+    # Length of message.
+    cdef int length
+
+    # Number of received bytes.
+    cdef int received
+
+    # Current state of packet.
+    cdef ReadState state
+
+    # Buffer for packet payload.
+    cdef object payload
+
+    # First bytes of payload.
+    cdef bytes head
+
+    cdef bint is_ready(self)
+    cdef object read_length(self, object incoming)
+    cdef object read_payload(self, object incoming)
+    cdef object push(self, object incoming)
+    cdef object get_buffer(self)
+    cdef MessageHeader peek(self)
+
+
+cdef class Connection:
+
+    # Store id of next packet.
+    cdef int next_packet_id
+
+    # Store id of current packet.
+    cdef int current_packet_id
+
+    # Store current packet here.
+    cdef InputPacket current_packet
+
+    # Current state of connection.
+    cdef ConnectionState state
+
+    # Remote peer name.
+    cdef readonly object peer
+
+    # Number of requests passed to producer and not answered yet.
+    cdef readonly int inflight
+
+    # Traffic of connection.
+    cdef readonly unsigned long long bytes_in
+    cdef readonly unsigned long long bytes_out
+    cdef readonly unsigned long long frames_in
+    cdef readonly unsigned long long frames_out
+
+    # Loop time of creation and last read or write, ms.
+    cdef readonly double created
+    cdef readonly double last_activity
+
+    # Statistics of traffic by peer host, may be ``None``.
+    cdef object peer_requests
+    cdef object peer_responses
+
+    # Timer of sizes of read chunks, may be ``None``.
+    cdef object read_sizes
+
+    # Identifier of protocol detected by first message.
+    cdef readonly object protocol
+
+    cdef object producer
+    cdef object loop
+    cdef object handle
+    cdef object close_callback
+
+    cdef InputPacket create_packet(self)
+    cpdef object is_ready(self)
+    cpdef object is_closed(self)
+    cdef void handle_error(self, object error)
+    cdef object write(self, object data, object callback=*)
+    cdef object write_done(self, object done, object callback)
+    cdef object produce(self, object payload, Py_ssize_t size, int packet_id,
+                        MessageHeader header, object protocol)
+    cdef void account_write(self, Py_ssize_t size)
+    cdef object receive(self, object data)
+    cdef object process(self, InputPacket packet)
@@ -6,7 +6,10 @@ cimport cython
 from pyuv.errno import strerror, UV_EOF
 
 from thriftworker.utils.stats import Counter
-from thriftworker.constants import LENGTH_FORMAT, LENGTH_SIZE
+from thriftworker.constants import LENGTH_FORMAT, LENGTH_SIZE, PEEK_SIZE, \
+    MAX_FRAME_SIZE
+from thriftworker.transports.message cimport MessageHeader, peek_message, \
+    detect_protocol
 
 logger = getLogger(__name__)
 
@@ -14,46 +17,39 @@ logger = getLogger(__name__)
 cdef object length_struct = Struct(LENGTH_FORMAT)
 
 
-cdef enum ReadState:
-    READ_LEN = 0
-    READ_PAYLOAD = 1
-    READ_DONE = 2
+cdef class WriteDone:
+    """Handle end of write and pass its error to callback of response."""
 
+    cdef object done
+    cdef object callback
 
-cdef enum ConnectionState:
-    CONNECTION_READY = 0
-    CONNECTION_CLOSED = 1
+    def __init__(self, object done, object callback):
+        self.done = done
+        self.callback = callback
+
+    def __call__(self, object handle, object error):
+        try:
+            self.done(handle, error)
+        finally:
+            self.callback(error)
 
 
 cdef class InputPacket:
     """Represent some framed packet that we can read."""
 
-    # Number of input packet.
-    cdef int packet_id
-
-    # Length of message.
-    cdef int length
-
-    # Number of received bytes.
-    cdef int received
-
-    # Current state of packet.
-    cdef ReadState state
-
-    # Buffer for packet payload.
-    cdef object payload
-
     def __init__(self, packet_id):
         self.packet_id = packet_id
         self.length = 0
+        self.received = 0
         self.state = READ_LEN
         self.payload = BytesIO()
+        self.head = None
 
-    cdef inline bint is_ready(self):
+    cdef bint is_ready(self):
         """Returns ``True`` if packet is received."""
         return self.state == READ_DONE
 
-    cdef inline object read_length(self, object incoming):
+    cdef object read_length(self, object incoming):
         """Get length from message and return relative position."""
         assert self.state == READ_LEN, 'too late for length'
         assert len(incoming) >= LENGTH_SIZE, "packet length can't be read"
@@ -61,23 +57,26 @@ cdef class InputPacket:
         self.length = length_struct.unpack_from(incoming[0:LENGTH_SIZE].tobytes())[0]
         assert self.length > 0, "negative or empty frame size, it seems" \
                                 " client doesn't use FramedTransport"
+        assert self.length <= MAX_FRAME_SIZE, "frame size exceeds {0} bytes" \
+                                              .format(MAX_FRAME_SIZE)
 
         self.state = READ_PAYLOAD
         return LENGTH_SIZE
 
-    cdef inline object read_payload(self, object incoming):
+    cdef object read_payload(self, object incoming):
         """Reads data from stream and switch state."""
         assert self.state == READ_PAYLOAD, 'too early or too late for payload'
 
-        incoming_length = len(incoming)
-        self.received += incoming_length
-        self.payload.write(incoming[:self.length])
+        cdef int consumed = min(len(incoming), self.length - self.received)
+        chunk = incoming[:consumed]
+        if self.head is None:
+            self.head = chunk[:PEEK_SIZE].tobytes()
+        self.payload.write(chunk)
+        self.received += consumed
 
         if self.received >= self.length:
             self.state = READ_DONE
-            return self.length
-        else:
-            return incoming_length
+        return consumed
 
     cdef object push(self, object incoming):
         """Process incoming bytes."""
@@ -94,51 +93,51 @@ cdef class InputPacket:
             position = 0
         return ''
 
-    cdef inline object get_buffer(self):
+    cdef object get_buffer(self):
         """Return packet value."""
         assert self.state == READ_DONE, 'packet not received'
         return self.payload
 
+    cdef MessageHeader peek(self):
+        """Return header of received message or ``None``."""
+        assert self.state == READ_DONE, 'packet not received'
+        cdef MessageHeader header = peek_message(self.head)
+        if header is None and len(self.head) < self.length:
+            header = peek_message(self.payload.getvalue())
+        return header
+
 
 cdef class Connection:
     """Connection that work with framed packets."""
 
-    # Store id of next packet.
-    cdef int next_packet_id
-
-    # Store id of current packet.
-    cdef int current_packet_id
-
-    # Store current packet here.
-    cdef InputPacket current_packet
-
-    # Current state of connection.
-    cdef ConnectionState state
-
-    # Remote peer name.
-    cdef object peer
-
-    cdef object producer
-    cdef object handle
-    cdef object close_callback
-
-    def __init__(self, object producer, object loop, object handle, object peer, object close_callback):
+    def __init__(self, object producer, object loop, object handle, object peer, object close_callback,
+                 object peer_requests=None, object peer_responses=None,
+                 object read_sizes=None):
         # Default variables.
         self.next_packet_id = 0
         self.current_packet_id = 0
         self.current_packet = self.create_packet()
         self.state = CONNECTION_READY
+        self.protocol = None
+        self.inflight = 0
+        self.bytes_in = self.bytes_out = 0
+        self.frames_in = self.frames_out = 0
+        self.created = self.last_activity = loop.now()
 
         # Given arguments.
         self.producer = producer
+        self.loop = loop
         self.handle = handle
         self.peer = peer
         self.close_callback = close_callback
+        self.peer_requests = peer_requests
+        self.peer_responses = peer_responses
+        self.read_sizes = read_sizes
 
         # Start watchers.
         self.handle.start_read(self.cb_read_done)
 
-    cdef inline InputPacket create_packet(self):
+    cdef InputPacket create_packet(self):
         """Create new packet for processing."""
         self.next_packet_id += 1
         return InputPacket(self.next_packet_id)
@@ -151,6 +150,18 @@ cdef class Connection:
         """Returns ``True`` if connection is closed."""
         return self.state == CONNECTION_CLOSED
 
+    property age:
+        """Milliseconds since connection was accepted."""
+
+        def __get__(self):
+            return self.loop.now() - self.created
+
+    property idle:
+        """Milliseconds since last read or write."""
+
+        def __get__(self):
+            return self.loop.now() - self.last_activity
+
     def on_close(self, handle):
         if self.close_callback is not None:
             try:
@@ -166,23 +177,47 @@ cdef class Connection:
         if not self.handle.closed:
             self.handle.close(self.on_close)
 
-    def ready(self, object all_ok, object data, int packet_id):
+    def ready(self, object all_ok, object data, int packet_id,
+              object callback=None):
+        """Write response of given packet. Responses are written in order
+        they are ready, clients that send many requests at once match them
+        by sequence id. Given callback is called with error or ``None``
+        when response is written to socket.
+
+        """
         assert self.is_ready(), 'connection not ready'
 
-        if self.current_packet_id != packet_id:
-            return
+        if self.inflight > 0:
+            self.inflight -= 1
 
         if not all_ok:
             self.close()
             return
 
-        cdef int data_length = len(data)
-        if data_length != 0:
-            # Prepend length to message
-            data = length_struct.pack(data_length) + data
-            self.handle.write(data, self.cb_write_done)
-
-    cdef inline void handle_error(self, object error):
+        if len(data) != 0:
+            self.write(data, callback)
+
+    cdef object write(self, object data, object callback=None):
+        """Write response prepended with its length."""
+        self.account_write(len(data) + LENGTH_SIZE)
+        self.handle.write(length_struct.pack(len(data)) + data,
+                          self.write_done(self.cb_write_done, callback))
+
+    cdef object write_done(self, object done, object callback):
+        """Return callback of write that also notify given callback."""
+        if callback is None:
+            return done
+        return WriteDone(done, callback)
+
+    cdef void account_write(self, Py_ssize_t size):
+        """Count response of given size written to peer."""
+        self.bytes_out += size
+        self.frames_out += 1
+        self.last_activity = self.loop.now()
+        if self.peer_responses is not None:
+            self.peer_responses.add(self.peer[0], size)
+
+    cdef void handle_error(self, object error):
         logger.warn('Error with %r: %s', self, strerror(error))
 
     def cb_read_done(self, object handle, object data, object error):
@@ -197,20 +232,44 @@ cdef class Connection:
             self.close()
             return
 
-        cdef int packet_id = 0
-        cdef InputPacket packet = self.current_packet
+        self.bytes_in += len(data)
+        self.last_activity = self.loop.now()
+        if self.read_sizes is not None:
+            self.read_sizes.add(len(data))
         try:
-            while data:
-                data = packet.push(data)
-                if packet.is_ready():
-                    packet_id = self.current_packet_id = packet.packet_id
-                    self.producer(self, packet.get_buffer(), packet_id)
-                    packet = self.current_packet = self.create_packet()
-
+            self.receive(data)
         except Exception as exc:
             logger.exception(exc)
             self.close()
 
+    cdef object receive(self, object data):
+        """Split incoming data to packets."""
+        cdef InputPacket packet = self.current_packet
+        while data:
+            data = packet.push(data)
+            if packet.is_ready():
+                self.current_packet_id = packet.packet_id
+                self.process(packet)
+                packet = self.current_packet = self.create_packet()
+
+    cdef object process(self, InputPacket packet):
+        """Pass received packet to producer."""
+        cdef MessageHeader header = packet.peek()
+        if self.protocol is None and header is not None:
+            # Pin connection to protocol of first message.
+            self.protocol = detect_protocol(header)
+        self.produce(packet.get_buffer(), packet.length, packet.packet_id,
+                     header, self.protocol)
+
+    cdef object produce(self, object payload, Py_ssize_t size, int packet_id,
+                        MessageHeader header, object protocol):
+        """Count request of given size and pass it to producer."""
+        self.inflight += 1
+        self.frames_in += 1
+        if self.peer_requests is not None:
+            self.peer_requests.add(self.peer[0], size)
+        self.producer(self, payload, packet_id, header, protocol, size)
+
     def cb_write_done(self, object handle, object error):
         if error:
             self.handle_error(error)
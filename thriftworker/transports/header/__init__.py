@@ -0,0 +1,11 @@
+from __future__ import absolute_import
+
+from thriftworker.transports.base import BaseAcceptor
+
+from .connection import Connection
+
+
+class HeaderAcceptor(BaseAcceptor):
+
+    #: Which connection should we use?
+    Connection = Connection
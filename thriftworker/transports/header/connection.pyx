@@ -0,0 +1,242 @@
+import zlib
+from io import BytesIO
+from struct import Struct
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+
+from thriftworker.constants import COMPRESSION_THRESHOLD, MAX_FRAME_SIZE
+from thriftworker.transports.message cimport MessageHeader, peek_message
+from thriftworker.transports.framed.connection cimport InputPacket, \
+    Connection as FramedConnection
+
+
+cdef object prefix_struct = Struct('!HHIH')
+
+
+cdef enum:
+    # First bytes of frame with header.
+    HEADER_MAGIC = 0x0fff
+    HEADER_MAGIC_HIGH = 0x0f
+    HEADER_MAGIC_LOW = 0xff
+
+    # Size of magic, flags, sequence number and header size.
+    PREFIX_SIZE = 10
+
+    # Identifiers of info headers.
+    INFO_PADDING = 0
+    INFO_KEYVALUE = 1
+
+    # Identifiers of transforms.
+    ZLIB_TRANSFORM = 1
+
+# Transforms that we can apply.
+TRANSFORMS = frozenset([ZLIB_TRANSFORM])
+
+
+class HeaderError(ValueError):
+    """Frame header can't be parsed."""
+
+
+cdef inline Py_ssize_t read_varint(const unsigned char *buf, Py_ssize_t pos,
+                                   Py_ssize_t length, unsigned int *result):
+    """Read varint at given position, return position after it."""
+    cdef unsigned int value = 0
+    cdef int shift = 0
+    while pos < length and shift < 35:
+        value |= <unsigned int>(buf[pos] & 0x7f) << shift
+        if not buf[pos] & 0x80:
+            result[0] = value
+            return pos + 1
+        pos += 1
+        shift += 7
+    raise HeaderError('malformed varint')
+
+
+cdef inline Py_ssize_t read_string(bytes data, const unsigned char *buf,
+                                   Py_ssize_t pos, Py_ssize_t length,
+                                   list result) except -1:
+    """Read string prefixed with its varint length and append it to given
+    list, return position after it.
+
+    """
+    cdef unsigned int size = 0
+    pos = read_varint(buf, pos, length, &size)
+    if pos + <Py_ssize_t>size > length:
+        raise HeaderError('string out of header')
+    result.append(data[pos:pos + size])
+    return pos + size
+
+
+cdef bytes write_varint(unsigned int value):
+    cdef bytearray result = bytearray()
+    while value > 0x7f:
+        result.append((value & 0x7f) | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+cdef class Frame:
+    """Received frame with header. Payload is untransformed on first
+    access and response is transformed by :meth:`encode`, so both happen
+    in worker thread.
+
+    """
+
+    # Flags of frame.
+    cdef readonly int flags
+
+    # Sequence number of frame.
+    cdef readonly unsigned int seqid
+
+    # Identifier of protocol of payload.
+    cdef readonly int protocol
+
+    # Identifiers of transforms applied to payload.
+    cdef readonly tuple transforms
+
+    # Key-value info headers, like deadlines and trace ids.
+    cdef readonly dict headers
+
+    # Payload, probably transformed.
+    cdef object payload
+
+    # Untransformed payload.
+    cdef object value
+
+    # Last response and its encoded frame.
+    cdef object response
+    cdef object encoded
+
+    def __init__(self, int flags, unsigned int seqid, int protocol,
+                 tuple transforms, dict headers, bytes payload):
+        self.flags = flags
+        self.seqid = seqid
+        self.protocol = protocol
+        self.transforms = transforms
+        self.headers = headers
+        self.payload = payload
+        self.value = payload if not transforms else None
+        self.response = self.encoded = None
+
+    def getvalue(self):
+        """Return untransformed payload."""
+        cdef object value = self.value
+        cdef int transform
+        if value is None:
+            value = self.payload
+            for transform in reversed(self.transforms):
+                if transform == ZLIB_TRANSFORM:
+                    # Limit output, small payload may expand enormously.
+                    decompressor = zlib.decompressobj()
+                    value = decompressor.decompress(value, MAX_FRAME_SIZE)
+                    if decompressor.unconsumed_tail:
+                        raise HeaderError(
+                            'decompressed payload exceeds {0} bytes'
+                            .format(MAX_FRAME_SIZE))
+            self.value = value
+        return value
+
+    cpdef bytes encode(self, bytes response):
+        """Return frame with given response. Response is compressed if
+        client compressed request and response is large enough.
+
+        """
+        cdef tuple transforms = self.transforms
+        cdef int transform
+        cdef bytes header, payload = response
+        if response is self.response:
+            return self.encoded
+        if PyBytes_GET_SIZE(response) < COMPRESSION_THRESHOLD:
+            transforms = ()
+        for transform in transforms:
+            if transform == ZLIB_TRANSFORM:
+                payload = zlib.compress(payload)
+        header = write_varint(self.protocol) + \
+            write_varint(len(transforms)) + \
+            b''.join([write_varint(transform) for transform in transforms])
+        header += b'\0' * (-len(header) % 4)
+        encoded = prefix_struct.pack(HEADER_MAGIC, 0, self.seqid,
+                                     len(header) // 4) + header + payload
+        self.response, self.encoded = response, encoded
+        return encoded
+
+
+cpdef Frame parse_frame(bytes data):
+    """Parse frame with header. Raise :class:`HeaderError` if frame is
+    malformed or uses unknown transform.
+
+    """
+    cdef const unsigned char *buf = <const unsigned char *>PyBytes_AS_STRING(data)
+    cdef Py_ssize_t length = PyBytes_GET_SIZE(data)
+    cdef Py_ssize_t pos = PREFIX_SIZE, end
+    cdef unsigned int protocol = 0, count = 0, transform = 0, info = 0
+    cdef unsigned int i
+    cdef list transforms = [], pair
+    cdef dict headers = {}
+    if length < PREFIX_SIZE or buf[0] != HEADER_MAGIC_HIGH or \
+            buf[1] != HEADER_MAGIC_LOW:
+        raise HeaderError('not a header frame')
+    magic, flags, seqid, size = prefix_struct.unpack_from(data)
+    end = PREFIX_SIZE + size * 4
+    if end > length:
+        raise HeaderError('header out of frame')
+    pos = read_varint(buf, pos, end, &protocol)
+    pos = read_varint(buf, pos, end, &count)
+    for i in range(count):
+        pos = read_varint(buf, pos, end, &transform)
+        if transform not in TRANSFORMS:
+            raise HeaderError('unknown transform {0}'.format(transform))
+        transforms.append(transform)
+    while pos < end:
+        pos = read_varint(buf, pos, end, &info)
+        if info != INFO_KEYVALUE:
+            # Rest is padding or info we can't skip.
+            break
+        pos = read_varint(buf, pos, end, &count)
+        for i in range(count):
+            pair = []
+            pos = read_string(data, buf, pos, end, pair)
+            pos = read_string(data, buf, pos, end, pair)
+            headers[pair[0]] = pair[1]
+    return Frame(flags, seqid, protocol, tuple(transforms), headers,
+                 data[end:])
+
+
+cdef inline bint is_header_frame(bytes head):
+    return PyBytes_GET_SIZE(head) >= 2 and \
+        <unsigned char>head[0] == HEADER_MAGIC_HIGH and \
+        <unsigned char>head[1] == HEADER_MAGIC_LOW
+
+
+cdef class Connection(FramedConnection):
+    """Connection that work with frames with header. Frames without header
+    are processed as framed ones.
+
+    """
+
+    # Frames of packets that wait for response, by packet id.
+    cdef dict frames
+
+    cdef object process(self, InputPacket packet):
+        cdef Frame frame
+        cdef MessageHeader header
+        if not is_header_frame(packet.head):
+            FramedConnection.process(self, packet)
+            return
+        if self.frames is None:
+            self.frames = {}
+        frame = self.frames[packet.packet_id] = \
+            parse_frame(packet.get_buffer().getvalue())
+        header = peek_message(frame.payload) if not frame.transforms else None
+        self.protocol = frame.protocol
+        self.produce(frame, packet.length, packet.packet_id, header,
+                     frame.protocol)
+
+    def ready(self, object all_ok, object data, int packet_id,
+              object callback=None):
+        cdef Frame frame = self.frames.pop(packet_id, None) \
+            if self.frames is not None else None
+        if all_ok and data and frame is not None:
+            data = frame.encode(data)
+        FramedConnection.ready(self, all_ok, data, packet_id, callback)
@@ -0,0 +1,25 @@
+cdef class MessageHeader:
+
+    # Name of called method.
+    cdef readonly object name
+
+    # Type of message.
+    cdef readonly int type
+
+    # Sequence id of message.
+    cdef readonly int seqid
+
+    # Size of serialized header in bytes.
+    cdef readonly Py_ssize_t size
+
+    # Identifier of protocol.
+    cdef readonly int protocol
+
+    # Has binary message a version?
+    cdef readonly bint strict
+
+
+cpdef MessageHeader peek_message(bytes data)
+
+
+cpdef int detect_protocol(MessageHeader header)
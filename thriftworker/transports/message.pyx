@@ -0,0 +1,235 @@
+"""Read header of Thrift message without decoding its body."""
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+
+
+# Identifiers of protocols, the same as in THeader transport.
+BINARY = 0
+JSON = 1
+COMPACT = 2
+
+# Binary protocol without version in message, unknown to THeader.
+BINARY_NON_STRICT = 0x10
+
+# Plain HTTP request instead of Thrift message, see admin transport.
+HTTP = 0x20
+
+
+cdef enum:
+    T_BINARY = 0
+    T_JSON = 1
+    T_COMPACT = 2
+    T_BINARY_NON_STRICT = 0x10
+
+    # Limit length of method name to distinguish binary message without
+    # version from garbage.
+    MAX_NAME_LENGTH = 0xffff
+
+    BINARY_VERSION_MASK = 0xffff0000
+    BINARY_VERSION_1 = 0x80010000
+    BINARY_TYPE_MASK = 0xff
+
+    COMPACT_PROTOCOL_ID = 0x82
+    COMPACT_VERSION = 1
+    COMPACT_VERSION_MASK = 0x1f
+    COMPACT_TYPE_SHIFT = 5
+    COMPACT_TYPE_MASK = 0x07
+
+    JSON_ARRAY_START = 0x5b
+    JSON_VERSION = 1
+
+    MIN_MESSAGE_TYPE = 1
+    MAX_MESSAGE_TYPE = 4
+
+
+cdef class MessageHeader:
+    """Header of Thrift message."""
+
+    def __init__(self, name, int type, int seqid, Py_ssize_t size,
+                 int protocol, bint strict=True):
+        self.name = name
+        self.type = type
+        self.seqid = seqid
+        self.size = size
+        self.protocol = protocol
+        self.strict = strict
+
+    def __richcmp__(MessageHeader self, other, int op):
+        if op not in (2, 3):
+            return NotImplemented
+        if not isinstance(other, MessageHeader):
+            return op == 3
+        equal = (self.name, self.type, self.seqid, self.size,
+                 self.protocol, self.strict) == \
+            (other.name, other.type, other.seqid, other.size,
+             other.protocol, other.strict)
+        return equal if op == 2 else not equal
+
+    def __repr__(self):
+        return ('<{0}(name={1.name!r}, type={1.type}, seqid={1.seqid})>'
+                .format(type(self).__name__, self))
+
+
+cdef inline int read_i32(const unsigned char *buf):
+    return <int>((<unsigned int>buf[0] << 24) | (<unsigned int>buf[1] << 16) |
+                 (<unsigned int>buf[2] << 8) | <unsigned int>buf[3])
+
+
+cdef inline Py_ssize_t read_varint(const unsigned char *buf, Py_ssize_t pos,
+                                   Py_ssize_t length, unsigned int *result):
+    """Read varint at given position, return position after it or -1."""
+    cdef unsigned int value = 0
+    cdef int shift = 0
+    while pos < length and shift < 35:
+        value |= <unsigned int>(buf[pos] & 0x7f) << shift
+        if not buf[pos] & 0x80:
+            result[0] = value
+            return pos + 1
+        pos += 1
+        shift += 7
+    return -1
+
+
+cdef inline bint is_message_type(int message_type):
+    return MIN_MESSAGE_TYPE <= message_type <= MAX_MESSAGE_TYPE
+
+
+cdef MessageHeader peek_binary(bytes data, const unsigned char *buf,
+                               Py_ssize_t length):
+    cdef int version, message_type, name_length
+    cdef Py_ssize_t pos = 0
+    if length < 4:
+        return None
+    version = read_i32(buf)
+    if version < 0:
+        # Strict message: version, name, sequence id.
+        if <unsigned int>version & BINARY_VERSION_MASK != BINARY_VERSION_1:
+            return None
+        message_type = version & BINARY_TYPE_MASK
+        if length < 8:
+            return None
+        name_length = read_i32(buf + 4)
+        pos = 8
+    else:
+        # Old message: name, type, sequence id.
+        message_type = 0
+        name_length = version
+        pos = 4
+    if name_length < 0 or name_length > MAX_NAME_LENGTH:
+        return None
+    if version >= 0:
+        if length < pos + name_length + 1:
+            return None
+        message_type = buf[pos + name_length]
+    if not is_message_type(message_type):
+        return None
+    name = data[pos:pos + name_length]
+    pos += name_length if version < 0 else name_length + 1
+    if length < pos + 4:
+        return None
+    return MessageHeader(name, message_type, read_i32(buf + pos), pos + 4,
+                         T_BINARY, version < 0)
+
+
+cdef MessageHeader peek_compact(bytes data, const unsigned char *buf,
+                                Py_ssize_t length):
+    cdef unsigned int seqid = 0, name_length = 0
+    cdef int message_type
+    cdef Py_ssize_t pos
+    if length < 2:
+        return None
+    if buf[1] & COMPACT_VERSION_MASK != COMPACT_VERSION:
+        return None
+    message_type = (buf[1] >> COMPACT_TYPE_SHIFT) & COMPACT_TYPE_MASK
+    if not is_message_type(message_type):
+        return None
+    pos = read_varint(buf, 2, length, &seqid)
+    if pos == -1:
+        return None
+    pos = read_varint(buf, pos, length, &name_length)
+    if pos == -1 or name_length > MAX_NAME_LENGTH or \
+            length < pos + <Py_ssize_t>name_length:
+        return None
+    return MessageHeader(data[pos:pos + name_length], message_type,
+                         <int>seqid, pos + name_length, T_COMPACT, True)
+
+
+cdef inline Py_ssize_t read_json_number(const unsigned char *buf,
+                                         Py_ssize_t pos, Py_ssize_t length,
+                                         int *result):
+    """Read integer followed by delimiter, return position after it or
+    -1.
+
+    """
+    cdef long value = 0
+    cdef bint negative = pos < length and buf[pos] == '-'
+    cdef Py_ssize_t start
+    if negative:
+        pos += 1
+    start = pos
+    while pos < length and ord('0') <= buf[pos] <= ord('9'):
+        value = value * 10 + (buf[pos] - ord('0'))
+        if value > 0x80000000:
+            return -1
+        pos += 1
+    if pos == start or pos == length or buf[pos] not in b',]':
+        return -1
+    if negative:
+        value = -value
+    if value > 0x7fffffff:
+        return -1
+    result[0] = <int>value
+    return pos
+
+
+cdef MessageHeader peek_json(bytes data, const unsigned char *buf,
+                             Py_ssize_t length):
+    cdef int version = 0, message_type = 0, seqid = 0
+    cdef Py_ssize_t pos, start
+    pos = read_json_number(buf, 1, length, &version)
+    if pos == -1 or version != JSON_VERSION or buf[pos] != ',':
+        return None
+    pos += 1
+    if pos >= length or buf[pos] != '"':
+        return None
+    start = pos = pos + 1
+    while pos < length and buf[pos] != '"':
+        if buf[pos] == '\\':
+            # Escaped names are not expected in method names.
+            return None
+        pos += 1
+    if pos + 1 >= length or buf[pos + 1] != ',':
+        return None
+    name = data[start:pos]
+    pos = read_json_number(buf, pos + 2, length, &message_type)
+    if pos == -1 or buf[pos] != ',' or not is_message_type(message_type):
+        return None
+    pos = read_json_number(buf, pos + 1, length, &seqid)
+    if pos == -1:
+        return None
+    return MessageHeader(name, message_type, seqid, pos, T_JSON, True)
+
+
+cpdef MessageHeader peek_message(bytes data):
+    """Read header of binary, compact or JSON message. Return
+    :class:`MessageHeader` or ``None`` if header can't be read.
+
+    """
+    cdef const unsigned char *buf = <const unsigned char *>PyBytes_AS_STRING(data)
+    cdef Py_ssize_t length = PyBytes_GET_SIZE(data)
+    if length == 0:
+        return None
+    if buf[0] == COMPACT_PROTOCOL_ID:
+        return peek_compact(data, buf, length)
+    elif buf[0] == JSON_ARRAY_START:
+        return peek_json(data, buf, length)
+    return peek_binary(data, buf, length)
+
+
+cpdef int detect_protocol(MessageHeader header):
+    """Return identifier of protocol that was used to write message with
+    given header.
+
+    """
+    if header.protocol == T_BINARY and not header.strict:
+        return T_BINARY_NON_STRICT
+    return header.protocol
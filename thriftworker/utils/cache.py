@@ -0,0 +1,108 @@
+"""Cache responses of idempotent methods."""
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+from ..constants import CACHE_SIZE, CACHE_TTL
+from .monotime import monotonic
+from .stats import Counter, Counters
+
+
+class ResponseCache(object):
+    """Size-bounded LRU cache of responses with TTL. Keys are tuples of
+    method name and serialized arguments, values are tuples of message type
+    and serialized result. Should be used only from loop thread.
+
+    :param methods: names of cacheable methods or mapping of names to
+        their TTL in seconds
+    :param maxsize: how many bytes cache may hold
+    :param ttl: default TTL of cached response in seconds
+
+    """
+
+    def __init__(self, methods, maxsize=None, ttl=None):
+        self.ttl = ttl or CACHE_TTL
+        self.maxsize = maxsize or CACHE_SIZE
+        if isinstance(methods, dict):
+            self.ttls = dict(methods)
+        else:
+            self.ttls = dict.fromkeys(methods)
+        self.size = 0
+        self.hits = Counter()
+        self.misses = Counter()
+        self.evictions = Counter()
+        self._entries = OrderedDict()
+
+    def __contains__(self, method):
+        """Is given method cacheable?"""
+        return method in self.ttls
+
+    def __len__(self):
+        """Return number of cached responses."""
+        return len(self._entries)
+
+    def __repr__(self):
+        return '<{0}({1} entries, {2} bytes) at {3}>'.format(
+            type(self).__name__, len(self), self.size, hex(id(self)))
+
+    @staticmethod
+    def _cost(key, value):
+        """How many bytes given entry takes."""
+        return len(key[0]) + len(key[1]) + len(value[1])
+
+    def _remove(self, key):
+        expires, value = self._entries.pop(key)
+        self.size -= self._cost(key, value)
+        return expires, value
+
+    def get(self, key):
+        """Return cached value or ``None``."""
+        try:
+            expires, value = self._remove(key)
+        except KeyError:
+            self.misses.add()
+            return None
+        if expires <= monotonic():
+            self.misses.add()
+            return None
+        # Move entry to the end of LRU.
+        self._entries[key] = (expires, value)
+        self.size += self._cost(key, value)
+        self.hits.add()
+        return value
+
+    def set(self, key, value):
+        """Store value, evict least recently used entries if needed."""
+        cost = self._cost(key, value)
+        if cost > self.maxsize:
+            return
+        entries = self._entries
+        if key in entries:
+            self._remove(key)
+        while entries and self.size + cost > self.maxsize:
+            self._remove(next(iter(entries)))
+            self.evictions.add()
+        ttl = self.ttls.get(key[0]) or self.ttl
+        entries[key] = (monotonic() + ttl, value)
+        self.size += cost
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self):
+        """Return copy of hit, miss and eviction counters."""
+        result = Counters()
+        result['hits'] = self.hits.snapshot()
+        result['misses'] = self.misses.snapshot()
+        result['evictions'] = self.evictions.snapshot()
+        return result
+
+    def to_dict(self):
+        """Convert cache statistics to dict."""
+        return {'hits': self.hits.count,
+                'misses': self.misses.count,
+                'evictions': self.evictions.count,
+                'entries': len(self),
+                'size': self.size}
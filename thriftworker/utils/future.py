@@ -0,0 +1,115 @@
+"""Result of operation that will be completed later."""
+from __future__ import absolute_import
+
+import sys
+import logging
+from threading import Event, Lock
+
+import six
+
+logger = logging.getLogger(__name__)
+
+
+class Future(object):
+    """Store result or exception of pending operation. May be completed
+    from any thread, callbacks are called in thread that complete future.
+
+    """
+
+    __slots__ = ['_result', '_exception', '_event', '_lock', '_callbacks']
+
+    def __init__(self):
+        self._result = None
+        self._exception = None
+        self._event = Event()
+        self._lock = Lock()
+        self._callbacks = []
+
+    def __repr__(self):
+        state = 'pending' if not self.done() else \
+            'failed' if self._exception is not None else 'done'
+        return '<{0}({1}) at {2}>'.format(type(self).__name__, state,
+                                          hex(id(self)))
+
+    def done(self):
+        """Is future completed?"""
+        return self._event.is_set()
+
+    def _complete(self, result, exception):
+        with self._lock:
+            if self._event.is_set():
+                raise RuntimeError('Future already completed')
+            self._result = result
+            self._exception = exception
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, None
+        for callback in callbacks:
+            self._run_callback(callback)
+
+    def _run_callback(self, callback):
+        try:
+            callback(self)
+        except Exception as exc:
+            logger.exception(exc)
+
+    def set_result(self, result):
+        """Complete future with given result."""
+        self._complete(result, None)
+
+    def set_exception(self, exception):
+        """Complete future with given exception or tuple returned by
+        :func:`sys.exc_info`.
+
+        """
+        assert isinstance(exception, (Exception, tuple))
+        self._complete(None, exception)
+
+    def add_done_callback(self, callback):
+        """Call given function with future when it will be completed."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        self._run_callback(callback)
+
+    def exception(self, timeout=None):
+        """Wait for completion and return exception or ``None``."""
+        self.wait(timeout)
+        exception = self._exception
+        if isinstance(exception, tuple):
+            return exception[1]
+        return exception
+
+    def result(self, timeout=None):
+        """Wait for completion and return result or raise exception."""
+        self.wait(timeout)
+        exception = self._exception
+        if exception is None:
+            return self._result
+        elif isinstance(exception, tuple):
+            exc_type, exc, tb = exception
+            six.reraise(exc_type, exc, tb)
+        else:
+            raise exception
+
+    def wait(self, timeout=None):
+        """Wait for completion."""
+        if not self._event.wait(timeout):
+            raise RuntimeError('Timeout happened waiting for {0!r}'
+                               .format(self))
+
+    def chain(self, func):
+        """Return new future completed with result of given function
+        called with this future when it will be completed.
+
+        """
+        future = type(self)()
+
+        def inner_callback(source):
+            try:
+                future.set_result(func(source))
+            except:
+                future.set_exception(sys.exc_info())
+
+        self.add_done_callback(inner_callback)
+        return future
@@ -10,6 +10,9 @@ import six
 
 from thriftworker.state import current_app
 
+from .future import Future
+from .monotime import monotonic
+
 #: Specify default timeout for delegation decorators.
 DELEGATION_TIMEOUT = 5.0
 
@@ -144,6 +147,63 @@ def _greenlet_delegate(func, options, *args, **kwargs):
 greenlet_delegate = partial(_create_decorator, _greenlet_delegate)
 
 
+def _execute(future, func, args, kwargs):
+    try:
+        future.set_result(func(*args, **kwargs))
+    except:
+        future.set_exception(sys.exc_info())
+
+
+def submit_many(calls):
+    """Schedule execution of given calls in loop with one wakeup and
+    return list of :class:`Future` instances without waiting. Each call is
+    a tuple of function and optional tuple of positional arguments and
+    dict of keyword arguments. Calls are executed at once if we are in
+    loop.
+
+    """
+    try:
+        ident = current_app.loop.ident
+    except AttributeError:
+        raise RuntimeError('Loop not started')
+    scheduled = []
+    for call in calls:
+        args = call[1] if len(call) > 1 else ()
+        kwargs = call[2] if len(call) > 2 else {}
+        scheduled.append((Future(), call[0], args, kwargs))
+    futures = [item[0] for item in scheduled]
+
+    def inner_callback():
+        for future, func, args, kwargs in scheduled:
+            _execute(future, func, args, kwargs)
+
+    if ident == get_ident():
+        inner_callback()
+    elif scheduled:
+        current_app.hub.callback(inner_callback)
+    return futures
+
+
+def submit(func, *args, **kwargs):
+    """Schedule execution of given function in loop, return
+    :class:`Future` of its result.
+
+    """
+    return submit_many([(func, args, kwargs)])[0]
+
+
+def wait_all(futures, timeout=None):
+    """Wait for all given futures at most *timeout* seconds together,
+    return list of their results. Exception of first failed future is
+    raised when all futures are completed.
+
+    """
+    deadline = monotonic() + (timeout or DELEGATION_TIMEOUT)
+    for future in futures:
+        future.wait(max(deadline - monotonic(), 0))
+    return [future.result() for future in futures]
+
+
 class in_loop(object):
     """Schedule execution of given function in main event loop. Wait for
     function execution.
@@ -165,4 +225,7 @@ class in_loop(object):
             method = self.__func.__get__(obj)
             value = obj.__dict__[self.__name__] = \
                 loop_delegate(timeout=self.__timeout)(method)
+            # Allow to schedule call without waiting for it.
+            value.func = method
+            value.submit = partial(submit, method)
             return value
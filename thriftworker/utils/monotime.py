@@ -1,6 +1,9 @@
 from __future__ import absolute_import
 
 try:
-    from ._monotime import monotonic
+    from ._monotime import monotonic, monotonic_ns
 except ImportError:
     from time import time as monotonic
+
+    def monotonic_ns():
+        return int(monotonic() * 1e9)
@@ -4,3 +4,5 @@ from .counter import Counter
 from .counters import Counters
 from .timer import Timer
 from .timers import Timers
+from .rolling import Rolling, RollingCounter, RollingTimer
+from .heavy import HeavyHitters
@@ -1,4 +1,5 @@
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
 
 
 cdef extern from "stdint.h" nogil:
@@ -17,6 +18,8 @@ cdef extern from "cm_counter.h":
 
     int init_counter(counter* c_counter)
     int counter_add_sample(counter *c_counter, double sample)
+    int counter_merge(counter *c_counter, counter *other)
+    int counter_subtract(counter *c_counter, counter *other)
     uint64_t counter_count(counter *c_counter)
     double counter_mean(counter *c_counter)
     double counter_stddev(counter *c_counter)
@@ -42,6 +45,45 @@ cdef class Counter(object):
     cpdef add(self, double sample=1.0):
         assert counter_add_sample(self._c_counter, sample) == 0
 
+    def merge(self, Counter other not None):
+        """Add all samples of other counter."""
+        assert counter_merge(self._c_counter, other._c_counter) == 0
+        return self
+
+    def subtract(self, Counter other not None):
+        """Remove samples of other counter, that is earlier snapshot of
+        this one. Minimum and maximum are kept.
+
+        """
+        assert counter_subtract(self._c_counter, other._c_counter) == 0
+        return self
+
+    def reset(self):
+        """Remove all samples."""
+        assert init_counter(self._c_counter) == 0
+
+    def __reduce__(self):
+        cdef counter *c_counter = self._c_counter
+        return (type(self), (), (c_counter.count, c_counter.sum,
+                                 c_counter.squared_sum, c_counter.min,
+                                 c_counter.max))
+
+    def __setstate__(self, tuple state):
+        cdef counter *c_counter = self._c_counter
+        (c_counter.count, c_counter.sum, c_counter.squared_sum, c_counter.min,
+         c_counter.max) = state
+
+    def snapshot(self, bint reset=False):
+        """Return copy of counter and reset it if asked. Both happen at
+        once, so samples added by other threads aren't lost.
+
+        """
+        cdef Counter result = type(self)()
+        memcpy(result._c_counter, self._c_counter, sizeof(counter))
+        if reset:
+            assert init_counter(self._c_counter) == 0
+        return result
+
     def __int__(self):
         return int(self.sum)
 
@@ -1,18 +1,59 @@
 from __future__ import absolute_import
 
 from collections import defaultdict
+from functools import partial
 
 from .counter import Counter
+from .rolling import RollingCounter
 
 
 class Counters(defaultdict):
-    """Store counters here."""
+    """Store counters here. If `period` is given counters keep only
+    samples of last `period` seconds.
 
-    def __init__(self):
-        super(Counters, self).__init__(Counter)
+    """
+
+    def __init__(self, period=None, buckets=6):
+        self.period = period
+        self.buckets = buckets
+        factory = Counter if period is None else \
+            partial(RollingCounter, period, buckets)
+        super(Counters, self).__init__(factory)
+
+    def __reduce__(self):
+        return (type(self), (self.period, self.buckets), None, None,
+                iter(self.items()))
+
+    def merge(self, other):
+        """Add samples of all counters from other collection."""
+        for key, counter in other.items():
+            self[key].merge(counter)
+        return self
+
+    def subtract(self, other):
+        """Remove samples of counters from other collection, that is earlier
+        snapshot of this one.
+
+        """
+        for key, counter in self.items():
+            previous = other.get(key)
+            if previous is not None:
+                counter.subtract(previous)
+        return self
+
+    def snapshot(self, reset=False):
+        """Return copy of all counters and reset them if asked. Counters
+        may be updated meanwhile, each of them is copied at once.
+
+        """
+        result = Counters()
+        for key, counter in list(self.items()):
+            result[key] = counter.snapshot(reset)
+        return result
 
     def to_dict(self):
         """Convert all counters to dict."""
+        counters = self if self.period is None else self.snapshot()
         return {key: {'mean': counter.mean,
                       'stddev': counter.stddev,
                       'sum': counter.sum,
@@ -20,4 +61,4 @@ class Counters(defaultdict):
                       'squared_sum': counter.squared_sum,
                       'min': counter.min,
                       'max': counter.max}
-                for key, counter in self.items()}
+                for key, counter in counters.items()}
@@ -0,0 +1,70 @@
+from __future__ import absolute_import
+
+from thriftworker.constants import HEAVY_HITTERS_CAPACITY
+
+from .counter import Counter
+from .counters import Counters
+
+
+class HeavyHitters(Counters):
+    """Counters of at most `capacity` keys. When new key doesn't fit, key
+    with least sum is replaced and new counter inherits its samples
+    (Space-Saving algorithm), so sums of heavy keys are never
+    underestimated. Overestimation of each key is stored in `errors`.
+
+    """
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity or HEAVY_HITTERS_CAPACITY
+        self.errors = {}
+        super(HeavyHitters, self).__init__()
+
+    def __reduce__(self):
+        return (type(self), (self.capacity,), {'errors': self.errors}, None,
+                iter(self.items()))
+
+    def __missing__(self, key):
+        counter = Counter()
+        if len(self) >= self.capacity:
+            victim = min(self, key=lambda k: self[k].sum)
+            counter.merge(self.pop(victim))
+            self.errors.pop(victim, None)
+            self.errors[key] = counter.sum
+        self[key] = counter
+        return counter
+
+    def add(self, key, sample=1.0):
+        """Add sample to counter of given key."""
+        self[key].add(sample)
+
+    def merge(self, other):
+        """Add samples of all counters from other collection."""
+        errors = getattr(other, 'errors', {})
+        for key, counter in other.items():
+            self[key].merge(counter)
+            if key in errors:
+                self.errors[key] = self.errors.get(key, 0.0) + errors[key]
+        return self
+
+    def snapshot(self, reset=False):
+        """Return copy of all counters and reset them if asked."""
+        result = type(self)(self.capacity)
+        result.errors = dict(self.errors)
+        for key, counter in list(self.items()):
+            result[key] = counter.snapshot(reset)
+        if reset:
+            self.clear()
+            self.errors.clear()
+        return result
+
+    def top(self, number=None):
+        """Return pairs of keys and counters with largest sums first."""
+        items = sorted(self.items(), key=lambda item: item[1].sum,
+                       reverse=True)
+        return items[:number] if number is not None else items
+
+    def to_dict(self):
+        result = super(HeavyHitters, self).to_dict()
+        for key, value in result.items():
+            value['error'] = self.errors.get(key, 0.0)
+        return result
@@ -0,0 +1,91 @@
+from __future__ import absolute_import
+
+from collections import deque
+from functools import partial
+from threading import Lock
+
+from thriftworker.utils.monotime import monotonic
+
+from .counter import Counter
+from .timer import Timer
+
+
+class Rolling(object):
+    """Keep samples of last `period` seconds. Samples are added to newest of
+    `buckets` rotating buckets, so window slides with step of one bucket.
+
+    """
+
+    def __init__(self, factory, period=60.0, buckets=6, clock=None):
+        if period <= 0 or buckets <= 0:
+            raise ValueError('Period and number of buckets must be positive')
+        self.factory = factory
+        self.period = period
+        self.step = float(period) / buckets
+        self.clock = clock or monotonic
+        self.buckets = deque([factory()], maxlen=buckets)
+        self.started = self.clock()
+        self._lock = Lock()
+
+    def __repr__(self):
+        return '<{0}(period={1}) at {2}>'.format(
+            type(self).__name__, self.period, hex(id(self)))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def rotate(self):
+        """Replace buckets that are out of window with new ones."""
+        if self.clock() - self.started < self.step:
+            return
+        with self._lock:
+            passed = int((self.clock() - self.started) // self.step)
+            for _ in range(min(max(passed, 0), self.buckets.maxlen)):
+                self.buckets.append(self.factory())
+            self.started += max(passed, 0) * self.step
+
+    def add(self, *args):
+        self.rotate()
+        self.buckets[-1].add(*args)
+
+    def __iadd__(self, sample):
+        self.add(sample)
+        return self
+
+    def merge(self, other):
+        """Add samples of other window or statistic to newest bucket."""
+        if isinstance(other, Rolling):
+            other = other.snapshot()
+        self.rotate()
+        self.buckets[-1].merge(other)
+        return self
+
+    def snapshot(self, reset=False):
+        """Return samples of window merged together, remove them if asked."""
+        self.rotate()
+        result = self.factory()
+        for bucket in list(self.buckets):
+            result.merge(bucket.snapshot(reset))
+        return result
+
+
+class RollingCounter(Rolling):
+    """Counter of last `period` seconds."""
+
+    def __init__(self, period=60.0, buckets=6, clock=None):
+        super(RollingCounter, self).__init__(Counter, period, buckets, clock)
+
+
+class RollingTimer(Rolling):
+    """Timer of last `period` seconds."""
+
+    def __init__(self, period=60.0, buckets=6, eps=0.01, quantiles=None,
+                 clock=None):
+        super(RollingTimer, self).__init__(partial(Timer, eps, quantiles),
+                                           period, buckets, clock)
@@ -1,16 +1,26 @@
 from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING, \
+    PyBytes_GET_SIZE
 
 
 cdef extern from "stdint.h" nogil:
 
     ctypedef unsigned int uint32_t
-    ctypedef unsigned int uint64_t
+    ctypedef int int32_t
+    ctypedef unsigned long long uint64_t
 
 
-cdef extern from "cm_quantile.h":
+cdef extern from "cm_sketch.h":
 
-    ctypedef struct cm_quantile:
-        pass
+    ctypedef struct cm_sketch:
+        double eps
+        uint32_t num_bins
+        int32_t offset
+        int populated
+        uint64_t zero_count
+        uint64_t count
+        uint64_t *bins
 
 
 cdef extern from "cm_timer.h":
@@ -19,13 +29,17 @@ cdef extern from "cm_timer.h":
         uint64_t count
         double sum
         double squared_sum
-        int finalized
-        cm_quantile cm
+        double min
+        double max
+        cm_sketch sketch
 
-    int init_timer(double eps, double *quantiles, uint32_t num_quants, timer *c_timer)
+    int init_timer(double eps, uint32_t num_bins, timer *c_timer)
     int destroy_timer(timer *c_timer)
 
     int timer_add_sample(timer *c_timer, double sample)
+    int timer_merge(timer *c_timer, timer *other)
+    int timer_subtract(timer *c_timer, timer *other)
+    void timer_reset(timer *c_timer)
     double timer_query(timer *c_timer, double quantile)
     uint64_t timer_count(timer *c_timer)
     double timer_min(timer *c_timer)
@@ -36,25 +50,102 @@ cdef extern from "cm_timer.h":
     double timer_max(timer *c_timer)
 
 
+# Quantiles that are reported by default.
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+# Number of buckets of sketch, with default accuracy they cover values
+# that differ up to 10^8 times, like from microseconds to minutes.
+DEFAULT_BINS = 1024
+
+
 cdef class Timer(object):
+    """Track distribution of samples. Quantiles are estimated with
+    relative error `eps` and timers with same `eps` and `bins` can be
+    merged, even if they were pickled in other process.
+
+    """
+
     cdef timer *_c_timer
     cdef int _initialized
-
-    def __cinit__(self, double eps=0.01):
-        # These are the quantiles we track
-        cdef double *quantiles = [0.5, 0.95, 0.99]
+    cdef readonly tuple quantiles
+
+    def __cinit__(self, double eps=0.01, object quantiles=None,
+                  uint32_t bins=DEFAULT_BINS):
+        quantiles = tuple(sorted(quantiles or DEFAULT_QUANTILES))
+        if not all(0 < quantile < 1 for quantile in quantiles):
+            raise ValueError('Quantiles must be on (0, 1)')
+        self.quantiles = quantiles
         self._c_timer = <timer *>malloc(sizeof(timer))
         if self._c_timer is NULL:
             raise MemoryError("Can't create timer struct")
-        self._initialized = init_timer(eps, quantiles, 3, self._c_timer)
-        assert self._initialized == 0
+        self._initialized = init_timer(eps, bins, self._c_timer)
+        if self._initialized != 0:
+            raise ValueError('Bad accuracy or number of buckets')
 
     def add(self, double sample):
         assert timer_add_sample(self._c_timer, sample) == 0
 
+    def merge(self, Timer other not None):
+        """Add all samples of other timer."""
+        if timer_merge(self._c_timer, other._c_timer) != 0:
+            raise ValueError("Can't merge timers with different accuracy")
+        return self
+
+    def subtract(self, Timer other not None):
+        """Remove samples of other timer, that is earlier snapshot of this
+        one. Minimum and maximum are estimated from remaining samples.
+
+        """
+        if timer_subtract(self._c_timer, other._c_timer) != 0:
+            raise ValueError("Can't subtract timers with different accuracy")
+        return self
+
+    def reset(self):
+        """Remove all samples."""
+        timer_reset(self._c_timer)
+
+    def snapshot(self, bint reset=False):
+        """Return copy of timer and reset it if asked. Both happen at
+        once, so samples added by other threads aren't lost.
+
+        """
+        cdef Timer result = type(self)(self._c_timer.sketch.eps,
+                                       self.quantiles,
+                                       self._c_timer.sketch.num_bins)
+        timer_merge(result._c_timer, self._c_timer)
+        if reset:
+            timer_reset(self._c_timer)
+        return result
+
     def query(self, double quantile=0.95):
         return timer_query(self._c_timer, quantile)
 
+    def query_all(self):
+        """Return dict with values of tracked quantiles."""
+        return {'p{0:g}'.format(quantile * 100): self.query(quantile)
+                for quantile in self.quantiles}
+
+    def __reduce__(self):
+        cdef timer *c_timer = self._c_timer
+        cdef cm_sketch *sketch = &c_timer.sketch
+        bins = PyBytes_FromStringAndSize(<char *>sketch.bins,
+                                         sketch.num_bins * sizeof(uint64_t))
+        return (type(self), (sketch.eps, self.quantiles, sketch.num_bins),
+                (c_timer.count, c_timer.sum, c_timer.squared_sum,
+                 c_timer.min, c_timer.max, sketch.offset, sketch.populated,
+                 sketch.zero_count, sketch.count, bins))
+
+    def __setstate__(self, tuple state):
+        cdef timer *c_timer = self._c_timer
+        cdef cm_sketch *sketch = &c_timer.sketch
+        cdef bytes bins
+        (c_timer.count, c_timer.sum, c_timer.squared_sum, c_timer.min,
+         c_timer.max, sketch.offset, sketch.populated, sketch.zero_count,
+         sketch.count, bins) = state
+        if PyBytes_GET_SIZE(bins) != sketch.num_bins * sizeof(uint64_t):
+            raise ValueError('Bad number of buckets')
+        memcpy(sketch.bins, PyBytes_AS_STRING(bins), PyBytes_GET_SIZE(bins))
+
     def __int__(self):
         return int(self.sum)
 
@@ -1,17 +1,61 @@
 from __future__ import absolute_import
 
 from collections import defaultdict
+from functools import partial
 
 from .timer import Timer
+from .rolling import RollingTimer
 
 
 class Timers(defaultdict):
+    """Store timers here. If `period` is given timers keep only samples
+    of last `period` seconds.
 
-    def __init__(self):
-        super(Timers, self).__init__(Timer)
+    """
+
+    def __init__(self, eps=0.01, quantiles=None, period=None, buckets=6):
+        self.eps = eps
+        self.quantiles = quantiles
+        self.period = period
+        self.buckets = buckets
+        factory = partial(Timer, eps, quantiles) if period is None else \
+            partial(RollingTimer, period, buckets, eps, quantiles)
+        super(Timers, self).__init__(factory)
+
+    def __reduce__(self):
+        return (type(self), (self.eps, self.quantiles, self.period,
+                             self.buckets), None, None, iter(self.items()))
+
+    def merge(self, other):
+        """Add samples of all timers from other collection."""
+        for key, timer in other.items():
+            self[key].merge(timer)
+        return self
+
+    def subtract(self, other):
+        """Remove samples of timers from other collection, that is earlier
+        snapshot of this one.
+
+        """
+        for key, timer in self.items():
+            previous = other.get(key)
+            if previous is not None:
+                timer.subtract(previous)
+        return self
+
+    def snapshot(self, reset=False):
+        """Return copy of all timers and reset them if asked. Timers may
+        be updated meanwhile, each of them is copied at once.
+
+        """
+        result = Timers(self.eps, self.quantiles)
+        for key, timer in list(self.items()):
+            result[key] = timer.snapshot(reset)
+        return result
 
     def to_dict(self):
         """Convert all timers to dict."""
+        timers = self if self.period is None else self.snapshot()
         return {key: {'mean': timer.mean,
                       'stddev': timer.stddev,
                       'sum': timer.sum,
@@ -19,5 +63,6 @@ class Timers(defaultdict):
                       'squared_sum': timer.squared_sum,
                       'min': timer.min,
                       'max': timer.max,
-                      'distribution95': timer.query(0.95)}
-                for key, timer in self.items()}
+                      'distribution95': timer.query(0.95),
+                      'quantiles': timer.query_all()}
+                for key, timer in timers.items()}
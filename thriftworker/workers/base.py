@@ -4,13 +4,23 @@ import sys
 import logging
 from abc import ABCMeta, abstractmethod
 from functools import partial
+from io import BytesIO
 
 from six import with_metaclass
+from thrift.Thrift import TMessageType
+from thrift.protocol.TMultiplexedProtocol import SEPARATOR
 
+from ..utils.loop import in_loop
 from ..utils.mixin import LoopMixin, StartStopMixin
 from ..utils.atomics import ContextCounter
 from ..utils.decorators import cached_property
-from ..utils.monotime import monotonic
+from ..utils.future import Future
+
+from ..transports.message import peek_message, MessageHeader
+
+from .shedding import Admission
+from .batching import Collector, execute as execute_batch
+from .timeline import Timeline
 
 logger = logging.getLogger(__name__)
 
@@ -20,53 +30,110 @@ class Request(object):
 
     __slots__ = (
         'loop', 'connection', 'message_buffer',
-        'request_id', 'service', 'receipt_time',
-        'start_time', 'end_time', 'dispatch_time',
-        'method', 'response', 'exception', 'successful',
+        'request_id', 'service', 'receipt_time', 'timeline',
+        'method', 'response', 'exception', 'successful', 'key', 'header',
+        'protocol', 'size', 'write_callback',
     )
 
-    def __init__(self, loop, connection, message_buffer, request_id, service):
+    def __init__(self, loop, connection, message_buffer, request_id, service,
+                 header=None, protocol=None, size=None):
         self.loop = loop
         self.connection = connection
         self.message_buffer = message_buffer
         self.request_id = request_id
         self.service = service
+        # Time in loop clock, used by queue policies.
         self.receipt_time = self.loop.now()
-        self.start_time = self.end_time = self.dispatch_time = None
-        self.method = self.response = self.exception = None
+        self.timeline = Timeline()
+        self.response = self.exception = None
         self.successful = None
+        # Header of message, known before request processed.
+        self.header = header
+        self.method = header.name if header is not None else None
+        # Protocol detected on connection.
+        self.protocol = protocol
+        # Size of received message in bytes, if transport knows it.
+        self.size = size
+        # Method name, serialized arguments and protocol, used to find
+        # identical requests.
+        self.key = None
+        # Called when response is written to socket.
+        self.write_callback = None
 
     @property
     def dispatching_timers(self):
-        return self.dispatch_time - self.receipt_time
+        return self.timeline.elapsed('received', 'handed_back')
 
     @property
     def execution_time(self):
-        return (self.end_time - self.start_time) * 1e3
+        return self.timeline.elapsed('started', 'finished')
 
     def execute(self, processor):
         """Process our request."""
-        self.start_time = monotonic()
+        self.timeline.mark('started')
+        try:
+            self.method, self.response = processor(self.message_buffer,
+                                                   self.protocol)
+            encode = getattr(self.message_buffer, 'encode', None)
+            if encode is not None and self.response and \
+                    not isinstance(self.response, Future):
+                # Let transport encode response out of loop.
+                encode(self.response)
+        except:
+            successful = self.successful = False
+            exception = self.exception = sys.exc_info()
+            logger.error(exception[1], exc_info=exception)
+        else:
+            successful = self.successful = True
+        finally:
+            self.timeline.mark('finished')
+        return successful
+
+    @property
+    def deferred(self):
+        """Will response be completed later?"""
+        return isinstance(self.response, Future)
+
+    def resolve(self, future):
+        """Take response from completed future of deferred request."""
         try:
-            self.method, self.response = processor(self.message_buffer)
+            self.response = future.result()
+            encode = getattr(self.message_buffer, 'encode', None)
+            if encode is not None and self.response:
+                encode(self.response)
         except:
             successful = self.successful = False
             exception = self.exception = sys.exc_info()
+            self.response = None
             logger.error(exception[1], exc_info=exception)
         else:
             successful = self.successful = True
         finally:
-            self.end_time = monotonic()
+            self.timeline.mark('finished')
         return successful
 
-    def dispatch(self):
-        """Notify connection that request was processed."""
-        self.dispatch_time = self.loop.now()
+    def dispatch(self, callback=None):
+        """Notify connection that request was processed. Given callback
+        is called with request and error or ``None`` when response is
+        written to socket.
+
+        """
+        self.timeline.mark('handed_back')
         if not self.connection.is_ready():
             return False
-        self.connection.ready(self.successful, self.response, self.request_id)
+        self.write_callback = callback
+        self.connection.ready(self.successful, self.response,
+                              self.request_id, self.written)
         return True
 
+    def written(self, error):
+        """Response is written to socket, called by connection."""
+        if error is None:
+            self.timeline.mark('written')
+        callback, self.write_callback = self.write_callback, None
+        if callback is not None:
+            callback(self, error)
+
     @property
     def method_name(self):
         return "{0}::{1}".format(self.service, self.method or 'unknown')
@@ -80,30 +147,59 @@ class BaseWorker(StartStopMixin, with_metaclass(ABCMeta, LoopMixin)):
         self.pool_size = pool_size or 10
         super(BaseWorker, self).__init__()
 
+    @cached_property
+    def request_cls(self):
+        """Class of created requests, it call registered hooks if there are
+        any when it's first used.
+
+        """
+        hooks = self.app.hooks
+        if not hooks:
+            return self.Request
+        return hooks.subclass(self.Request)
+
+    @cached_property
+    def write_callback(self):
+        """Callback of each response written to socket, it measures size
+        and write time of response.
+
+        """
+        write_timers = self.app.write_timers
+        response_sizes = self.app.response_sizes
+
+        def inner_written(request, error):
+            """Response is written, measure it."""
+            if error is not None:
+                return
+            method_name = request.method_name
+            write_timers[method_name] += \
+                request.timeline.elapsed('handed_back', 'written')
+            if request.response:
+                response_sizes[method_name] += len(request.response)
+
+        return inner_written
+
     def create_callback(self):
         """Create callback that should be called after request was done."""
         concurrency = self.concurrency
         pool_size = self.pool_size
-        acceptors = self.app.acceptors
         counter = self.app.counters['response_served']
         timeouts = self.app.timeouts
         execution_timers = self.app.execution_timers
         dispatching_timers = self.app.dispatching_timers
+        request_sizes = self.app.request_sizes
+        stage_timers = ((self.app.queue_timers, 'enqueued', 'dequeued'),
+                        (self.app.handback_timers, 'finished', 'handed_back'))
+        written = self.write_callback
         delay = self.app.hub.callback
 
-        def start_accepting():
-            if not concurrency.reached:
-                return
-            concurrency.reached.clean()
-            logger.info('Start registered acceptors,'
-                        ' current concurrency: %d...', int(concurrency))
-            acceptors.start_accepting()
+        start_accepting = self.start_accepting
 
         def inner_callback(request, result, exception=None):
             """Process task result."""
             method_name = request.method_name
 
-            if request.dispatch():
+            if request.dispatch(written):
                 # connection is ready for answer
                 counter.add()
             elif request.successful and request.response:
@@ -117,12 +213,51 @@ class BaseWorker(StartStopMixin, with_metaclass(ABCMeta, LoopMixin)):
             if request.successful:
                 execution_timers[method_name] += request.execution_time
                 dispatching_timers[method_name] += request.dispatching_timers
+                timeline = request.timeline
+                for timers, first, last in stage_timers:
+                    elapsed = timeline.elapsed(first, last)
+                    if elapsed is not None:
+                        timers[method_name] += elapsed
+                if request.size is not None:
+                    request_sizes[method_name] += request.size
 
             if concurrency.reached and pool_size > concurrency:
                 delay(start_accepting)
 
         return inner_callback
 
+    def stop(self):
+        """Submit pending batches, subclasses should call it before they
+        stop processing tasks.
+
+        """
+        if self._collectors:
+            self._close_collectors()
+        super(BaseWorker, self).stop()
+
+    @in_loop
+    def _close_collectors(self):
+        for collector in self._collectors:
+            collector.close()
+
+    @property
+    def queue_size(self):
+        """Number of tasks waiting for free worker or ``None`` if it's
+        unknown.
+
+        """
+        return None
+
+    def start_accepting(self):
+        """Start acceptors stopped when pool was exhausted."""
+        concurrency = self.concurrency
+        if not concurrency.reached:
+            return
+        concurrency.reached.clean()
+        logger.info('Start registered acceptors,'
+                    ' current concurrency: %d...', int(concurrency))
+        self.app.acceptors.start_accepting()
+
     @abstractmethod
     def create_consumer(self):
         raise NotImplementedError()
@@ -138,24 +273,259 @@ class BaseWorker(StartStopMixin, with_metaclass(ABCMeta, LoopMixin)):
 
         def inner_task(request):
             """Process incoming request with given processor."""
+            request.timeline.mark('dequeued')
             with concurrency:
                 return request.execute(processor)
 
         return inner_task
 
+    def create_batch_task(self, processor):
+        """Create new task that process batch of requests with given
+        batch processor.
+
+        """
+        concurrency = self.concurrency
+
+        def inner_task(method, requests):
+            """Process given requests with one call of processor."""
+            for request in requests:
+                request.timeline.mark('dequeued')
+            with concurrency:
+                return execute_batch(processor, method, requests)
+
+        return inner_task
+
+    def create_rejector(self, service):
+        """Create function that answer to shed requests."""
+        write_error = self.app.services.create_error_writer(service)
+        counters = self.app.shedding_counters
+        written = self.write_callback
+
+        def inner_rejector(request):
+            """Answer with error to given request without processing it."""
+            try:
+                request.method, request.response = write_error(
+                    request.message_buffer,
+                    'Request rejected, server is overloaded',
+                    protocol=request.protocol)
+            except Exception as exc:
+                logger.exception(exc)
+                request.successful = False
+            else:
+                request.successful = True
+            counters[request.method_name].add()
+            request.dispatch(written)
+
+        return inner_rejector
+
+    def create_identifier(self, service):
+        """Create function that set key of request if it may be answered
+        from cache or coalesced.
+
+        """
+        services = self.app.services
+        selectors = [selector for selector in (services[service].cache,
+                                               services[service].coalescing)
+                     if selector is not None]
+
+        def inner_identifier(request):
+            """Find key of given request."""
+            payload = request.message_buffer.getvalue()
+            header = request.header
+            if header is None:
+                header = request.header = peek_message(payload)
+                if header is None:
+                    # Let processor handle unknown message.
+                    return
+            if header.type == TMessageType.CALL and \
+                    any(header.name in selector for selector in selectors):
+                # Bodies of different protocols may be equal.
+                request.key = (header.name, payload[header.size:],
+                               request.protocol)
+                # Requests answered without processor are measured by
+                # method too.
+                request.method = header.name
+
+        return inner_identifier
+
+    def create_reply_writer(self, service):
+        """Create function that answer to request with response of identical
+        request.
+
+        """
+        write_header = self.app.services.create_header_writer(service)
+        counter = self.app.counters['response_served']
+        written = self.write_callback
+
+        def inner_writer(request, response, successful=True):
+            """Write response with sequence id of given request."""
+            reply_header = peek_message(response) \
+                if successful and response else None
+            if reply_header is not None:
+                request.response = write_header(
+                    reply_header.name, reply_header.type,
+                    request.header.seqid, request.protocol) + \
+                    response[reply_header.size:]
+                request.successful = True
+            else:
+                request.successful = successful and not response
+            if request.dispatch(written):
+                counter.add()
+
+        return inner_writer
+
+    def create_cache(self, service):
+        """Create functions that answer to requests from response cache and
+        store responses of processed requests.
+
+        """
+        cache = self.app.services[service].cache
+        write_header = self.app.services.create_header_writer(service)
+        counter = self.app.counters['response_served']
+        written = self.write_callback
+
+        def inner_lookup(request):
+            """Answer to request from cache if we can."""
+            method = request.key[0]
+            if method not in cache:
+                return False
+            value = cache.get(request.key)
+            if value is None:
+                return False
+            reply_type, body = value
+            request.response = write_header(method, reply_type,
+                                            request.header.seqid,
+                                            request.protocol) + body
+            request.successful = True
+            if request.dispatch(written):
+                counter.add()
+            return True
+
+        def inner_store(request):
+            """Store response of processed request."""
+            if request.key is None or request.key[0] not in cache \
+                    or not request.successful or not request.response:
+                return
+            response = request.response
+            reply_header = peek_message(response)
+            if reply_header is not None and \
+                    reply_header.type == TMessageType.REPLY:
+                cache.set(request.key, (reply_header.type,
+                                        response[reply_header.size:]))
+
+        return inner_lookup, inner_store
+
+    def create_router(self, name):
+        """Create producer that route requests of multiplexed service to
+        producers of served services.
+
+        """
+        services = self.app.services
+        routes = {}
+        for service in services.multiplexed[name]:
+            routes[service] = (self.create_producer(service),
+                               services.create_header_writer(service))
+
+        def inner_router(connection, message_buffer, request_id,
+                         header=None, protocol=None, size=None):
+            """Strip service name from message header and pass request
+            to producer of this service.
+
+            """
+            payload = message_buffer.getvalue()
+            if header is None:
+                header = peek_message(payload)
+            route = method = None
+            if header is not None:
+                service, _, method = header.name.partition(SEPARATOR)
+                route = routes.get(service) if method else None
+            if route is None:
+                logger.warning('Unknown service of %r in %s from %r',
+                               header.name if header is not None else None,
+                               name, connection)
+                if connection.is_ready():
+                    connection.ready(False, None, request_id)
+                return
+            produce, write_header = route
+            prefix = write_header(method, header.type, header.seqid, protocol)
+            produce(connection, BytesIO(prefix + payload[header.size:]),
+                    request_id,
+                    MessageHeader(method, header.type, header.seqid,
+                                  len(prefix), header.protocol, header.strict),
+                    protocol, size)
+
+        return inner_router
+
+    def create_inline_producer(self, service):
+        """Create producer that process requests in loop. Such requests
+        don't wait for pool, so they are answered even if all workers are
+        busy.
+
+        """
+        callback = self.create_callback()
+        processor = self.app.services.create_processor(service)
+        loop = self.app.loop
+        Request = self.request_cls
+
+        def inner_producer(connection, message_buffer, request_id,
+                           header=None, protocol=None, size=None):
+            """Create request and process it at once."""
+            request = Request(loop=loop,
+                              connection=connection,
+                              message_buffer=message_buffer,
+                              request_id=request_id,
+                              service=service,
+                              header=header,
+                              protocol=protocol,
+                              size=size)
+            callback(request, request.execute(processor))
+
+        return inner_producer
+
+    @cached_property
+    def _producers(self):
+        return {}
+
+    @cached_property
+    def _collectors(self):
+        return []
+
     def create_producer(self, service):
+        """Return producer for connections of given service. It's created
+        once per worker, so acceptor and routers of service share its
+        admission queue, cache and coalescer.
+
+        """
+        try:
+            return self._producers[service]
+        except KeyError:
+            producer = self._producers[service] = \
+                self._create_producer(service)
+            return producer
+
+    def _create_producer(self, service):
         """Create producer for connections."""
+        if service in self.app.services.multiplexed:
+            return self.create_router(service)
+        if self.app.services[service].inline:
+            return self.create_inline_producer(service)
         concurrency = self.concurrency
         pool_size = self.pool_size
         callback = self.create_callback()
+        reject = self.create_rejector(service)
         processor = self.app.services.create_processor(service)
+        shedding = self.app.services[service].shedding
+        cache = self.app.services[service].cache
+        coalescer = self.app.services[service].coalescing
+        batcher = self.app.services[service].batching
         counter = self.app.counters['pool_overflow']
         task = self.create_task(processor)
         consume = self.create_consumer()
         acceptors = self.app.acceptors
         loop = self.app.loop
         delay = self.app.hub.callback
-        Request = self.Request
+        Request = self.request_cls
+        hooks = self.app.hooks if Request is not self.Request else None
 
         def stop_accepting():
             if concurrency.reached or pool_size > concurrency:
@@ -164,18 +534,137 @@ class BaseWorker(StartStopMixin, with_metaclass(ABCMeta, LoopMixin)):
                         ' current concurrency: %d...', int(concurrency))
             counter.add()
             concurrency.reached.set()
-            acceptors.stop_accepting()
-
-        def inner_producer(connection, message_buffer, request_id):
+            # Inline services still answer, keep their acceptors.
+            acceptors.stop_accepting(inline=False)
+
+        identify = None
+        if cache is not None or coalescer is not None:
+            identify = self.create_identifier(service)
+
+        if cache is not None:
+            lookup, store = self.create_cache(service)
+            cached_callback = callback
+
+            def callback(request, result, exception=None):
+                """Store response in cache and process task result."""
+                store(request)
+                cached_callback(request, result, exception)
+
+        if coalescer is not None:
+            write_reply = self.create_reply_writer(service)
+            coalesced_callback, coalesced_reject = callback, reject
+
+            def callback(request, result, exception=None):
+                """Process task result and answer to attached requests."""
+                coalesced_callback(request, result, exception)
+                for follower in coalescer.detach(request):
+                    write_reply(follower, request.response,
+                                request.successful)
+
+            def reject(request):
+                """Reject request with all attached requests."""
+                coalesced_reject(request)
+                for follower in coalescer.detach(request):
+                    coalesced_reject(follower)
+
+        def enqueue(request):
             """Enqueue given request to thread pool."""
+            consume(partial(task, request), partial(callback, request))
+            if not concurrency.reached and pool_size <= concurrency:
+                delay(stop_accepting)
+
+        if shedding is not None:
+
+            def submit(request):
+                """Enqueue admitted request to thread pool."""
+                consume(partial(task, request),
+                        partial(admitted_callback, request))
+
+            def admitted_callback(request, result, exception=None):
+                """Process task result and admit next request."""
+                try:
+                    callback(request, result, exception)
+                finally:
+                    admission.release()
+
+            admission = Admission(loop, shedding, pool_size, submit, reject)
+            enqueue = admission.put
+
+        collector = None
+        if batcher is not None:
+            batch_task = self.create_batch_task(
+                self.app.services.create_batch_processor(service))
+            if hooks is not None:
+                batch_task = hooks.wrap_batch(batch_task)
+
+            def submit_batch(method, requests):
+                """Enqueue batch of requests to thread pool."""
+                consume(partial(batch_task, method, requests),
+                        partial(batch_callback, requests))
+                if not concurrency.reached and pool_size <= concurrency:
+                    delay(stop_accepting)
+
+            def batch_callback(requests, result, exception=None):
+                """Process result of each request of batch."""
+                for request in requests:
+                    callback(request, request.successful, exception)
+
+            collector = Collector(loop, batcher, submit_batch)
+            self._collectors.append(collector)
+            put = collector.put
+
+        if self.app.services[service].deferred:
+            deferred_callback = callback
+
+            def callback(request, result, exception=None):
+                """Wait for deferred response out of pool."""
+                if not request.successful or not request.deferred:
+                    deferred_callback(request, result, exception)
+                    return
+                request.response.add_done_callback(
+                    partial(resolve, request))
+                if concurrency.reached and pool_size > concurrency:
+                    delay(self.start_accepting)
+
+            def resolve(request, future):
+                """Serialized response is ready, process it in loop."""
+                delay(deferred_callback, request, request.resolve(future))
+
+        if hooks is not None:
+            enqueue = hooks.wrap(enqueue, 'enqueued')
+            if collector is not None:
+                put = hooks.wrap(put, 'enqueued')
+
+        def inner_producer(connection, message_buffer, request_id,
+                           header=None, protocol=None, size=None):
+            """Create request and enqueue it."""
             request = Request(loop=loop,
                               connection=connection,
                               message_buffer=message_buffer,
                               request_id=request_id,
-                              service=service)
-            curried_task = partial(task, request)
-            consume(curried_task, partial(callback, request))
-            if not concurrency.reached and pool_size <= concurrency:
-                delay(stop_accepting)
+                              service=service,
+                              header=header,
+                              protocol=protocol,
+                              size=size)
+            if identify is not None:
+                identify(request)
+                if request.key is not None:
+                    if cache is not None and lookup(request):
+                        return
+                    if coalescer is not None and \
+                            request.key[0] in coalescer and \
+                            coalescer.attach(request):
+                        return
+            request.timeline.mark('enqueued')
+            if collector is not None:
+                if request.header is None:
+                    request.header = peek_message(message_buffer.getvalue())
+                header = request.header
+                if header is not None and header.type == TMessageType.CALL \
+                        and header.name in batcher:
+                    request.method = header.name
+                    put(request)
+                    return
+            enqueue(request)
 
         return inner_producer
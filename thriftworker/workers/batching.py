@@ -0,0 +1,156 @@
+"""Group requests of the same method to process them with one call of
+batch handler.
+
+All objects from this module are not thread-safe and should be used only
+from the loop thread.
+
+"""
+from __future__ import absolute_import
+
+import sys
+import logging
+
+from pyuv import Timer
+
+from ..constants import BATCH_WINDOW, BATCH_SIZE
+from ..utils.monotime import monotonic_ns
+from ..utils.stats import Timers
+
+logger = logging.getLogger(__name__)
+
+
+class Batcher(object):
+    """Collect requests of batched methods. Batch is submitted when it
+    becomes full or when its first request waited for given window.
+
+    :param handlers: mapping of method names to batch handlers. Handler
+        accept list of argument structs and return list of results in the
+        same order, result may be exception declared by method
+    :param window: how long first request of batch waits for others,
+        in milliseconds
+    :param maxsize: maximal number of requests in batch
+
+    """
+
+    def __init__(self, handlers, window=None, maxsize=None):
+        self.handlers = dict(handlers)
+        self.window = window or BATCH_WINDOW
+        self.maxsize = maxsize or BATCH_SIZE
+        self.sizes = Timers()
+        self.delays = Timers()
+        self._pending = {}
+
+    def __contains__(self, method):
+        """Should requests of given method be batched?"""
+        return method in self.handlers
+
+    def __len__(self):
+        """Return number of requests that wait for their batch."""
+        return sum(len(batch) for batch in self._pending.values())
+
+    def __repr__(self):
+        return '<{0}({1} pending) at {2}>'.format(
+            type(self).__name__, len(self), hex(id(self)))
+
+    def put(self, request):
+        """Add request to batch of its method. Return batch if it's full
+        or ``None``.
+
+        """
+        method = request.method
+        batch = self._pending.setdefault(method, [])
+        batch.append(request)
+        if len(batch) >= self.maxsize:
+            return self.pop(method, request.receipt_time)
+
+    def pop(self, method, now):
+        """Return pending batch of given method or ``None``."""
+        batch = self._pending.pop(method, None)
+        if batch:
+            self.sizes[method].add(len(batch))
+            self.delays[method].add(now - batch[0].receipt_time)
+        return batch or None
+
+    def to_dict(self):
+        """Convert batching statistics to dict."""
+        sizes, delays = self.sizes.to_dict(), self.delays.to_dict()
+        return {method: {'sizes': sizes[method], 'delays': delays[method]}
+                for method in sizes}
+
+
+class Collector(object):
+    """Put requests to batches and submit batches when they are full or
+    their window expired.
+
+    :param batcher: instance of :class:`Batcher`
+    :param submit: function that accept method name and list of requests
+        and enqueue them to workers
+
+    """
+
+    def __init__(self, loop, batcher, submit):
+        self.loop = loop
+        self.batcher = batcher
+        self.submit = submit
+        self.timers = {}
+
+    def put(self, request):
+        """Add request to batch, submit batch if it's full."""
+        method = request.method
+        batch = self.batcher.put(request)
+        timer = self.timers.get(method)
+        if batch is not None:
+            if timer is not None:
+                timer.stop()
+            self.submit(method, batch)
+        elif timer is None or not timer.active:
+            if timer is None:
+                timer = self.timers[method] = Timer(self.loop)
+            timer.start(lambda handle: self.expire(method),
+                        self.batcher.window / 1000.0, 0)
+
+    def expire(self, method):
+        """Submit batch of given method that waited for whole window."""
+        batch = self.batcher.pop(method, self.loop.now())
+        if batch is not None:
+            self.submit(method, batch)
+
+    def close(self):
+        """Close timers and submit pending batches."""
+        timers, self.timers = self.timers, {}
+        for method, timer in timers.items():
+            if not timer.closed:
+                timer.close()
+            self.expire(method)
+
+
+def execute(processor, method, requests):
+    """Process batch of requests with given batch processor. Each request
+    gets its own response.
+
+    """
+    started = monotonic_ns()
+    try:
+        responses = processor(method, [(request.message_buffer,
+                                        request.protocol)
+                                       for request in requests])
+    except:
+        exception = sys.exc_info()
+        logger.error(exception[1], exc_info=exception)
+        responses = [None] * len(requests)
+    else:
+        exception = None
+    finished = monotonic_ns()
+    for request, response in zip(requests, responses):
+        timeline = request.timeline
+        timeline.started, timeline.finished = started, finished
+        if response is None:
+            request.successful = False
+            request.exception = exception
+            continue
+        request.response = response
+        request.successful = True
+        encode = getattr(request.message_buffer, 'encode', None)
+        if encode is not None and response:
+            encode(response)
+    return exception is None
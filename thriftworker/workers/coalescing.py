@@ -0,0 +1,77 @@
+"""Coalesce identical requests that are executed at the same time."""
+from __future__ import absolute_import
+
+from ..utils.stats import Counters
+
+
+class Coalescer(object):
+    """Attach duplicates of executing request to it, so they will get the
+    same response. Requests are identical if they have the same method name
+    and serialized arguments. Should be used only from loop thread.
+
+    :param methods: names of methods which requests should be coalesced
+
+    """
+
+    def __init__(self, methods):
+        self.methods = frozenset(methods)
+        self.requests = Counters()
+        self.coalesced = Counters()
+        self._executing = {}
+
+    def __contains__(self, method):
+        """Should requests of given method be coalesced?"""
+        return method in self.methods
+
+    def __len__(self):
+        """Return number of executing requests."""
+        return len(self._executing)
+
+    def __repr__(self):
+        return '<{0}({1} executing) at {2}>'.format(
+            type(self).__name__, len(self), hex(id(self)))
+
+    def attach(self, request):
+        """Attach request to identical one if it executing. Return ``True``
+        if request attached, ``False`` if request should be executed.
+
+        """
+        key = request.key
+        method = key[0]
+        self.requests[method].add()
+        followers = self._executing.get(key)
+        if followers is None:
+            self._executing[key] = []
+            return False
+        followers.append(request)
+        self.coalesced[method].add()
+        return True
+
+    def detach(self, request):
+        """Request done, return list of attached requests."""
+        return self._executing.pop(request.key, None) or []
+
+    def ratio(self, method):
+        """Return share of requests of given method that were coalesced."""
+        requests = self.requests[method].count
+        return float(self.coalesced[method].count) / requests \
+            if requests else 0.0
+
+    def stats(self):
+        """Return copy of counters keyed by method and kind, like
+        ``method.requests`` and ``method.coalesced``.
+
+        """
+        result = Counters()
+        for kind, counters in (('requests', self.requests),
+                               ('coalesced', self.coalesced)):
+            for method, counter in counters.items():
+                result['{0}.{1}'.format(method, kind)] = counter.snapshot()
+        return result
+
+    def to_dict(self):
+        """Convert coalescing statistics to dict."""
+        return {method: {'requests': counter.count,
+                         'coalesced': self.coalesced[method].count,
+                         'ratio': self.ratio(method)}
+                for method, counter in self.requests.items()}
@@ -0,0 +1,147 @@
+"""Hooks called at stages of request lifecycle.
+
+Hooks are taken into account when worker creates its producers, so they
+should be registered before acceptors are started. Without registered
+hooks workers use plain :class:`Request` and nothing is called.
+
+"""
+from __future__ import absolute_import
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#: Events of request lifecycle in order they happen.
+EVENTS = ('received', 'enqueued', 'started', 'finished', 'dispatched')
+
+
+class Hook(object):
+    """Base class of hooks. Methods are called with request; *received*,
+    *enqueued* and *dispatched* in loop thread, *started* and *finished*
+    in thread that process request.
+
+    """
+
+    def received(self, request):
+        pass
+
+    def enqueued(self, request):
+        pass
+
+    def started(self, request):
+        pass
+
+    def finished(self, request):
+        pass
+
+    def dispatched(self, request):
+        pass
+
+
+def run(request, event):
+    """Call given event of hooks sampled for request."""
+    for hook in request.hooks:
+        try:
+            getattr(hook, event)(request)
+        except Exception as exc:
+            logger.exception(exc)
+
+
+class Hooks(object):
+    """Registry of hooks. Each hook is called for one of *rate* requests,
+    the decision is made once when request is received.
+
+    """
+
+    def __init__(self):
+        self._hooks = []
+        self._counters = []
+
+    def __len__(self):
+        return len(self._hooks)
+
+    def __iter__(self):
+        return iter(self._hooks)
+
+    def register(self, hook, rate=1):
+        """Register given :class:`Hook` instance, sampled 1 in *rate*."""
+        rate = int(rate)
+        if rate < 1:
+            raise ValueError('Sampling rate must be positive')
+        self._hooks.append((hook, rate))
+        self._counters.append(0)
+
+    def sample(self):
+        """Return tuple of hooks for new request."""
+        counters = self._counters
+        sampled = []
+        for i, (hook, rate) in enumerate(self._hooks):
+            counter = counters[i] = (counters[i] + 1) % rate
+            if counter == 0:
+                sampled.append(hook)
+        return tuple(sampled)
+
+    def wrap(self, func, event):
+        """Return function that call given event and then given function
+        with request.
+
+        """
+
+        def inner_wrapper(request, *args, **kwargs):
+            run(request, event)
+            return func(request, *args, **kwargs)
+
+        return inner_wrapper
+
+    def wrap_batch(self, func):
+        """Return function that process batch of requests with given
+        function and call *started* and *finished* for each request.
+
+        """
+
+        def inner_wrapper(method, requests):
+            for request in requests:
+                run(request, 'started')
+            try:
+                return func(method, requests)
+            finally:
+                for request in requests:
+                    run(request, 'finished')
+
+        return inner_wrapper
+
+    def subclass(self, Request):
+        """Return subclass of given request class that call hooks."""
+        sample = self.sample
+
+        class HookedRequest(Request):
+
+            __slots__ = ('hooks',)
+
+            def __init__(self, *args, **kwargs):
+                Request.__init__(self, *args, **kwargs)
+                self.hooks = sample()
+                run(self, 'received')
+
+            def execute(self, processor):
+                run(self, 'started')
+                try:
+                    return Request.execute(self, processor)
+                finally:
+                    if not self.deferred:
+                        run(self, 'finished')
+
+            def resolve(self, future):
+                try:
+                    return Request.resolve(self, future)
+                finally:
+                    run(self, 'finished')
+
+            def dispatch(self, callback=None):
+                try:
+                    return Request.dispatch(self, callback)
+                finally:
+                    run(self, 'dispatched')
+
+        HookedRequest.__name__ = 'Hooked' + Request.__name__
+        return HookedRequest
@@ -5,6 +5,8 @@ from time import time as _time
 
 from pyuv import thread as _thread
 
+from thriftworker.utils.monotime import monotonic
+
 __all__ = ['Empty', 'Full', 'Queue']
 
 
@@ -37,6 +39,19 @@ class Queue(object):
         # Notify not_full whenever an item is removed from the queue;
         # a thread waiting to put is notified then.
         self.not_full = _thread.Condition()
+        # Timer of milliseconds spent acquiring mutex in put() and get(),
+        # may be None.
+        self.lock_timer = None
+
+    def _lock(self):
+        """Acquire mutex, measure wait if asked."""
+        timer = self.lock_timer
+        if timer is None:
+            self.mutex.lock()
+            return
+        started = monotonic()
+        self.mutex.lock()
+        timer.add((monotonic() - started) * 1e3)
  
     def qsize(self):
         """Return the approximate size of the queue (not reliable!)."""
@@ -70,7 +85,7 @@ class Queue(object):
         is immediately available, else raise the Full exception ('timeout'
         is ignored in that case).
         """
-        self.mutex.lock()
+        self._lock()
         try:
             if self.maxsize > 0:
                 if not block:
@@ -112,7 +127,7 @@ class Queue(object):
         available, else raise the Empty exception ('timeout' is ignored
         in that case).
         """
-        self.mutex.lock()
+        self._lock()
         try:
             if not block:
                 if not len(self.queue):
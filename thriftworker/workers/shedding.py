@@ -0,0 +1,188 @@
+"""Bounded admission of requests to workers with load shedding.
+
+All objects from this module are not thread-safe and should be used only
+from the loop thread.
+
+"""
+from __future__ import absolute_import
+
+import math
+from abc import ABCMeta, abstractmethod
+from collections import deque
+
+from six import with_metaclass
+
+from ..constants import QUEUE_SIZE
+
+
+class AdmissionQueue(with_metaclass(ABCMeta, object)):
+    """Bounded queue of requests that wait for a free worker. Subclasses
+    define which requests should be shed.
+
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize or QUEUE_SIZE
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __repr__(self):
+        return '<{0}({1}/{2}) at {3}>'.format(
+            type(self).__name__, len(self.queue), self.maxsize, hex(id(self)))
+
+    @abstractmethod
+    def put(self, request, now):
+        """Enqueue given request. Return shed request or ``None``."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get(self, now):
+        """Dequeue next request. Return tuple of request (or ``None`` if
+        queue is empty) and list of shed requests. This implementation
+        dequeue in order of arrival and never shed.
+
+        """
+        try:
+            return self.queue.popleft(), []
+        except IndexError:
+            return None, []
+
+
+class RejectNewest(AdmissionQueue):
+    """Reject incoming request when queue is full."""
+
+    def put(self, request, now):
+        if len(self.queue) >= self.maxsize:
+            return request
+        self.queue.append(request)
+
+    def get(self, now):
+        return super(RejectNewest, self).get(now)
+
+
+class RejectOldest(AdmissionQueue):
+    """Reject the request that waits longest when queue is full."""
+
+    def put(self, request, now):
+        queue = self.queue
+        queue.append(request)
+        if len(queue) > self.maxsize:
+            return queue.popleft()
+
+    def get(self, now):
+        return super(RejectOldest, self).get(now)
+
+
+class CoDel(RejectNewest):
+    """Shed requests by queue delay with CoDel (Controlled Delay)
+    algorithm. Queue still bounded by `maxsize`.
+
+    :param target: acceptable queue delay in milliseconds
+    :param interval: how long delay may stay above target before
+        we start shedding, in milliseconds
+
+    """
+
+    def __init__(self, target=5.0, interval=100.0, maxsize=None):
+        self.target = target
+        self.interval = interval
+        self.first_above_time = 0
+        self.drop_next = 0
+        self.count = 0
+        self.last_count = 0
+        self.dropping = False
+        super(CoDel, self).__init__(maxsize=maxsize)
+
+    def control_law(self, t):
+        return t + self.interval / math.sqrt(self.count)
+
+    def _dequeue(self, now):
+        """Return next request and whether we can drop it."""
+        try:
+            request = self.queue.popleft()
+        except IndexError:
+            self.first_above_time = 0
+            return None, False
+        sojourn_time = now - request.receipt_time
+        if sojourn_time < self.target:
+            self.first_above_time = 0
+        elif self.first_above_time == 0:
+            self.first_above_time = now + self.interval
+        elif now >= self.first_above_time:
+            return request, True
+        return request, False
+
+    def get(self, now):
+        shed = []
+        request, ok_to_drop = self._dequeue(now)
+        if self.dropping:
+            if not ok_to_drop:
+                self.dropping = False
+            while self.dropping and now >= self.drop_next:
+                shed.append(request)
+                self.count += 1
+                request, ok_to_drop = self._dequeue(now)
+                if not ok_to_drop:
+                    self.dropping = False
+                else:
+                    self.drop_next = self.control_law(self.drop_next)
+        elif ok_to_drop:
+            shed.append(request)
+            request, ok_to_drop = self._dequeue(now)
+            self.dropping = True
+            delta = self.count - self.last_count
+            if delta > 1 and now - self.drop_next < 16 * self.interval:
+                self.count = delta
+            else:
+                self.count = 1
+            self.drop_next = self.control_law(now)
+            self.last_count = self.count
+        return request, shed
+
+
+class Admission(object):
+    """Admit requests to workers while there are free ones, queue others
+    and reject what policy sheds.
+
+    :param policy: instance of :class:`AdmissionQueue`, should not be
+        shared between admissions
+    :param limit: how many requests may be executed simultaneously
+    :param submit: function that enqueue request to workers
+    :param reject: function that answer to shed request
+
+    """
+
+    def __init__(self, loop, policy, limit, submit, reject):
+        self.loop = loop
+        self.policy = policy
+        self.limit = limit
+        self.submit = submit
+        self.reject = reject
+        self.active = 0
+
+    def __len__(self):
+        """Return number of queued requests."""
+        return len(self.policy)
+
+    def put(self, request):
+        """Submit request if we can or enqueue it."""
+        policy = self.policy
+        if self.active < self.limit and not len(policy):
+            self.active += 1
+            self.submit(request)
+            return
+        shed = policy.put(request, self.loop.now())
+        if shed is not None:
+            self.reject(shed)
+
+    def release(self):
+        """Request done, submit next one if any."""
+        self.active -= 1
+        request, shed = self.policy.get(self.loop.now())
+        for shed_request in shed:
+            self.reject(shed_request)
+        if request is not None:
+            self.active += 1
+            self.submit(request)
@@ -2,7 +2,9 @@ from __future__ import absolute_import
 
 import sys
 import logging
+from threading import current_thread, local
 
+from thriftworker.utils.monotime import monotonic
 from thriftworker.workers.base import BaseWorker
 
 logger = logging.getLogger(__name__)
@@ -11,33 +13,62 @@ logger = logging.getLogger(__name__)
 class Promise(object):
     """Used to enqueue task execution in thread pool."""
 
-    __slots__ = ('func', 'callback', 'result', 'exception')
+    __slots__ = ('func', 'callback', 'result', 'exception', 'timers',
+                 'enqueued')
 
-    def __init__(self, func, callback):
+    def __init__(self, func, callback, timers):
         self.func = func
         self.callback = callback
         self.result = None
         self.exception = None
+        self.timers = timers
+        self.enqueued = monotonic()
 
     def __call__(self):
+        timers = self.timers
+        started = monotonic()
+        timers.queue_wait.add((started - self.enqueued) * 1e3)
         try:
             self.result = self.func()
         except:
             self.exception = sys.exc_info()
+        finally:
+            timers.busy.add((monotonic() - started) * 1e3)
 
     def cb(self, *args):
         self.callback(self.result, self.exception)
 
 
+class PoolTimers(local):
+    """Timers of thread pool resolved once per thread, so threads of loop
+    don't format keys and insert them to shared timers on each call.
+
+    """
+
+    def __init__(self, timers):
+        # Called again in each thread that use this object.
+        self.timers = timers
+        self.queue_wait = timers['queue_wait']
+        self._busy = None
+
+    @property
+    def busy(self):
+        """Timer of time current thread spent on tasks."""
+        if self._busy is None:
+            self._busy = self.timers['{0}.busy'.format(current_thread().name)]
+        return self._busy
+
+
 class SyncWorker(BaseWorker):
     """Process all request in separate thread."""
 
     def create_consumer(self):
         loop = self.loop
+        timers = PoolTimers(self.app.pool_timers)
 
         def inner_consumer(task, callback):
             """Nested function that process incoming request."""
-            promise = Promise(task, callback)
+            promise = Promise(task, callback, timers)
             loop.queue_work(promise, promise.cb)
 
         return inner_consumer
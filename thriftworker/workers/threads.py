@@ -6,6 +6,7 @@ from collections import namedtuple
 from threading import Thread, Event
 
 from ..utils.decorators import cached_property
+from ..utils.monotime import monotonic
 
 from .base import BaseWorker
 from .queue import Queue
@@ -16,8 +17,8 @@ logger = logging.getLogger(__name__)
 class Worker(Thread):
     """Simple threaded worker."""
 
-    def __init__(self, app, queue, shutdown_timeout=None):
-        super(Worker, self).__init__()
+    def __init__(self, app, queue, shutdown_timeout=None, name=None):
+        super(Worker, self).__init__(name=name)
         self.app = app
         self.daemon = True
         self.queue = queue
@@ -33,18 +34,29 @@ class Worker(Thread):
         get = self.queue.get
         shutdown = self._is_shutdown.set
         delay = self.app.hub.callback
+        timers = self.app.pool_timers
+        completed = self.app.pool_counters['{0}.completed'.format(self.name)]
+        busy = timers['{0}.busy'.format(self.name)]
+        idle = timers['{0}.idle'.format(self.name)]
+        queue_wait = timers['queue_wait']
 
         while True:
+            waited = monotonic()
             message = get()
+            started = monotonic()
+            idle.add((started - waited) * 1e3)
             if message is None:
                 shutdown()
                 break
+            queue_wait.add((started - message.enqueued) * 1e3)
             result = None
             exception = None
             try:
                 result = message.task()
             except Exception:
                 exception = sys.exc_info()
+            busy.add((monotonic() - started) * 1e3)
+            completed.add()
             delay(message.callback, result, exception)
 
     def run(self):
@@ -69,14 +81,22 @@ class Pool(object):
         self.app = app
         self.size = size or 1
         self.queue = Queue()
+        self.queue.lock_timer = app.pool_timers['lock_wait']
+        self._depth = app.pool_timers['queue_depth']
 
     @cached_property
     def _workers(self):
-        return [self.Worker(self.app, self.queue) for i in xrange(self.size)]
+        return [self.Worker(self.app, self.queue,
+                            name='worker-{0}'.format(i))
+                for i in xrange(self.size)]
 
     def put(self, task):
         self.queue.put_nowait(task)
 
+    def sample(self):
+        """Add current depth of queue to its timer."""
+        self._depth.add(len(self.queue.queue))
+
     def start(self):
         for worker in self._workers:
             worker.start()
@@ -91,23 +111,31 @@ class Pool(object):
 class ThreadsWorker(BaseWorker):
     """Process all request in thread-pool."""
 
-    Message = namedtuple('Message', ('task', 'callback'))
+    Message = namedtuple('Message', ('task', 'callback', 'enqueued'))
 
     @cached_property
     def _pool(self):
         return Pool(self.app, size=self.app.pool_size)
 
+    @property
+    def queue_size(self):
+        return self._pool.queue.qsize()
+
     def create_consumer(self):
         pool = self._pool
         Message = self.Message
 
         def inner_consumer(task, callback):
-            pool.put(Message(task, callback))
+            pool.put(Message(task, callback, monotonic()))
 
         return inner_consumer
 
     def start(self):
         self._pool.start()
+        # Depth of queue is sampled with each snapshot of statistics.
+        self.app.collector.add_sampler(self._pool.sample)
 
     def stop(self):
+        self.app.collector.remove_sampler(self._pool.sample)
+        super(ThreadsWorker, self).stop()
         self._pool.stop()
@@ -0,0 +1,54 @@
+"""Moments of request processing on one nanosecond monotonic clock."""
+from __future__ import absolute_import
+
+from ..utils.monotime import monotonic_ns
+
+#: Stages of request in order they happen.
+STAGES = ('received', 'enqueued', 'dequeued', 'started', 'finished',
+          'handed_back', 'written')
+
+#: Intervals between stages that we measure, with their first and last
+#: stages.
+INTERVALS = (('queue_wait', 'enqueued', 'dequeued'),
+             ('execution', 'started', 'finished'),
+             ('handback', 'finished', 'handed_back'),
+             ('write', 'handed_back', 'written'))
+
+
+class Timeline(object):
+    """Store moment of each passed stage in nanoseconds. Stages that
+    request skipped, like queue for cached response, stay ``None``.
+
+    """
+
+    __slots__ = STAGES
+
+    def __init__(self):
+        self.received = monotonic_ns()
+        self.enqueued = self.dequeued = self.started = self.finished = \
+            self.handed_back = self.written = None
+
+    def __repr__(self):
+        return '<{0}({1}) at {2}>'.format(
+            type(self).__name__,
+            ', '.join('{0}={1}'.format(stage, getattr(self, stage))
+                      for stage in STAGES), hex(id(self)))
+
+    def mark(self, stage):
+        """Remember that given stage is passed now."""
+        setattr(self, stage, monotonic_ns())
+
+    def elapsed(self, first, last):
+        """Return milliseconds between given stages or ``None`` if any of
+        them wasn't passed.
+
+        """
+        start, end = getattr(self, first), getattr(self, last)
+        if start is None or end is None:
+            return None
+        return (end - start) / 1e6
+
+    def intervals(self):
+        """Return mapping of measured intervals to milliseconds."""
+        return {name: self.elapsed(first, last)
+                for name, first, last in INTERVALS}